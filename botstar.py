@@ -2,52 +2,75 @@
 
 import asyncio
 import logging
+from importlib import import_module
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
-from aiogram.fsm.storage.memory import MemoryStorage
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from config import settings
 from database import db
-
-# --- ИЗМЕНЕНИЕ: Добавлен импорт debug_handlers и subgram_handlers ---
-from handlers import (
-    admin_handlers,
-    basketball_handlers,
-    bowling_handlers,
-    darts_handlers,
-    debug_handlers,
-    dice_handlers,
-    duel_handlers,
-    football_handlers,
-    game_handlers,
-    language_handlers,
-    menu_handler,
-    slots_handlers,
-    subgram_handlers,
-    timer_handlers,
-    user_handlers,
-    webapp_handler,
-)
+from database.fsm_storage import SQLiteStorage
 from keyboards.reply import get_main_menu_keyboard
-from logger_config import setup_logging
+from lexicon.languages import check_lexicon
+from logger_config import setup_logging, stop_logging
 from middlewares.error_handler import ErrorHandler
 from middlewares.middlewares import LastSeenMiddleware
 from middlewares.subgram_middleware import SubgramMiddleware
 from middlewares.throttling import ThrottlingMiddleware
 from middlewares.tracing import TracingMiddleware
+from utils.broadcast import broadcaster
+from utils.broker import broker_client
 from utils.commands import set_bot_commands
+from utils.continuations import continuations
+from utils.game_events import game_events
+from utils.maintenance import schedule_maintenance
+from utils.passive_income import passive_income_sweeper
 
 logger = logging.getLogger(__name__)
 
+# Роутеры в порядке регистрации. Модули хендлеров импортируются при сборке
+# Dispatcher, а не при импорте botstar: главному процессу webhook-режима
+# (и скриптам, которым нужен только botstar) они не нужны.
+ROUTERS = (
+    "handlers.subgram_handlers",  # Обработчики подписки (высокий приоритет)
+    "handlers.user_handlers",
+    "handlers.language_handlers",  # Обработчики языков
+    "handlers.menu_handler",
+    "handlers.admin_handlers",
+    "handlers.game_handlers",
+    "handlers.duel_handlers",
+    "handlers.timer_handlers",
+    "handlers.slots_handlers",
+    "handlers.football_handlers",
+    "handlers.bowling_handlers",
+    "handlers.basketball_handlers",
+    "handlers.darts_handlers",
+    "handlers.dice_handlers",
+    "handlers.webapp_handler",
+    # Роутер-ловушка регистрируется ПОСЛЕДНИМ
+    "handlers.debug_handlers",
+)
+
 
-def setup_scheduler(bot: Bot):
+def setup_scheduler(bot: Bot, storage: SQLiteStorage):
     """
     Настраивает и запускает планировщик задач.
     """
     scheduler = AsyncIOScheduler(timezone="Europe/Moscow")
 
+    scheduler.add_job(storage.cleanup_expired, "interval", hours=1)
+    # Проход может занять дольше интервала: новый не запускаем, пока идёт старый
+    scheduler.add_job(
+        passive_income_sweeper.run,
+        "interval",
+        minutes=settings.PASSIVE_INCOME_SWEEP_MINUTES,
+        args=[bot],
+        max_instances=1,
+        coalesce=True,
+    )
+    schedule_maintenance(scheduler)
+
     return scheduler
 
 
@@ -74,6 +97,86 @@ async def on_startup(bot: Bot):
             )
 
 
+def create_bot() -> Bot:
+    return Bot(
+        token=settings.BOT_TOKEN, default=DefaultBotProperties(parse_mode="Markdown")
+    )
+
+
+def create_dispatcher(storage: SQLiteStorage) -> Dispatcher:
+    """
+    Собирает Dispatcher со всеми middleware и роутерами.
+    """
+    dp = Dispatcher(storage=storage)
+
+    # --- ИЗМЕНЕНИЕ: ErrorHandler теперь регистрируется как middleware ---
+    dp.update.outer_middleware(ErrorHandler())
+    dp.update.outer_middleware(TracingMiddleware())
+    dp.update.outer_middleware(LastSeenMiddleware())
+    dp.update.outer_middleware(
+        SubgramMiddleware(enabled=True)
+    )  # Проверка подписки через SubGram включена
+    dp.update.middleware(ThrottlingMiddleware())
+
+    # Регистрируем все роутеры
+    for module_name in ROUTERS:
+        dp.include_router(import_module(module_name).router)
+
+    return dp
+
+
+async def shutdown(bot: Bot, storage: SQLiteStorage, scheduler) -> None:
+    if scheduler is not None:
+        scheduler.shutdown()
+    # Незавершённые рассылки продолжатся после перезапуска
+    await broadcaster.close()
+    # Доигрываем начатые игры и дообрабатываем их события,
+    # пока сессия бота ещё открыта
+    await continuations.close()
+    await game_events.close()
+    await bot.session.close()
+    await storage.close()
+
+
+async def run_worker(index: int):
+    """
+    Рабочий процесс webhook-режима: получает обновления от брокера.
+    Планировщик и рассылки запускает только процесс 0.
+    """
+    setup_logging()
+
+    storage = SQLiteStorage()
+    bot = create_bot()
+    dp = create_dispatcher(storage)
+    primary = index == 0
+    scheduler = setup_scheduler(bot, storage) if primary else None
+
+    try:
+        game_events.start(bot)
+        if primary:
+            scheduler.start()
+            await broadcaster.resume_unfinished(bot)
+            await on_startup(bot)
+        await broker_client.serve(
+            index,
+            settings.BROKER_SOCKET,
+            lambda update: dp.feed_raw_update(bot, update),
+        )
+    finally:
+        await shutdown(bot, storage, scheduler)
+        logger.info("Worker stopped.", extra={"worker": index})
+
+
+def worker_main(index: int):
+    try:
+        asyncio.run(run_worker(index))
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        # Дочерний процесс multiprocessing завершается без atexit
+        stop_logging()
+
+
 async def main():
     """
     Главная функция для запуска бота.
@@ -82,59 +185,35 @@ async def main():
 
     logger.info("Starting bot...")
 
+    # Неполный перевод должен остановить запуск, а не всплыть в обработчике
+    check_lexicon()
     await db.init_db()
 
-    storage = MemoryStorage()
+    if settings.RUN_MODE == "webhook":
+        from utils.cluster import run_cluster
 
-    bot = Bot(
-        token=settings.BOT_TOKEN, default=DefaultBotProperties(parse_mode="Markdown")
-    )
+        await run_cluster(worker_main)
+        return
 
-    dp = Dispatcher(storage=storage)
+    storage = SQLiteStorage()
 
-    scheduler = setup_scheduler(bot)
+    bot = create_bot()
 
-    # --- ИЗМЕНЕНИЕ: ErrorHandler теперь регистрируется как middleware ---
-    dp.update.outer_middleware(ErrorHandler())
-    dp.update.outer_middleware(TracingMiddleware())
-    dp.update.outer_middleware(LastSeenMiddleware())
-    dp.update.outer_middleware(
-        SubgramMiddleware(enabled=True)
-    )  # Проверка подписки через SubGram включена
-    dp.update.middleware(ThrottlingMiddleware())
+    dp = create_dispatcher(storage)
 
-    # Регистрируем все основные роутеры
-    dp.include_router(
-        subgram_handlers.router
-    )  # Обработчики подписки (высокий приоритет)
-    dp.include_router(user_handlers.router)
-    dp.include_router(language_handlers.router)  # Обработчики языков
-    dp.include_router(menu_handler.router)
-    dp.include_router(admin_handlers.router)
-    dp.include_router(game_handlers.router)
-    dp.include_router(duel_handlers.router)
-    dp.include_router(timer_handlers.router)
-    dp.include_router(slots_handlers.router)
-    dp.include_router(football_handlers.router)
-    dp.include_router(bowling_handlers.router)
-    dp.include_router(basketball_handlers.router)
-    dp.include_router(darts_handlers.router)
-    dp.include_router(dice_handlers.router)
-    dp.include_router(webapp_handler.router)
-
-    # --- ИЗМЕНЕНИЕ: Роутер-ловушка регистрируется ПОСЛЕДНИМ ---
-    dp.include_router(debug_handlers.router)
+    scheduler = setup_scheduler(bot, storage)
 
     dp.startup.register(on_startup)
 
     try:
         scheduler.start()
+        game_events.start(bot)
+        await broadcaster.resume_unfinished(bot)
 
         await bot.delete_webhook(drop_pending_updates=True)
         await dp.start_polling(bot)
     finally:
-        await bot.session.close()
-        scheduler.shutdown()
+        await shutdown(bot, storage, scheduler)
         logger.info("Bot stopped.")
 
 
@@ -1,6 +1,6 @@
 # plyusovp/maniacstarsbot/ManiacStarsBot-4df23ef8bd5b8766acddffe6bca30a128458c7a5/config.py
 
-from typing import List
+from typing import Dict, List, Literal
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,6 +24,16 @@ class Settings(BaseSettings):
     WEB_SERVER_HOST: str = "0.0.0.0"  # nosec B104
     WEB_SERVER_PORT: int = 8080
 
+    # --- Webhook и рабочие процессы ---
+    # webhook — главный процесс принимает обновления и раздаёт их рабочим по user_id
+    RUN_MODE: Literal["polling", "webhook"] = "polling"
+    WEBHOOK_URL: str = ""  # Публичный адрес без пути, например https://bot.example.com
+    WEBHOOK_PATH: str = "/webhook"
+    WEBHOOK_SECRET: str = ""  # Проверяется по заголовку X-Telegram-Bot-Api-Secret-Token
+    WEBHOOK_WORKERS: int = 0  # Рабочих процессов; 0 — по числу ядер
+    WEBHOOK_WORKER_MAX_INFLIGHT: int = 200  # Необработанных обновлений на процесс
+    BROKER_SOCKET: str = "maniac_stars_broker.sock"
+
     @field_validator("ADMIN_IDS", mode="before")
     @classmethod
     def split_admin_ids(cls, v: str) -> List[int]:
@@ -44,11 +54,14 @@ class Settings(BaseSettings):
     DUEL_RAKE_PERCENT: int = 10
     DUEL_BOOST_COST: int = 1
     DUEL_REROLL_COST: int = 2
+    DUEL_START_DELAY: float = 2.0  # Пауза между "соперник найден" и первым раундом
+    DUEL_REVEAL_DELAY: float = 4.0  # Сколько показываем итог раунда
     REFERRAL_BONUS: int = 5
     MIN_REFERRALS_FOR_WITHDRAW: int = 5
     DAILY_BONUS_HOURS: int = 24
     DAILY_BONUS_AMOUNT: int = 1
     COINFLIP_RAKE_PERCENT: int = 7
+    PASSIVE_INCOME_REWARD: int = 1  # Звёзд за сутки со ссылкой на бота в био
 
     # --- Настройки вывода ---
     REWARDS_ENABLED: bool = True
@@ -59,6 +72,59 @@ class Settings(BaseSettings):
     # --- Технические настройки ---
     THROTTLING_RATE_LIMIT: float = 0.7
     ADMIN_PAGE_SIZE: int = 5
+    USER_SCAN_BATCH_SIZE: int = 500  # Пачка ID при потоковом обходе users
+
+    # --- Логирование ---
+    # Записи форматирует и пишет в stdout фоновый поток; если очередь
+    # переполнена, новые записи отбрасываются и учитываются в счётчике
+    LOG_QUEUE_SIZE: int = 10_000
+    # Доля сохраняемых записей ниже WARNING по логгерам (вместе с дочерними),
+    # например {"middlewares.metrics": 0.1, "root": 0.5}
+    LOG_SAMPLE_RATES: Dict[str, float] = {}
+
+    # --- SQLite ---
+    # NORMAL в режиме WAL не теряет данные при падении процесса; при отключении
+    # питания могут пропасть только последние транзакции. FULL — fsync на каждый commit
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_CACHE_SIZE_KB: int = 65_536  # Кэш страниц на соединение
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # Байт файла БД, читаемых через mmap
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    SQLITE_WAL_AUTOCHECKPOINT: int = 1000  # Страниц WAL до автоматического checkpoint
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
+    # --- FSM storage ---
+    FSM_DB_NAME: str = "fsm_storage.db"
+    FSM_FLUSH_INTERVAL: float = 0.5  # Как часто сбрасывать изменения на диск (сек)
+    FSM_STATE_TTL_DAYS: int = 7  # Сколько хранить состояния без изменений
+
+    # --- Фоновая обработка завершённых игр ---
+    GAME_EVENT_WORKERS: int = 2
+    GAME_EVENT_BATCH_SIZE: int = 50  # Максимум событий в одной пачке
+    GAME_EVENT_QUEUE_SIZE: int = 10_000
+
+    # --- Рассылки ---
+    BROADCAST_RATE: float = 25  # Сообщений в секунду (глобальный лимит Telegram ~30)
+    BROADCAST_CONCURRENCY: int = 20  # Одновременных запросов к API
+    BROADCAST_CHUNK_SIZE: int = 200  # Получателей в одной пачке из БД
+    BROADCAST_PROGRESS_INTERVAL: float = 5  # Как часто обновлять прогресс (сек)
+
+    # --- Пассивный доход ---
+    PASSIVE_INCOME_SWEEP_MINUTES: int = 10  # Как часто запускать начисление
+    PASSIVE_INCOME_CHECK_RATE: float = 10  # Запросов get_chat в секунду
+    PASSIVE_INCOME_CHECK_CONCURRENCY: int = 10  # Одновременных запросов get_chat
+
+    # --- Обслуживание БД ---
+    MAINTENANCE_HOUR: int = 4  # Час (МСК) для VACUUM и checkpoint, ночью
+    MAINTENANCE_BATCH_SIZE: int = 500  # Строк в одной транзакции удаления
+    MAINTENANCE_BATCH_PAUSE: float = 0.05  # Пауза между транзакциями (сек)
+    MAINTENANCE_VACUUM_STEP_PAGES: int = 1000  # Страниц за шаг incremental_vacuum
+    IDEMPOTENCY_TTL_DAYS: int = 7
+    EARN_COUNTERS_TTL_DAYS: int = 14
+    BROADCAST_DELIVERIES_TTL_DAYS: int = 30
+    GAME_HOLD_REFUND_MINUTES: int = 5  # Через сколько вернуть нерассчитанную ставку
+    LEDGER_HOT_MONTHS: int = 2  # Месяцев истории в ledger_entries, остальное — в архив
+    LEDGER_ARCHIVE_BATCH_SIZE: int = 5000  # Записей ledger за одну транзакцию архивации
+    LEDGER_AUDIT_BATCH_SIZE: int = 50_000  # Строк за один запрос при сверке балансов
 
     # --- Ссылки ---
     URL_CHANNEL: str = "https://t.me/kolostats"
@@ -0,0 +1,286 @@
+# database/achievements.py
+"""
+Движок достижений.
+
+Каталог (таблица achievements) читается один раз, каждому достижению
+присваивается номер бита. Полученные пользователем достижения хранятся
+в LRU-кэше как битовая маска (int), поэтому повторная проверка уже
+полученного достижения не обращается к БД вовсе.
+
+Условия описаны правилами «метрика >= порог». Источник события передаёт
+известные ему значения метрик (новый баланс, стрик, число побед);
+недостающие читаются из БД, и только если по ним ещё есть что получить.
+Все заработанные за событие достижения выдаются одной транзакцией.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional
+
+from aiogram import Bot
+from cachetools import LRUCache
+
+from database import db
+
+logger = logging.getLogger(__name__)
+
+UNLOCKED_CACHE_SIZE = 50_000  # Пользователей с маской в памяти
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    ach_id: str
+    metric: str
+    threshold: int
+    # Второе условие для составных достижений (уровень и число рефералов)
+    also: Optional[tuple[str, int]] = None
+
+    def is_met(self, facts: Mapping[str, int]) -> bool:
+        if facts.get(self.metric, 0) < self.threshold:
+            return False
+        return self.also is None or facts.get(self.also[0], 0) >= self.also[1]
+
+
+RULES = (
+    Rule("level_up_novice", "level", 1, ("total_referrals", 1)),
+    Rule("level_up_pro", "level", 2, ("total_referrals", 10)),
+    Rule("level_up_legend", "level", 3, ("total_referrals", 25)),
+    Rule("level_up_mafia", "level", 4, ("total_referrals", 50)),
+    Rule("social", "referrals", 15),  # Душа компании
+    Rule("legend", "referrals", 50),  # Легенда
+    Rule("promo_master", "promo_codes", 3),  # Магистр промокодов
+    Rule("streak_3", "streak", 3),  # Постоянство
+    Rule("streak_7", "streak", 7),  # Привычка
+    Rule("regular", "streak", 7),  # Завсегдатай
+    Rule("streak_30", "streak", 30),  # Мастер дисциплины
+    Rule("magnate", "balance", 100),  # Магнат
+    Rule("balance_master", "balance", 500),  # Накопитель
+    Rule("game_master", "games_played", len(db.ALL_GAME_TYPES)),  # Мастер игр
+    Rule("first_duel_win", "duel_wins", 1),
+    Rule("duel_warrior", "duel_wins", 5),
+    Rule("duel_master", "duel_wins", 10),
+    Rule("duel_legend", "duel_wins", 25),
+    Rule("daily_challenge_1", "daily_referrals", 1),
+    Rule("daily_challenge_3", "daily_referrals", 3),
+    Rule("daily_challenge_5", "daily_referrals", 5),
+)
+
+
+async def _load_user_row(user_id: int) -> Dict[str, int]:
+    async with db.connect() as conn:
+        cursor = await conn.execute(
+            "SELECT user_level, total_referrals, streak_days, balance, duel_wins "
+            "FROM users WHERE user_id = ?",
+            (user_id,),
+        )
+        row = await cursor.fetchone()
+    if not row:
+        return {}
+    return {
+        "level": row[0] or 0,
+        "total_referrals": row[1] or 0,
+        "streak": row[2] or 0,
+        "balance": row[3] or 0,
+        "duel_wins": row[4] or 0,
+    }
+
+
+async def _load_promo_codes(user_id: int) -> Dict[str, int]:
+    async with db.connect() as conn:
+        cursor = await conn.execute(
+            "SELECT COUNT(DISTINCT code) FROM promo_activations WHERE user_id = ?",
+            (user_id,),
+        )
+        row = await cursor.fetchone()
+    return {"promo_codes": row[0] if row else 0}
+
+
+async def _load_games_played(user_id: int) -> Dict[str, int]:
+    counts = await db.get_played_game_counts([user_id])
+    return {"games_played": counts.get(user_id, 0)}
+
+
+async def _load_referrals(user_id: int) -> Dict[str, int]:
+    return {"referrals": await db.get_referrals_count(user_id)}
+
+
+async def _load_daily_referrals(user_id: int) -> Dict[str, int]:
+    return {"daily_referrals": await db.get_daily_referrals_count(user_id)}
+
+
+# Метрика -> загрузчик; колонки users читаются одним запросом
+FACT_LOADERS = {
+    "level": _load_user_row,
+    "total_referrals": _load_user_row,
+    "streak": _load_user_row,
+    "balance": _load_user_row,
+    "duel_wins": _load_user_row,
+    "promo_codes": _load_promo_codes,
+    "games_played": _load_games_played,
+    "referrals": _load_referrals,
+    "daily_referrals": _load_daily_referrals,
+}
+
+
+class CatalogEntry(NamedTuple):
+    bit: int
+    name: str
+    reward: int
+    description: str
+    rarity: str
+
+
+class AchievementEngine:
+    def __init__(self, cache_size: int = UNLOCKED_CACHE_SIZE) -> None:
+        self._catalog: Optional[Dict[str, CatalogEntry]] = None
+        self._display_order: List[tuple[str, CatalogEntry]] = []
+        self._unlocked: LRUCache = LRUCache(maxsize=cache_size)
+        self._lock = asyncio.Lock()
+        # Растёт при каждом сбросе: по ней сбрасываются производные кэши (страницы меню)
+        self.version = 0
+
+    def reset(self) -> None:
+        """Сбрасывает каталог и маски (после изменения таблицы achievements)."""
+        self._catalog = None
+        self._display_order = []
+        self._unlocked.clear()
+        self.version += 1
+
+    async def catalog(self) -> Dict[str, CatalogEntry]:
+        if self._catalog is None:
+            async with self._lock:
+                if self._catalog is None:
+                    async with db.connect() as conn:
+                        cursor = await conn.execute(
+                            "SELECT id, name, reward, description, rarity "
+                            "FROM achievements ORDER BY id"
+                        )
+                        rows = await cursor.fetchall()
+                    catalog = {
+                        row[0]: CatalogEntry(bit, row[1], row[2], row[3], row[4] or "")
+                        for bit, row in enumerate(rows)
+                    }
+                    # Порядок в меню — как в get_all_achievements: по редкости и названию
+                    self._display_order = sorted(
+                        catalog.items(), key=lambda item: (item[1].rarity, item[1].name)
+                    )
+                    self._catalog = catalog
+        return self._catalog
+
+    async def display_order(self) -> List[tuple[str, CatalogEntry]]:
+        """Достижения в порядке показа в меню: [(id, запись каталога)]."""
+        await self.catalog()
+        return self._display_order
+
+    def _mask(self, catalog: Dict[str, CatalogEntry], ach_ids: Iterable[str]) -> int:
+        mask = 0
+        for ach_id in ach_ids:
+            entry = catalog.get(ach_id)
+            if entry is not None:
+                mask |= 1 << entry.bit
+        return mask
+
+    async def preload(self, user_ids: Iterable[int]) -> None:
+        """Загружает маски нескольких пользователей одним запросом."""
+        missing = [user_id for user_id in user_ids if user_id not in self._unlocked]
+        if not missing:
+            return
+        catalog = await self.catalog()
+        owned = await db.get_owned_achievements(missing, list(catalog))
+        masks = dict.fromkeys(missing, 0)
+        for user_id, ach_id in owned:
+            masks[user_id] |= 1 << catalog[ach_id].bit
+        for user_id, mask in masks.items():
+            self._unlocked[user_id] = mask
+
+    async def unlocked(self, user_id: int) -> int:
+        mask = self._unlocked.get(user_id)
+        if mask is None:
+            await self.preload([user_id])
+            mask = self._unlocked[user_id]
+        return mask
+
+    async def has(self, user_id: int, ach_id: str) -> bool:
+        entry = (await self.catalog()).get(ach_id)
+        return entry is not None and bool(await self.unlocked(user_id) >> entry.bit & 1)
+
+    async def check(
+        self,
+        user_id: int,
+        bot: Optional[Bot],
+        metrics: Iterable[str],
+        facts: Optional[Mapping[str, int]] = None,
+    ) -> List[str]:
+        """
+        Проверяет правила по указанным метрикам и выдаёт заработанное.
+        `facts` — уже известные значения метрик, остальные читаются из БД.
+        """
+        metrics = set(metrics)
+        catalog = await self.catalog()
+        mask = await self.unlocked(user_id)
+        pending = [
+            rule
+            for rule in RULES
+            if rule.metric in metrics
+            and rule.ach_id in catalog
+            and not mask >> catalog[rule.ach_id].bit & 1
+        ]
+        if not pending:
+            return []
+
+        known: Dict[str, int] = dict(facts or {})
+        needed = {rule.metric for rule in pending}
+        needed |= {rule.also[0] for rule in pending if rule.also}
+        for loader in {FACT_LOADERS[m] for m in needed - known.keys()}:
+            for metric, value in (await loader(user_id)).items():
+                known.setdefault(metric, value)
+
+        earned = list(dict.fromkeys(r.ach_id for r in pending if r.is_met(known)))
+        if not earned:
+            return []
+        return await self.grant(user_id, earned, bot)
+
+    async def grant(
+        self, user_id: int, ach_ids: Iterable[str], bot: Optional[Bot]
+    ) -> List[str]:
+        """Выдаёт достижения одной транзакцией; возвращает действительно новые."""
+        catalog = await self.catalog()
+        mask = await self.unlocked(user_id)
+        candidates = [
+            ach_id
+            for ach_id in ach_ids
+            if ach_id in catalog and not mask >> catalog[ach_id].bit & 1
+        ]
+        if not candidates:
+            return []
+
+        granted, balance = await db.grant_achievements(
+            user_id, [(ach_id, catalog[ach_id].reward) for ach_id in candidates]
+        )
+        if balance is None:
+            return []
+        # Не выданные повторно уже были в БД (например, из другого процесса)
+        self._unlocked[user_id] = mask | self._mask(catalog, candidates)
+
+        if bot is not None:
+            for ach_id in granted:
+                entry = catalog[ach_id]
+                try:
+                    await bot.send_message(
+                        user_id,
+                        f"🏆 **Новое достижение!**\nВы открыли: «{entry.name}» (+{entry.reward} ⭐)",
+                    )
+                except Exception:
+                    logger.warning(
+                        "Не удалось уведомить пользователя о достижении",
+                        exc_info=True,
+                        extra={"user_id": user_id},
+                    )
+        if granted:
+            # Награда изменила баланс — проверяем достижения за баланс
+            await self.check(user_id, bot, ("balance",), {"balance": balance})
+        return granted
+
+
+achievement_engine = AchievementEngine()
@@ -1,9 +1,12 @@
 import asyncio
 import datetime
+import json
 import logging
 import secrets  # Используем secrets для более криптографически стойких случайных чисел
 import sqlite3
 import time
+import zlib
+from collections import defaultdict
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 
@@ -16,37 +19,77 @@ from economy import EARN_RULES
 DB_NAME = "maniac_stars.db"
 
 
+def connection_pragmas() -> str:
+    """PRAGMA script applied to every new connection (see SQLITE_* settings)."""
+    return (
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA foreign_keys = ON;"
+        f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS};"
+        f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS};"
+        # Negative cache_size is in KiB rather than pages
+        f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KB};"
+        f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE};"
+        f"PRAGMA temp_store = {settings.SQLITE_TEMP_STORE};"
+        f"PRAGMA wal_autocheckpoint = {settings.SQLITE_WAL_AUTOCHECKPOINT};"
+    )
+
+
 @asynccontextmanager
 async def connect() -> AsyncGenerator[aiosqlite.Connection, None]:
     """Asynchronous context manager for connecting to the DB with PRAGMA settings."""
     db_conn = await aiosqlite.connect(DB_NAME)
     db_conn.row_factory = aiosqlite.Row
-    await db_conn.execute("PRAGMA journal_mode=WAL;")
-    await db_conn.execute("PRAGMA foreign_keys = ON;")
-    await db_conn.execute("PRAGMA busy_timeout = 5000;")
+    # One round trip to the connection thread instead of one per PRAGMA
+    await db_conn.executescript(connection_pragmas())
     try:
         yield db_conn
     finally:
         await db_conn.close()
 
 
+# Write-lock contention seen by _begin_transaction since start (or the last reset)
+lock_stats: Dict[str, float] = {
+    "transactions": 0,
+    "wait_seconds": 0.0,
+    "max_wait_seconds": 0.0,
+    "retries": 0,
+    "locked_failures": 0,
+}
+
+
+def reset_lock_stats() -> None:
+    for key in lock_stats:
+        lock_stats[key] = 0
+
+
 async def _begin_transaction(db: aiosqlite.Connection) -> None:
     """Starts a transaction, retrying if another one is in progress."""
     retries = 5
+    started = time.perf_counter()
     for attempt in range(retries):
         try:
             await db.execute("BEGIN EXCLUSIVE;")
+            waited = time.perf_counter() - started
+            lock_stats["transactions"] += 1
+            lock_stats["wait_seconds"] += waited
+            lock_stats["max_wait_seconds"] = max(lock_stats["max_wait_seconds"], waited)
             return
         except sqlite3.OperationalError as e:
-            if "locked" in str(e).lower() and attempt < retries - 1:
-                await asyncio.sleep(0.01 * (attempt + 1))
-                continue
+            if "locked" in str(e).lower():
+                if attempt < retries - 1:
+                    lock_stats["retries"] += 1
+                    await asyncio.sleep(0.01 * (attempt + 1))
+                    continue
+                lock_stats["locked_failures"] += 1
             raise
 
 
 async def init_db() -> None:
     """Initializes and migrates the database schema."""
     async with connect() as db:
+        # Lets the maintenance job return free pages with incremental_vacuum.
+        # Takes effect immediately only on a new, empty database file.
+        await db.execute("PRAGMA auto_vacuum = INCREMENTAL")
         # --- Idempotency Table ---
         await db.execute(
             """
@@ -289,6 +332,102 @@ async def init_db() -> None:
         )"""
         )
 
+        # --- Game Holds ---
+        # Ставка одиночной игры на дайсе: списана до броска, ждёт расчёта.
+        # Строка, оставшаяся после рестарта, — ставка, которую так и не рассчитали
+        await db.execute(
+            """
+        CREATE TABLE IF NOT EXISTS game_holds (
+            ref_id TEXT PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            stake INTEGER NOT NULL CHECK(stake > 0),
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(user_id) REFERENCES users(user_id) ON DELETE CASCADE
+        )"""
+        )
+
+        # --- Ledger Archive Tables ---
+        # Старые записи ledger_entries переносятся сюда помесячно: сегмент —
+        # сжатый JSON-массив записей одного пользователя за месяц
+        await db.execute(
+            """
+        CREATE TABLE IF NOT EXISTS ledger_archive (
+            user_id INTEGER NOT NULL,
+            month TEXT NOT NULL, -- 'YYYY-MM'
+            first_id INTEGER NOT NULL,
+            last_id INTEGER NOT NULL,
+            entries_count INTEGER NOT NULL,
+            amount_sum INTEGER NOT NULL,
+            entries BLOB NOT NULL,
+            PRIMARY KEY (user_id, month, first_id)
+        ) WITHOUT ROWID"""
+        )
+        # Инкрементальная сверка дочитывает сегменты с last_id больше курсора
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ledger_archive_last_id ON ledger_archive (last_id);"
+        )
+        # Сумма всех заархивированных записей пользователя: баланс по ledger
+        # = balance отсюда + сумма оставшихся в ledger_entries записей
+        await db.execute(
+            """
+        CREATE TABLE IF NOT EXISTS ledger_checkpoints (
+            user_id INTEGER PRIMARY KEY,
+            balance INTEGER NOT NULL DEFAULT 0,
+            archived_through_id INTEGER NOT NULL DEFAULT 0,
+            updated_at INTEGER NOT NULL
+        )"""
+        )
+
+        # Состояние сверки балансов (database/ledger_audit.py): до какой
+        # записи ledger дошла сверка и суммы по пользователям на этот момент
+        await db.execute(
+            """
+        CREATE TABLE IF NOT EXISTS ledger_audit_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            last_entry_id INTEGER NOT NULL DEFAULT 0,
+            updated_at INTEGER NOT NULL
+        )"""
+        )
+        await db.execute(
+            """
+        CREATE TABLE IF NOT EXISTS ledger_audit_sums (
+            user_id INTEGER PRIMARY KEY,
+            amount INTEGER NOT NULL
+        )"""
+        )
+
+        # --- Broadcast Tables ---
+        await db.execute(
+            """
+        CREATE TABLE IF NOT EXISTS broadcasts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            text TEXT NOT NULL,
+            created_by INTEGER,
+            created_at INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'running'
+                CHECK(status IN ('running','done','cancelled')),
+            admin_chat_id INTEGER,
+            progress_message_id INTEGER,
+            last_user_id INTEGER NOT NULL DEFAULT 0,
+            total INTEGER NOT NULL DEFAULT 0,
+            sent INTEGER NOT NULL DEFAULT 0,
+            failed INTEGER NOT NULL DEFAULT 0,
+            blocked INTEGER NOT NULL DEFAULT 0,
+            finished_at INTEGER
+        )"""
+        )
+        await db.execute(
+            """
+        CREATE TABLE IF NOT EXISTS broadcast_deliveries (
+            broadcast_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            status TEXT NOT NULL CHECK(status IN ('sent','failed','blocked')),
+            attempted_at INTEGER NOT NULL,
+            PRIMARY KEY (broadcast_id, user_id),
+            FOREIGN KEY(broadcast_id) REFERENCES broadcasts(id) ON DELETE CASCADE
+        ) WITHOUT ROWID"""
+        )
+
         # --- Migrations and Indexes ---
         cursor = await db.execute("PRAGMA table_info(users)")
         columns = [column[1] for column in await cursor.fetchall()]
@@ -386,6 +525,12 @@ async def init_db() -> None:
             logging.info("Adding language field to users table...")
             await db.execute("ALTER TABLE users ADD COLUMN language TEXT DEFAULT 'ru'")
 
+        if "is_blocked" not in columns:
+            # Пользователь заблокировал бота: рассылки его пропускают
+            await db.execute(
+                "ALTER TABLE users ADD COLUMN is_blocked INTEGER NOT NULL DEFAULT 0"
+            )
+
         # Migration for referrals table
         cursor = await db.execute("PRAGMA table_info(referrals)")
         referrals_columns = [row[1] for row in await cursor.fetchall()]
@@ -438,6 +583,13 @@ async def init_db() -> None:
         await db.execute(
             "CREATE INDEX IF NOT EXISTS idx_duel_players_user ON duel_players(user_id);"
         )
+        # Частичный индекс для обхода пользователей с пассивным доходом:
+        # упорядочен по user_id (keyset-пагинация) и покрывает остальные фильтры
+        await db.execute(
+            """CREATE INDEX IF NOT EXISTS idx_users_passive_income
+               ON users(user_id, last_bio_check_time, last_passive_income_time)
+               WHERE passive_income_enabled = 1;"""
+        )
 
         await db.commit()
     await populate_achievements()
@@ -463,15 +615,161 @@ async def check_idempotency_key(
         return False
 
 
-async def cleanup_old_idempotency_keys(days: int = 7) -> None:
+async def cleanup_old_idempotency_keys(days: int = 7) -> Dict[str, Any]:
     """Deletes old idempotency keys."""
+    # created_at is written by CURRENT_TIMESTAMP (UTC), so compare in SQL
+    report = await delete_in_batches(
+        "idempotency", "created_at < datetime('now', ?)", (f"-{days} days",)
+    )
+    logging.info(f"Deleted {report['deleted']} old idempotency keys.")
+    return report
+
+
+async def delete_in_batches(
+    table: str,
+    where: str,
+    params: tuple = (),
+    key: str = "rowid",
+    batch_size: Optional[int] = None,
+    pause: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Deletes rows matching `where` in short transactions of `batch_size` rows,
+    sleeping `pause` seconds between them so other writers can get the lock.
+    `key` identifies a row: rowid, or the primary key columns of a
+    WITHOUT ROWID table. Returns rows deleted and how long the write lock
+    was held.
+    """
+    batch_size = batch_size or settings.MAINTENANCE_BATCH_SIZE
+    pause = settings.MAINTENANCE_BATCH_PAUSE if pause is None else pause
+    report = {"table": table, "deleted": 0, "batches": 0, "lock_ms": 0.0}
+    max_lock_ms = 0.0
+    while True:
+        async with connect() as db:
+            started = time.perf_counter()
+            await _begin_transaction(db)
+            try:
+                cursor = await db.execute(
+                    f"""DELETE FROM {table} WHERE ({key}) IN (
+                            SELECT {key} FROM {table} WHERE {where} LIMIT ?
+                        )""",
+                    (*params, batch_size),
+                )
+                deleted = cursor.rowcount
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+            lock_ms = (time.perf_counter() - started) * 1000
+        report["deleted"] += deleted
+        report["batches"] += 1
+        report["lock_ms"] += lock_ms
+        max_lock_ms = max(max_lock_ms, lock_ms)
+        if deleted < batch_size:
+            break
+        await asyncio.sleep(pause)
+    report["lock_ms"] = round(report["lock_ms"], 1)
+    report["max_lock_ms"] = round(max_lock_ms, 1)
+    return report
+
+
+async def prune_earn_counters(days: int) -> List[Dict[str, Any]]:
+    """Deletes daily and windowed earn counters older than `days`."""
+    cutoff_day = (datetime.date.today() - datetime.timedelta(days=days)).isoformat()
+    return [
+        await delete_in_batches("earn_counters_daily", "day < ?", (cutoff_day,)),
+        await delete_in_batches(
+            "earn_counters_window",
+            "window_start < datetime('now', ?)",
+            (f"-{days} days",),
+        ),
+    ]
+
+
+async def prune_broadcast_deliveries(days: int) -> Dict[str, Any]:
+    """Deletes delivery rows of broadcasts finished more than `days` ago."""
+    return await delete_in_batches(
+        "broadcast_deliveries",
+        """broadcast_id IN (
+               SELECT id FROM broadcasts
+               WHERE status != 'running' AND finished_at < ?
+           )""",
+        (int(time.time()) - days * 86400,),
+        key="broadcast_id, user_id",  # WITHOUT ROWID
+    )
+
+
+async def run_storage_maintenance() -> Dict[str, Any]:
+    """
+    Returns free pages to the OS with incremental_vacuum (in steps, so each
+    write lock stays short), truncates the WAL and refreshes planner stats.
+    Reports pages reclaimed and how long each step held the database.
+    """
+    report: Dict[str, Any] = {}
     async with connect() as db:
-        cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days)
-        cursor = await db.execute(
-            "DELETE FROM idempotency WHERE created_at < ?", (cutoff_date,)
-        )
-        await db.commit()
-        logging.info(f"Deleted {cursor.rowcount} old idempotency keys.")
+        # PRAGMA results are read with execute_fetchall: a statement left
+        # open on the connection makes checkpoint and VACUUM fail as locked
+        incremental = (await db.execute_fetchall("PRAGMA auto_vacuum"))[0][0] == 2
+        report["incremental_vacuum"] = incremental
+        if not incremental:
+            # Switching needs a full VACUUM that locks the whole file, so it
+            # is never done here: see scripts/enable_incremental_vacuum.py
+            logging.warning(
+                "auto_vacuum is not INCREMENTAL, free pages are not reclaimed; "
+                "run scripts/enable_incremental_vacuum.py during downtime"
+            )
+
+        page_size = (await db.execute_fetchall("PRAGMA page_size"))[0][0]
+        free_before = (await db.execute_fetchall("PRAGMA freelist_count"))[0][0]
+        free_before = free_before if incremental else 0
+        max_step_ms = 0.0
+        while incremental:
+            if (await db.execute_fetchall("PRAGMA freelist_count"))[0][0] == 0:
+                break
+            started = time.perf_counter()
+            await db.execute_fetchall(
+                f"PRAGMA incremental_vacuum({settings.MAINTENANCE_VACUUM_STEP_PAGES})"
+            )
+            max_step_ms = max(max_step_ms, (time.perf_counter() - started) * 1000)
+            await asyncio.sleep(settings.MAINTENANCE_BATCH_PAUSE)
+        report["pages_reclaimed"] = free_before
+        report["bytes_reclaimed"] = free_before * page_size
+        report["vacuum_max_step_ms"] = round(max_step_ms, 1)
+
+        started = time.perf_counter()
+        rows = await db.execute_fetchall("PRAGMA wal_checkpoint(TRUNCATE)")
+        busy, wal_pages, checkpointed = rows[0]
+        report["checkpoint_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        report["checkpoint_busy"] = bool(busy)
+        report["wal_pages_checkpointed"] = max(checkpointed, 0)
+
+        started = time.perf_counter()
+        await db.execute("PRAGMA optimize")
+        report["optimize_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return report
+
+
+async def enable_incremental_vacuum() -> Dict[str, Any]:
+    """
+    One-off migration for files created before auto_vacuum was enabled:
+    switches to INCREMENTAL and rebuilds the file with a full VACUUM.
+    Holds an exclusive lock for the whole rebuild, so run it with the bot
+    stopped. Does nothing if the mode is already INCREMENTAL.
+    """
+    async with connect() as db:
+        if (await db.execute_fetchall("PRAGMA auto_vacuum"))[0][0] == 2:
+            return {"changed": False}
+        pages_before = (await db.execute_fetchall("PRAGMA page_count"))[0][0]
+        started = time.perf_counter()
+        await db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        await db.execute("VACUUM")
+        pages_after = (await db.execute_fetchall("PRAGMA page_count"))[0][0]
+        return {
+            "changed": True,
+            "pages_before": pages_before,
+            "pages_after": pages_after,
+            "vacuum_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
 
 
 async def _change_balance(
@@ -559,6 +857,126 @@ async def spend_balance(
             return False
 
 
+async def hold_game_stake(
+    user_id: int, stake: int, stake_reason: str, ref_id: str
+) -> bool:
+    """
+    Debits a single-player game stake before the outcome is shown and
+    records a hold under ref_id. Returns False if funds are insufficient.
+    """
+    if stake <= 0:
+        return False
+    async with connect() as db:
+        await _begin_transaction(db)
+        try:
+            if not await _change_balance(db, user_id, -stake, stake_reason, ref_id):
+                await db.rollback()
+                return False
+            await db.execute(
+                "INSERT INTO game_holds (ref_id, user_id, stake) VALUES (?, ?, ?)",
+                (ref_id, user_id, stake),
+            )
+            await db.commit()
+            return True
+        except Exception:
+            await db.rollback()
+            logging.error(
+                "Hold game stake transaction failed",
+                exc_info=True,
+                extra={"user_id": user_id, "ref_id": ref_id},
+            )
+            return False
+
+
+async def _release_game_hold(
+    db: aiosqlite.Connection, user_id: int, ref_id: str
+) -> Optional[int]:
+    """Deletes the hold and returns its stake (None if it is already settled)."""
+    cursor = await db.execute(
+        "SELECT stake FROM game_holds WHERE ref_id = ? AND user_id = ?",
+        (ref_id, user_id),
+    )
+    row = await cursor.fetchone()
+    if row is None:
+        return None
+    await db.execute("DELETE FROM game_holds WHERE ref_id = ?", (ref_id,))
+    return row[0]
+
+
+async def settle_game(
+    user_id: int, ref_id: str, payout: int, win_reason: str
+) -> Optional[int]:
+    """
+    Settles a stake held by hold_game_stake: credits the payout and returns
+    the new balance. Returns None if the hold does not exist or was already
+    settled, so a game is never paid twice.
+    """
+    if payout < 0:
+        return None
+    async with connect() as db:
+        await _begin_transaction(db)
+        try:
+            if await _release_game_hold(db, user_id, ref_id) is None:
+                await db.rollback()
+                return None
+            if payout > 0:
+                await _change_balance(db, user_id, payout, win_reason, ref_id)
+            cursor = await db.execute(
+                "SELECT balance FROM users WHERE user_id = ?", (user_id,)
+            )
+            new_balance = (await cursor.fetchone())[0]
+            await db.commit()
+            return new_balance
+        except Exception:
+            await db.rollback()
+            logging.error(
+                "Settle game transaction failed",
+                exc_info=True,
+                extra={"user_id": user_id, "ref_id": ref_id},
+            )
+            return None
+
+
+async def refund_game_stake(user_id: int, ref_id: str, refund_reason: str) -> bool:
+    """Returns a held stake when the game could not be played (no dice sent)."""
+    async with connect() as db:
+        await _begin_transaction(db)
+        try:
+            stake = await _release_game_hold(db, user_id, ref_id)
+            if stake is None:
+                await db.rollback()
+                return False
+            await _change_balance(db, user_id, stake, refund_reason, ref_id)
+            await db.commit()
+            return True
+        except Exception:
+            await db.rollback()
+            logging.error(
+                "Refund game stake transaction failed",
+                exc_info=True,
+                extra={"user_id": user_id, "ref_id": ref_id},
+            )
+            return False
+
+
+async def refund_stale_game_holds(minutes: int) -> Dict[str, Any]:
+    """
+    Refunds holds older than `minutes`: games whose continuation never ran
+    (restart mid-animation, a failed settlement). One transaction per hold.
+    """
+    async with connect() as db:
+        cursor = await db.execute(
+            "SELECT user_id, ref_id FROM game_holds WHERE created_at < datetime('now', ?)",
+            (f"-{minutes} minutes",),
+        )
+        holds = [(row[0], row[1]) for row in await cursor.fetchall()]
+    refunded = 0
+    for user_id, ref_id in holds:
+        if await refund_game_stake(user_id, ref_id, "game_hold_refund"):
+            refunded += 1
+    return {"table": "game_holds", "stale": len(holds), "refunded": refunded}
+
+
 async def add_balance_with_checks(
     user_id: int, amount: int, source: str, ref_id: Optional[str] = None
 ) -> Dict[str, Union[bool, str]]:
@@ -850,6 +1268,11 @@ async def populate_achievements():
         )
         await db.commit()
 
+    from database.achievements import achievement_engine
+
+    # Каталог изменился — маски в кэше построены по старой нумерации битов
+    achievement_engine.reset()
+
 
 async def add_user(
     user_id,
@@ -998,9 +1421,10 @@ async def user_exists(user_id: int) -> bool:
 
 
 async def update_user_last_seen(user_id: int):
+    # Пользователь снова пишет боту — значит, он его разблокировал
     async with connect() as db:
         await db.execute(
-            "UPDATE users SET last_seen = ? WHERE user_id = ?",
+            "UPDATE users SET last_seen = ?, is_blocked = 0 WHERE user_id = ?",
             (int(time.time()), user_id),
         )
         await db.commit()
@@ -1315,171 +1739,92 @@ async def update_streak_and_check_achievements(
         return 0
 
 
-async def grant_achievement(user_id, ach_id, bot: Bot) -> bool:
-    """Награждает пользователя за достижение."""
+async def grant_achievements(
+    user_id: int, achievements: List[tuple]
+) -> tuple[List[str], Optional[int]]:
+    """
+    Grants (achievement_id, reward) pairs in one transaction, skipping the ones
+    the user already has. Returns the newly granted ids and the resulting
+    balance (None if the transaction failed).
+    """
     async with connect() as db:
         try:
-            await db.execute("BEGIN IMMEDIATE;")
-            cursor = await db.execute(
-                "SELECT id FROM user_achievements WHERE user_id = ? AND achievement_id = ?",
-                (user_id, ach_id),
-            )
-            if await cursor.fetchone():
-                await db.rollback()
-                return False
-
+            await _begin_transaction(db)
+            now = int(time.time())
+            granted = []
+            for ach_id, reward in achievements:
+                cursor = await db.execute(
+                    "INSERT OR IGNORE INTO user_achievements (user_id, achievement_id, completion_date) VALUES (?, ?, ?)",
+                    (user_id, ach_id, now),
+                )
+                if cursor.rowcount:
+                    await _change_balance(
+                        db, user_id, reward, "achievement_reward", ach_id
+                    )
+                    granted.append(ach_id)
             cursor = await db.execute(
-                "SELECT name, reward FROM achievements WHERE id = ?", (ach_id,)
-            )
-            details = await cursor.fetchone()
-            if not details:
-                await db.rollback()
-                return False
-
-            ach_name, reward = details
-            await db.execute(
-                "INSERT INTO user_achievements (user_id, achievement_id, completion_date) VALUES (?, ?, ?)",
-                (user_id, ach_id, int(time.time())),
+                "SELECT balance FROM users WHERE user_id = ?", (user_id,)
             )
-            await _change_balance(db, user_id, reward, "achievement_reward", ach_id)
+            row = await cursor.fetchone()
             await db.commit()
-
-            try:
-                await bot.send_message(
-                    user_id,
-                    f"🏆 **Новое достижение!**\nВы открыли: «{ach_name}» (+{reward} ⭐)",
-                )
-            except Exception:
-                logging.warning(
-                    "Не удалось уведомить пользователя о достижении",
-                    exc_info=True,
-                    extra={"user_id": user_id},
-                )
-
-            # Проверяем достижения баланса после начисления награды
-            try:
-                await check_balance_achievements(user_id, bot)
-            except Exception as e:
-                logging.warning(
-                    f"Failed to check balance achievements for user {user_id}: {e}"
-                )
-
-            return True
+            return granted, row[0] if row else 0
         except Exception:
             await db.rollback()
             logging.error(
-                "Error in grant_achievement transaction",
+                "Error in grant_achievements transaction",
                 exc_info=True,
                 extra={"user_id": user_id},
             )
-            return False
+            return [], None
 
 
-async def check_level_achievements(user_id: int, bot: Bot) -> None:
-    """Проверяет и выдает достижения за повышение уровня."""
-    try:
-        # Получаем текущий уровень пользователя
-        async with connect() as db:
-            cursor = await db.execute(
-                "SELECT user_level, total_referrals FROM users WHERE user_id = ?",
-                (user_id,),
-            )
-            row = await cursor.fetchone()
-            if not row:
-                return
+# Проверки достижений выполняет движок database/achievements.py. Он сам
+# импортирует этот модуль, поэтому здесь импорт внутри функций.
 
-            current_level, referrals = row
 
-            # Проверяем достижения по уровню (используем if вместо elif для получения всех подходящих)
-            if current_level >= 1 and referrals >= 1:
-                await grant_achievement(user_id, "level_up_novice", bot)
-            if current_level >= 2 and referrals >= 10:
-                await grant_achievement(user_id, "level_up_pro", bot)
-            if current_level >= 3 and referrals >= 25:
-                await grant_achievement(user_id, "level_up_legend", bot)
-            if current_level >= 4 and referrals >= 50:
-                await grant_achievement(user_id, "level_up_mafia", bot)
-
-    except Exception as e:
-        logging.warning(f"Failed to check level achievements for user {user_id}: {e}")
+async def grant_achievement(user_id, ach_id, bot: Bot) -> bool:
+    """Награждает пользователя за достижение."""
+    from database.achievements import achievement_engine
 
+    return bool(await achievement_engine.grant(user_id, [ach_id], bot))
 
-async def check_referral_achievements(user_id: int, bot: Bot) -> None:
-    """Проверяет достижения связанные с рефералами."""
-    try:
-        referrals_count = await get_referrals_count(user_id)
 
-        # Проверяем достижения по количеству рефералов
-        if referrals_count >= 15:
-            await grant_achievement(user_id, "social", bot)  # Душа компании
-        if referrals_count >= 50:
-            await grant_achievement(user_id, "legend", bot)  # Легенда
+async def _check_achievements(
+    user_id: int, bot: Bot, *metrics: str, facts: Optional[Dict[str, int]] = None
+) -> None:
+    from database.achievements import achievement_engine
 
+    try:
+        await achievement_engine.check(user_id, bot, metrics, facts)
     except Exception as e:
         logging.warning(
-            f"Failed to check referral achievements for user {user_id}: {e}"
+            f"Failed to check {', '.join(metrics)} achievements for user {user_id}: {e}"
         )
 
 
-async def check_promo_achievements(user_id: int, bot: Bot) -> None:
-    """Проверяет достижения связанные с промокодами."""
-    try:
-        async with connect() as db:
-            cursor = await db.execute(
-                "SELECT COUNT(DISTINCT code) FROM promo_activations WHERE user_id = ?",
-                (user_id,),
-            )
-            result = await cursor.fetchone()
-            unique_promos = result[0] if result else 0
+async def check_level_achievements(user_id: int, bot: Bot) -> None:
+    """Проверяет и выдает достижения за повышение уровня."""
+    await _check_achievements(user_id, bot, "level")
 
-            # Проверяем достижение "Магистр промокодов" (3 разных промокода)
-            if unique_promos >= 3:
-                await grant_achievement(user_id, "promo_master", bot)
 
-    except Exception as e:
-        logging.warning(f"Failed to check promo achievements for user {user_id}: {e}")
+async def check_referral_achievements(user_id: int, bot: Bot) -> None:
+    """Проверяет достижения связанные с рефералами."""
+    await _check_achievements(user_id, bot, "referrals")
+
+
+async def check_promo_achievements(user_id: int, bot: Bot) -> None:
+    """Проверяет достижения связанные с промокодами."""
+    await _check_achievements(user_id, bot, "promo_codes")
 
 
 async def check_streak_achievements(user_id: int, bot: Bot) -> None:
     """Проверяет достижения связанные с ежедневными входами."""
-    try:
-        async with connect() as db:
-            cursor = await db.execute(
-                "SELECT streak_days FROM users WHERE user_id = ?", (user_id,)
-            )
-            result = await cursor.fetchone()
-            streak_days = result[0] if result else 0
-
-            # Проверяем достижения по стрику (используем if вместо elif для получения всех подходящих)
-            if streak_days >= 3:
-                await grant_achievement(user_id, "streak_3", bot)  # Постоянство (3 дня)
-            if streak_days >= 7:
-                await grant_achievement(user_id, "streak_7", bot)  # Привычка (7 дней)
-                await grant_achievement(user_id, "regular", bot)  # Завсегдатай (7 дней)
-            if streak_days >= 30:
-                await grant_achievement(
-                    user_id, "streak_30", bot
-                )  # Мастер дисциплины (30 дней)
-
-    except Exception as e:
-        logging.warning(f"Failed to check streak achievements for user {user_id}: {e}")
+    await _check_achievements(user_id, bot, "streak")
 
 
 async def check_balance_achievements(user_id: int, bot: Bot) -> None:
     """Проверяет достижения связанные с балансом."""
-    try:
-        balance = await get_user_balance(user_id)
-
-        # Проверяем достижения по балансу (используем if вместо elif для получения всех подходящих)
-        if balance >= 100:
-            await grant_achievement(user_id, "magnate", bot)  # Магнат (100+ звезд)
-        if balance >= 500:
-            await grant_achievement(
-                user_id, "balance_master", bot
-            )  # Накопитель (500+ звезд)
-
-    except Exception as e:
-        logging.warning(f"Failed to check balance achievements for user {user_id}: {e}")
+    await _check_achievements(user_id, bot, "balance")
 
 
 async def record_game_play(user_id: int, game_type: str) -> None:
@@ -1504,64 +1849,86 @@ async def record_game_play(user_id: int, game_type: str) -> None:
         )
 
 
-async def check_game_achievements(user_id: int, bot: Bot) -> None:
-    """Проверяет достижения связанные с играми."""
+async def record_game_plays(plays: list[tuple[int, str]]) -> None:
+    """Пакетная версия record_game_play: все пары (user_id, game_type) одной транзакцией."""
+    if not plays:
+        return
+    now = int(time.time())
     try:
-        # Список всех доступных игр
-        available_games = [
-            "duel",
-            "coinflip",
-            "slots",
-            "dice",
-            "bowling",
-            "basketball",
-            "football",
-            "darts",
-            "timer",
-        ]
-
-        # Получаем игры, в которые играл пользователь
         async with connect() as db:
-            cursor = await db.execute(
-                "SELECT DISTINCT game_type FROM game_plays WHERE user_id = ?",
-                (user_id,),
+            await db.executemany(
+                "INSERT OR IGNORE INTO game_plays (user_id, game_type, played_at) VALUES (?, ?, ?)",
+                [(user_id, game_type, now) for user_id, game_type in plays],
             )
-            played_games = [row[0] for row in await cursor.fetchall()]
-
-            # Проверяем, играл ли пользователь во все доступные игры
-            if len(played_games) >= len(available_games):
-                await grant_achievement(user_id, "game_master", bot)
-
+            await db.commit()
     except Exception as e:
-        logging.warning(f"Failed to check game achievements for user {user_id}: {e}")
+        logging.warning(f"Failed to record {len(plays)} game plays: {e}")
 
 
-async def check_all_achievements(user_id: int, bot: Bot) -> None:
-    """Проверяет все возможные достижения для пользователя."""
-    try:
-        # Проверяем достижения уровней
-        await check_level_achievements(user_id, bot)
+async def get_played_game_counts(user_ids: list[int]) -> dict[int, int]:
+    """Сколько разных игр попробовал каждый из пользователей."""
+    if not user_ids:
+        return {}
+    placeholders = ",".join("?" * len(user_ids))
+    async with connect() as db:
+        cursor = await db.execute(
+            f"SELECT user_id, COUNT(DISTINCT game_type) FROM game_plays "
+            f"WHERE user_id IN ({placeholders}) GROUP BY user_id",
+            user_ids,
+        )
+        return {row[0]: row[1] for row in await cursor.fetchall()}
 
-        # Проверяем достижения рефералов
-        await check_referral_achievements(user_id, bot)
 
-        # Проверяем достижения промокодов
-        await check_promo_achievements(user_id, bot)
+async def get_owned_achievements(
+    user_ids: list[int], achievement_ids: list[str]
+) -> set[tuple[int, str]]:
+    """Какие из указанных достижений уже есть у пользователей: {(user_id, achievement_id)}."""
+    if not user_ids or not achievement_ids:
+        return set()
+    user_placeholders = ",".join("?" * len(user_ids))
+    ach_placeholders = ",".join("?" * len(achievement_ids))
+    async with connect() as db:
+        cursor = await db.execute(
+            f"SELECT user_id, achievement_id FROM user_achievements "
+            f"WHERE user_id IN ({user_placeholders}) AND achievement_id IN ({ach_placeholders})",
+            [*user_ids, *achievement_ids],
+        )
+        return {(row[0], row[1]) for row in await cursor.fetchall()}
 
-        # Проверяем достижения стрика
-        await check_streak_achievements(user_id, bot)
 
-        # Проверяем достижения баланса
-        await check_balance_achievements(user_id, bot)
+# Список всех доступных игр (для достижения "Мастер игр")
+ALL_GAME_TYPES = (
+    "duel",
+    "coinflip",
+    "slots",
+    "dice",
+    "bowling",
+    "basketball",
+    "football",
+    "darts",
+    "timer",
+)
 
-        # Проверяем достижения игр
-        await check_game_achievements(user_id, bot)
 
-        # Проверяем ежедневные челленджи
-        await check_daily_challenges(user_id, bot)
+async def check_game_achievements(user_id: int, bot: Bot) -> None:
+    """Проверяет достижения связанные с играми."""
+    await _check_achievements(user_id, bot, "games_played", "duel_wins")
 
-    except Exception as e:
-        logging.warning(f"Failed to check achievements for user {user_id}: {e}")
+
+async def check_all_achievements(user_id: int, bot: Bot) -> None:
+    """Проверяет все возможные достижения для пользователя."""
+    await _check_achievements(
+        user_id,
+        bot,
+        "level",
+        "referrals",
+        "promo_codes",
+        "streak",
+        "balance",
+        "games_played",
+        "duel_wins",
+        "daily_referrals",
+    )
 
 
 async def create_duel(p1_id: int, p2_id: int, stake: int) -> Optional[int]:
@@ -1784,6 +2151,19 @@ async def get_user_duel_stats(user_id: int):
         )
 
 
+async def get_duel_wins(user_ids: list[int]) -> dict[int, int]:
+    """Число побед в дуэлях для нескольких пользователей одним запросом."""
+    if not user_ids:
+        return {}
+    placeholders = ",".join("?" * len(user_ids))
+    async with connect() as db:
+        cursor = await db.execute(
+            f"SELECT user_id, duel_wins FROM users WHERE user_id IN ({placeholders})",
+            user_ids,
+        )
+        return {row[0]: row[1] for row in await cursor.fetchall()}
+
+
 async def get_all_active_duels():
     async with connect() as db:
         cursor = await db.execute("SELECT id FROM duel_matches WHERE state = 'active'")
@@ -1819,6 +2199,168 @@ async def get_all_users() -> List[int]:
         return [row[0] for row in await cursor.fetchall()]
 
 
+async def _iter_user_ids(
+    where: str, params: tuple, batch_size: Optional[int]
+) -> AsyncGenerator[List[int], None]:
+    """
+    Обходит users пачками по возрастанию user_id (keyset-пагинация).
+    Каждая пачка читается отдельным коротким запросом, поэтому память
+    не зависит от числа пользователей, а запись в БД между пачками
+    не блокируется долгим чтением.
+    """
+    batch_size = batch_size or settings.USER_SCAN_BATCH_SIZE
+    last_user_id = 0
+    while True:
+        async with connect() as db:
+            cursor = await db.execute(
+                f"""SELECT user_id FROM users
+                    WHERE user_id > ? AND ({where})
+                    ORDER BY user_id LIMIT ?""",
+                (last_user_id, *params, batch_size),
+            )
+            batch = [row[0] for row in await cursor.fetchall()]
+        if not batch:
+            return
+        yield batch
+        if len(batch) < batch_size:
+            return
+        last_user_id = batch[-1]
+
+
+def iter_all_users(
+    batch_size: Optional[int] = None,
+) -> AsyncGenerator[List[int], None]:
+    """Потоковый вариант get_all_users: отдаёт ID пачками."""
+    return _iter_user_ids("1", (), batch_size)
+
+
+# --- Рассылки ---
+
+
+async def create_broadcast(
+    text: str, created_by: int, admin_chat_id: int, progress_message_id: int
+) -> int:
+    """Создаёт рассылку и возвращает её id. total — число незаблокированных пользователей."""
+    async with connect() as db:
+        cursor = await db.execute("SELECT COUNT(*) FROM users WHERE is_blocked = 0")
+        total = (await cursor.fetchone())[0]
+        cursor = await db.execute(
+            """INSERT INTO broadcasts
+               (text, created_by, created_at, admin_chat_id, progress_message_id, total)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (
+                text,
+                created_by,
+                int(time.time()),
+                admin_chat_id,
+                progress_message_id,
+                total,
+            ),
+        )
+        await db.commit()
+        return cursor.lastrowid
+
+
+async def get_broadcast(broadcast_id: int) -> Optional[Dict[str, Any]]:
+    async with connect() as db:
+        cursor = await db.execute(
+            "SELECT * FROM broadcasts WHERE id = ?", (broadcast_id,)
+        )
+        row = await cursor.fetchone()
+        return dict(row) if row else None
+
+
+async def get_running_broadcasts() -> List[Dict[str, Any]]:
+    """Рассылки, прерванные перезапуском бота."""
+    async with connect() as db:
+        cursor = await db.execute(
+            "SELECT * FROM broadcasts WHERE status = 'running' ORDER BY id"
+        )
+        return [dict(row) for row in await cursor.fetchall()]
+
+
+async def get_broadcast_recipients(
+    broadcast_id: int, after_user_id: int, limit: int
+) -> List[int]:
+    """
+    Следующая пачка получателей по возрастанию user_id (keyset-пагинация).
+    Заблокировавшие бота и уже обработанные в этой рассылке пропускаются.
+    """
+    async with connect() as db:
+        cursor = await db.execute(
+            """SELECT user_id FROM users
+               WHERE user_id > ? AND is_blocked = 0
+                 AND user_id NOT IN (
+                     SELECT user_id FROM broadcast_deliveries WHERE broadcast_id = ?
+                 )
+               ORDER BY user_id LIMIT ?""",
+            (after_user_id, broadcast_id, limit),
+        )
+        return [row[0] for row in await cursor.fetchall()]
+
+
+async def record_broadcast_chunk(
+    broadcast_id: int, results: List[tuple], last_user_id: int
+) -> Optional[str]:
+    """
+    Сохраняет статусы доставки пачки, сдвигает курсор рассылки и помечает
+    заблокировавших бота пользователей — всё одной транзакцией.
+    results: [(user_id, 'sent' | 'failed' | 'blocked'), ...]
+    Возвращает текущий статус рассылки: её могли остановить из другого воркера.
+    """
+    now = int(time.time())
+    counts = {"sent": 0, "failed": 0, "blocked": 0}
+    for _, status in results:
+        counts[status] += 1
+    blocked = [(user_id,) for user_id, status in results if status == "blocked"]
+    async with connect() as db:
+        await _begin_transaction(db)
+        try:
+            await db.executemany(
+                """INSERT OR REPLACE INTO broadcast_deliveries
+                   (broadcast_id, user_id, status, attempted_at) VALUES (?, ?, ?, ?)""",
+                [(broadcast_id, user_id, status, now) for user_id, status in results],
+            )
+            if blocked:
+                await db.executemany(
+                    "UPDATE users SET is_blocked = 1 WHERE user_id = ?", blocked
+                )
+            await db.execute(
+                """UPDATE broadcasts
+                   SET last_user_id = MAX(last_user_id, ?),
+                       sent = sent + ?, failed = failed + ?, blocked = blocked + ?
+                   WHERE id = ?""",
+                (
+                    last_user_id,
+                    counts["sent"],
+                    counts["failed"],
+                    counts["blocked"],
+                    broadcast_id,
+                ),
+            )
+            cursor = await db.execute(
+                "SELECT status FROM broadcasts WHERE id = ?", (broadcast_id,)
+            )
+            row = await cursor.fetchone()
+            await db.commit()
+            return row[0] if row else None
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def finish_broadcast(broadcast_id: int, status: str = "done") -> bool:
+    """Завершает идущую рассылку. False — если она уже была завершена."""
+    async with connect() as db:
+        cursor = await db.execute(
+            """UPDATE broadcasts SET status = ?, finished_at = ?
+               WHERE id = ? AND status = 'running'""",
+            (status, int(time.time()), broadcast_id),
+        )
+        await db.commit()
+        return cursor.rowcount > 0
+
+
 async def get_user_by_username(username: str) -> Union[int, None]:
     async with connect() as db:
         cursor = await db.execute(
@@ -1840,6 +2382,25 @@ async def add_promo_code(name, reward, uses):
 # --- PASSIVE INCOME FUNCTIONS ---
 
 
+def bio_has_bot_link(bio: Optional[str], bot_username: str) -> bool:
+    """Есть ли в тексте био ссылка на бота."""
+    if not bio:
+        return False
+
+    bio = bio.lower()
+    bot_username_lower = bot_username.lower()
+
+    # Проверяем различные варианты ссылок на бота
+    possible_links = [
+        f"t.me/{bot_username_lower}",
+        f"telegram.me/{bot_username_lower}",
+        f"@{bot_username_lower}",
+        bot_username_lower,
+    ]
+
+    return any(link in bio for link in possible_links)
+
+
 async def check_user_bio_for_bot_link(
     bot: Bot, user_id: int, bot_username: str
 ) -> bool:
@@ -1851,21 +2412,7 @@ async def check_user_bio_for_bot_link(
         # Получаем информацию о пользователе
         user_profile = await bot.get_chat(user_id)
 
-        if not user_profile.bio:
-            return False
-
-        bio = user_profile.bio.lower()
-        bot_username_lower = bot_username.lower()
-
-        # Проверяем различные варианты ссылок на бота
-        possible_links = [
-            f"t.me/{bot_username_lower}",
-            f"telegram.me/{bot_username_lower}",
-            f"@{bot_username_lower}",
-            bot_username_lower,
-        ]
-
-        return any(link in bio for link in possible_links)
+        return bio_has_bot_link(user_profile.bio, bot_username)
 
     except Exception as e:
         logging.warning(
@@ -1948,8 +2495,7 @@ async def get_passive_income_reward(user_id: int) -> Dict[str, Any]:
                 (current_time, user_id),
             )
 
-            # Начисляем 1 звезду
-            reward = 1
+            reward = settings.PASSIVE_INCOME_REWARD
             if not await _change_balance(db, user_id, reward, "passive_income"):
                 await db.rollback()
                 return {"status": "error", "reason": "balance_update_failed"}
@@ -1967,6 +2513,81 @@ async def get_passive_income_reward(user_id: int) -> Dict[str, Any]:
             return {"status": "error", "reason": "transaction_failed"}
 
 
+async def apply_passive_income_checks(
+    verdicts: List[tuple], ref_id: Optional[str] = None
+) -> Dict[int, int]:
+    """
+    Сохраняет результаты проверки био пачки пользователей одной транзакцией.
+    verdicts: [(user_id, has_link), ...], has_link None — био недоступно
+
+    Всем проверенным обновляется last_bio_check_time (до истечения окна
+    проверки их не будут проверять снова), в том числе тем, чьё био
+    недоступно: им ничего не начисляется и не отключается. Убравшим ссылку
+    пассивный доход отключается, остальным начисляется PASSIVE_INCOME_REWARD,
+    если с прошлого начисления прошло 24 часа. Возвращает {user_id: время
+    прошлого начисления} для пользователей, получивших награду.
+    """
+    if not verdicts:
+        return {}
+    current_time = int(time.time())
+    income_limit = current_time - (24 * 3600)
+    reward = settings.PASSIVE_INCOME_REWARD
+    with_link = [user_id for user_id, has_link in verdicts if has_link]
+    without_link = [(user_id,) for user_id, has_link in verdicts if has_link is False]
+
+    async with connect() as db:
+        await _begin_transaction(db)
+        try:
+            await db.executemany(
+                "UPDATE users SET last_bio_check_time = ? WHERE user_id = ?",
+                [(current_time, user_id) for user_id, _ in verdicts],
+            )
+            if without_link:
+                await db.executemany(
+                    "UPDATE users SET passive_income_enabled = 0 WHERE user_id = ?",
+                    without_link,
+                )
+
+            credited: Dict[int, int] = {}
+            if with_link:
+                # Условия перепроверяются внутри транзакции: пользователь мог
+                # отключить доход или получить начисление после выборки
+                placeholders = ",".join("?" * len(with_link))
+                cursor = await db.execute(
+                    f"""SELECT user_id, last_passive_income_time FROM users
+                        WHERE user_id IN ({placeholders})
+                          AND passive_income_enabled = 1
+                          AND (last_passive_income_time < ?
+                               OR last_passive_income_time IS NULL)""",
+                    (*with_link, income_limit),
+                )
+                credited = {row[0]: row[1] or 0 for row in await cursor.fetchall()}
+            if credited:
+                await db.executemany(
+                    """UPDATE users SET balance = balance + ?,
+                                        last_passive_income_time = ?
+                       WHERE user_id = ?""",
+                    [(reward, current_time, user_id) for user_id in credited],
+                )
+                await db.executemany(
+                    "INSERT INTO ledger_entries (user_id, amount, reason, ref_id) VALUES (?, ?, ?, ?)",
+                    [
+                        (user_id, reward, "passive_income", ref_id)
+                        for user_id in credited
+                    ],
+                )
+            await db.commit()
+            return credited
+        except Exception:
+            await db.rollback()
+            logging.error(
+                "Error in apply_passive_income_checks",
+                exc_info=True,
+                extra={"users": len(verdicts)},
+            )
+            return {}
+
+
 async def get_users_for_passive_income_check() -> List[int]:
     """
     Возвращает список пользователей, которых нужно проверить на пассивный доход.
@@ -1975,21 +2596,27 @@ async def get_users_for_passive_income_check() -> List[int]:
     2. Прошло более 24 часов с последнего получения
     3. Прошло более 30 минут с последней проверки био (для более быстрой реакции)
     """
+    return [
+        user_id
+        async for batch in iter_users_for_passive_income_check()
+        for user_id in batch
+    ]
+
+
+def iter_users_for_passive_income_check(
+    batch_size: Optional[int] = None,
+) -> AsyncGenerator[List[int], None]:
+    """Потоковый вариант get_users_for_passive_income_check."""
     current_time = int(time.time())
     check_limit = current_time - (30 * 60)  # 30 минут с последней проверки био
     income_limit = current_time - (24 * 3600)  # 24 часа с последнего дохода
-
-    async with connect() as db:
-        cursor = await db.execute(
-            """
-            SELECT user_id FROM users
-            WHERE passive_income_enabled = 1
-            AND (last_passive_income_time < ? OR last_passive_income_time IS NULL)
-            AND (last_bio_check_time < ? OR last_bio_check_time IS NULL)
-            """,
-            (income_limit, check_limit),
-        )
-        return [row[0] for row in await cursor.fetchall()]
+    return _iter_user_ids(
+        """passive_income_enabled = 1
+           AND (last_passive_income_time < ? OR last_passive_income_time IS NULL)
+           AND (last_bio_check_time < ? OR last_bio_check_time IS NULL)""",
+        (income_limit, check_limit),
+        batch_size,
+    )
 
 
 async def get_active_promos():
@@ -2005,13 +2632,17 @@ async def get_users_for_notification() -> List[int]:
     Возвращает ID пользователей, которые не забирали
     ежедневный бонус более 24 часов.
     """
-    async with connect() as db:
-        day_ago = int(time.time()) - 86400  # 24 часа в секундах
-        cursor = await db.execute(
-            "SELECT user_id FROM users WHERE last_bonus_time < ?",
-            (day_ago,),
-        )
-        return [row[0] for row in await cursor.fetchall()]
+    return [
+        user_id async for batch in iter_users_for_notification() for user_id in batch
+    ]
+
+
+def iter_users_for_notification(
+    batch_size: Optional[int] = None,
+) -> AsyncGenerator[List[int], None]:
+    """Потоковый вариант get_users_for_notification."""
+    day_ago = int(time.time()) - 86400  # 24 часа в секундах
+    return _iter_user_ids("last_bonus_time < ?", (day_ago,), batch_size)
 
 
 async def get_all_achievements():
@@ -2131,6 +2762,162 @@ async def get_reward_full_details(reward_id: int) -> Optional[dict]:
         }
 
 
+# --- Архив ledger ---
+
+_ARCHIVE_FIELDS = ("id", "amount", "currency", "reason", "ref_id", "created_at")
+
+
+def _pack_ledger_entries(rows: List[tuple]) -> bytes:
+    return zlib.compress(json.dumps(rows, separators=(",", ":")).encode(), 9)
+
+
+def _unpack_ledger_entries(blob: bytes) -> List[dict]:
+    return [
+        dict(zip(_ARCHIVE_FIELDS, row, strict=True))
+        for row in json.loads(zlib.decompress(blob))
+    ]
+
+
+def ledger_archive_cutoff(hot_months: int) -> str:
+    """
+    Начало самого старого месяца, который остаётся в ledger_entries
+    (created_at хранится в UTC как 'YYYY-MM-DD HH:MM:SS').
+    """
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    month_index = today.year * 12 + today.month - 1 - (hot_months - 1)
+    year, month = divmod(month_index, 12)
+    return f"{year:04d}-{month + 1:02d}-01 00:00:00"
+
+
+async def archive_ledger_entries(
+    cutoff: str, batch_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Переносит записи ledger_entries старше cutoff в ledger_archive.
+
+    Записи обрабатываются пачками по id, каждая пачка — отдельная короткая
+    транзакция: сегменты архива и чекпоинты балансов пишутся в той же
+    транзакции, что и удаление из ledger_entries, поэтому сумма по ledger
+    для пользователя не меняется ни в какой момент.
+    """
+    batch_size = batch_size or settings.LEDGER_ARCHIVE_BATCH_SIZE
+    report = {"archived": 0, "segments": 0, "batches": 0, "bytes": 0}
+    while True:
+        async with connect() as db:
+            await _begin_transaction(db)
+            try:
+                cursor = await db.execute(
+                    f"""SELECT user_id, {", ".join(_ARCHIVE_FIELDS)}
+                        FROM ledger_entries WHERE created_at < ?
+                        ORDER BY id LIMIT ?""",
+                    (cutoff, batch_size),
+                )
+                rows = await cursor.fetchall()
+                if not rows:
+                    await db.rollback()
+                    break
+
+                segments: Dict[tuple, List[tuple]] = defaultdict(list)
+                for row in rows:
+                    segments[(row[0], str(row["created_at"])[:7])].append(
+                        tuple(row)[1:]
+                    )
+
+                archive_rows = []
+                checkpoints: Dict[int, List[int]] = {}
+                for (user_id, month), entries in segments.items():
+                    blob = _pack_ledger_entries(entries)
+                    amount_sum = sum(entry[1] for entry in entries)
+                    archive_rows.append(
+                        (
+                            user_id,
+                            month,
+                            entries[0][0],
+                            entries[-1][0],
+                            len(entries),
+                            amount_sum,
+                            blob,
+                        )
+                    )
+                    report["bytes"] += len(blob)
+                    checkpoint = checkpoints.setdefault(user_id, [0, 0])
+                    checkpoint[0] += amount_sum
+                    checkpoint[1] = max(checkpoint[1], entries[-1][0])
+
+                await db.executemany(
+                    """INSERT INTO ledger_archive
+                       (user_id, month, first_id, last_id, entries_count,
+                        amount_sum, entries)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    archive_rows,
+                )
+                now = int(time.time())
+                await db.executemany(
+                    """INSERT INTO ledger_checkpoints
+                       (user_id, balance, archived_through_id, updated_at)
+                       VALUES (?, ?, ?, ?)
+                       ON CONFLICT(user_id) DO UPDATE SET
+                           balance = balance + excluded.balance,
+                           archived_through_id = MAX(
+                               archived_through_id, excluded.archived_through_id
+                           ),
+                           updated_at = excluded.updated_at""",
+                    [
+                        (user_id, amount, last_id, now)
+                        for user_id, (amount, last_id) in checkpoints.items()
+                    ],
+                )
+                await db.executemany(
+                    "DELETE FROM ledger_entries WHERE id = ?",
+                    [(row["id"],) for row in rows],
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                logging.error(
+                    "Error in archive_ledger_entries",
+                    exc_info=True,
+                    extra={"cutoff": cutoff},
+                )
+                raise
+        report["archived"] += len(rows)
+        report["segments"] += len(archive_rows)
+        report["batches"] += 1
+        if len(rows) < batch_size:
+            break
+        await asyncio.sleep(settings.MAINTENANCE_BATCH_PAUSE)
+    return report
+
+
+async def get_ledger_checkpoint(user_id: int) -> Dict[str, int]:
+    async with connect() as db:
+        cursor = await db.execute(
+            """SELECT balance, archived_through_id FROM ledger_checkpoints
+               WHERE user_id = ?""",
+            (user_id,),
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return {"balance": 0, "archived_through_id": 0}
+        return dict(row)
+
+
+async def get_archived_ledger(user_id: int, month: Optional[str] = None) -> List[dict]:
+    """Заархивированные записи пользователя (за месяц 'YYYY-MM' или все)."""
+    query = "SELECT entries FROM ledger_archive WHERE user_id = ?"
+    params: tuple = (user_id,)
+    if month:
+        query += " AND month = ?"
+        params += (month,)
+    async with connect() as db:
+        cursor = await db.execute(query + " ORDER BY first_id", params)
+        return [
+            entry
+            for row in await cursor.fetchall()
+            for entry in _unpack_ledger_entries(row[0])
+        ]
+
+
 async def get_user_transactions_history(user_id: int, limit: int = 20) -> List[dict]:
     """Получает историю транзакций пользователя."""
     async with connect() as db:
@@ -2207,12 +2994,12 @@ async def update_user_level(user_id: int, referrals: int, bot: Bot = None) -> bo
 
             # Проверяем достижения за повышение уровня (вне транзакции)
             if new_level > current_level and bot:
-                try:
-                    await check_level_achievements(user_id, bot)
-                except Exception as e:
-                    logging.warning(
-                        f"Failed to check level achievements for user {user_id}: {e}"
-                    )
+                await _check_achievements(
+                    user_id,
+                    bot,
+                    "level",
+                    facts={"level": new_level, "total_referrals": referrals},
+                )
 
             return new_level > current_level
 
@@ -2288,12 +3075,9 @@ async def update_user_streak(user_id: int, bot: Bot = None) -> bool:
 
             # Проверяем достижения стрика после обновления
             if bot:
-                try:
-                    await check_streak_achievements(user_id, bot)
-                except Exception as e:
-                    logging.warning(
-                        f"Failed to check streak achievements for user {user_id}: {e}"
-                    )
+                await _check_achievements(
+                    user_id, bot, "streak", facts={"streak": new_streak}
+                )
 
             return streak_bonus > 0
 
@@ -2322,62 +3106,16 @@ async def get_daily_referrals_count(user_id: int) -> int:
 
 async def check_daily_challenges(user_id: int, bot: Bot = None) -> List[str]:
     """Проверяет и выдает достижения за ежедневные челленджи."""
-    async with connect() as db:
-        try:
-            await db.execute("BEGIN IMMEDIATE;")
-
-            today_referrals = await get_daily_referrals_count(user_id)
-            completed_challenges = []
-
-            # Проверяем челленджи (одноразовые достижения)
-            if today_referrals >= 1:
-                # Проверяем, не получил ли уже достижение
-                cursor = await db.execute(
-                    "SELECT COUNT(*) FROM user_achievements WHERE user_id = ? AND achievement_id = 'daily_challenge_1'",
-                    (user_id,),
-                )
-                result = await cursor.fetchone()
-                if not (result and result[0]):
-                    completed_challenges.append("daily_challenge_1")
-
-            if today_referrals >= 3:
-                cursor = await db.execute(
-                    "SELECT COUNT(*) FROM user_achievements WHERE user_id = ? AND achievement_id = 'daily_challenge_3'",
-                    (user_id,),
-                )
-                result = await cursor.fetchone()
-                if not (result and result[0]):
-                    completed_challenges.append("daily_challenge_3")
-
-            if today_referrals >= 5:
-                cursor = await db.execute(
-                    "SELECT COUNT(*) FROM user_achievements WHERE user_id = ? AND achievement_id = 'daily_challenge_5'",
-                    (user_id,),
-                )
-                result = await cursor.fetchone()
-                if not (result and result[0]):
-                    completed_challenges.append("daily_challenge_5")
-
-            await db.commit()
+    if not bot:
+        # Как и раньше, без бота челленджи не выдаются
+        return []
+    from database.achievements import achievement_engine
 
-            # Выдаем достижения вне транзакции (это автоматически начислит баланс через grant_achievement)
-            if bot and completed_challenges:
-                for challenge in completed_challenges:
-                    if challenge == "daily_challenge_1":
-                        await grant_achievement(user_id, "daily_challenge_1", bot)
-                    elif challenge == "daily_challenge_3":
-                        await grant_achievement(user_id, "daily_challenge_3", bot)
-                    elif challenge == "daily_challenge_5":
-                        await grant_achievement(user_id, "daily_challenge_5", bot)
-
-            return completed_challenges
-
-        except Exception:
-            await db.rollback()
-            logging.error(
-                f"Error checking daily challenges for {user_id}", exc_info=True
-            )
-            return []
+    try:
+        return await achievement_engine.check(user_id, bot, ("daily_referrals",))
+    except Exception:
+        logging.error(f"Error checking daily challenges for {user_id}", exc_info=True)
+        return []
 
 
 async def get_pending_rewards(page: int = 1, limit: int = 5) -> List[dict]:
@@ -2518,6 +3256,18 @@ async def get_user_language(user_id: int) -> str:
         return row[0] if row and row[0] else "ru"
 
 
+async def get_balance_and_language(user_id: int) -> tuple[int, str]:
+    """Баланс и язык пользователя одним запросом."""
+    async with connect() as db:
+        cursor = await db.execute(
+            "SELECT balance, language FROM users WHERE user_id = ?", (user_id,)
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return 0, "ru"
+        return row[0], row[1] or "ru"
+
+
 async def set_user_language(user_id: int, language: str) -> bool:
     """Устанавливает язык пользователя."""
     if language not in ["ru", "en", "uk", "es"]:
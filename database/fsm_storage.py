@@ -0,0 +1,227 @@
+# database/fsm_storage.py
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import aiosqlite
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import (
+    BaseStorage,
+    DefaultKeyBuilder,
+    KeyBuilder,
+    StateType,
+    StorageKey,
+)
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _StateRecord:
+    state: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    updated_at: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return self.state is None and not self.data
+
+
+class SQLiteStorage(BaseStorage):
+    """
+    FSM storage на SQLite, переживающий перезапуск бота.
+
+    Чтение и запись идут через кеш в памяти, поэтому горячие ключи
+    обслуживаются так же быстро, как в MemoryStorage. Изменённые ключи
+    копятся в буфере и записываются одной транзакцией раз в
+    `flush_interval` секунд (и при закрытии хранилища).
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        flush_interval: Optional[float] = None,
+        state_ttl_days: Optional[int] = None,
+        key_builder: Optional[KeyBuilder] = None,
+    ) -> None:
+        self.db_path = db_path or settings.FSM_DB_NAME
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.FSM_FLUSH_INTERVAL
+        )
+        self.state_ttl = (
+            state_ttl_days
+            if state_ttl_days is not None
+            else settings.FSM_STATE_TTL_DAYS
+        ) * 86400
+        self.key_builder = key_builder or DefaultKeyBuilder(with_destiny=True)
+
+        self._cache: Dict[str, _StateRecord] = {}
+        self._dirty: Dict[str, _StateRecord] = {}
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._open_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def _connection(self) -> aiosqlite.Connection:
+        if self._conn is not None:
+            return self._conn
+        async with self._open_lock:
+            if self._conn is None:
+                conn = await aiosqlite.connect(self.db_path)
+                await conn.execute("PRAGMA journal_mode=WAL;")
+                await conn.execute("PRAGMA synchronous=NORMAL;")
+                await conn.execute("PRAGMA busy_timeout = 5000;")
+                await conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS fsm_states (
+                        key TEXT PRIMARY KEY,
+                        state TEXT,
+                        data TEXT NOT NULL DEFAULT '{}',
+                        updated_at INTEGER NOT NULL
+                    )"""
+                )
+                await conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_fsm_states_updated_at ON fsm_states (updated_at);"
+                )
+                await conn.commit()
+                self._conn = conn
+        return self._conn
+
+    async def _load(self, key: str) -> _StateRecord:
+        record = self._cache.get(key)
+        if record is not None:
+            return record
+        conn = await self._connection()
+        cursor = await conn.execute(
+            "SELECT state, data, updated_at FROM fsm_states WHERE key = ?", (key,)
+        )
+        row = await cursor.fetchone()
+        # Пока ждали ответа БД, ключ мог быть записан другим обработчиком
+        record = self._cache.get(key)
+        if record is not None:
+            return record
+        if row is None:
+            record = _StateRecord()
+        else:
+            record = _StateRecord(
+                state=row[0], data=json.loads(row[1]), updated_at=row[2]
+            )
+        self._cache[key] = record
+        return record
+
+    def _mark_dirty(self, key: str, record: _StateRecord) -> None:
+        record.updated_at = int(time.time())
+        self._dirty[key] = record
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        # Крутимся, пока есть что писать: ключи, изменённые во время flush,
+        # попадут в следующую пачку.
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.error("Failed to flush FSM states", exc_info=True)
+            if not self._dirty:
+                break
+
+    async def flush(self) -> int:
+        """Записывает все изменённые ключи одной транзакцией."""
+        async with self._flush_lock:
+            if not self._dirty:
+                return 0
+            batch, self._dirty = self._dirty, {}
+            upserts = []
+            deletes = []
+            for key, record in batch.items():
+                if record.is_empty:
+                    deletes.append((key,))
+                else:
+                    upserts.append(
+                        (
+                            key,
+                            record.state,
+                            json.dumps(record.data, ensure_ascii=False),
+                            record.updated_at,
+                        )
+                    )
+            conn = await self._connection()
+            try:
+                if upserts:
+                    await conn.executemany(
+                        "INSERT OR REPLACE INTO fsm_states (key, state, data, updated_at) VALUES (?, ?, ?, ?)",
+                        upserts,
+                    )
+                if deletes:
+                    await conn.executemany(
+                        "DELETE FROM fsm_states WHERE key = ?", deletes
+                    )
+                await conn.commit()
+            except BaseException:
+                # Возвращаем ключи в буфер, если их не успели переписать заново
+                for key, record in batch.items():
+                    self._dirty.setdefault(key, record)
+                await conn.rollback()
+                raise
+            return len(batch)
+
+    async def cleanup_expired(self) -> int:
+        """Удаляет состояния, которые не менялись дольше state_ttl."""
+        await self.flush()
+        cutoff = int(time.time()) - self.state_ttl
+        conn = await self._connection()
+        # Соединение общее с flush: его commit/rollback не должен вклиниться
+        async with self._flush_lock:
+            cursor = await conn.execute(
+                "DELETE FROM fsm_states WHERE updated_at < ?", (cutoff,)
+            )
+            await conn.commit()
+        for key in [k for k, r in self._cache.items() if r.updated_at < cutoff]:
+            if key not in self._dirty:
+                del self._cache[key]
+        logger.info(f"Deleted {cursor.rowcount} expired FSM states.")
+        return cursor.rowcount
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        str_key = self.key_builder.build(key)
+        record = await self._load(str_key)
+        record.state = state.state if isinstance(state, State) else state
+        self._mark_dirty(str_key, record)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        record = await self._load(self.key_builder.build(key))
+        return record.state
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        str_key = self.key_builder.build(key)
+        record = await self._load(str_key)
+        record.data = data.copy()
+        self._mark_dirty(str_key, record)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        record = await self._load(self.key_builder.build(key))
+        return record.data.copy()
+
+    async def close(self) -> None:
+        if self._flusher and not self._flusher.done():
+            self._flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flusher
+        if self._conn is None:
+            return
+        try:
+            await self.flush()
+        finally:
+            await self._conn.close()
+            self._conn = None
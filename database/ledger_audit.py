@@ -0,0 +1,172 @@
+# database/ledger_audit.py
+"""
+Сверка users.balance с суммой записей ledger по каждому пользователю.
+
+Сверка инкрементальная: суммы по пользователям и id последней учтённой
+записи сохраняются (ledger_audit_sums, ledger_audit_state), и следующий
+запуск дочитывает только новые записи ledger_entries — потоком по id,
+без GROUP BY по всей таблице. Записи, успевшие уйти в архив до сверки,
+дочитываются из сегментов ledger_archive с last_id больше курсора.
+
+Все чтения идут в одной транзакции, то есть по одному снимку БД: баланс
+и записи ledger, сделанные во время сверки, не дают ложного расхождения.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from config import settings
+from database import db
+
+logger = logging.getLogger(__name__)
+
+DRIFT_REPORT_LIMIT = 20  # Сколько расхождений с наибольшей суммой показывать
+
+
+async def run_audit(
+    full: bool = False, batch_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Сверяет балансы. full=True пересчитывает суммы с нуля.
+
+    Возвращает отчёт: сколько записей прочитано, сколько пользователей
+    сверено и список расхождений (user_id, balance, ledger_sum, drift).
+    """
+    batch_size = batch_size or settings.LEDGER_AUDIT_BATCH_SIZE
+    started = time.monotonic()
+    sums: Dict[int, int] = {}
+    touched: set[int] = set()
+    drifts: List[tuple] = []
+    report: Dict[str, Any] = {"full": full, "entries": 0, "archived_entries": 0}
+
+    async with db.connect() as conn:
+        await conn.execute("BEGIN")
+        try:
+            cursor_id = 0
+            if not full:
+                cursor = await conn.execute(
+                    "SELECT last_entry_id FROM ledger_audit_state WHERE id = 1"
+                )
+                row = await cursor.fetchone()
+                cursor_id = row[0] if row else 0
+                cursor = await conn.execute(
+                    "SELECT user_id, amount FROM ledger_audit_sums"
+                )
+                cursor.row_factory = None
+                sums = {user_id: amount for user_id, amount in await cursor.fetchall()}
+
+            # Записи, заархивированные раньше, чем их учла сверка
+            last_id = cursor_id
+            cursor = await conn.execute(
+                """SELECT user_id, entries FROM ledger_archive
+                   WHERE last_id > ? ORDER BY first_id""",
+                (cursor_id,),
+            )
+            for user_id, blob in await cursor.fetchall():
+                for entry in db._unpack_ledger_entries(blob):
+                    if entry["id"] > cursor_id:
+                        sums[user_id] = sums.get(user_id, 0) + entry["amount"]
+                        touched.add(user_id)
+                        report["archived_entries"] += 1
+                        last_id = max(last_id, entry["id"])
+
+            # Новые записи ledger_entries, потоком по id. Заархивированных
+            # здесь уже нет, поэтому начинаем с того же курсора
+            scan_id = cursor_id
+            while True:
+                cursor = await conn.execute(
+                    """SELECT id, user_id, amount FROM ledger_entries
+                       WHERE id > ? ORDER BY id LIMIT ?""",
+                    (scan_id, batch_size),
+                )
+                # Кортежи вместо sqlite3.Row: на миллионах строк это заметно
+                cursor.row_factory = None
+                rows = await cursor.fetchall()
+                if not rows:
+                    break
+                get = sums.get
+                for _, user_id, amount in rows:
+                    sums[user_id] = get(user_id, 0) + amount
+                report["entries"] += len(rows)
+                scan_id = rows[-1][0]
+                touched.update(row[1] for row in rows)
+            last_id = max(last_id, scan_id)
+
+            # Сравнение с балансами, тоже пачками по user_id
+            users = 0
+            last_user_id = 0
+            while True:
+                cursor = await conn.execute(
+                    """SELECT user_id, balance FROM users
+                       WHERE user_id > ? ORDER BY user_id LIMIT ?""",
+                    (last_user_id, batch_size),
+                )
+                cursor.row_factory = None
+                rows = await cursor.fetchall()
+                if not rows:
+                    break
+                for user_id, balance in rows:
+                    ledger_sum = sums.get(user_id, 0)
+                    if balance != ledger_sum:
+                        drifts.append(
+                            (user_id, balance, ledger_sum, balance - ledger_sum)
+                        )
+                users += len(rows)
+                last_user_id = rows[-1][0]
+        finally:
+            await conn.rollback()
+
+    await _save_state(
+        last_id, {user_id: sums[user_id] for user_id in touched}, replace=full
+    )
+
+    drifts.sort(key=lambda d: abs(d[3]), reverse=True)
+    report.update(
+        {
+            "users": users,
+            "last_entry_id": last_id,
+            "drifted_users": len(drifts),
+            "total_drift": sum(d[3] for d in drifts),
+            "drifts": drifts[:DRIFT_REPORT_LIMIT],
+            "duration": round(time.monotonic() - started, 2),
+        }
+    )
+    if drifts:
+        logger.warning(
+            f"Ledger audit found {len(drifts)} users with balance drift",
+            extra={"drifts": report["drifts"]},
+        )
+    logger.info(
+        "Ledger audit finished",
+        extra={k: v for k, v in report.items() if k != "drifts"},
+    )
+    return report
+
+
+async def _save_state(
+    last_entry_id: int, changed_sums: Dict[int, int], replace: bool = False
+) -> None:
+    """Сохраняет курсор и изменившиеся суммы одной транзакцией."""
+    async with db.connect() as conn:
+        await db._begin_transaction(conn)
+        try:
+            if replace:
+                await conn.execute("DELETE FROM ledger_audit_sums")
+            await conn.executemany(
+                """INSERT INTO ledger_audit_sums (user_id, amount) VALUES (?, ?)
+                   ON CONFLICT(user_id) DO UPDATE SET amount = excluded.amount""",
+                list(changed_sums.items()),
+            )
+            await conn.execute(
+                """INSERT INTO ledger_audit_state (id, last_entry_id, updated_at)
+                   VALUES (1, ?, ?)
+                   ON CONFLICT(id) DO UPDATE SET
+                       last_entry_id = excluded.last_entry_id,
+                       updated_at = excluded.updated_at""",
+                (last_entry_id, int(time.time())),
+            )
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            raise
@@ -1,9 +1,8 @@
 # plyusovp/maniacstarsbot/ManiacStarsBot-4df23ef8bd5b8766acddffe6bca30a128458c7a5/handlers/admin_handlers.py
 
-import asyncio
 import logging
 
-from aiogram import Bot, F, Router
+from aiogram import Bot, F
 from aiogram.filters import Command, CommandObject, CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
@@ -16,6 +15,7 @@ from handlers.utils import get_user_info_text, safe_send_message
 from keyboards.factories import AdminCallback
 from keyboards.inline import (
     admin_back_keyboard,
+    admin_broadcast_progress_keyboard,
     admin_confirm_keyboard,
     admin_main_menu,
     admin_manage_menu,
@@ -24,8 +24,10 @@ from keyboards.inline import (
     admin_rewards_menu,
     admin_user_info_menu,
 )
+from utils.broadcast import broadcaster
+from utils.callback_router import CallbackRouter
 
-router = Router()
+router = CallbackRouter()
 
 
 # --- FSM States ---
@@ -109,30 +111,37 @@ async def broadcast_confirm_handler(
             )
         return
 
-    if callback.message:
-        await callback.message.edit_text("⏳ Начинаю рассылку...", reply_markup=None)
-    all_users = await db.get_all_users()
-    sent_count = 0
-    failed_count = 0
-
-    logging.info(f"Starting broadcast for {len(all_users)} users.")
+    if not callback.message:
+        return
 
-    for user_id in all_users:
-        if await safe_send_message(bot, user_id, text):
-            sent_count += 1
-        else:
-            failed_count += 1
-        await asyncio.sleep(0.1)
+    broadcast_id = await db.create_broadcast(
+        text,
+        created_by=callback.from_user.id,
+        admin_chat_id=callback.message.chat.id,
+        progress_message_id=callback.message.message_id,
+    )
+    await callback.message.edit_text(
+        "⏳ Начинаю рассылку...",
+        reply_markup=admin_broadcast_progress_keyboard(broadcast_id),
+    )
+    # Рассылка идёт в фоне: обработчик не держит апдейт до её окончания,
+    # а прогресс обновляется в этом же сообщении
+    broadcaster.start(bot, broadcast_id)
+    await callback.answer()
 
-    logging.info(f"Broadcast finished. Sent: {sent_count}, Failed: {failed_count}")
 
-    if callback.message:
-        summary = (
-            f"✅ Рассылка завершена!\n\n"
-            f"Отправлено: {sent_count}\n"
-            f"Не удалось отправить: {failed_count}"
-        )
-        await callback.message.edit_text(summary, reply_markup=admin_back_keyboard())
+@router.callback_query(
+    AdminCallback.filter(F.action == "broadcast_stop"), AdminFilter()
+)
+async def broadcast_stop_handler(
+    callback: CallbackQuery, callback_data: AdminCallback, bot: Bot
+):
+    if not callback_data.target_id:
+        return
+    if await broadcaster.stop(bot, callback_data.target_id):
+        await callback.answer("Рассылка остановлена.")
+    else:
+        await callback.answer("Рассылка уже завершена.", show_alert=True)
 
 
 # --- User Info Section ---
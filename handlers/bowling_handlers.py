@@ -1,20 +1,33 @@
 # handlers/bowling_handlers.py
 
-import asyncio
-import uuid
-
-from aiogram import Bot, F, Router
+from aiogram import Bot, F
 from aiogram.fsm.context import FSMContext
-from aiogram.types import CallbackQuery, Message
+from aiogram.types import CallbackQuery
 
 from config import settings
-from database import db
-from handlers.utils import safe_delete, safe_edit_caption
+from handlers.dice_engine import (
+    DiceGame,
+    play_dice_game,
+    show_game_menu,
+    show_game_rules,
+)
 from keyboards.factories import BowlingCallback, GameCallback
 from keyboards.inline import bowling_stake_keyboard
-from lexicon.texts import LEXICON
-
-router = Router()
+from utils.callback_router import CallbackRouter
+
+router = CallbackRouter()
+
+BOWLING = DiceGame(
+    name="bowling",
+    emoji="🎳",
+    photo=settings.PHOTO_BOWLING,
+    keyboard=bowling_stake_keyboard,
+    multipliers={
+        6: 3,  # Strike
+        5: 1.5,  # 1 pin left
+    },
+    stake_reason="bowling_throw_cost",
+)
 
 
 @router.callback_query(
@@ -22,23 +35,7 @@ router = Router()
 )
 async def bowling_menu_handler(callback: CallbackQuery, state: FSMContext, bot: Bot):
     """Отображает главное меню игры 'Боулинг' с выбором ставки."""
-    await state.clear()
-    if not callback.message or not callback.from_user:
-        return
-
-    balance = await db.get_user_balance(callback.from_user.id)
-    user_language = await db.get_user_language(callback.from_user.id)
-    text = LEXICON["bowling_menu"].format(balance=balance)
-
-    await safe_edit_caption(
-        bot,
-        caption=text,
-        chat_id=callback.message.chat.id,
-        message_id=callback.message.message_id,
-        reply_markup=bowling_stake_keyboard(user_language),
-        photo=settings.PHOTO_BOWLING,
-    )
-    await callback.answer()
+    await show_game_menu(callback, bot, BOWLING, state)
 
 
 @router.callback_query(
@@ -46,21 +43,7 @@ async def bowling_menu_handler(callback: CallbackQuery, state: FSMContext, bot:
 )
 async def bowling_rules_handler(callback: CallbackQuery, bot: Bot):
     """Отображает правила игры 'Боулинг'."""
-    if not callback.message:
-        return
-
-    user_language = await db.get_user_language(callback.from_user.id)
-    text = LEXICON["bowling_rules"]
-
-    await safe_edit_caption(
-        bot,
-        caption=text,
-        chat_id=callback.message.chat.id,
-        message_id=callback.message.message_id,
-        reply_markup=bowling_stake_keyboard(user_language),
-        photo=settings.PHOTO_BOWLING,
-    )
-    await callback.answer("📖 Правила игры")
+    await show_game_rules(callback, bot, BOWLING)
 
 
 @router.callback_query(BowlingCallback.filter(F.action == "throw"))
@@ -68,75 +51,7 @@ async def throw_bowling_handler(
     callback: CallbackQuery, callback_data: BowlingCallback, bot: Bot
 ):
     """Обрабатывает бросок шара по выбранной ставке."""
-    if not callback.from_user or not callback.message:
-        return
-
-    stake_value = callback_data.value
-    if stake_value is None:
+    if callback_data.value is None:
         await callback.answer("Неверная ставка.", show_alert=True)
         return
-
-    stake = int(stake_value)
-    user_id = callback.from_user.id
-    balance = await db.get_user_balance(user_id)
-    user_language = await db.get_user_language(user_id)
-
-    if balance < stake:
-        await callback.answer("Недостаточно средств для игры.", show_alert=True)
-        return
-
-    await callback.answer()
-    await safe_delete(bot, callback.message.chat.id, callback.message.message_id)
-
-    idem_key = f"bowling-spend-{user_id}-{uuid.uuid4()}"
-    spent = await db.spend_balance(
-        user_id, stake, "bowling_throw_cost", idem_key=idem_key
-    )
-    if not spent:
-        new_balance = await db.get_user_balance(user_id)
-        error_text = "Не удалось списать ставку, попробуйте снова."
-        menu_text = LEXICON["bowling_menu"].format(balance=new_balance)
-        await bot.send_photo(
-            user_id,
-            settings.PHOTO_BOWLING,
-            caption=f"{error_text}\n\n{menu_text}",
-            reply_markup=bowling_stake_keyboard(user_language),
-        )
-        return
-
-    msg: Message = await bot.send_dice(chat_id=user_id, emoji="🎳")
-    await asyncio.sleep(4)
-
-    dice_value = msg.dice.value if msg.dice else 0
-    win_amount: int = 0  # Инициализируем как int
-
-    if dice_value == 6:  # Strike
-        win_amount = stake * 3
-    elif dice_value == 5:  # 1 pin left
-        # ИСПРАВЛЕНИЕ: Преобразуем float в int
-        win_amount = int(stake * 1.5)
-
-    new_balance = await db.get_user_balance(user_id)
-
-    if win_amount > 0:
-        await db.add_balance_unrestricted(user_id, win_amount, "bowling_win")
-        new_balance += win_amount
-        result_text = LEXICON["bowling_win"].format(
-            prize=win_amount, new_balance=new_balance
-        )
-    else:
-        result_text = LEXICON["bowling_lose"].format(
-            cost=stake, new_balance=new_balance
-        )
-
-    # Записываем, что пользователь играл в боулинг
-    await db.record_game_play(user_id, "bowling")
-
-    menu_text = LEXICON["bowling_menu"].format(balance=new_balance)
-    final_text = f"{result_text}\n\n{menu_text}"
-    await bot.send_photo(
-        user_id,
-        settings.PHOTO_BOWLING,
-        caption=final_text,
-        reply_markup=bowling_stake_keyboard(user_language),
-    )
+    await play_dice_game(callback, bot, BOWLING, int(callback_data.value))
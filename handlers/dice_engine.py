@@ -0,0 +1,257 @@
+# handlers/dice_engine.py
+"""
+Общий движок игр на Telegram-дайсах (слоты, футбол, боулинг, баскетбол,
+дартс, кости).
+
+Игра описывается данными: эмодзи дайса, таблица множителей по выпавшему
+значению и тексты. Ставка списывается в БД до броска (db.hold_game_stake,
+строка в game_holds под ref_id игры), поэтому проигрыш, показанный
+анимацией, уже оплачен. Когда значение дайса известно, db.settle_game
+снимает холд и начисляет выигрыш; если дайс так и не отправлен, ставка
+возвращается (db.refund_game_stake). Так же возвращается ставка при
+любой ошибке до расчёта; холды, оставшиеся после рестарта, возвращает
+utils.maintenance.run_game_hold_refunds.
+
+Пока дайс анимируется, обработчик не спит: результат обрабатывается
+продолжением из utils.continuations, а между шагами живёт только _Spin.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping, Optional
+
+from aiogram import Bot
+from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup
+
+from database import db
+from handlers.utils import safe_delete, safe_edit_caption
+from lexicon.texts import LEXICON
+from utils.continuations import continuations
+from utils.game_events import GameFinished, game_events
+
+logger = logging.getLogger(__name__)
+
+# Множитель и выплата, означающие "крутим ещё раз" (слоты)
+RESPIN = -1
+RESPIN_DELAY = 1  # Небольшая пауза перед следующим броском
+
+
+class DiceGame:
+    """Описание игры на дайсе и предрасчитанные таблицы выплат."""
+
+    __slots__ = (
+        "name",
+        "emoji",
+        "photo",
+        "keyboard",
+        "stake_reason",
+        "animation_delay",
+        "_multipliers",
+        "_payouts",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        emoji: str,
+        photo: str,
+        keyboard: Callable[[str], InlineKeyboardMarkup],
+        multipliers: Mapping[int, float],
+        stake_reason: str,
+        animation_delay: float = 4,
+    ) -> None:
+        self.name = name
+        self.emoji = emoji
+        self.photo = photo
+        self.keyboard = keyboard
+        self.stake_reason = stake_reason
+        self.animation_delay = animation_delay
+        # Индекс — значение дайса (1..64 у слотов, 1..6 у остальных)
+        size = max(multipliers) + 1
+        self._multipliers = tuple(multipliers.get(v, 0.0) for v in range(size))
+        self._payouts: dict[int, tuple[int, ...]] = {}
+
+    @property
+    def win_reason(self) -> str:
+        return f"{self.name}_win"
+
+    @property
+    def refund_reason(self) -> str:
+        return f"{self.name}_refund"
+
+    def payouts(self, stake: int) -> tuple[int, ...]:
+        """Выплата для каждого значения дайса при данной ставке."""
+        table = self._payouts.get(stake)
+        if table is None:
+            table = tuple(
+                RESPIN if m == RESPIN else int(stake * m) for m in self._multipliers
+            )
+            self._payouts[stake] = table
+        return table
+
+    def payout(self, stake: int, value: int) -> int:
+        table = self.payouts(stake)
+        return table[value] if 0 <= value < len(table) else 0
+
+
+@dataclass(slots=True)
+class _Spin:
+    """Состояние одной игры между бросками."""
+
+    bot: Bot
+    user_id: int
+    game: DiceGame
+    stake: int
+    user_language: str
+    ref_id: str
+    text_fields: dict[str, Any] = field(default_factory=dict)
+
+
+async def show_game_menu(
+    callback: CallbackQuery,
+    bot: Bot,
+    game: DiceGame,
+    state: Optional[FSMContext] = None,
+) -> None:
+    """Меню игры с балансом и выбором ставки."""
+    if state is not None:
+        await state.clear()
+    if not callback.message:
+        return
+
+    balance, user_language = await db.get_balance_and_language(callback.from_user.id)
+    await safe_edit_caption(
+        bot,
+        caption=LEXICON[f"{game.name}_menu"].format(balance=balance),
+        chat_id=callback.message.chat.id,
+        message_id=callback.message.message_id,
+        reply_markup=game.keyboard(user_language),
+        photo=game.photo,
+    )
+    await callback.answer()
+
+
+async def show_game_rules(callback: CallbackQuery, bot: Bot, game: DiceGame) -> None:
+    if not callback.message:
+        return
+
+    user_language = await db.get_user_language(callback.from_user.id)
+    await safe_edit_caption(
+        bot,
+        caption=LEXICON[f"{game.name}_rules"],
+        chat_id=callback.message.chat.id,
+        message_id=callback.message.message_id,
+        reply_markup=game.keyboard(user_language),
+        photo=game.photo,
+    )
+    await callback.answer("📖 Правила игры")
+
+
+async def play_dice_game(
+    callback: CallbackQuery,
+    bot: Bot,
+    game: DiceGame,
+    stake: int,
+    **text_fields,
+) -> None:
+    """
+    Начинает игру: списывает ставку и бросает дайс. Расчёт и сообщение
+    с результатом выполнит продолжение, когда анимация закончится.
+    """
+    if not callback.from_user or not callback.message:
+        return
+
+    user_id = callback.from_user.id
+    ref_id = uuid.uuid4().hex
+    if not await db.hold_game_stake(user_id, stake, game.stake_reason, ref_id):
+        await callback.answer("Недостаточно средств для игры.", show_alert=True)
+        return
+
+    try:
+        user_language = await db.get_user_language(user_id)
+        spin = _Spin(bot, user_id, game, stake, user_language, ref_id, text_fields)
+        await callback.answer()
+        await safe_delete(bot, callback.message.chat.id, callback.message.message_id)
+        await _throw(spin)
+    except BaseException:
+        # Дайс не брошен — ставка возвращается (повторный возврат ничего не делает)
+        await db.refund_game_stake(user_id, ref_id, game.refund_reason)
+        raise
+
+
+async def _refund(spin: _Spin) -> None:
+    await db.refund_game_stake(spin.user_id, spin.ref_id, spin.game.refund_reason)
+
+
+async def _throw(spin: _Spin) -> None:
+    try:
+        msg = await spin.bot.send_dice(chat_id=spin.user_id, emoji=spin.game.emoji)
+    except BaseException:
+        # Исход никто не увидел — ставка возвращается
+        await _refund(spin)
+        raise
+    value = msg.dice.value if msg.dice else 0
+    continuations.call_later(spin.game.animation_delay, _on_dice_landed, spin, value)
+
+
+async def _on_dice_landed(spin: _Spin, value: int) -> None:
+    game, user_id = spin.game, spin.user_id
+    payout = game.payout(spin.stake, value)
+    if payout == RESPIN:
+        try:
+            await spin.bot.send_message(
+                user_id, LEXICON[f"{game.name}_two_match"], parse_mode="Markdown"
+            )
+        except BaseException:
+            # Повторного броска не будет, итог не показан
+            await _refund(spin)
+            raise
+        continuations.call_later(RESPIN_DELAY, _throw, spin)
+        return
+
+    new_balance = await db.settle_game(user_id, spin.ref_id, payout, game.win_reason)
+    if new_balance is None:
+        await _refund(spin)
+    await _send_result(spin, value, payout, new_balance)
+
+
+async def _send_result(
+    spin: _Spin, value: int, payout: int, new_balance: Optional[int]
+) -> None:
+    game, user_id, stake = spin.game, spin.user_id, spin.stake
+    if new_balance is None:
+        logger.error(
+            "Failed to settle dice game",
+            extra={"user_id": user_id, "game": game.name, "stake": stake},
+        )
+        balance, _ = await db.get_balance_and_language(user_id)
+        error_text = "Не удалось рассчитать игру, ставка будет возвращена."
+        menu_text = LEXICON[f"{game.name}_menu"].format(balance=balance)
+        await spin.bot.send_photo(
+            user_id,
+            game.photo,
+            caption=f"{error_text}\n\n{menu_text}",
+            reply_markup=game.keyboard(spin.user_language),
+        )
+        return
+
+    if payout > 0:
+        result_text = LEXICON[f"{game.name}_win"].format(
+            prize=payout, new_balance=new_balance, value=value, **spin.text_fields
+        )
+    else:
+        result_text = LEXICON[f"{game.name}_lose"].format(
+            cost=stake, new_balance=new_balance, value=value, **spin.text_fields
+        )
+
+    game_events.publish(GameFinished(game.name, (user_id,)))
+
+    menu_text = LEXICON[f"{game.name}_menu"].format(balance=new_balance)
+    await spin.bot.send_photo(
+        user_id,
+        game.photo,
+        caption=f"{result_text}\n\n{menu_text}",
+        reply_markup=game.keyboard(spin.user_language),
+    )
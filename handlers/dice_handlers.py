@@ -1,24 +1,45 @@
 # handlers/dice_handlers.py
 
-import asyncio
-import uuid
-
-from aiogram import Bot, F, Router
+from aiogram import Bot, F
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import CallbackQuery, Message
+from aiogram.types import CallbackQuery
 
 from config import settings
 from database import db
-from handlers.utils import safe_delete, safe_edit_caption
+from handlers.dice_engine import (
+    DiceGame,
+    play_dice_game,
+    show_game_menu,
+    show_game_rules,
+)
+from handlers.utils import safe_edit_caption
 from keyboards.factories import DiceCallback, GameCallback
 from keyboards.inline import dice_range_choice_keyboard, dice_stake_keyboard
-from lexicon.texts import LEXICON
+from utils.callback_router import CallbackRouter
 
-router = Router()
+router = CallbackRouter()
 WIN_MULTIPLIER = 2.5
 
 
+def _dice_game(winning_values: range) -> DiceGame:
+    return DiceGame(
+        name="dice",
+        emoji="🎲",
+        photo=settings.PHOTO_DICE,
+        keyboard=dice_stake_keyboard,
+        multipliers={value: WIN_MULTIPLIER for value in winning_values},
+        stake_reason="dice_throw_cost",
+    )
+
+
+# Выбор игрока -> (игра с таблицей выплат, текст диапазона)
+DICE_CHOICES = {
+    "low": (_dice_game(range(1, 4)), "1-3"),
+    "high": (_dice_game(range(4, 7)), "4-6"),
+}
+
+
 class DiceState(StatesGroup):
     waiting_for_choice = State()
 
@@ -26,43 +47,13 @@ class DiceState(StatesGroup):
 @router.callback_query(GameCallback.filter((F.name == "dice") & (F.action == "start")))
 async def dice_menu_handler(callback: CallbackQuery, state: FSMContext, bot: Bot):
     """Отображает главное меню игры 'Кости' с выбором ставки."""
-    await state.clear()
-    if not callback.message:
-        return
-
-    balance = await db.get_user_balance(callback.from_user.id)
-    user_language = await db.get_user_language(callback.from_user.id)
-    text = LEXICON["dice_menu"].format(balance=balance)
-
-    await safe_edit_caption(
-        bot,
-        caption=text,
-        chat_id=callback.message.chat.id,
-        message_id=callback.message.message_id,
-        reply_markup=dice_stake_keyboard(user_language),
-        photo=settings.PHOTO_DICE,
-    )
-    await callback.answer()
+    await show_game_menu(callback, bot, DICE_CHOICES["low"][0], state)
 
 
 @router.callback_query(GameCallback.filter((F.name == "dice") & (F.action == "rules")))
 async def dice_rules_handler(callback: CallbackQuery, bot: Bot):
     """Отображает правила игры 'Кости'."""
-    if not callback.message:
-        return
-
-    user_language = await db.get_user_language(callback.from_user.id)
-    text = LEXICON["dice_rules"]
-
-    await safe_edit_caption(
-        bot,
-        caption=text,
-        chat_id=callback.message.chat.id,
-        message_id=callback.message.message_id,
-        reply_markup=dice_stake_keyboard(user_language),
-        photo=settings.PHOTO_DICE,
-    )
-    await callback.answer("📖 Правила игры")
+    await show_game_rules(callback, bot, DICE_CHOICES["low"][0])
 
 
 @router.callback_query(DiceCallback.filter(F.action == "stake"))
@@ -80,8 +71,7 @@ async def dice_stake_selected_handler(
 
     stake = int(stake_from_callback)
     user_id = callback.from_user.id
-    balance = await db.get_user_balance(user_id)
-    user_language = await db.get_user_language(user_id)
+    balance, user_language = await db.get_balance_and_language(user_id)
 
     if balance < stake:
         await callback.answer("Недостаточно средств.", show_alert=True)
@@ -109,76 +99,14 @@ async def throw_dice_handler(
     callback: CallbackQuery, callback_data: DiceCallback, bot: Bot, state: FSMContext
 ):
     """Обрабатывает бросок костей после выбора диапазона."""
-    if not callback.from_user or not callback.message:
-        return
-
     fsm_data = await state.get_data()
     stake = fsm_data.get("stake")
-    user_choice = callback_data.choice
-
-    if not stake or not user_choice:
-        await state.clear()
-        await callback.answer("Произошла ошибка, попробуйте снова.", show_alert=True)
-        return
+    choice = DICE_CHOICES.get(callback_data.choice or "")
 
     await state.clear()
-    user_id = callback.from_user.id
-    user_language = await db.get_user_language(user_id)
-
-    await safe_delete(bot, callback.message.chat.id, callback.message.message_id)
-
-    idem_key = f"dice-spend-{user_id}-{uuid.uuid4()}"
-    spent = await db.spend_balance(user_id, stake, "dice_throw_cost", idem_key=idem_key)
-    if not spent:
-        new_balance = await db.get_user_balance(user_id)
-        error_text = "Не удалось списать ставку, попробуйте снова."
-        menu_text = LEXICON["dice_menu"].format(balance=new_balance)
-        await bot.send_photo(
-            user_id,
-            settings.PHOTO_DICE,
-            caption=f"{error_text}\n\n{menu_text}",
-            reply_markup=dice_stake_keyboard(user_language),
-        )
+    if not stake or not choice:
+        await callback.answer("Произошла ошибка, попробуйте снова.", show_alert=True)
         return
 
-    msg: Message = await bot.send_dice(chat_id=user_id, emoji="🎲")
-    await asyncio.sleep(4)
-    dice_value = msg.dice.value
-
-    is_win = (user_choice == "low" and dice_value in [1, 2, 3]) or (
-        user_choice == "high" and dice_value in [4, 5, 6]
-    )
-    choice_text = "1-3" if user_choice == "low" else "4-6"
-
-    new_balance = await db.get_user_balance(user_id)
-
-    if is_win:
-        win_amount = int(stake * WIN_MULTIPLIER)
-        await db.add_balance_unrestricted(user_id, win_amount, "dice_win")
-        new_balance += win_amount
-        result_text = LEXICON["dice_win"].format(
-            choice=choice_text,
-            value=dice_value,
-            prize=win_amount,
-            new_balance=new_balance,
-        )
-    else:
-        result_text = LEXICON["dice_lose"].format(
-            choice=choice_text,
-            value=dice_value,
-            cost=stake,
-            new_balance=new_balance,
-        )
-
-    # Записываем, что пользователь играл в кости
-    await db.record_game_play(user_id, "dice")
-
-    menu_text = LEXICON["dice_menu"].format(balance=new_balance)
-    final_text = f"{result_text}\n\n{menu_text}"
-
-    await bot.send_photo(
-        user_id,
-        settings.PHOTO_DICE,
-        caption=final_text,
-        reply_markup=dice_stake_keyboard(user_language),
-    )
+    game, choice_text = choice
+    await play_dice_game(callback, bot, game, stake, choice=choice_text)
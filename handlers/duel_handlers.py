@@ -2,11 +2,12 @@
 
 import asyncio
 import logging
-import secrets
+import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
-from aiogram import Bot, F, Router
+from aiogram import Bot, F
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 
@@ -22,21 +23,34 @@ from keyboards.inline import (
     duel_stake_keyboard,
 )
 from lexicon.texts import LEXICON
+from utils.callback_router import CallbackRouter
+from utils.continuations import Continuation, continuations
+from utils.game_events import GameFinished, game_events
+from utils.matchmaking import ALREADY_WAITING, MATCHED, Matchmaker
 
-router = Router()
+router = CallbackRouter()
 
+# Фазы матча. Переходы между ними запускаются через общий планировщик
+# продолжений, поэтому матч, ожидающий следующего шага, — это одна запись
+# в куче таймеров, а не спящая корутина с захваченными локами.
+PHASE_STARTING = "starting"  # Соперник найден, показываем заставку
+PHASE_PLAYING = "playing"  # Ждём ходы игроков
+PHASE_REVEAL = "reveal"  # Карты раскрыты, скоро следующий раунд
+PHASE_FINISHED = "finished"
 
-@dataclass
+
+@dataclass(slots=True)
 class Player:
     id: int
     message_id: int
-    hand: list[int] = field(default_factory=list)
+    # Карты 1..12 (с учётом усиления) помещаются в байт, поэтому рука — bytearray
+    hand: bytearray = field(default_factory=bytearray)
     played_card: Optional[int] = None
     has_boosted: bool = False
     has_rerolled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DuelMatch:
     match_id: int
     p1: Player
@@ -49,16 +63,114 @@ class DuelMatch:
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     current_event: Optional[str] = None
     trace_id: Optional[str] = None
-
+    phase: str = PHASE_STARTING
+    timer: Optional[Continuation] = None
+
+
+class BufferedRandom:
+    """
+    Криптостойкий генератор, читающий os.urandom блоками.
+
+    secrets.SystemRandom делает системный вызов на каждое число, а раздача
+    руки требует нескольких чисел подряд. Здесь один вызов os.urandom
+    обслуживает сотни раздач.
+    """
+
+    __slots__ = ("_buffer", "_pos", "_chunk_size")
+
+    def __init__(self, chunk_size: int = 4096):
+        self._chunk_size = chunk_size
+        self._buffer = b""
+        self._pos = 0
+
+    def _next_byte(self) -> int:
+        if self._pos >= len(self._buffer):
+            self._buffer = os.urandom(self._chunk_size)
+            self._pos = 0
+        byte = self._buffer[self._pos]
+        self._pos += 1
+        return byte
+
+    def randbelow(self, n: int) -> int:
+        """Равномерное число из [0, n) для n <= 256 (отбраковка без смещения)."""
+        limit = 256 - (256 % n)
+        while True:
+            byte = self._next_byte()
+            if byte < limit:
+                return byte % n
+
+    def choice(self, seq):
+        return seq[self.randbelow(len(seq))]
+
+
+CARD_EMOJIS = ("1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟")
+CARD_MESSAGES = {
+    1: "🃏 Скромно, но смело!",
+    2: "🃏 Начинаем с малого!",
+    3: "🃏 Осторожная стратегия!",
+    4: "🃏 Средняя карта в деле!",
+    5: "🃏 Золотая середина!",
+    6: "🃏 Неплохой выбор!",
+    7: "🔥 Сильная карта!",
+    8: "🔥 Отличный ход!",
+    9: "✨ Мощная атака!",
+    10: "🎆 МАКСИМАЛЬНАЯ МОЩЬ!",
+}
 
 duel_queue: dict[int, tuple[int, int, Optional[str]]] = {}
 active_duels: dict[int, DuelMatch] = {}
-DUEL_MATCHMAKING_LOCK = asyncio.Lock()
-rand = secrets.SystemRandom()
+duel_matchmaker = Matchmaker("duel", duel_queue)
+rand = BufferedRandom()
+
+
+def schedule_transition(bot: Bot, match: DuelMatch, delay: float, transition) -> None:
+    """Планирует переход `transition(bot, match)` через `delay` секунд."""
+    cancel_transition(match)
+    match.timer = continuations.call_later(
+        delay, _run_transition, bot, match, transition
+    )
+
+
+def cancel_transition(match: DuelMatch) -> None:
+    if match.timer is not None:
+        match.timer.cancel()
+        match.timer = None
+
+
+async def _run_transition(bot: Bot, match: DuelMatch, transition) -> None:
+    match.timer = None
+    if active_duels.get(match.match_id) is not match:
+        return
+    try:
+        async with match.lock:
+            if match.phase != PHASE_FINISHED:
+                await transition(bot, match)
+    except Exception:
+        logging.error(
+            f"Duel transition {transition.__name__} failed",
+            exc_info=True,
+            extra={"trace_id": match.trace_id, "match_id": match.match_id},
+        )
+
+
+def deal_hand() -> bytearray:
+    """Раздаёт 5 разных карт из 1..10 (частичная перетасовка Фишера–Йетса)."""
+    deck = bytearray(range(1, 11))
+    for i in range(5):
+        j = i + rand.randbelow(10 - i)
+        deck[i], deck[j] = deck[j], deck[i]
+    return deck[:5]
+
 
+@lru_cache(maxsize=4096)
+def format_hand(hand: bytes) -> str:
+    """Текст руки с эмодзи. Ключ — отсортированные байты руки, поэтому
+    одна и та же рука рендерится один раз на процесс."""
+    return " ".join(CARD_EMOJIS[card - 1] if card <= 10 else f"{card}" for card in hand)
 
-def deal_hand() -> list[int]:
-    return rand.sample(range(1, 11), 5)
+
+def hand_text(hand: bytearray) -> str:
+    return format_hand(bytes(sorted(hand)))
 
 
 async def update_game_interface(
@@ -66,18 +178,8 @@ async def update_game_interface(
 ):
     event_text = LEXICON.get(match.current_event, "") if match.current_event else ""
 
-    # Красивое отображение карт с эмодзи
-    card_emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
-
-    def format_hand(hand):
-        formatted_cards = []
-        for card in sorted(hand):
-            emoji = card_emojis[card - 1] if card <= 10 else f"{card}"
-            formatted_cards.append(emoji)
-        return " ".join(formatted_cards)
-
-    p1_hand_text = format_hand(match.p1.hand)
-    p2_hand_text = format_hand(match.p2.hand)
+    p1_hand_text = hand_text(match.p1.hand)
+    p2_hand_text = hand_text(match.p2.hand)
     p1_text = text_override or LEXICON["duel_turn"].format(
         round=match.round,
         p1_wins=match.p1_wins,
@@ -134,17 +236,29 @@ async def update_game_interface(
     )
 
 
+def _enter_playing(match: DuelMatch) -> None:
+    match.phase = PHASE_PLAYING
+    match.turn_started_at = asyncio.get_running_loop().time()
+
+
+async def open_first_round(bot: Bot, match: DuelMatch):
+    _enter_playing(match)
+    await update_game_interface(bot, match)
+
+
 async def start_new_round(bot: Bot, match: DuelMatch):
+    cancel_transition(match)
     if match.p1_wins >= 2 or match.p2_wins >= 2:
         return await resolve_game_end(bot, match)
     match.round += 1
     match.p1.played_card = None
     match.p2.played_card = None
     match.current_event = None
+    _enter_playing(match)
 
     # Увеличиваем шанс магических событий для большей захватывающей игры
-    event_chance = 0.15  # 15% вместо 10%
-    if rand.random() < event_chance:
+    event_chance = 15  # 15% вместо 10%
+    if rand.randbelow(100) < event_chance:
         # Добавляем больше разнообразия в события
         events = ["event_comet", "event_black_hole"]
 
@@ -160,6 +274,7 @@ async def resolve_round(bot: Bot, match: DuelMatch):
     p1_card, p2_card = match.p1.played_card, match.p2.played_card
     if p1_card is None or p2_card is None:
         return
+    match.phase = PHASE_REVEAL
     round_winner = None
     p1_round_text = ""
     p2_round_text = ""
@@ -213,13 +328,15 @@ async def resolve_round(bot: Bot, match: DuelMatch):
             reply_markup=back_to_duels_keyboard(),
         ),
     )
-    await asyncio.sleep(4)
-    await start_new_round(bot, match)
+    schedule_transition(bot, match, settings.DUEL_REVEAL_DELAY, start_new_round)
 
 
 async def resolve_game_end(bot: Bot, match: DuelMatch):
-    if match.match_id not in active_duels:
+    if match.match_id not in active_duels or match.phase == PHASE_FINISHED:
         return
+    # Фазу ставим сразу: сдача во время паузы не должна завершить матч дважды
+    match.phase = PHASE_FINISHED
+    cancel_transition(match)
     extra = {"trace_id": match.trace_id, "match_id": match.match_id}
     winner_id, loser_id = (
         (match.p1.id, match.p2.id)
@@ -231,34 +348,9 @@ async def resolve_game_end(bot: Bot, match: DuelMatch):
     logging.info(f"Duel finished. Winner: {winner_id}, Prize: {prize}", extra=extra)
     await db.finish_duel_atomic(match.match_id, winner_id, loser_id, prize)
 
-    # Проверяем достижения для победителя
-    try:
-        from aiogram import Bot as BotType
-
-        if isinstance(bot, BotType):
-            # Записываем, что оба игрока играли в дуэли
-            await db.record_game_play(winner_id, "duel")
-            await db.record_game_play(loser_id, "duel")
-            
-            # Проверяем достижения по количеству побед
-            winner_stats = await db.get_user_duel_stats(winner_id)
-            wins = winner_stats.get("wins", 0)
-
-            # Достижения за победы в дуэлях
-            if wins == 1:
-                await db.grant_achievement(winner_id, "first_duel_win", bot)
-            elif wins == 5:
-                await db.grant_achievement(winner_id, "duel_warrior", bot)
-            elif wins == 10:
-                await db.grant_achievement(winner_id, "duel_master", bot)
-            elif wins == 25:
-                await db.grant_achievement(winner_id, "duel_legend", bot)
-                
-            # Проверяем достижение "Мастер игр" для обоих игроков
-            await db.check_game_achievements(winner_id, bot)
-            await db.check_game_achievements(loser_id, bot)
-    except Exception as e:
-        logging.warning(f"Failed to check duel achievements: {e}")
+    # Статистика и достижения считаются в фоне, экран результата их не ждёт
+    game_events.publish(GameFinished("duel", (winner_id, loser_id), winner_id))
+
     # Создаем персональные сообщения об окончании игры
     if winner_id == match.p1.id:
         # P1 победил
@@ -308,9 +400,10 @@ async def resolve_game_end(bot: Bot, match: DuelMatch):
     )
     if match.match_id in active_duels:
         del active_duels[match.match_id]
+        duel_matchmaker.release(match.match_id)
 
 
-async def start_duel_game(
+def start_duel_game(
     bot: Bot,
     match_id: int,
     p1_id: int,
@@ -319,16 +412,26 @@ async def start_duel_game(
     p1_msg_id: int,
     p2_msg_id: int,
     trace_id: str,
-):
-    p1 = Player(id=p1_id, message_id=p1_msg_id, hand=deal_hand())
-    p2 = Player(id=p2_id, message_id=p2_msg_id, hand=deal_hand())
-    match = DuelMatch(match_id=match_id, p1=p1, p2=p2, stake=stake, trace_id=trace_id)
+) -> DuelMatch:
+    p1 = Player(id=p1_id, message_id=p1_msg_id, hand=bytearray(deal_hand()))
+    p2 = Player(id=p2_id, message_id=p2_msg_id, hand=bytearray(deal_hand()))
+    match = DuelMatch(
+        match_id=match_id,
+        p1=p1,
+        p2=p2,
+        stake=stake,
+        trace_id=trace_id,
+        turn_started_at=asyncio.get_running_loop().time(),
+    )
     active_duels[match_id] = match
+    duel_matchmaker.claim(match_id)
     logging.info(
         f"Duel game starting. Match ID: {match_id}",
         extra={"trace_id": trace_id, "p1_id": p1_id, "p2_id": p2_id, "stake": stake},
     )
-    await update_game_interface(bot, match)
+    # Первый раунд откроется после заставки "соперник найден"
+    schedule_transition(bot, match, settings.DUEL_START_DELAY, open_first_round)
+    return match
 
 
 @router.callback_query(GameCallback.filter((F.name == "duel") & (F.action == "start")))
@@ -371,69 +474,68 @@ async def find_duel_handler(
     extra = {"trace_id": trace_id, "user_id": user_id, "stake": stake}
     if balance < stake:
         return await callback.answer("Недостаточно средств!", show_alert=True)
-    async with DUEL_MATCHMAKING_LOCK:
-        if stake in duel_queue:
-            opponent_id, opponent_msg_id, opponent_trace_id = duel_queue[stake]
-            if opponent_id == user_id:
-                return await callback.answer("Вы уже в поиске.", show_alert=True)
-            match_id = await db.create_duel(opponent_id, user_id, stake)
-            if match_id:
-                del duel_queue[stake]
-                logging.info(
-                    f"Duel match created successfully: {match_id}", extra=extra
-                )
-
-                # Показываем красивое сообщение о начале матча
-                prize = stake * 2 - int(stake * 2 * (settings.DUEL_RAKE_PERCENT / 100))
-                match_text = LEXICON["duel_match_found"].format(
-                    stake=stake, prize=prize
-                )
-
-                # Отправляем сообщение обоим игрокам
-                await asyncio.gather(
-                    safe_edit_caption(
-                        bot, match_text, opponent_id, opponent_msg_id, reply_markup=None
-                    ),
-                    safe_edit_caption(
-                        bot,
-                        match_text,
-                        callback.message.chat.id,
-                        callback.message.message_id,
-                        reply_markup=None,
-                    ),
-                )
+    status, opponent = await duel_matchmaker.join(
+        stake, (user_id, callback.message.message_id, trace_id)
+    )
+    if status == ALREADY_WAITING:
+        return await callback.answer("Вы уже в поиске.", show_alert=True)
+    if status == MATCHED and opponent is not None:
+        opponent_id, opponent_msg_id, _ = opponent
+        match_id = await db.create_duel(opponent_id, user_id, stake)
+        if match_id:
+            logging.info(f"Duel match created successfully: {match_id}", extra=extra)
+
+            # Показываем красивое сообщение о начале матча
+            prize = stake * 2 - int(stake * 2 * (settings.DUEL_RAKE_PERCENT / 100))
+            match_text = LEXICON["duel_match_found"].format(stake=stake, prize=prize)
+
+            # Отправляем сообщение обоим игрокам
+            await asyncio.gather(
+                safe_edit_caption(
+                    bot, match_text, opponent_id, opponent_msg_id, reply_markup=None
+                ),
+                safe_edit_caption(
+                    bot,
+                    match_text,
+                    callback.message.chat.id,
+                    callback.message.message_id,
+                    reply_markup=None,
+                ),
+            )
 
-                # Небольшая пауза для драматического эффекта
-                await asyncio.sleep(2)
-                asyncio.create_task(
-                    start_duel_game(
-                        bot,
-                        match_id,
-                        opponent_id,
-                        user_id,
-                        stake,
-                        opponent_msg_id,
-                        callback.message.message_id,
-                        trace_id,
-                    )
+            start_duel_game(
+                bot,
+                match_id,
+                opponent_id,
+                user_id,
+                stake,
+                opponent_msg_id,
+                callback.message.message_id,
+                trace_id,
+            )
+        else:
+            logging.warning(
+                f"Failed to create duel atomically for stake {stake}", extra=extra
+            )
+            await callback.answer(
+                "Не удалось начать игру. Возможно, у вас или у соперника не хватило средств.",
+                show_alert=True,
+            )
+            # Пока создавали матч, место в очереди мог занять другой игрок
+            if await duel_matchmaker.requeue(stake, opponent):
+                await safe_send_message(
+                    bot,
+                    opponent_id,
+                    "Попытка начать дуэль не удалась, поиск продолжается.",
                 )
             else:
-                logging.warning(
-                    f"Failed to create duel atomically for stake {stake}", extra=extra
-                )
-                await callback.answer(
-                    "Не удалось начать игру. Возможно, у вас или у соперника не хватило средств.",
-                    show_alert=True,
-                )
                 await safe_send_message(
                     bot,
                     opponent_id,
-                    "Попытка начать дуэль не удалась, поиск продолжается.",
+                    "Попытка начать дуэль не удалась, начните поиск заново.",
                 )
-        else:
-            logging.info("User started duel search", extra=extra)
-            if callback.message:
-                duel_queue[stake] = (user_id, callback.message.message_id, trace_id)
+    else:
+        logging.info("User started duel search", extra=extra)
     await safe_edit_caption(
         bot,
         LEXICON["duel_searching"].format(stake=stake),
@@ -455,18 +557,16 @@ async def cancel_duel_search_handler(
     user_id = callback.from_user.id
     trace_id = state.key.user_id if state.key else "unknown"
     extra = {"trace_id": trace_id, "user_id": user_id, "stake": stake}
-    async with DUEL_MATCHMAKING_LOCK:
-        if stake in duel_queue and duel_queue[stake][0] == user_id:
-            del duel_queue[stake]
-            logging.info("User cancelled duel search", extra=extra)
-            await callback.answer("Поиск отменен.", show_alert=True)
-            await duel_menu_handler(callback, state, bot)
-        else:
-            logging.warning("Failed to cancel duel search (not in queue?)", extra=extra)
-            await callback.answer(
-                "Не удалось отменить поиск. Возможно, соперник уже найден.",
-                show_alert=True,
-            )
+    if await duel_matchmaker.leave(user_id, stake):
+        logging.info("User cancelled duel search", extra=extra)
+        await callback.answer("Поиск отменен.", show_alert=True)
+        await duel_menu_handler(callback, state, bot)
+    else:
+        logging.warning("Failed to cancel duel search (not in queue?)", extra=extra)
+        await callback.answer(
+            "Не удалось отменить поиск. Возможно, соперник уже найден.",
+            show_alert=True,
+        )
 
 
 @router.callback_query(
@@ -487,6 +587,8 @@ async def play_card_handler(
         )
     match = active_duels[match_id]
     async with match.lock:
+        if match.phase != PHASE_PLAYING:
+            return await callback.answer("Дождитесь начала раунда.")
         player = match.p1 if user_id == match.p1.id else match.p2
         if player.played_card:
             return await callback.answer(
@@ -496,24 +598,10 @@ async def play_card_handler(
             return await callback.answer("У вас нет такой карты!", show_alert=True)
         player.hand.remove(card_value)
         player.played_card = card_value
-        # Красивые сообщения при игре карт
-        card_messages = {
-            1: "🃏 Скромно, но смело!",
-            2: "🃏 Начинаем с малого!",
-            3: "🃏 Осторожная стратегия!",
-            4: "🃏 Средняя карта в деле!",
-            5: "🃏 Золотая середина!",
-            6: "🃏 Неплохой выбор!",
-            7: "🔥 Сильная карта!",
-            8: "🔥 Отличный ход!",
-            9: "✨ Мощная атака!",
-            10: "🎆 МАКСИМАЛЬНАЯ МОЩЬ!",
-        }
-
-        message = card_messages.get(card_value, f"🃏 Карта {card_value} в игре!")
+        message = CARD_MESSAGES.get(card_value, f"🃏 Карта {card_value} в игре!")
         await callback.answer(message)
         if match.p1.played_card and match.p2.played_card:
-            asyncio.create_task(resolve_round(bot, match))
+            await resolve_round(bot, match)
         else:
             await update_game_interface(bot, match)
 
@@ -562,6 +650,8 @@ async def boost_confirm_handler(
         return await callback.answer("Игра не найдена.", show_alert=True)
     match = active_duels[match_id]
     async with match.lock:
+        if match.phase != PHASE_PLAYING:
+            return await callback.answer("Дождитесь начала раунда.")
         player = match.p1 if user_id == match.p1.id else match.p2
         if player.has_boosted or card_to_boost not in player.hand:
             return await update_game_interface(bot, match)
@@ -605,6 +695,8 @@ async def reroll_hand_handler(
         return await callback.answer("Игра не найдена.", show_alert=True)
     match = active_duels[match_id]
     async with match.lock:
+        if match.phase != PHASE_PLAYING:
+            return await callback.answer("Дождитесь начала раунда.")
         player = match.p1 if user_id == match.p1.id else match.p2
         if player.has_rerolled:
             return await callback.answer("Вы уже меняли руку.", show_alert=True)
@@ -661,7 +753,7 @@ async def duel_stuck_handler(callback: CallbackQuery, bot: Bot):
         if (
             asyncio.get_event_loop().time() - active_duels[match_id].turn_started_at
         ) > 300:
-            del active_duels[match_id]
+            cancel_transition(active_duels.pop(match_id))
             cleaned_count += 1
     await callback.answer(
         f"Очищено {cleaned_count} зависших игр. Попробуйте найти игру снова.",
@@ -1,10 +1,9 @@
 # handlers/game_handlers.py
-import asyncio
 import logging
 import secrets
 import uuid
 
-from aiogram import Bot, F, Router
+from aiogram import Bot, F
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
@@ -22,10 +21,15 @@ from keyboards.inline import (
     coinflip_stake_keyboard,
 )
 from lexicon.languages import get_text
+from utils.callback_router import CallbackRouter
+from utils.continuations import continuations
+from utils.game_events import GameFinished, game_events
 
-router = Router()
+router = CallbackRouter()
 logger = logging.getLogger(__name__)
 
+COINFLIP_ANIMATION_DELAY = 1.5
+
 
 class CoinflipState(StatesGroup):
     game_in_progress = State()
@@ -160,10 +164,21 @@ async def coinflip_choice_handler(
             reply_markup=None,
         )
 
-        await asyncio.sleep(1.5)
+        # Монетка "крутится" 1.5 с; обработчик не ждёт, результат покажет продолжение
+        continuations.call_later(
+            COINFLIP_ANIMATION_DELAY, reveal_coinflip, callback, bot, state
+        )
+    except Exception:
+        await state.clear()
+        raise
+
 
+async def reveal_coinflip(callback: CallbackQuery, bot: Bot, state: FSMContext):
+    """Определяет исход броска после анимации."""
+    try:
         fsm_data = await state.get_data()
         if not fsm_data:
+            user_language = await db.get_user_language(callback.from_user.id)
             await safe_edit_caption(
                 bot,
                 "Произошла ошибка, данные игры потеряны. Начните заново.",
@@ -298,7 +313,7 @@ async def cash_out(callback: CallbackQuery, bot: Bot, state: FSMContext):
     await db.add_balance_with_checks(user_id, prize, "coinflip_win")
 
     # Записываем, что пользователь играл в coinflip
-    await db.record_game_play(user_id, "coinflip")
+    game_events.publish(GameFinished("coinflip", (user_id,)))
 
     new_balance = await db.get_user_balance(user_id)
     await state.clear()
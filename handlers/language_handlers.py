@@ -2,7 +2,7 @@
 
 import logging
 
-from aiogram import F, Router
+from aiogram import F
 from aiogram.types import CallbackQuery
 
 from database import db
@@ -10,9 +10,10 @@ from handlers.utils import safe_edit_caption
 from keyboards.factories import LanguageCallback, MenuCallback
 from keyboards.inline import language_selection_keyboard, language_settings_keyboard
 from lexicon.languages import get_language_name, get_text
+from utils.callback_router import CallbackRouter
 
 logger = logging.getLogger(__name__)
-router = Router()
+router = CallbackRouter()
 
 
 @router.callback_query(LanguageCallback.filter(F.action == "select"))
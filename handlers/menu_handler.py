@@ -4,13 +4,14 @@ import logging
 import time
 from typing import Optional
 
-from aiogram import Bot, F, Router
+from aiogram import Bot, F
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, InputMediaPhoto, Message
 
 from config import settings
 from database import db
+from database.achievements import achievement_engine
 from handlers.utils import (
     clean_junk_message,
     generate_referral_link,
@@ -37,8 +38,9 @@ from keyboards.inline import (
     top_users_keyboard,
 )
 from lexicon.languages import get_text
+from utils.callback_router import CallbackRouter
 
-router = Router()
+router = CallbackRouter()
 logger = logging.getLogger(__name__)
 
 
@@ -560,18 +562,12 @@ async def achievements_handler(
 
     await clean_junk_message(state, bot)
     user_id = callback.from_user.id
-    page = 1
-    limit = 5
 
-    all_achs = await db.get_all_achievements()
-    user_achs_set = set(await db.get_user_achievements(user_id))
+    # Каталог и маска полученных достижений берутся из кэша движка
+    entries = await achievement_engine.display_order()
+    unlocked = await achievement_engine.unlocked(user_id)
 
-    total_pages = (len(all_achs) + limit - 1) // limit if all_achs else 1
-    start_index = (page - 1) * limit
-    end_index = start_index + limit
-    current_page_achs = all_achs[start_index:end_index]
-
-    text = f"📜 Ваши достижения ({len(user_achs_set)}/{len(all_achs)})"
+    text = f"📜 Ваши достижения ({unlocked.bit_count()}/{len(entries)})"
     media = InputMediaPhoto(media=settings.PHOTO_ACHIEVEMENTS, caption=text)
 
     if callback.message:
@@ -581,7 +577,7 @@ async def achievements_handler(
             chat_id=callback.message.chat.id,
             message_id=callback.message.message_id,
             reply_markup=achievements_keyboard(
-                current_page_achs, user_achs_set, page, total_pages
+                entries, achievement_engine.version, unlocked, page=1
             ),
         )
         await state.update_data(current_view="achievements")
@@ -594,21 +590,13 @@ async def achievements_page_handler(
 ):
     """Обрабатывает переключение страниц в достижениях."""
     page = callback_data.page or 1
-    limit = 5
-    user_id = callback.from_user.id
-
-    all_achs = await db.get_all_achievements()
-    user_achs_set = set(await db.get_user_achievements(user_id))
-
-    total_pages = (len(all_achs) + limit - 1) // limit if all_achs else 1
-    start_index = (page - 1) * limit
-    end_index = start_index + limit
-    current_page_achs = all_achs[start_index:end_index]
+    entries = await achievement_engine.display_order()
+    unlocked = await achievement_engine.unlocked(callback.from_user.id)
 
     if callback.message:
         await callback.message.edit_reply_markup(
             reply_markup=achievements_keyboard(
-                current_page_achs, user_achs_set, page, total_pages
+                entries, achievement_engine.version, unlocked, page
             )
         )
     await callback.answer()
@@ -625,18 +613,18 @@ async def achievement_info_handler(
     ach_id = callback_data.ach_id
     if not ach_id:
         return await callback.answer()
-    details = await db.get_achievement_details(ach_id)
+    details = (await achievement_engine.catalog()).get(ach_id)
     if not details:
         await callback.answer("Достижение не найдено.", show_alert=True)
         return
 
-    user_achs_set = set(await db.get_user_achievements(callback.from_user.id))
-    status = "✅ Получено" if ach_id in user_achs_set else "❌ Не получено"
+    owned = await achievement_engine.has(callback.from_user.id, ach_id)
+    status = "✅ Получено" if owned else "❌ Не получено"
 
     text = (
-        f"**{details['name']}** ({details['rarity']})\n\n"
-        f"_{details['description']}_\n\n"
-        f"**Награда:** {details['reward']} ⭐\n"
+        f"**{details.name}** ({details.rarity})\n\n"
+        f"_{details.description}_\n\n"
+        f"**Награда:** {details.reward} ⭐\n"
         f"**Статус:** {status}"
     )
     if callback.message:
@@ -4,11 +4,10 @@ import asyncio
 import logging
 import secrets
 import time
-from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Optional
 
-from aiogram import Bot, F, Router
+from aiogram import Bot, F
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 
@@ -23,14 +22,18 @@ from keyboards.inline import (
     timer_stake_keyboard,
 )
 from lexicon.texts import LEXICON
+from utils.callback_router import CallbackRouter
+from utils.continuations import continuations
+from utils.game_events import GameFinished, game_events
+from utils.matchmaking import ALREADY_WAITING, MATCHED, Matchmaker
 
-router = Router()
+router = CallbackRouter()
 logger = logging.getLogger(__name__)
 
 # --- Global Storage ---
-timer_queue: dict[int, dict[int, int]] = defaultdict(dict)
+timer_queue: dict[int, tuple[int, int]] = {}
 active_timers: dict[int, "TimerMatch"] = {}
-TIMER_MATCHMAKING_LOCK = asyncio.Lock()
+timer_matchmaker = Matchmaker("timer", timer_queue)
 
 
 # --- Game State Class ---
@@ -71,6 +74,7 @@ async def live_timer_updater(bot: Bot, match: TimerMatch):
                     logger.info(f"Timer match {match.match_id} timed out.")
                     if match.match_id in active_timers:
                         del active_timers[match.match_id]
+                        timer_matchmaker.release(match.match_id)
 
                     await db.finish_timer_match(match_id=match.match_id, is_draw=True)
                     text = (
@@ -150,6 +154,7 @@ async def start_timer_game(
         match_id, p1_id, p2_id, stake, float(target_time), p1_msg_id, p2_msg_id
     )
     active_timers[match_id] = match
+    timer_matchmaker.claim(match_id)
 
     try:
         p1_chat, p2_chat = await asyncio.gather(
@@ -170,6 +175,7 @@ async def start_timer_game(
         logger.error(f"Could not get timer player info for match {match_id}: {e}")
         if match_id in active_timers:
             del active_timers[match_id]
+            timer_matchmaker.release(match_id)
         return
 
     text = LEXICON["timer_match_found"].format(
@@ -181,9 +187,19 @@ async def start_timer_game(
             safe_edit_caption(bot, text + "\n\nПриготовьтесь...", p2_id, p2_msg_id),
         )
 
-    await asyncio.sleep(secrets.SystemRandom().uniform(2.5, 4.0))
-    if match_id not in active_timers:
+    # Start at a random moment; until then the match is only a heap entry
+    continuations.call_later(
+        secrets.SystemRandom().uniform(2.5, 4.0), launch_timer, bot, match
+    )
+
+
+async def launch_timer(bot: Bot, match: TimerMatch):
+    """Starts the countdown after the 'get ready' pause."""
+    match_id = match.match_id
+    if active_timers.get(match_id) is not match:
         return
+    p1_id, p2_id = match.p1_id, match.p2_id
+    p1_msg_id, p2_msg_id = match.p1_msg_id, match.p2_msg_id
 
     match.start_time = time.time()
     match.updater_task = asyncio.create_task(live_timer_updater(bot, match))
@@ -224,6 +240,7 @@ async def resolve_timer_game(bot: Bot, match_id: int):
             match.updater_task.cancel()
 
         del active_timers[match_id]
+        timer_matchmaker.release(match_id)
 
         p1_result = match.p1_stopped_time - match.start_time
         p2_result = match.p2_stopped_time - match.start_time
@@ -236,9 +253,7 @@ async def resolve_timer_game(bot: Bot, match_id: int):
 
         if is_draw:
             await db.finish_timer_match(match_id=match_id, is_draw=True)
-            # Записываем, что оба игрока играли в timer
-            await db.record_game_play(match.p1_id, "timer")
-            await db.record_game_play(match.p2_id, "timer")
+            game_events.publish(GameFinished("timer", (match.p1_id, match.p2_id)))
             # Одинаковое сообщение для ничьи
             text = LEXICON["timer_draw"].format(
                 target_time=f"{match.target_time:.2f}",
@@ -273,9 +288,7 @@ async def resolve_timer_game(bot: Bot, match_id: int):
                 else (match.p2_id, match.p1_id)
             )
             await db.finish_timer_match(match_id, winner_id=winner_id, new_bank=prize)
-            # Записываем, что оба игрока играли в timer
-            await db.record_game_play(match.p1_id, "timer")
-            await db.record_game_play(match.p2_id, "timer")
+            game_events.publish(GameFinished("timer", (match.p1_id, match.p2_id)))
 
             # Создаем персональные сообщения
             if winner_id == match.p1_id:
@@ -361,55 +374,50 @@ async def find_timer_handler(
     if balance < stake:
         return await callback.answer("Недостаточно средств.", show_alert=True)
 
-    async with TIMER_MATCHMAKING_LOCK:
-        if stake in timer_queue and timer_queue[stake]:
-            opponent_id, opponent_msg_id = timer_queue[stake].popitem()
-            if opponent_id == user_id:
-                timer_queue[stake][opponent_id] = opponent_msg_id
-                return await callback.answer("Вы уже в поиске.", show_alert=True)
-
-            logger.info(
-                f"Timer match found! {user_id} vs {opponent_id} with stake {stake}"
-            )
+    status, opponent = await timer_matchmaker.join(
+        stake, (user_id, callback.message.message_id)
+    )
+    if status == ALREADY_WAITING:
+        return await callback.answer("Вы уже в поиске.", show_alert=True)
+    if status == MATCHED and opponent is not None:
+        opponent_id, opponent_msg_id = opponent
+        logger.info(f"Timer match found! {user_id} vs {opponent_id} with stake {stake}")
 
-            match_id, stop_second = await db.create_timer_match(
-                opponent_id, user_id, stake
-            )
+        match_id, stop_second = await db.create_timer_match(opponent_id, user_id, stake)
 
-            if match_id and stop_second:
-                asyncio.create_task(
-                    start_timer_game(
-                        bot,
-                        match_id,
-                        opponent_id,
-                        user_id,
-                        stake,
-                        opponent_msg_id,
-                        callback.message.message_id,
-                        stop_second,
-                    )
-                )
-            else:
-                timer_queue[stake][opponent_id] = opponent_msg_id
-                await callback.answer(
-                    "Не удалось начать игру. Возможно, у вас или соперника не хватило средств.",
-                    show_alert=True,
-                )
-                await safe_send_message(
+        if match_id and stop_second:
+            asyncio.create_task(
+                start_timer_game(
                     bot,
+                    match_id,
                     opponent_id,
-                    "Попытка начать игру в таймер не удалась, поиск продолжается.",
+                    user_id,
+                    stake,
+                    opponent_msg_id,
+                    callback.message.message_id,
+                    stop_second,
                 )
-
+            )
         else:
-            timer_queue[stake][user_id] = callback.message.message_id
-            await safe_edit_caption(
+            await timer_matchmaker.requeue(stake, opponent)
+            await callback.answer(
+                "Не удалось начать игру. Возможно, у вас или соперника не хватило средств.",
+                show_alert=True,
+            )
+            await safe_send_message(
                 bot,
-                caption=f"🔎 Ищем соперника для игры в таймер со ставкой {stake} ⭐...",
-                chat_id=callback.message.chat.id,
-                message_id=callback.message.message_id,
-                reply_markup=timer_searching_keyboard(),
+                opponent_id,
+                "Попытка начать игру в таймер не удалась, поиск продолжается.",
             )
+
+    else:
+        await safe_edit_caption(
+            bot,
+            caption=f"🔎 Ищем соперника для игры в таймер со ставкой {stake} ⭐...",
+            chat_id=callback.message.chat.id,
+            message_id=callback.message.message_id,
+            reply_markup=timer_searching_keyboard(),
+        )
     await callback.answer()
 
 
@@ -418,13 +426,7 @@ async def timer_cancel_search_handler(
     callback: CallbackQuery, state: FSMContext, bot: Bot, **data
 ):
     user_id = callback.from_user.id
-    async with TIMER_MATCHMAKING_LOCK:
-        for stake, players in list(timer_queue.items()):
-            if user_id in players:
-                del players[user_id]
-                if not players:
-                    del timer_queue[stake]
-                break
+    await timer_matchmaker.leave(user_id)
     await callback.answer("Поиск отменен.", show_alert=True)
     await timer_menu_handler(callback, state, bot)
 
@@ -4,7 +4,7 @@ import datetime
 import logging
 import uuid
 
-from aiogram import Bot, F, Router
+from aiogram import Bot, F
 from aiogram.filters import Command, CommandStart, StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
@@ -25,9 +25,10 @@ from keyboards.inline import (
 )
 from keyboards.reply import get_main_menu_keyboard
 from lexicon.languages import get_text
+from utils.callback_router import CallbackRouter
 
 logger = logging.getLogger(__name__)
-router = Router()
+router = CallbackRouter()
 
 
 class PromoCodeStates(StatesGroup):
@@ -1,4 +1,5 @@
 # keyboards/inline.py
+from functools import lru_cache
 from typing import Optional, Union
 from urllib.parse import quote_plus
 
@@ -38,7 +39,22 @@ from keyboards.factories import (
 )
 from lexicon.languages import get_available_languages
 
+# --- Кэш клавиатур ---
+KEYBOARD_CACHE_SIZE = 1024  # Вариантов одной клавиатуры (аргументы и язык)
 
+
+def cached_keyboard(func):
+    """
+    Кэширует клавиатуру по (функция, аргументы, язык): кнопки и
+    callback_data собираются один раз, дальше возвращается тот же объект.
+
+    Подходит только для клавиатур, которые зависят лишь от своих
+    аргументов. Результат общий для всех вызовов — менять его нельзя.
+    """
+    return lru_cache(maxsize=KEYBOARD_CACHE_SIZE)(func)
+
+
+@cached_keyboard
 def main_menu_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует новую клавиатуру главного меню."""
     from lexicon.languages import get_text
@@ -98,6 +114,7 @@ def main_menu_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def resources_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для раздела 'Наши ресурсы'."""
     from lexicon.languages import get_text
@@ -132,6 +149,7 @@ def resources_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def games_menu_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру выбора игр."""
     from lexicon.languages import get_text
@@ -203,6 +221,7 @@ def games_menu_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
 
 
 # --- Profile & User Keyboards ---
+@cached_keyboard
 def profile_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -245,6 +264,7 @@ def profile_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def back_to_profile_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Кнопка 'Назад в профиль'."""
     from lexicon.languages import get_text
@@ -259,6 +279,7 @@ def back_to_profile_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def daily_challenges_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Клавиатура для ежедневных челленджей."""
     from lexicon.languages import get_text
@@ -273,6 +294,7 @@ def daily_challenges_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def social_content_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Клавиатура для выбора платформы социального контента."""
     from lexicon.languages import get_text
@@ -303,6 +325,7 @@ def social_content_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def back_to_menu_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Универсальная кнопка 'Назад в меню'."""
     from lexicon.languages import get_text
@@ -317,6 +340,7 @@ def back_to_menu_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def promo_back_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Клавиатура для возврата из ввода промокода."""
     from lexicon.languages import get_text
@@ -331,10 +355,12 @@ def promo_back_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def top_users_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return back_to_menu_keyboard(language)
 
 
+@cached_keyboard
 def gifts_catalog_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру с каталогом подарков."""
     from lexicon.languages import get_text
@@ -359,6 +385,7 @@ def gifts_catalog_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def gift_confirm_keyboard(
     item_id: str, cost: int, language: str = "ru"
 ) -> InlineKeyboardMarkup:
@@ -384,6 +411,7 @@ def gift_confirm_keyboard(
 
 
 # --- Duel Keyboards ---
+@cached_keyboard
 def duel_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -420,6 +448,7 @@ def duel_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def duel_searching_keyboard(stake: int, language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -441,6 +470,34 @@ def duel_searching_keyboard(stake: int, language: str = "ru") -> InlineKeyboardM
     return builder.as_markup()
 
 
+CARD_EMOJIS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+
+
+@lru_cache(maxsize=KEYBOARD_CACHE_SIZE)
+def _duel_game_template(
+    match_id: int, opponent_id: int, language: str
+) -> tuple[dict, InlineKeyboardButton, InlineKeyboardButton, InlineKeyboardButton]:
+    """Заготовка клавиатуры партии: кнопки карт (заполняются по мере
+    надобности), улучшения и «сдаться» — всё, что не меняется между раундами."""
+    from lexicon.languages import get_text
+
+    boost = InlineKeyboardButton(
+        text=f"⚡ {get_text('boost_card_button', language, default='Усилить карту')} ({settings.DUEL_BOOST_COST} ⭐)",
+        callback_data=DuelCallback(action="boost", match_id=match_id).pack(),
+    )
+    reroll = InlineKeyboardButton(
+        text=f"🔄 {get_text('new_cards_button', language, default='Новые карты')} ({settings.DUEL_REROLL_COST} ⭐)",
+        callback_data=DuelCallback(action="reroll", match_id=match_id).pack(),
+    )
+    surrender = InlineKeyboardButton(
+        text="🏳️ " + get_text("surrender_button", language, default="Сдаться"),
+        callback_data=DuelCallback(
+            action="surrender", match_id=match_id, opponent_id=opponent_id
+        ).pack(),
+    )
+    return {}, boost, reroll, surrender
+
+
 def duel_game_keyboard(
     match_id: int,
     hand: list[int],
@@ -449,56 +506,37 @@ def duel_game_keyboard(
     can_reroll: bool,
     language: str = "ru",
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    # Создаем красивые кнопки для карт с эмодзи
-    card_emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+    """
+    Клавиатура партии. Перерисовывается каждый раунд, поэтому кнопки
+    берутся из заготовки матча и заново собираются только ряды.
+    """
+    cards, boost, reroll, surrender = _duel_game_template(
+        match_id, opponent_id, language
+    )
     card_buttons = []
-
     for card in sorted(hand):
-        emoji = card_emojis[card - 1] if card <= 10 else f"{card}"
-        card_buttons.append(
-            InlineKeyboardButton(
+        button = cards.get(card)
+        if button is None:
+            emoji = CARD_EMOJIS[card - 1] if card <= 10 else f"{card}"
+            button = cards[card] = InlineKeyboardButton(
                 text=f"🃏 {emoji}",
                 callback_data=DuelCallback(
                     action="play", match_id=match_id, value=card
                 ).pack(),
             )
-        )
-    builder.row(*card_buttons, width=len(hand) or 1)
-    # Кнопки улучшений
-    from lexicon.languages import get_text
-
-    improvement_buttons = []
-    if can_boost:
-        improvement_buttons.append(
-            InlineKeyboardButton(
-                text=f"⚡ {get_text('boost_card_button', language, default='Усилить карту')} ({settings.DUEL_BOOST_COST} ⭐)",
-                callback_data=DuelCallback(action="boost", match_id=match_id).pack(),
-            )
-        )
-    if can_reroll:
-        improvement_buttons.append(
-            InlineKeyboardButton(
-                text=f"🔄 {get_text('new_cards_button', language, default='Новые карты')} ({settings.DUEL_REROLL_COST} ⭐)",
-                callback_data=DuelCallback(action="reroll", match_id=match_id).pack(),
-            )
-        )
+        card_buttons.append(button)
 
+    rows = [card_buttons] if card_buttons else []
+    # Кнопки улучшений
+    improvement_buttons = [
+        button
+        for button, available in ((boost, can_boost), (reroll, can_reroll))
+        if available
+    ]
     if improvement_buttons:
-        if len(improvement_buttons) == 2:
-            builder.row(*improvement_buttons)
-        else:
-            builder.row(improvement_buttons[0])
-
-    builder.row(
-        InlineKeyboardButton(
-            text="🏳️ " + get_text("surrender_button", language, default="Сдаться"),
-            callback_data=DuelCallback(
-                action="surrender", match_id=match_id, opponent_id=opponent_id
-            ).pack(),
-        )
-    )
-    return builder.as_markup()
+        rows.append(improvement_buttons)
+    rows.append([surrender])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 def duel_boost_choice_keyboard(
@@ -526,6 +564,7 @@ def duel_boost_choice_keyboard(
     return builder.as_markup()
 
 
+@cached_keyboard
 def back_to_duels_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -540,6 +579,7 @@ def back_to_duels_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
 
 
 # --- Timer Keyboards ---
+@cached_keyboard
 def timer_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -566,6 +606,7 @@ def timer_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def timer_searching_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -580,6 +621,7 @@ def timer_searching_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def timer_game_keyboard(match_id: int, language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -593,6 +635,7 @@ def timer_game_keyboard(match_id: int, language: str = "ru") -> InlineKeyboardMa
     return builder.as_markup()
 
 
+@cached_keyboard
 def timer_finish_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -607,6 +650,7 @@ def timer_finish_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
 
 
 # --- Coinflip Keyboards ---
+@cached_keyboard
 def coinflip_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -634,6 +678,7 @@ def coinflip_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def coinflip_choice_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -651,6 +696,7 @@ def coinflip_choice_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def coinflip_continue_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -671,6 +717,7 @@ def coinflip_continue_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def coinflip_play_again_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -693,50 +740,95 @@ def coinflip_play_again_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
 
 
 # --- Achievements Keyboards ---
-def achievements_keyboard(
-    all_achs: list, user_achs: set, page: int, total_pages: int, language: str = "ru"
-) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for ach in all_achs:
-        ach_id, ach_name = ach["id"], ach["name"]
-        status = "✅" if ach_id in user_achs else "❌"
-        builder.row(
-            InlineKeyboardButton(
-                text=f"{status} {ach_name}",
-                callback_data=AchievementCallback(action="info", ach_id=ach_id).pack(),
+ACHIEVEMENTS_PAGE_SIZE = 5
+
+# (версия каталога, язык) -> (страницы, кнопка «назад»). Страница — кнопки
+# достижений в обоих вариантах (получено / нет) и ряд навигации; при показе
+# остаётся только выбрать вариант по биту из маски пользователя.
+_achievement_pages: dict[tuple[int, str], tuple[list, InlineKeyboardButton]] = {}
+
+
+def _build_achievement_pages(
+    entries: list, language: str
+) -> tuple[list, InlineKeyboardButton]:
+    from lexicon.languages import get_text
+
+    total_pages = max(1, -(-len(entries) // ACHIEVEMENTS_PAGE_SIZE))
+    pages = []
+    for page in range(1, total_pages + 1):
+        start = (page - 1) * ACHIEVEMENTS_PAGE_SIZE
+        items = []
+        for ach_id, entry in entries[start : start + ACHIEVEMENTS_PAGE_SIZE]:
+            callback_data = AchievementCallback(action="info", ach_id=ach_id).pack()
+            items.append(
+                (
+                    1 << entry.bit,
+                    InlineKeyboardButton(
+                        text=f"✅ {entry.name}", callback_data=callback_data
+                    ),
+                    InlineKeyboardButton(
+                        text=f"❌ {entry.name}", callback_data=callback_data
+                    ),
+                )
             )
-        )
-    nav_buttons = []
-    if page > 1:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="⬅️",
-                callback_data=AchievementCallback(action="page", page=page - 1).pack(),
+        nav_buttons = []
+        if page > 1:
+            nav_buttons.append(
+                InlineKeyboardButton(
+                    text="⬅️",
+                    callback_data=AchievementCallback(
+                        action="page", page=page - 1
+                    ).pack(),
+                )
             )
-        )
-    nav_buttons.append(
-        InlineKeyboardButton(text=f"{page}/{total_pages}", callback_data="noop")
-    )
-    if page < total_pages:
         nav_buttons.append(
-            InlineKeyboardButton(
-                text="➡️",
-                callback_data=AchievementCallback(action="page", page=page + 1).pack(),
+            InlineKeyboardButton(text=f"{page}/{total_pages}", callback_data="noop")
+        )
+        if page < total_pages:
+            nav_buttons.append(
+                InlineKeyboardButton(
+                    text="➡️",
+                    callback_data=AchievementCallback(
+                        action="page", page=page + 1
+                    ).pack(),
+                )
             )
-        )
-    if len(nav_buttons) > 1:
-        builder.row(*nav_buttons)
-    from lexicon.languages import get_text
-
-    builder.row(
-        InlineKeyboardButton(
-            text="⬅️ " + get_text("back_to_menu", language),
-            callback_data=MenuCallback(name="main_menu").pack(),
-        )
+        pages.append((items, nav_buttons if len(nav_buttons) > 1 else None))
+    back_button = InlineKeyboardButton(
+        text="⬅️ " + get_text("back_to_menu", language),
+        callback_data=MenuCallback(name="main_menu").pack(),
     )
-    return builder.as_markup()
+    return pages, back_button
 
 
+def achievements_keyboard(
+    entries: list,
+    catalog_version: int,
+    unlocked: int,
+    page: int,
+    language: str = "ru",
+) -> InlineKeyboardMarkup:
+    """
+    Страница меню достижений. `entries` — каталог в порядке показа
+    [(id, запись)], `unlocked` — битовая маска полученных достижений.
+    """
+    key = (catalog_version, language)
+    cached = _achievement_pages.get(key)
+    if cached is None:
+        for stale in [k for k in _achievement_pages if k[0] != catalog_version]:
+            del _achievement_pages[stale]
+        cached = _achievement_pages[key] = _build_achievement_pages(entries, language)
+    pages, back_button = cached
+    items, nav_buttons = pages[min(max(page, 1), len(pages)) - 1]
+
+    rows = [[done if unlocked & bit else todo] for bit, done, todo in items]
+    if nav_buttons:
+        rows.append(nav_buttons)
+    rows.append([back_button])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+@cached_keyboard
 def back_to_achievements_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     from lexicon.languages import get_text
 
@@ -797,6 +889,19 @@ def admin_back_keyboard(
     return builder.as_markup()
 
 
+def admin_broadcast_progress_keyboard(broadcast_id: int) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    builder.row(
+        InlineKeyboardButton(
+            text="⏹ Остановить",
+            callback_data=AdminCallback(
+                action="broadcast_stop", target_id=broadcast_id
+            ).pack(),
+        )
+    )
+    return builder.as_markup()
+
+
 def admin_confirm_keyboard(
     action: str,
     target_id: Optional[int] = None,
@@ -1016,6 +1121,7 @@ def admin_manage_menu() -> InlineKeyboardMarkup:
 
 
 # --- Slots Keyboards ---
+@cached_keyboard
 def slots_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для выбора ставки в слотах."""
     from lexicon.languages import get_text
@@ -1050,6 +1156,7 @@ def slots_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
 # ЭТОТ БЛОК НУЖНО ДОБАВИТЬ
 
 
+@cached_keyboard
 def football_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для выбора ставки в футболе."""
     from lexicon.languages import get_text
@@ -1082,6 +1189,7 @@ def football_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def bowling_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для выбора ставки в боулинге."""
     from lexicon.languages import get_text
@@ -1111,6 +1219,7 @@ def bowling_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def bowling_play_again_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для боулинга с кнопкой 'Играть снова'."""
     from lexicon.languages import get_text
@@ -1138,6 +1247,7 @@ def bowling_play_again_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
 # ЭТОТ БЛОК НУЖНО ДОБАВИТЬ
 
 
+@cached_keyboard
 def basketball_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для выбора ставки в баскетболе."""
     from lexicon.languages import get_text
@@ -1172,6 +1282,7 @@ def basketball_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
 # ЭТОТ БЛОК НУЖНО ДОБАВИТЬ
 
 
+@cached_keyboard
 def darts_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для выбора ставки в дартсе."""
     from lexicon.languages import get_text
@@ -1204,6 +1315,7 @@ def darts_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
 # ЭТОТ БЛОК НУЖНО ДОБАВИТЬ ПЕРЕД ФУНКЦИЕЙ ВЫШЕ
 
 
+@cached_keyboard
 def dice_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для выбора ставки в костях."""
     from lexicon.languages import get_text
@@ -1234,6 +1346,7 @@ def dice_stake_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
 
 
 # --- Language Selection Keyboards ---
+@cached_keyboard
 def language_selection_keyboard() -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для выбора языка."""
     builder = InlineKeyboardBuilder()
@@ -1258,6 +1371,7 @@ def language_selection_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def settings_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру настроек."""
     from lexicon.languages import get_text
@@ -1300,6 +1414,7 @@ def settings_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def language_settings_keyboard(current_language: str) -> InlineKeyboardMarkup:
     """Генерирует клавиатуру настроек языка."""
     from lexicon.languages import get_text
@@ -1337,6 +1452,7 @@ def language_settings_keyboard(current_language: str) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def faq_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для FAQ."""
     from lexicon.languages import get_text
@@ -1355,6 +1471,7 @@ def faq_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cached_keyboard
 def terms_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для пользовательского соглашения."""
     from lexicon.languages import get_text
@@ -1374,6 +1491,7 @@ def terms_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
 
 
 # --- Dice Keyboards ---
+@cached_keyboard
 def dice_range_choice_keyboard(language: str = "ru") -> InlineKeyboardMarkup:
     """Генерирует клавиатуру для игры в кости с выбором диапазона."""
     from lexicon.languages import get_text
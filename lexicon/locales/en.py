@@ -0,0 +1,244 @@
+# lexicon/locales/en.py
+
+TEXTS = {
+    "start_message": "👋 **Hello, {full_name}!**\n\nWelcome to **Maniac Stars** — a place where you can earn and play!\n\n🎯 **What's here:**\n• 💰 Earning through referrals\n• 🎮 Mini-games with bets\n• 🏆 Achievement system\n• 🎁 Prizes for activity\n\nChoose what interests you ⬇️",
+    "main_menu": "**⚔️ Maniac Stars ⚔️**\n\nUse the buttons below to navigate.\n\n**💰 Balance: {balance} ⭐**",
+    "games_menu": "🎮 **Choose a game** 🎮\n\nAlso click stars in our free clicker! ⭐",
+    "profile": "👤 **Your profile**\n\n"
+    "**Name:** {full_name}\n"
+    "**ID:** `{user_id}`\n"
+    "**Level:** {level_name}\n\n"
+    "📈 **Statistics:**\n"
+    "• Invited: {referrals_count} people\n"
+    "• Duels: {duel_wins} wins / {duel_losses} losses\n"
+    "• Streak: {streak_days} days in a row\n"
+    "• Balance: {balance} ⭐\n\n"
+    "{status_text}",
+    "profile_status": "**Account status:**\n{quarantine_status}{cooldown_status}",
+    "referral_menu": "💰 **Earning through referrals** 💰\n\n"
+    "Invite friends and get **+{ref_bonus} ⭐** for each!\n\n"
+    "🔗 **Your referral link:**\n"
+    "`{ref_link}`\n\n"
+    "✅ **Invited:** {invited_count} people\n"
+    "📊 **Earned:** {earned} ⭐",
+    "referral_pending_notification": "⏳ @{username} followed your referral link, but hasn't subscribed to channels yet. Once they subscribe, you'll receive +{ref_bonus} ⭐!",
+    "referral_success_notification": "{username} joined via your link! You received +{bonus} ⭐.",
+    "top_menu": "🏆 **Referral Leaders** 🏆\n\n{top_users_text}",
+    "gifts_menu": "🎁 **Prizes** 🎁\n\n"
+    "Exchange your ⭐ for gifts! To receive prizes, you need to invite at least {min_refs} friends and subscribe to our resources.\n\n"
+    "💰 **Your balance:** {balance} ⭐\n"
+    "👥 **Invited:** {referrals_count} people\n\n"
+    "Choose a gift:",
+    "resources_menu": "🎁 **Our resources** 🎁\n\n"
+    "Subscription to all our resources is **mandatory** for gift withdrawals. "
+    "Subscribe to not miss important announcements and withdrawal confirmations!",
+    "gift_confirm": "Are you sure you want to exchange **{cost} ⭐** for **{emoji} {name}**?\n\n"
+    "This action cannot be undone.",
+    "withdrawal_success": "✅ Your withdrawal request for **{emoji} {name}** ({amount} ⭐) has been successfully created! The administrator will review it soon.",
+    "promo_prompt": "🎟️ Enter your promo code:",
+    "promo_success": "✅ Promo code successfully activated! You received: {amount} ⭐",
+    "promo_fail": "❌ Failed to activate promo code. Reason: {reason}",
+    "entertainment_menu": "👾 **Entertainment** 👾\n\nChoose what you want to play, or enter a promo code.",
+    "language_selection": "🌍 **Choose Language** 🌍\n\nSelect your preferred language for the bot:",
+    "language_changed": "✅ Language changed to {language}!",
+    "settings_menu": "⚙️ **Settings** ⚙️\n\nChoose an action:",
+    "current_language": "🌍 **Current language:** {language}",
+    "back_to_menu": "⬅️ Back to menu",
+    "back_to_profile": "⬅️ Back to profile",
+    "back_to_games": "⬅️ Back to games",
+    "back_to_gifts": "⬅️ Back to gifts",
+    "cancel": "❌ Cancel",
+    "confirm": "✅ Confirm",
+    # Menu buttons
+    "earn_button": "Earn",
+    "games_button": "Entertainment",
+    "profile_button": "Profile",
+    "gifts_button": "Prizes",
+    "leaders_button": "Leaders",
+    "resources_button": "Our Resources",
+    "achievements_button": "Achievements",
+    "settings_button": "Settings",
+    "change_language": "Change Language",
+    "error_unknown": "🔧 An unexpected error occurred. We're already working on it. Please try again later.",
+    "error_db": "🗄️ Database access error. Please repeat your request in a few minutes.",
+    "error_timeout": "⏳ Server took too long to respond. There might be temporary issues. Please try again.",
+    "error_not_subscribed": "❌ **Subscription not found!**\nTo withdraw, you must be subscribed to all our resources. Check subscriptions in the '🎁 Our resources' section.",
+    "error_not_enough_referrals": "❌ **Not enough friends!**\nTo withdraw, you need to invite at least {min_refs} friends (you have {current_refs}).",
+    "gift_requirements_not_met": "The following conditions are not met for this gift withdrawal:\n{errors}",
+    "insufficient_funds": "Insufficient funds in balance.",
+    "daily_cap_exceeded": "Daily limit for earning stars from this source has been reached.",
+    "rate_limit_minute": "Too frequent! Try again in a minute.",
+    "rate_limit_hour": "Hourly limit reached. Try again later.",
+    "user_in_quarantine": "New users cannot withdraw funds within 24 hours of registration.",
+    "withdraw_cooldown": "Withdrawal temporarily unavailable after a big win. Try again in {hours}h {minutes}m.",
+    "rewards_disabled": "Withdrawal temporarily disabled by administration.",
+    "daily_ops_limit": "You have reached the daily limit for number of requests.",
+    "daily_amount_limit": "You have reached the daily limit for withdrawal amount.",
+    "not_subscribed": "You must be subscribed to our channel for this action!",
+    "not_enough_referrals": "To withdraw, you need to invite at least {min_refs} friends (you have {current_refs}).",
+    "unknown_error": "An unknown error occurred. Please try again later.",
+    "subscription_welcome": "🎉 **Welcome to Maniac Stars!**\n\nSubscription confirmed! Now you can use all bot features.",
+    "subscription_admin_welcome": "👑 **Welcome, administrator!**\n\nYou have full access to all bot features.",
+    "subscription_required": "🔒 **Subscription required**\n\nYou must subscribe to our channel to use the bot.",
+    "subscription_success": "✅ **Subscription confirmed!**\n\nWelcome to the bot!",
+    "subscription_failed": "❌ **Subscription not found**\n\nPlease subscribe to the channel and try again.",
+    # --- Game Texts ---
+    "coinflip_menu": "🪙 **Heads or Tails** 🪙\n\n"
+    "Risk and multiply your winnings! Guess which side will come up.\n"
+    "With each next win, the chance decreases and the prize grows!\n\n"
+    "💰 **Your balance:** {balance} ⭐\n\nChoose your bet:",
+    "coinflip_process": "🪙 Flipping coin...",
+    "coinflip_choice_prompt": "🎉 **Bet {stake} ⭐ accepted!** 🎉\n\n"
+    "What do you choose?",
+    "coinflip_continue": "🎉 **Win!** 🎉\n\n"
+    "You won **{current_prize}** ⭐.\n"
+    "The next throw can bring **{next_prize}** ⭐ with {next_chance}% chance.\n\n"
+    "Risk it?",
+    "coinflip_win_final": "🎉 **Congratulations!** 🎉\n\n"
+    "You take the winnings: {prize} ⭐\n"
+    "💰 Your new balance: {new_balance} ⭐",
+    "coinflip_loss": "😕 **Alas, failure...**\n\n"
+    "You lost your bet: {stake} ⭐\n"
+    "💰 Your new balance: {new_balance} ⭐",
+    "slots_menu": "🎰 **Slots** 🎰\n\nTest your luck! Collect three identical symbols in a row to win.\n\n💰 **Your balance:** {balance} ⭐\n\nChoose your bet:",
+    "slots_win": "🎉 **WIN!** 🎉\n\nYou won {prize} ⭐!\n💰 Your new balance: {new_balance} ⭐",
+    "slots_lose": "😕 **Alas, no luck...**\n\nYou lost {cost} ⭐.\n💰 Your new balance: {new_balance} ⭐",
+    "football_menu": "⚽️ **Football** ⚽️\n\nScore a penalty! If you score a goal, you get a prize.\n\n💰 **Your balance:** {balance} ⭐",
+    "football_win": "🎉 **GOOOAL!** 🎉\n\nYou scored and won {prize} ⭐!\n💰 Your new balance: {new_balance} ⭐",
+    "football_lose": "😕 **Miss...**\n\nYou lost {cost} ⭐.\n💰 Your new balance: {new_balance} ⭐",
+    "bowling_menu": "🎳 **Bowling** 🎳\n\nCan you get a strike? If you knock down all pins with one throw - you get a prize!\n\n💰 **Your balance:** {balance} ⭐\n\nChoose your bet:",
+    "bowling_win": "🎉 **STRIKE!** 🎉\n\nGreat throw! You won {prize} ⭐!\n💰 Your new balance: {new_balance} ⭐",
+    "bowling_lose": "😕 **Miss...**\n\nBetter luck next time. You lost {cost} ⭐.\n💰 Your new balance: {new_balance} ⭐",
+    "basketball_menu": "🏀 **Basketball** 🏀\n\nHit the ball into the basket to win a prize!\n\n💰 **Your balance:** {balance} ⭐",
+    "basketball_win": "🎉 **Right on target!** 🎉\n\nGreat shot! You won {prize} ⭐!\n💰 Your new balance: {new_balance} ⭐",
+    "basketball_lose": "😕 **Miss...**\n\nThe ball flew past. You lost {cost} ⭐.\n💰 Your new balance: {new_balance} ⭐",
+    "darts_menu": "🎯 **Darts** 🎯\n\nHit the bullseye to win a prize!\n\n💰 **Your balance:** {balance} ⭐",
+    "darts_win": "🎉 **Right on target!** 🎉\n\nGreat throw! You won {prize} ⭐!\n💰 Your new balance: {new_balance} ⭐",
+    "darts_lose": "😕 **Miss...**\n\nThe dart flew past. You lost {cost} ⭐.\n💰 Your new balance: {new_balance} ⭐",
+    "dice_menu": "🎲 **Dice** 🎲\n\nGuess in which range the number will fall on the dice! Bet on (1-3) or (4-6).\n\n💰 **Your balance:** {balance} ⭐",
+    "dice_win": "🎉 **Win!** 🎉\n\nYou bet on ({choice}), and the number {value} came up! You won {prize} ⭐!\n💰 Your new balance: {new_balance} ⭐",
+    "dice_lose": "😕 **Alas, didn't guess...**\n\nYou bet on ({choice}), and the number {value} came up. You lost {cost} ⭐.\n💰 Your new balance: {new_balance} ⭐",
+    # --- Transaction Texts ---
+    "transactions_title": "📊 **Transaction History** 📊\n\n💰 **Current balance:** {balance} ⭐\n\n📋 **Recent operations:**\n\n",
+    "transactions_empty": "📊 **Transaction History** 📊\n\n💰 **Current balance:** {balance} ⭐\n\n📭 **History is empty**\nYou don't have any transactions yet. Start playing or invite friends!",
+    "transaction_item": "{emoji} **{amount_text}** - {reason_text}\n📅 {date}\n",
+    # --- Social Content Texts ---
+    "social_content": "📱 **READY CONTENT FOR REPOSTS** 📱\n\n🎯 **Choose platform:**",
+    "tiktok_content": "🎵 CONTENT FOR TIKTOK 🎵\n\n📝 Ready texts:\n\n🔥 Found a way to earn in Telegram! Already {balance} ⭐ today. Who's with me? {ref_link}\n\n💎 This bot pays real money for games! Already withdrew {balance} ⭐. {ref_link}\n\n⚡ While everyone sleeps, I earn in Telegram! {balance} ⭐ today. Who's ready to earn? {ref_link}\n\n🎯 Hashtags:\n\\#earnings \\#telegram \\#money \\#games \\#referrals \\#passiveincome",
+    "instagram_content": "📸 CONTENT FOR INSTAGRAM 📸\n\n📝 Ready texts:\n\n🌟 New way to earn in Telegram! Already {balance} ⭐ this week. Who's ready to try? {ref_link}\n\n💰 This bot really pays! Already withdrew {balance} ⭐. {ref_link}\n\n🎮 Earning by playing in Telegram! {balance} ⭐ today. Who's with me? {ref_link}\n\n🎯 Hashtags:\n\\#earnings \\#telegram \\#money \\#games \\#referrals \\#passiveincome \\#workfromhome",
+    "telegram_content": "📱 CONTENT FOR TELEGRAM 📱\n\n📝 Ready texts:\n\n🚀 Guys, found a cool bot for earning! Already {balance} ⭐ today. Who's ready to try? {ref_link}\n\n💎 This bot really pays money! Already withdrew {balance} ⭐. {ref_link}\n\n⚡ While everyone sleeps, I earn! {balance} ⭐ today. Who's with me? {ref_link}\n\n🎯 Additionally:\n• Add balance screenshot\n• Show achievements\n• Tell about games",
+    "challenges_stub": "⚡ **CHALLENGES** ⚡\n\n🚧 **Coming soon...**\n\nWe are working on a daily challenges system that will help you earn even more stars!\n\n💡 **What awaits you:**\n• Daily tasks\n• Completion bonuses\n• Special rewards\n• User tournaments\n\n⏰ Stay tuned for updates!",
+    # Additional translations for inline buttons
+    "activate_promo_button": "Activate Promo Code",
+    "my_transactions_button": "My Transactions",
+    "challenges_button": "Challenges",
+    "social_content_button": "Content for Reposts",
+    "tiktok_button": "TikTok",
+    "instagram_button": "Instagram",
+    "telegram_button": "Telegram",
+    "duels_button": "Duels",
+    "timer_button": "Timer",
+    "coinflip_button": "Heads/Tails",
+    "slots_button": "Slots",
+    "football_button": "Football",
+    "bowling_button": "Bowling",
+    "basketball_button": "Basketball",
+    "darts_button": "Darts",
+    "dice_button": "Dice",
+    "webapp_game_button": "Maniac Clic Game",
+    "passive_income_button": "Passive Income",
+    "daily_bonus_button": "Get Daily Bonus",
+    "our_channel_button": "Our Channel",
+    "our_chat_button": "Our Chat",
+    "our_withdrawals_button": "Our Withdrawals",
+    "our_manual_button": "Our Manual",
+    "tech_support_button": "Tech Support 12:00-21:00 🆘",
+    "heads_button": "Heads",
+    "tails_button": "Tails",
+    "risk_button": "Risk it!",
+    "cashout_button": "Take Winnings",
+    "play_again_button": "Play Again",
+    "to_other_games_button": "To Other Games",
+    "training_button": "Training",
+    "stats_button": "Statistics",
+    "cancel_search_button": "Cancel Search",
+    "how_to_play_button": "How to Play?",
+    "stop_button": "STOP!",
+    "surrender_button": "Surrender",
+    "boost_card_button": "Boost Card",
+    "new_cards_button": "New Cards",
+    "bet_low_button": "Bet on 1-3",
+    "bet_high_button": "Bet on 4-6",
+    # --- FAQ and Terms of Service ---
+    "faq_menu": "❓ **Frequently Asked Questions** ❓\n\n"
+    "**🤔 How to earn in the bot?**\n"
+    "• Invite friends via referral link (+5 ⭐ for each)\n"
+    "• Play mini-games with bets\n"
+    "• Get daily bonus (1 ⭐ every 24 hours)\n"
+    "• Activate passive income (place link in profile)\n\n"
+    "**🎮 What games are available?**\n"
+    "• 🃏 Card duels - strategic game\n"
+    "• ⏱️ Star timer - reaction game\n"
+    "• 🪙 Heads or Tails - luck game\n"
+    "• 🎰 Slots - classic gambling game\n"
+    "• ⚽️ Football, 🎳 Bowling, 🏀 Basketball, 🎯 Darts, 🎲 Dice\n\n"
+    "**💰 How to withdraw earned stars?**\n"
+    "• Need to invite at least 5 friends\n"
+    "• Subscribe to all our resources\n"
+    "• Exchange stars for gifts in 'Prizes' section\n\n"
+    "**🎁 What is passive income?**\n"
+    "• Place bot link in your profile\n"
+    "• Receive 1 ⭐ every day automatically\n"
+    "• 30 ⭐ per month passively!\n\n"
+    "**❓ Are there any restrictions?**\n"
+    "• New users cannot withdraw funds for 24 hours\n"
+    "• Maximum 3 withdrawal requests per day\n"
+    "• Maximum 500 ⭐ for withdrawal per day",
+    "terms_of_service": "📋 **Terms of Service** 📋\n\n"
+    "**1. General Provisions**\n"
+    "By using Maniac Stars bot, you agree to these terms. "
+    "If you disagree with any points, please stop using the bot.\n\n"
+    "**2. Service Description**\n"
+    "Maniac Stars is an entertainment bot with gamification elements, "
+    "allowing users to earn virtual currency (stars) "
+    "through game participation and inviting friends.\n\n"
+    "**3. Registration and Account**\n"
+    "• To use the bot, you need a Telegram account\n"
+    "• One user can have only one account\n"
+    "• Creating multiple accounts is prohibited\n"
+    "• Administration reserves the right to block accounts for rule violations\n\n"
+    "**4. Virtual Currency**\n"
+    "• Stars (⭐) - bot's virtual currency\n"
+    "• Stars have no real monetary value\n"
+    "• Stars can be exchanged for gifts according to catalog\n"
+    "• Administration does not guarantee real money payouts\n\n"
+    "**5. Gameplay**\n"
+    "• All games are based on randomness\n"
+    "• Game results are non-disputable\n"
+    "• Using bots, scripts or other automation means is prohibited\n"
+    "• Fraud and deception of other users is prohibited\n\n"
+    "**6. Referral Program**\n"
+    "• 5 ⭐ credited for each invited friend\n"
+    "• Referral must be an active user\n"
+    "• Creating fake accounts for bonuses is prohibited\n\n"
+    "**7. Withdrawals**\n"
+    "• To withdraw, conditions must be met (minimum referrals, subscription)\n"
+    "• Administration reserves the right to refuse withdrawal\n"
+    "• Request review period - up to 7 business days\n"
+    "• Withdrawal is made as gifts according to catalog\n\n"
+    "**8. Liability**\n"
+    "• Administration is not liable for data loss\n"
+    "• User uses the bot at their own risk\n"
+    "• Administration may change terms without prior notice\n\n"
+    "**9. Prohibited Actions**\n"
+    "• Spam and flooding in the bot\n"
+    "• Insulting other users\n"
+    "• Attempting to hack or disrupt bot operation\n"
+    "• Distributing malicious content\n\n"
+    "**10. Contact Information**\n"
+    "For all questions, contact support: @limejko\n\n"
+    "**Last update date:** {current_date}",
+    "faq_button": "FAQ",
+    "terms_button": "Terms of Service",
+    "back_to_settings": "Back to Settings",
+}
@@ -0,0 +1,231 @@
+# lexicon/locales/es.py
+
+TEXTS = {
+    "start_message": "👋 **¡Hola, {full_name}!**\n\n¡Bienvenido a **Maniac Stars** — un lugar donde puedes ganar y jugar!\n\n🎯 **Qué hay aquí:**\n• 💰 Ganancias a través de referidos\n• 🎮 Mini-juegos con apuestas\n• 🏆 Sistema de logros\n• 🎁 Premios por actividad\n\nElige lo que te interesa ⬇️",
+    "main_menu": "**⚔️ Maniac Stars ⚔️**\n\nUsa los botones de abajo para navegar.\n\n**💰 Balance: {balance} ⭐**",
+    "games_menu": "🎮 **Elige un juego** 🎮\n\n¡También haz clic en las estrellas en nuestro clicker gratuito! ⭐",
+    "profile": "👤 **Tu perfil**\n\n"
+    "**Nombre:** {full_name}\n"
+    "**ID:** `{user_id}`\n"
+    "**Nivel:** {level_name}\n\n"
+    "📈 **Estadísticas:**\n"
+    "• Invitados: {referrals_count} personas\n"
+    "• Duelos: {duel_wins} victorias / {duel_losses} derrotas\n"
+    "• Racha: {streak_days} días seguidos\n"
+    "• Balance: {balance} ⭐\n\n"
+    "{status_text}",
+    "profile_status": "**Estado de la cuenta:**\n{quarantine_status}{cooldown_status}",
+    "referral_menu": "💰 **Ganancias a través de referidos** 💰\n\n"
+    "¡Invita amigos y obtén **+{ref_bonus} ⭐** por cada uno!\n\n"
+    "🔗 **Tu enlace de referido:**\n"
+    "`{ref_link}`\n\n"
+    "✅ **Invitados:** {invited_count} personas\n"
+    "📊 **Ganado:** {earned} ⭐",
+    "referral_pending_notification": "⏳ @{username} siguió tu enlace de referido, pero aún no se ha suscrito a los canales. ¡Una vez que se suscriba, recibirás +{ref_bonus} ⭐!",
+    "referral_success_notification": "¡{username} se unió a través de tu enlace! Recibiste +{bonus} ⭐.",
+    "top_menu": "🏆 **Líderes de referidos** 🏆\n\n{top_users_text}",
+    "gifts_menu": "🎁 **Premios** 🎁\n\n"
+    "¡Intercambia tus ⭐ por regalos! Para recibir premios necesitas invitar al menos {min_refs} amigos y suscribirte a nuestros recursos.\n\n"
+    "💰 **Tu balance:** {balance} ⭐\n"
+    "👥 **Invitados:** {referrals_count} personas\n\n"
+    "Elige un regalo:",
+    "resources_menu": "🎁 **Nuestros recursos** 🎁\n\n"
+    "La suscripción a todos nuestros recursos es **obligatoria** para retirar regalos. "
+    "¡Suscríbete para no perder anuncios importantes y confirmaciones de retiro!",
+    "gift_confirm": "¿Estás seguro de que quieres intercambiar **{cost} ⭐** por **{emoji} {name}**?\n\n"
+    "Esta acción no se puede deshacer.",
+    "withdrawal_success": "✅ ¡Tu solicitud de retiro para **{emoji} {name}** ({amount} ⭐) ha sido creada exitosamente! El administrador la revisará pronto.",
+    "promo_prompt": "🎟️ Ingresa tu código promocional:",
+    "promo_success": "✅ ¡Código promocional activado exitosamente! Recibiste: {amount} ⭐",
+    "promo_fail": "❌ No se pudo activar el código promocional. Razón: {reason}",
+    "entertainment_menu": "👾 **Entretenimiento** 👾\n\nElige en qué quieres jugar, o ingresa un código promocional.",
+    "coinflip_process": "🪙 Lanzando moneda...",
+    "language_selection": "🌍 **Elige idioma** 🌍\n\nSelecciona tu idioma preferido para el bot:",
+    "language_changed": "✅ ¡Idioma cambiado a {language}!",
+    "settings_menu": "⚙️ **Configuración** ⚙️\n\nElige una acción:",
+    "current_language": "🌍 **Idioma actual:** {language}",
+    "back_to_menu": "⬅️ Volver al menú",
+    "back_to_profile": "⬅️ Volver al perfil",
+    "back_to_games": "⬅️ Volver a juegos",
+    "back_to_gifts": "⬅️ Volver a regalos",
+    "cancel": "❌ Cancelar",
+    "confirm": "✅ Confirmar",
+    # Botones del menú
+    "earn_button": "Ganar",
+    "games_button": "Entretenimiento",
+    "profile_button": "Perfil",
+    "gifts_button": "Premios",
+    "leaders_button": "Líderes",
+    "resources_button": "Nuestros Recursos",
+    "achievements_button": "Logros",
+    "settings_button": "Configuración",
+    "change_language": "Cambiar Idioma",
+    "error_unknown": "🔧 Ocurrió un error inesperado. Ya estamos trabajando en ello. Por favor, inténtalo más tarde.",
+    "error_db": "🗄️ Error al acceder a la base de datos. Por favor, repite tu solicitud en unos minutos.",
+    "error_timeout": "⏳ El servidor tardó demasiado en responder. Puede haber problemas temporales. Inténtalo de nuevo.",
+    "error_not_subscribed": "❌ **¡Suscripción no encontrada!**\nPara retirar, debes estar suscrito a todos nuestros recursos. Verifica las suscripciones en la sección '🎁 Nuestros recursos'.",
+    "error_not_enough_referrals": "❌ **¡No hay suficientes amigos!**\nPara retirar, necesitas invitar al menos {min_refs} amigos (tienes {current_refs}).",
+    "gift_requirements_not_met": "No se cumplen las siguientes condiciones para retirar este regalo:\n{errors}",
+    "insufficient_funds": "Fondos insuficientes en el balance.",
+    "daily_cap_exceeded": "Se alcanzó el límite diario para ganar estrellas de esta fuente.",
+    "rate_limit_minute": "¡Muy frecuente! Inténtalo en un minuto.",
+    "rate_limit_hour": "Límite horario alcanzado. Inténtalo más tarde.",
+    "user_in_quarantine": "Los nuevos usuarios no pueden retirar fondos dentro de las 24 horas posteriores al registro.",
+    "withdraw_cooldown": "Retiro temporalmente no disponible después de una gran ganancia. Inténtalo en {hours}h {minutes}m.",
+    "rewards_disabled": "Retiro temporalmente deshabilitado por la administración.",
+    "daily_ops_limit": "Has alcanzado el límite diario de solicitudes.",
+    "daily_amount_limit": "Has alcanzado el límite diario de cantidad de retiro.",
+    "not_subscribed": "¡Debes estar suscrito a nuestro canal para esta acción!",
+    "not_enough_referrals": "Para retirar, necesitas invitar al menos {min_refs} amigos (tienes {current_refs}).",
+    "unknown_error": "Ocurrió un error desconocido. Por favor, inténtalo más tarde.",
+    "subscription_welcome": "🎉 **¡Bienvenido a Maniac Stars!**\n\n¡Suscripción confirmada! Ahora puedes usar todas las funciones del bot.",
+    "subscription_admin_welcome": "👑 **¡Bienvenido, administrador!**\n\nTienes acceso completo a todas las funciones del bot.",
+    "subscription_required": "🔒 **Suscripción requerida**\n\nDebes suscribirte a nuestro canal para usar el bot.",
+    "subscription_success": "✅ **¡Suscripción confirmada!**\n\n¡Bienvenido al bot!",
+    "subscription_failed": "❌ **Suscripción no encontrada**\n\nPor favor, suscríbete al canal e inténtalo de nuevo.",
+    # --- Social Content Texts ---
+    "social_content": "📱 **CONTENIDO LISTO PARA REPOSTS** 📱\n\n🎯 **Elige plataforma:**",
+    "tiktok_content": "🎵 CONTENIDO PARA TIKTOK 🎵\n\n📝 Textos listos:\n\n🔥 ¡Encontré una forma de ganar en Telegram! Ya {balance} ⭐ hoy. ¿Quién está conmigo? {ref_link}\n\n💎 ¡Este bot paga dinero real por juegos! Ya retiré {balance} ⭐. {ref_link}\n\n⚡ ¡Mientras todos duermen, yo gano en Telegram! {balance} ⭐ hoy. ¿Quién está listo para ganar? {ref_link}\n\n🎯 Hashtags:\n\\#ganancias \\#telegram \\#dinero \\#juegos \\#referidos \\#ingresopasivo",
+    "instagram_content": "📸 CONTENIDO PARA INSTAGRAM 📸\n\n📝 Textos listos:\n\n🌟 ¡Nueva forma de ganar en Telegram! Ya {balance} ⭐ esta semana. ¿Quién está listo para probar? {ref_link}\n\n💰 ¡Este bot realmente paga! Ya retiré {balance} ⭐. {ref_link}\n\n🎮 ¡Ganando jugando en Telegram! {balance} ⭐ hoy. ¿Quién está conmigo? {ref_link}\n\n🎯 Hashtags:\n\\#ganancias \\#telegram \\#dinero \\#juegos \\#referidos \\#ingresopasivo \\#workfromhome",
+    "telegram_content": "📱 CONTENIDO PARA TELEGRAM 📱\n\n📝 Textos listos:\n\n🚀 ¡Chicos, encontré un bot genial para ganar! Ya {balance} ⭐ hoy. ¿Quién está listo para probar? {ref_link}\n\n💎 ¡Este bot realmente paga dinero! Ya retiré {balance} ⭐. {ref_link}\n\n⚡ ¡Mientras todos duermen, yo gano! {balance} ⭐ hoy. ¿Quién está conmigo? {ref_link}\n\n🎯 Adicionalmente:\n• Agrega captura de pantalla del balance\n• Muestra logros\n• Cuenta sobre juegos",
+    "challenges_stub": "⚡ **DESAFÍOS** ⚡\n\n🚧 **Próximamente...**\n\n¡Estamos trabajando en un sistema de desafíos diarios que te ayudará a ganar aún más estrellas!\n\n💡 **Lo que te espera:**\n• Tareas diarias\n• Bonificaciones por completar\n• Recompensas especiales\n• Torneos entre usuarios\n\n⏰ ¡Mantente atento a las actualizaciones!",
+    # Traducciones adicionales para botones inline
+    "activate_promo_button": "Activar Código Promocional",
+    "my_transactions_button": "Mis Transacciones",
+    "challenges_button": "Desafíos",
+    "social_content_button": "Contenido para Reposts",
+    "tiktok_button": "TikTok",
+    "instagram_button": "Instagram",
+    "telegram_button": "Telegram",
+    "duels_button": "Duelos",
+    "timer_button": "Temporizador",
+    "coinflip_button": "Cara/Cruz",
+    "slots_button": "Tragamonedas",
+    "football_button": "Fútbol",
+    "bowling_button": "Bolos",
+    "basketball_button": "Baloncesto",
+    "darts_button": "Dardos",
+    "dice_button": "Dados",
+    "webapp_game_button": "Maniac Clic Game",
+    "passive_income_button": "Ingreso Pasivo",
+    "daily_bonus_button": "Obtener Bono Diario",
+    "our_channel_button": "Nuestro Canal",
+    "our_chat_button": "Nuestro Chat",
+    "our_withdrawals_button": "Nuestros Retiros",
+    "our_manual_button": "Nuestro Manual",
+    "tech_support_button": "Soporte Técnico 12:00-21:00 🆘",
+    "heads_button": "Cara",
+    "tails_button": "Cruz",
+    "risk_button": "¡Arriesgarse!",
+    "cashout_button": "Tomar Ganancias",
+    "play_again_button": "Jugar de Nuevo",
+    "to_other_games_button": "A Otros Juegos",
+    "training_button": "Entrenamiento",
+    "stats_button": "Estadísticas",
+    "cancel_search_button": "Cancelar Búsqueda",
+    "how_to_play_button": "¿Cómo Jugar?",
+    "stop_button": "¡PARAR!",
+    "surrender_button": "Rendirse",
+    "boost_card_button": "Mejorar Carta",
+    "new_cards_button": "Nuevas Cartas",
+    "bet_low_button": "Apostar en 1-3",
+    "bet_high_button": "Apostar en 4-6",
+    # --- FAQ y Términos de Servicio ---
+    "faq_menu": "❓ **Preguntas Frecuentes** ❓\n\n"
+    "**🤔 ¿Cómo ganar en el bot?**\n"
+    "• Invita amigos por enlace de referido (+5 ⭐ por cada uno)\n"
+    "• Juega mini-juegos con apuestas\n"
+    "• Obtén bono diario (1 ⭐ cada 24 horas)\n"
+    "• Activa ingreso pasivo (coloca enlace en perfil)\n\n"
+    "**🎮 ¿Qué juegos están disponibles?**\n"
+    "• 🃏 Duelos de cartas - juego estratégico\n"
+    "• ⏱️ Temporizador estelar - juego de reacción\n"
+    "• 🪙 Cara o Cruz - juego de suerte\n"
+    "• 🎰 Tragamonedas - juego de azar clásico\n"
+    "• ⚽️ Fútbol, 🎳 Bolos, 🏀 Baloncesto, 🎯 Dardos, 🎲 Dados\n\n"
+    "**💰 ¿Cómo retirar estrellas ganadas?**\n"
+    "• Necesitas invitar al menos 5 amigos\n"
+    "• Suscribirse a todos nuestros recursos\n"
+    "• Intercambiar estrellas por regalos en sección 'Premios'\n\n"
+    "**🎁 ¿Qué es el ingreso pasivo?**\n"
+    "• Coloca el enlace del bot en tu perfil\n"
+    "• Recibe 1 ⭐ cada día automáticamente\n"
+    "• ¡30 ⭐ al mes pasivamente!\n\n"
+    "**❓ ¿Hay alguna restricción?**\n"
+    "• Los nuevos usuarios no pueden retirar fondos durante 24 horas\n"
+    "• Máximo 3 solicitudes de retiro por día\n"
+    "• Máximo 500 ⭐ para retiro por día",
+    "terms_of_service": "📋 **Términos de Servicio** 📋\n\n"
+    "**1. Disposiciones Generales**\n"
+    "Al usar el bot Maniac Stars, aceptas estos términos. "
+    "Si no estás de acuerdo con algún punto, deja de usar el bot.\n\n"
+    "**2. Descripción del Servicio**\n"
+    "Maniac Stars es un bot de entretenimiento con elementos de gamificación, "
+    "que permite a los usuarios ganar moneda virtual (estrellas) "
+    "mediante la participación en juegos e invitando amigos.\n\n"
+    "**3. Registro y Cuenta**\n"
+    "• Para usar el bot, necesitas una cuenta de Telegram\n"
+    "• Un usuario puede tener solo una cuenta\n"
+    "• Está prohibido crear múltiples cuentas\n"
+    "• La administración se reserva el derecho de bloquear cuentas por violaciones de reglas\n\n"
+    "**4. Moneda Virtual**\n"
+    "• Estrellas (⭐) - moneda virtual del bot\n"
+    "• Las estrellas no tienen valor monetario real\n"
+    "• Las estrellas se pueden intercambiar por regalos según el catálogo\n"
+    "• La administración no garantiza pagos en dinero real\n\n"
+    "**5. Juego**\n"
+    "• Todos los juegos se basan en aleatoriedad\n"
+    "• Los resultados de los juegos no son disputables\n"
+    "• Está prohibido usar bots, scripts u otros medios de automatización\n"
+    "• Está prohibido el fraude y el engaño a otros usuarios\n\n"
+    "**6. Programa de Referidos**\n"
+    "• Se acreditan 5 ⭐ por cada amigo invitado\n"
+    "• El referido debe ser un usuario activo\n"
+    "• Está prohibido crear cuentas falsas para obtener bonos\n\n"
+    "**7. Retiros**\n"
+    "• Para retirar, deben cumplirse las condiciones (mínimo de referidos, suscripción)\n"
+    "• La administración se reserva el derecho de rechazar retiros\n"
+    "• Período de revisión de solicitudes - hasta 7 días hábiles\n"
+    "• El retiro se realiza como regalos según el catálogo\n\n"
+    "**8. Responsabilidad**\n"
+    "• La administración no es responsable por pérdida de datos\n"
+    "• El usuario usa el bot bajo su propio riesgo\n"
+    "• La administración puede cambiar los términos sin previo aviso\n\n"
+    "**9. Acciones Prohibidas**\n"
+    "• Spam y flooding en el bot\n"
+    "• Insultar a otros usuarios\n"
+    "• Intentar hackear o interrumpir la operación del bot\n"
+    "• Distribuir contenido malicioso\n\n"
+    "**10. Información de Contacto**\n"
+    "Para todas las preguntas, contacta soporte: @limejko\n\n"
+    "**Fecha de última actualización:** {current_date}",
+    "faq_button": "FAQ",
+    "terms_button": "Términos de Servicio",
+    "back_to_settings": "Volver a Configuración",
+    "coinflip_menu": "🪙 **Cara o Cruz** 🪙\n\n¡Arriesga y multiplica tus ganancias! Adivina qué lado saldrá.\n¡Con cada victoria la probabilidad baja y el premio crece!\n\n💰 **Tu balance:** {balance} ⭐\n\nElige tu apuesta:",
+    "coinflip_choice_prompt": "🎉 **¡Apuesta de {stake} ⭐ aceptada!** 🎉\n\n¿Qué eliges?",
+    "coinflip_continue": "🎉 **¡Victoria!** 🎉\n\nGanaste **{current_prize}** ⭐.\nEl siguiente lanzamiento puede dar **{next_prize}** ⭐ con un {next_chance}% de probabilidad.\n\n¿Te arriesgas?",
+    "coinflip_win_final": "🎉 **¡Felicidades!** 🎉\n\nTe llevas las ganancias: {prize} ⭐\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "coinflip_loss": "😕 **Vaya, sin suerte...**\n\nPerdiste tu apuesta: {stake} ⭐\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "slots_menu": "🎰 **Tragamonedas** 🎰\n\n¡Prueba tu suerte! Consigue tres símbolos iguales seguidos para ganar.\n\n💰 **Tu balance:** {balance} ⭐\n\nElige tu apuesta:",
+    "slots_win": "🎉 **¡GANASTE!** 🎉\n\n¡Ganaste {prize} ⭐!\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "slots_lose": "😕 **Vaya, sin suerte...**\n\nPerdiste {cost} ⭐.\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "football_menu": "⚽️ **Fútbol** ⚽️\n\n¡Lanza un penalti! Si marcas gol, recibes un premio.\n\n💰 **Tu balance:** {balance} ⭐",
+    "football_win": "🎉 **¡GOOOL!** 🎉\n\n¡Marcaste y ganaste {prize} ⭐!\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "football_lose": "😕 **Fallaste...**\n\nPerdiste {cost} ⭐.\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "bowling_menu": "🎳 **Bolos** 🎳\n\n¿Lograrás un strike? Si derribas todos los bolos de un tiro, ¡recibes un premio!\n\n💰 **Tu balance:** {balance} ⭐\n\nElige tu apuesta:",
+    "bowling_win": "🎉 **¡STRIKE!** 🎉\n\n¡Gran tiro! ¡Ganaste {prize} ⭐!\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "bowling_lose": "😕 **Fallaste...**\n\nSuerte la próxima vez. Perdiste {cost} ⭐.\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "basketball_menu": "🏀 **Baloncesto** 🏀\n\n¡Encesta el balón para ganar un premio!\n\n💰 **Tu balance:** {balance} ⭐",
+    "basketball_win": "🎉 **¡Justo en el blanco!** 🎉\n\n¡Gran tiro! ¡Ganaste {prize} ⭐!\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "basketball_lose": "😕 **Fallaste...**\n\nEl balón pasó de largo. Perdiste {cost} ⭐.\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "darts_menu": "🎯 **Dardos** 🎯\n\n¡Acierta en el centro para ganar un premio!\n\n💰 **Tu balance:** {balance} ⭐",
+    "darts_win": "🎉 **¡Justo en el blanco!** 🎉\n\n¡Gran tiro! ¡Ganaste {prize} ⭐!\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "darts_lose": "😕 **Fallaste...**\n\nEl dardo pasó de largo. Perdiste {cost} ⭐.\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "dice_menu": "🎲 **Dados** 🎲\n\n¡Adivina en qué rango caerá el número del dado! Apuesta a (1-3) o (4-6).\n\n💰 **Tu balance:** {balance} ⭐",
+    "dice_win": "🎉 **¡Victoria!** 🎉\n\nApostaste a ({choice}) ¡y salió el {value}! ¡Ganaste {prize} ⭐!\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "dice_lose": "😕 **Vaya, no acertaste...**\n\nApostaste a ({choice}) y salió el {value}. Perdiste {cost} ⭐.\n💰 Tu nuevo balance: {new_balance} ⭐",
+    "transactions_title": "📊 **Historial de transacciones** 📊\n\n💰 **Balance actual:** {balance} ⭐\n\n📋 **Operaciones recientes:**\n\n",
+    "transactions_empty": "📊 **Historial de transacciones** 📊\n\n💰 **Balance actual:** {balance} ⭐\n\n📭 **El historial está vacío**\nAún no tienes transacciones. ¡Empieza a jugar o invita a tus amigos!",
+    "transaction_item": "{emoji} **{amount_text}** - {reason_text}\n📅 {date}\n",
+}
@@ -0,0 +1,243 @@
+# lexicon/locales/ru.py
+
+TEXTS = {
+    "start_message": "👋 **Привет, {full_name}!**\n\nДобро пожаловать в **Maniac Stars** — место где можно заработать и поиграть!\n\n🎯 **Что здесь есть:**\n• 💰 Заработок через рефералов\n• 🎮 Мини-игры на ставки\n• 🏆 Система достижений\n• 🎁 Призы за активность\n\nВыбери что тебя интересует ⬇️",
+    "main_menu": "**⚔️ Maniac Stars ⚔️**\n\nИспользуй кнопки ниже для навигации.\n\n**💰 Баланс: {balance} ⭐**",
+    "games_menu": "🎮 **Выберите игру** 🎮\n\nА также кликайте звезды в нашем бесплатном кликере! ⭐",
+    "profile": "👤 **Твой профиль**\n\n"
+    "**Имя:** {full_name}\n"
+    "**ID:** `{user_id}`\n"
+    "**Уровень:** {level_name}\n\n"
+    "📈 **Статистика:**\n"
+    "• Приглашено: {referrals_count} чел.\n"
+    "• Дуэли: {duel_wins} побед / {duel_losses} поражений\n"
+    "• Стрик: {streak_days} дней подряд\n"
+    "• Баланс: {balance} ⭐\n\n"
+    "{status_text}",
+    "profile_status": "**Статус аккаунта:**\n{quarantine_status}{cooldown_status}",
+    "referral_menu": "💰 **Заработок через рефералов** 💰\n\n"
+    "Приглашай друзей и получай **+{ref_bonus} ⭐** за каждого!\n\n"
+    "🔗 **Твоя реферальная ссылка:**\n"
+    "`{ref_link}`\n\n"
+    "✅ **Приглашено:** {invited_count} чел.\n"
+    "📊 **Заработано:** {earned} ⭐",
+    "referral_pending_notification": "⏳ @{username} перешел по вашей реферальной ссылке, но еще не подписался на каналы. Как только подпишется, вы получите +{ref_bonus} ⭐!",
+    "referral_success_notification": "{username} присоединился по вашей ссылке! Вам начислено +{bonus} ⭐.",
+    "top_menu": "🏆 **Лидеры по рефералам** 🏆\n\n{top_users_text}",
+    "gifts_menu": "🎁 **Призы** 🎁\n\n"
+    "Обменивай свои ⭐ на подарки! Для получения призов нужно пригласить минимум {min_refs} друзей и подписаться на наши ресурсы.\n\n"
+    "💰 **Твой баланс:** {balance} ⭐\n"
+    "👥 **Приглашено:** {referrals_count} чел.\n\n"
+    "Выбери подарок:",
+    "resources_menu": "🎁 **Наши ресурсы** 🎁\n\n"
+    "Подписка на все наши ресурсы **обязательна** для вывода подарков. "
+    "Подпишись, чтобы не пропустить важные анонсы и подтверждения выводов!",
+    "gift_confirm": "Вы уверены, что хотите обменять **{cost} ⭐** на **{emoji} {name}**?\n\n"
+    "Это действие нельзя будет отменить.",
+    "withdrawal_success": "✅ Ваша заявка на вывод **{emoji} {name}** ({amount} ⭐) успешно создана! Администратор рассмотрит её в ближайшее время.",
+    "promo_prompt": "🎟️ Введите ваш промокод:",
+    "promo_success": "✅ Промокод успешно активирован! Вам начислено: {amount} ⭐",
+    "promo_fail": "❌ Не удалось активировать промокод. Причина: {reason}",
+    "entertainment_menu": "👾 **Развлечения** 👾\n\nВыбери, во что хочешь сыграть, или введи промокод.",
+    "language_selection": "🌍 **Выберите язык** 🌍\n\nВыберите предпочитаемый язык для бота:",
+    "language_changed": "✅ Язык изменен на {language}!",
+    "settings_menu": "⚙️ **Настройки** ⚙️\n\nВыберите действие:",
+    "current_language": "🌍 **Текущий язык:** {language}",
+    "back_to_menu": "⬅️ Назад в меню",
+    "back_to_profile": "⬅️ Назад в профиль",
+    "back_to_games": "⬅️ Назад к играм",
+    "back_to_gifts": "⬅️ Назад к подаркам",
+    "cancel": "❌ Отмена",
+    "confirm": "✅ Подтвердить",
+    # Кнопки меню
+    "earn_button": "Заработать",
+    "games_button": "Развлечения",
+    "profile_button": "Профиль",
+    "gifts_button": "Призы",
+    "leaders_button": "Лидеры",
+    "resources_button": "Наши ресурсы",
+    "achievements_button": "Достижения",
+    "settings_button": "Настройки",
+    "change_language": "Сменить язык",
+    "error_unknown": "🔧 Произошла непредвиденная ошибка. Мы уже работаем над этим. Попробуйте, пожалуйста, позже.",
+    "error_db": "🗄️ Ошибка при обращении к базе данных. Пожалуйста, повторите ваш запрос через несколько минут.",
+    "error_timeout": "⏳ Сервер слишком долго отвечал. Возможно, временные неполадки. Попробуйте еще раз.",
+    "error_not_subscribed": "❌ **Подписка не найдена!**\nДля вывода необходимо быть подписанным на все наши ресурсы. Проверьте подписки в разделе '🎁 Наши ресурсы'.",
+    "error_not_enough_referrals": "❌ **Недостаточно друзей!**\nДля вывода нужно пригласить минимум {min_refs} друзей (у вас {current_refs}).",
+    "gift_requirements_not_met": "Для вывода этого подарка не выполнены следующие условия:\n{errors}",
+    "insufficient_funds": "Недостаточно средств на балансе.",
+    "daily_cap_exceeded": "Достигнут дневной лимит на получение звёзд из этого источника.",
+    "rate_limit_minute": "Слишком часто! Попробуйте через минуту.",
+    "rate_limit_hour": "Достигнут часовой лимит. Попробуйте позже.",
+    "user_in_quarantine": "Новые пользователи не могут выводить средства в течение 24 часов после регистрации.",
+    "withdraw_cooldown": "Вывод временно недоступен после крупного выигрыша. Попробуйте через {hours}ч {minutes}м.",
+    "rewards_disabled": "Вывод временно отключен администрацией.",
+    "daily_ops_limit": "Вы достигли лимита на количество заявок в день.",
+    "daily_amount_limit": "Вы достигли лимита на сумму вывода в день.",
+    "not_subscribed": "Для этого действия необходимо быть подписанным на наш канал!",
+    "not_enough_referrals": "Для вывода нужно пригласить минимум {min_refs} друзей (у вас {current_refs}).",
+    "unknown_error": "Произошла неизвестная ошибка. Попробуйте позже.",
+    "subscription_welcome": "🎉 **Добро пожаловать в Maniac Stars!**\n\nПодписка подтверждена! Теперь вы можете пользоваться всеми функциями бота.",
+    "subscription_admin_welcome": "👑 **Добро пожаловать, администратор!**\n\nУ вас есть полный доступ ко всем функциям бота.",
+    "subscription_required": "🔒 **Подписка обязательна**\n\nДля использования бота необходимо подписаться на наш канал.",
+    "subscription_success": "✅ **Подписка подтверждена!**\n\nДобро пожаловать в бота!",
+    "subscription_failed": "❌ **Подписка не найдена**\n\nПожалуйста, подпишитесь на канал и попробуйте снова.",
+    # --- Game Texts ---
+    "coinflip_menu": "🪙 **Орёл и Решка** 🪙\n\n"
+    "Рискни и умножь свой выигрыш! Угадай, какая сторона выпадет.\n"
+    "С каждым следующим выигрышем шанс уменьшается, а приз растет!\n\n"
+    "💰 **Ваш баланс:** {balance} ⭐\n\nВыберите ставку:",
+    "coinflip_process": "🪙 Подбрасываем монетку...",
+    "coinflip_choice_prompt": "🎉 **Ставка {stake} ⭐ принята!** 🎉\n\nЧто выбираешь?",
+    "coinflip_continue": "🎉 **Победа!** 🎉\n\n"
+    "Вы выиграли **{current_prize}** ⭐.\n"
+    "Следующий бросок может принести **{next_prize}** ⭐ с шансом {next_chance}%.\n\n"
+    "Рискнёте?",
+    "coinflip_win_final": "🎉 **Поздравляем!** 🎉\n\n"
+    "Вы забираете выигрыш: {prize} ⭐\n"
+    "💰 Ваш новый баланс: {new_balance} ⭐",
+    "coinflip_loss": "😕 **Увы, неудача...**\n\n"
+    "Вы проиграли свою ставку: {stake} ⭐\n"
+    "💰 Ваш новый баланс: {new_balance} ⭐",
+    "slots_menu": "🎰 **Слоты** 🎰\n\nИспытай свою удачу! Собери три одинаковых символа в ряд, чтобы выиграть.\n\n💰 **Ваш баланс:** {balance} ⭐\n\nВыберите ставку:",
+    "slots_win": "🎉 **ПОБЕДА!** 🎉\n\nВы выиграли {prize} ⭐!\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "slots_lose": "😕 **Увы, не повезло...**\n\nВы проиграли {cost} ⭐.\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "football_menu": "⚽️ **Футбол** ⚽️\n\nПробей пенальти! Если забьешь гол, получишь приз.\n\n💰 **Ваш баланс:** {balance} ⭐",
+    "football_win": "🎉 **ГОООЛ!** 🎉\n\nТы забил и выиграл {prize} ⭐!\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "football_lose": "😕 **Промах...**\n\nВы проиграли {cost} ⭐.\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "bowling_menu": "🎳 **Боулинг** 🎳\n\nСможешь выбить страйк? Если собьешь все кегли одним броском - получишь приз!\n\n💰 **Ваш баланс:** {balance} ⭐\n\nВыберите ставку:",
+    "bowling_win": "🎉 **СТРАЙК!** 🎉\n\nОтличный бросок! Ты выиграл {prize} ⭐!\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "bowling_lose": "😕 **Мимо...**\n\nВ следующий раз повезет больше. Вы проиграли {cost} ⭐.\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "basketball_menu": "🏀 **Баскетбол** 🏀\n\nПопади мячом в корзину, чтобы выиграть приз!\n\n💰 **Ваш баланс:** {balance} ⭐",
+    "basketball_win": "🎉 **Точно в цель!** 🎉\n\nОтличный бросок! Ты выиграл {prize} ⭐!\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "basketball_lose": "😕 **Промах...**\n\nМяч пролетел мимо. Вы проиграли {cost} ⭐.\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "darts_menu": "🎯 **Дартс** 🎯\n\nПопади в яблочко, чтобы выиграть приз!\n\n💰 **Ваш баланс:** {balance} ⭐",
+    "darts_win": "🎉 **Точно в цель!** 🎉\n\nОтличный бросок! Ты выиграл {prize} ⭐!\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "darts_lose": "😕 **Мимо...**\n\nДротик пролетел мимо. Вы проиграли {cost} ⭐.\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "dice_menu": "🎲 **Кости** 🎲\n\nУгадай, в каком диапазоне выпадет число на кубике! Ставь на (1-3) или (4-6).\n\n💰 **Ваш баланс:** {balance} ⭐",
+    "dice_win": "🎉 **Победа!** 🎉\n\nТы поставил на ({choice}), а выпало число {value}! Ты выиграл {prize} ⭐!\n💰 Ваш новый баланс: {new_balance} ⭐",
+    "dice_lose": "😕 **Увы, не угадал...**\n\nТы поставил на ({choice}), а выпало число {value}. Вы проиграли {cost} ⭐.\n💰 Ваш новый баланс: {new_balance} ⭐",
+    # --- Transaction Texts ---
+    "transactions_title": "📊 **История транзакций** 📊\n\n💰 **Текущий баланс:** {balance} ⭐\n\n📋 **Последние операции:**\n\n",
+    "transactions_empty": "📊 **История транзакций** 📊\n\n💰 **Текущий баланс:** {balance} ⭐\n\n📭 **История пуста**\nПока что у вас нет транзакций. Начните играть или приглашайте друзей!",
+    "transaction_item": "{emoji} **{amount_text}** - {reason_text}\n📅 {date}\n",
+    # --- Social Content Texts ---
+    "social_content": "📱 **ГОТОВЫЙ КОНТЕНТ ДЛЯ РЕПОСТОВ** 📱\n\n🎯 **Выберите платформу:**",
+    "tiktok_content": "🎵 КОНТЕНТ ДЛЯ TIKTOK 🎵\n\n📝 Готовые тексты:\n\n🔥 Нашел способ зарабатывать в Telegram! За день уже {balance} ⭐. Кто со мной? {ref_link}\n\n💎 Этот бот платит реальные деньги за игры! Уже вывел {balance} ⭐. {ref_link}\n\n⚡ Пока все спят, я зарабатываю в Telegram! {balance} ⭐ за сегодня. Кто готов к заработку? {ref_link}\n\n🎯 Хештеги:\n\\#заработок \\#telegram \\#деньги \\#игры \\#рефералы \\#пассивныйдоход",
+    "instagram_content": "📸 КОНТЕНТ ДЛЯ INSTAGRAM 📸\n\n📝 Готовые тексты:\n\n🌟 Новый способ заработка в Telegram! За неделю уже {balance} ⭐. Кто готов попробовать? {ref_link}\n\n💰 Этот бот реально платит! Уже вывел {balance} ⭐. {ref_link}\n\n🎮 Зарабатываю играя в Telegram! {balance} ⭐ за сегодня. Кто со мной? {ref_link}\n\n🎯 Хештеги:\n\\#заработок \\#telegram \\#деньги \\#игры \\#рефералы \\#пассивныйдоход \\#workfromhome",
+    "telegram_content": "📱 КОНТЕНТ ДЛЯ TELEGRAM 📱\n\n📝 Готовые тексты:\n\n🚀 Ребят, нашел крутой бот для заработка! За день уже {balance} ⭐. Кто готов попробовать? {ref_link}\n\n💎 Этот бот реально платит деньги! Уже вывел {balance} ⭐. {ref_link}\n\n⚡ Пока все спят, я зарабатываю! {balance} ⭐ за сегодня. Кто со мной? {ref_link}\n\n🎯 Дополнительно:\n• Добавьте скриншот баланса\n• Покажите достижения\n• Расскажите о играх",
+    "challenges_stub": "⚡ **ЧЕЛЛЕНДЖИ** ⚡\n\n🚧 **Скоро будет...**\n\nМы работаем над системой ежедневных челленджей, которые помогут вам зарабатывать еще больше звезд!\n\n💡 **Что вас ждет:**\n• Ежедневные задания\n• Бонусы за выполнение\n• Специальные награды\n• Турниры между пользователями\n\n⏰ Следите за обновлениями!",
+    # Дополнительные переводы для инлайн кнопок
+    "activate_promo_button": "Активировать промокод",
+    "my_transactions_button": "Мои транзакции",
+    "challenges_button": "Челленджи",
+    "social_content_button": "Контент для репостов",
+    "tiktok_button": "TikTok",
+    "instagram_button": "Instagram",
+    "telegram_button": "Telegram",
+    "duels_button": "Дуэли",
+    "timer_button": "Таймер",
+    "coinflip_button": "Орёл/Решка",
+    "slots_button": "Слоты",
+    "football_button": "Футбол",
+    "bowling_button": "Боулинг",
+    "basketball_button": "Баскетбол",
+    "darts_button": "Дартс",
+    "dice_button": "Кости",
+    "webapp_game_button": "Maniac Clic Game",
+    "passive_income_button": "Пассивный доход",
+    "daily_bonus_button": "Получить ежедневный бонус",
+    "our_channel_button": "Наш канал",
+    "our_chat_button": "Наш чат",
+    "our_withdrawals_button": "Наши выводы",
+    "our_manual_button": "Наш мануал",
+    "tech_support_button": "Техподдержка 12:00-21:00 🆘",
+    "heads_button": "Орёл",
+    "tails_button": "Решка",
+    "risk_button": "Рискнуть!",
+    "cashout_button": "Забрать выигрыш",
+    "play_again_button": "Играть снова",
+    "to_other_games_button": "К другим играм",
+    "training_button": "Обучение",
+    "stats_button": "Статистика",
+    "cancel_search_button": "Отменить поиск",
+    "how_to_play_button": "Как играть?",
+    "stop_button": "СТОП!",
+    "surrender_button": "Сдаться",
+    "boost_card_button": "Усилить карту",
+    "new_cards_button": "Новые карты",
+    "bet_low_button": "Поставить на 1-3",
+    "bet_high_button": "Поставить на 4-6",
+    # --- FAQ и Пользовательское соглашение ---
+    "faq_menu": "❓ **Часто задаваемые вопросы** ❓\n\n"
+    "**🤔 Как зарабатывать в боте?**\n"
+    "• Приглашайте друзей по реферальной ссылке (+5 ⭐ за каждого)\n"
+    "• Играйте в мини-игры на ставки\n"
+    "• Получайте ежедневный бонус (1 ⭐ каждые 24 часа)\n"
+    "• Активируйте пассивный доход (разместите ссылку в профиле)\n\n"
+    "**🎮 Какие игры доступны?**\n"
+    "• 🃏 Карточные дуэли - стратегическая игра\n"
+    "• ⏱️ Звёздный таймер - игра на реакцию\n"
+    "• 🪙 Орёл и решка - игра на удачу\n"
+    "• 🎰 Слоты - классическая азартная игра\n"
+    "• ⚽️ Футбол, 🎳 Боулинг, 🏀 Баскетбол, 🎯 Дартс, 🎲 Кости\n\n"
+    "**💰 Как вывести заработанные звёзды?**\n"
+    "• Нужно пригласить минимум 5 друзей\n"
+    "• Подписаться на все наши ресурсы\n"
+    "• Обменять звёзды на подарки в разделе 'Призы'\n\n"
+    "**🎁 Что такое пассивный доход?**\n"
+    "• Разместите ссылку на бота в своём профиле\n"
+    "• Получайте 1 ⭐ каждый день автоматически\n"
+    "• 30 ⭐ в месяц пассивно!\n\n"
+    "**❓ Есть ли ограничения?**\n"
+    "• Новые пользователи не могут выводить средства 24 часа\n"
+    "• Максимум 3 заявки на вывод в день\n"
+    "• Максимум 500 ⭐ на вывод в день",
+    "terms_of_service": "📋 **Пользовательское соглашение** 📋\n\n"
+    "**1. Общие положения**\n"
+    "Используя бота Maniac Stars, вы соглашаетесь с данными условиями. "
+    "Если вы не согласны с какими-либо пунктами, прекратите использование бота.\n\n"
+    "**2. Описание сервиса**\n"
+    "Maniac Stars - это развлекательный бот с элементами геймификации, "
+    "позволяющий пользователям зарабатывать виртуальную валюту (звёзды) "
+    "через участие в играх и приглашение друзей.\n\n"
+    "**3. Регистрация и аккаунт**\n"
+    "• Для использования бота необходимо иметь аккаунт Telegram\n"
+    "• Один пользователь может иметь только один аккаунт\n"
+    "• Запрещено создание множественных аккаунтов\n"
+    "• Администрация оставляет за собой право заблокировать аккаунт при нарушении правил\n\n"
+    "**4. Виртуальная валюта**\n"
+    "• Звёзды (⭐) - виртуальная валюта бота\n"
+    "• Звёзды не имеют реальной денежной стоимости\n"
+    "• Звёзды можно обменивать на подарки согласно каталогу\n"
+    "• Администрация не гарантирует выплату реальных денег\n\n"
+    "**5. Игровой процесс**\n"
+    "• Все игры основаны на случайности\n"
+    "• Результаты игр не подлежат оспариванию\n"
+    "• Запрещено использование ботов, скриптов или других средств автоматизации\n"
+    "• Запрещено мошенничество и обман других пользователей\n\n"
+    "**6. Реферальная программа**\n"
+    "• За каждого приглашённого друга начисляется 5 ⭐\n"
+    "• Реферал должен быть активным пользователем\n"
+    "• Запрещено создание фейковых аккаунтов для получения бонусов\n\n"
+    "**7. Вывод средств**\n"
+    "• Для вывода необходимо выполнить условия (минимум рефералов, подписка)\n"
+    "• Администрация оставляет за собой право отказать в выводе\n"
+    "• Срок рассмотрения заявок - до 7 рабочих дней\n"
+    "• Вывод осуществляется в виде подарков согласно каталогу\n\n"
+    "**8. Ответственность**\n"
+    "• Администрация не несёт ответственности за потерю данных\n"
+    "• Пользователь использует бота на свой страх и риск\n"
+    "• Администрация может изменить условия без предварительного уведомления\n\n"
+    "**9. Запрещённые действия**\n"
+    "• Спам и флуд в боте\n"
+    "• Оскорбления других пользователей\n"
+    "• Попытки взлома или нарушения работы бота\n"
+    "• Распространение вредоносного контента\n\n"
+    "**10. Контактная информация**\n"
+    "По всем вопросам обращайтесь в техподдержку: @limejko\n\n"
+    "**Дата последнего обновления:** {current_date}",
+    "faq_button": "FAQ",
+    "terms_button": "Пользовательское соглашение",
+    "back_to_settings": "Назад в настройки",
+}
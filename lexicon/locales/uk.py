@@ -0,0 +1,243 @@
+# lexicon/locales/uk.py
+
+TEXTS = {
+    "start_message": "👋 **Привіт, {full_name}!**\n\nЛаскаво просимо до **Maniac Stars** — місце, де можна заробляти та грати!\n\n🎯 **Що тут є:**\n• 💰 Заробіток через рефералів\n• 🎮 Міні-ігри на ставки\n• 🏆 Система досягнень\n• 🎁 Призи за активність\n\nОбери що тебе цікавить ⬇️",
+    "main_menu": "**⚔️ Maniac Stars ⚔️**\n\nВикористовуй кнопки нижче для навігації.\n\n**💰 Баланс: {balance} ⭐**",
+    "games_menu": "🎮 **Оберіть гру** 🎮\n\nА також клікайте зірки в нашому безкоштовному клікері! ⭐",
+    "profile": "👤 **Твій профіль**\n\n"
+    "**Ім'я:** {full_name}\n"
+    "**ID:** `{user_id}`\n"
+    "**Рівень:** {level_name}\n\n"
+    "📈 **Статистика:**\n"
+    "• Запрошено: {referrals_count} осіб\n"
+    "• Дуелі: {duel_wins} перемог / {duel_losses} поразок\n"
+    "• Стрік: {streak_days} днів поспіль\n"
+    "• Баланс: {balance} ⭐\n\n"
+    "{status_text}",
+    "profile_status": "**Статус акаунту:**\n{quarantine_status}{cooldown_status}",
+    "referral_menu": "💰 **Заробіток через рефералів** 💰\n\n"
+    "Запрошуй друзів і отримуй **+{ref_bonus} ⭐** за кожного!\n\n"
+    "🔗 **Твоя реферальна посилання:**\n"
+    "`{ref_link}`\n\n"
+    "✅ **Запрошено:** {invited_count} осіб\n"
+    "📊 **Зароблено:** {earned} ⭐",
+    "referral_pending_notification": "⏳ @{username} перейшов за вашим реферальним посиланням, але ще не підписався на канали. Як тільки підпишеться, ви отримаєте +{ref_bonus} ⭐!",
+    "referral_success_notification": "{username} приєднався за вашим посиланням! Вам нараховано +{bonus} ⭐.",
+    "top_menu": "🏆 **Лідери за рефералами** 🏆\n\n{top_users_text}",
+    "gifts_menu": "🎁 **Призи** 🎁\n\n"
+    "Обмінюй свої ⭐ на подарунки! Для отримання призів потрібно запросити мінімум {min_refs} друзів і підписатися на наші ресурси.\n\n"
+    "💰 **Твій баланс:** {balance} ⭐\n"
+    "👥 **Запрошено:** {referrals_count} осіб\n\n"
+    "Обери подарунок:",
+    "resources_menu": "🎁 **Наші ресурси** 🎁\n\n"
+    "Підписка на всі наші ресурси **обов'язкова** для виводу подарунків. "
+    "Підпишись, щоб не пропустити важливі анонси та підтвердження виводів!",
+    "gift_confirm": "Ви впевнені, що хочете обміняти **{cost} ⭐** на **{emoji} {name}**?\n\n"
+    "Цю дію не можна буде скасувати.",
+    "withdrawal_success": "✅ Ваша заявка на вивід **{emoji} {name}** ({amount} ⭐) успішно створена! Адміністратор розгляне її найближчим часом.",
+    "promo_prompt": "🎟️ Введіть ваш промокод:",
+    "promo_success": "✅ Промокод успішно активовано! Вам нараховано: {amount} ⭐",
+    "promo_fail": "❌ Не вдалося активувати промокод. Причина: {reason}",
+    "entertainment_menu": "👾 **Розваги** 👾\n\nОбери, у що хочеш зіграти, або введи промокод.",
+    "language_selection": "🌍 **Оберіть мову** 🌍\n\nВиберіть бажану мову для бота:",
+    "language_changed": "✅ Мову змінено на {language}!",
+    "settings_menu": "⚙️ **Налаштування** ⚙️\n\nОберіть дію:",
+    "current_language": "🌍 **Поточна мова:** {language}",
+    "back_to_menu": "⬅️ Назад в меню",
+    "back_to_profile": "⬅️ Назад в профіль",
+    "back_to_games": "⬅️ Назад до ігор",
+    "back_to_gifts": "⬅️ Назад до подарунків",
+    "cancel": "❌ Скасувати",
+    "confirm": "✅ Підтвердити",
+    # Кнопки меню
+    "earn_button": "Заробляти",
+    "games_button": "Розваги",
+    "profile_button": "Профіль",
+    "gifts_button": "Призи",
+    "leaders_button": "Лідери",
+    "resources_button": "Наші ресурси",
+    "achievements_button": "Досягнення",
+    "settings_button": "Налаштування",
+    "change_language": "Змінити мову",
+    "error_unknown": "🔧 Сталася непередбачена помилка. Ми вже працюємо над цим. Спробуйте, будь ласка, пізніше.",
+    "error_db": "🗄️ Помилка при зверненні до бази даних. Будь ласка, повторіть ваш запит через кілька хвилин.",
+    "error_timeout": "⏳ Сервер занадто довго відповідав. Можливо, тимчасові неполадки. Спробуйте ще раз.",
+    "error_not_subscribed": "❌ **Підписка не знайдена!**\nДля виводу необхідно бути підписаним на всі наші ресурси. Перевірте підписки в розділі '🎁 Наші ресурси'.",
+    "error_not_enough_referrals": "❌ **Недостатньо друзів!**\nДля виводу потрібно запросити мінімум {min_refs} друзів (у вас {current_refs}).",
+    "gift_requirements_not_met": "Для виводу цього подарунка не виконані наступні умови:\n{errors}",
+    "insufficient_funds": "Недостатньо коштів на балансі.",
+    "daily_cap_exceeded": "Досягнуто денний ліміт на отримання зірок з цього джерела.",
+    "rate_limit_minute": "Занадто часто! Спробуйте через хвилину.",
+    "rate_limit_hour": "Досягнуто годинний ліміт. Спробуйте пізніше.",
+    "user_in_quarantine": "Нові користувачі не можуть виводити кошти протягом 24 годин після реєстрації.",
+    "withdraw_cooldown": "Вивід тимчасово недоступний після великого виграшу. Спробуйте через {hours}г {minutes}хв.",
+    "rewards_disabled": "Вивід тимчасово відключений адміністрацією.",
+    "daily_ops_limit": "Ви досягли ліміту на кількість заявок на день.",
+    "daily_amount_limit": "Ви досягли ліміту на суму виводу на день.",
+    "not_subscribed": "Для цієї дії необхідно бути підписаним на наш канал!",
+    "not_enough_referrals": "Для виводу потрібно запросити мінімум {min_refs} друзів (у вас {current_refs}).",
+    "unknown_error": "Сталася невідома помилка. Спробуйте пізніше.",
+    "subscription_welcome": "🎉 **Ласкаво просимо до Maniac Stars!**\n\nПідписка підтверджена! Тепер ви можете користуватися всіма функціями бота.",
+    "subscription_admin_welcome": "👑 **Ласкаво просимо, адміністратор!**\n\nУ вас є повний доступ до всіх функцій бота.",
+    "subscription_required": "🔒 **Підписка обов'язкова**\n\nДля використання бота необхідно підписатися на наш канал.",
+    "subscription_success": "✅ **Підписка підтверджена!**\n\nЛаскаво просимо в бота!",
+    "subscription_failed": "❌ **Підписка не знайдена**\n\nБудь ласка, підпишіться на канал і спробуйте знову.",
+    # --- Game Texts ---
+    "coinflip_menu": "🪙 **Орел і Решка** 🪙\n\n"
+    "Ризикни і помнож свій виграш! Вгадай, яка сторона випаде.\n"
+    "З кожним наступним виграшем шанс зменшується, а приз росте!\n\n"
+    "💰 **Твій баланс:** {balance} ⭐\n\nОберіть ставку:",
+    "coinflip_process": "🪙 Підкидаємо монетку...",
+    "coinflip_choice_prompt": "🎉 **Ставка {stake} ⭐ прийнята!** 🎉\n\nЩо обираєш?",
+    "coinflip_continue": "🎉 **Перемога!** 🎉\n\n"
+    "Ти виграв **{current_prize}** ⭐.\n"
+    "Наступний кидок може принести **{next_prize}** ⭐ з шансом {next_chance}%.\n\n"
+    "Ризикнеш?",
+    "coinflip_win_final": "🎉 **Вітаємо!** 🎉\n\n"
+    "Ти забираєш виграш: {prize} ⭐\n"
+    "💰 Твій новий баланс: {new_balance} ⭐",
+    "coinflip_loss": "😕 **На жаль, невдача...**\n\n"
+    "Ти програв свою ставку: {stake} ⭐\n"
+    "💰 Твій новий баланс: {new_balance} ⭐",
+    "slots_menu": "🎰 **Слоти** 🎰\n\nСпробуй свою удачу! Збери три однакових символи в ряд, щоб виграти.\n\n💰 **Твій баланс:** {balance} ⭐\n\nОберіть ставку:",
+    "slots_win": "🎉 **ПЕРЕМОГА!** 🎉\n\nТи виграв {prize} ⭐!\n💰 Твій новий баланс: {new_balance} ⭐",
+    "slots_lose": "😕 **На жаль, не пощастило...**\n\nТи програв {cost} ⭐.\n💰 Твій новий баланс: {new_balance} ⭐",
+    "football_menu": "⚽️ **Футбол** ⚽️\n\nПробей пенальті! Якщо заб'єш гол, отримаєш приз.\n\n💰 **Твій баланс:** {balance} ⭐",
+    "football_win": "🎉 **ГОООЛ!** 🎉\n\nТи забив і виграв {prize} ⭐!\n💰 Твій новий баланс: {new_balance} ⭐",
+    "football_lose": "😕 **Промах...**\n\nТи програв {cost} ⭐.\n💰 Твій новий баланс: {new_balance} ⭐",
+    "bowling_menu": "🎳 **Боулінг** 🎳\n\nЗможеш вибити страйк? Якщо збиєш всі кеглі одним кидком - отримаєш приз!\n\n💰 **Твій баланс:** {balance} ⭐\n\nОберіть ставку:",
+    "bowling_win": "🎉 **СТРАЙК!** 🎉\n\nВідмінний кидок! Ти виграв {prize} ⭐!\n💰 Твій новий баланс: {new_balance} ⭐",
+    "bowling_lose": "😕 **Мимо...**\n\nНаступного разу пощастить більше. Ти програв {cost} ⭐.\n💰 Твій новий баланс: {new_balance} ⭐",
+    "basketball_menu": "🏀 **Баскетбол** 🏀\n\nПопади м'ячем в кошик, щоб виграти приз!\n\n💰 **Твій баланс:** {balance} ⭐",
+    "basketball_win": "🎉 **Точно в ціль!** 🎉\n\nВідмінний кидок! Ти виграв {prize} ⭐!\n💰 Твій новий баланс: {new_balance} ⭐",
+    "basketball_lose": "😕 **Промах...**\n\nМ'яч пролетів мимо. Ти програв {cost} ⭐.\n💰 Твій новий баланс: {new_balance} ⭐",
+    "darts_menu": "🎯 **Дартс** 🎯\n\nПопади в яблучко, щоб виграти приз!\n\n💰 **Твій баланс:** {balance} ⭐",
+    "darts_win": "🎉 **Точно в ціль!** 🎉\n\nВідмінний кидок! Ти виграв {prize} ⭐!\n💰 Твій новий баланс: {new_balance} ⭐",
+    "darts_lose": "😕 **Мимо...**\n\nДротик пролетів мимо. Ти програв {cost} ⭐.\n💰 Твій новий баланс: {new_balance} ⭐",
+    "dice_menu": "🎲 **Кістки** 🎲\n\nВгадай, в якому діапазоні випаде число на кубику! Став на (1-3) або (4-6).\n\n💰 **Твій баланс:** {balance} ⭐",
+    "dice_win": "🎉 **Перемога!** 🎉\n\nТи поставив на ({choice}), а випало число {value}! Ти виграв {prize} ⭐!\n💰 Твій новий баланс: {new_balance} ⭐",
+    "dice_lose": "😕 **На жаль, не вгадав...**\n\nТи поставив на ({choice}), а випало число {value}. Ти програв {cost} ⭐.\n💰 Твій новий баланс: {new_balance} ⭐",
+    # --- Transaction Texts ---
+    "transactions_title": "📊 **Історія транзакцій** 📊\n\n💰 **Поточний баланс:** {balance} ⭐\n\n📋 **Останні операції:**\n\n",
+    "transactions_empty": "📊 **Історія транзакцій** 📊\n\n💰 **Поточний баланс:** {balance} ⭐\n\n📭 **Історія порожня**\nПоки що у вас немає транзакцій. Почніть грати або запрошуйте друзів!",
+    "transaction_item": "{emoji} **{amount_text}** - {reason_text}\n📅 {date}\n",
+    # --- Social Content Texts ---
+    "social_content": "📱 **ГОТОВИЙ КОНТЕНТ ДЛЯ РЕПОСТІВ** 📱\n\n🎯 **Оберіть платформу:**",
+    "tiktok_content": "🎵 КОНТЕНТ ДЛЯ TIKTOK 🎵\n\n📝 Готові тексти:\n\n🔥 Знайшов спосіб заробляти в Telegram! За день вже {balance} ⭐. Хто зі мною? {ref_link}\n\n💎 Цей бот платить реальні гроші за ігри! Вже вивів {balance} ⭐. {ref_link}\n\n⚡ Поки всі сплять, я заробляю в Telegram! {balance} ⭐ сьогодні. Хто готовий до заробітку? {ref_link}\n\n🎯 Хештеги:\n\\#заробіток \\#telegram \\#гроші \\#ігри \\#реферали \\#пасивнийдохід",
+    "instagram_content": "📸 КОНТЕНТ ДЛЯ INSTAGRAM 📸\n\n📝 Готові тексти:\n\n🌟 Новий спосіб заробітку в Telegram! За тиждень вже {balance} ⭐. Хто готовий спробувати? {ref_link}\n\n💰 Цей бот реально платить! Вже вивів {balance} ⭐. {ref_link}\n\n🎮 Заробляю граючи в Telegram! {balance} ⭐ сьогодні. Хто зі мною? {ref_link}\n\n🎯 Хештеги:\n\\#заробіток \\#telegram \\#гроші \\#ігри \\#реферали \\#пасивнийдохід \\#workfromhome",
+    "telegram_content": "📱 КОНТЕНТ ДЛЯ TELEGRAM 📱\n\n📝 Готові тексти:\n\n🚀 Хлопці, знайшов крутий бот для заробітку! За день вже {balance} ⭐. Хто готовий спробувати? {ref_link}\n\n💎 Цей бот реально платить гроші! Вже вивів {balance} ⭐. {ref_link}\n\n⚡ Поки всі сплять, я заробляю! {balance} ⭐ сьогодні. Хто зі мною? {ref_link}\n\n🎯 Додатково:\n• Додайте скріншот балансу\n• Покажіть досягнення\n• Розкажіть про ігри",
+    "challenges_stub": "⚡ **ЧЕЛЛЕНДЖІ** ⚡\n\n🚧 **Незабаром...**\n\nМи працюємо над системою щоденних челленджів, які допоможуть вам заробляти ще більше зірок!\n\n💡 **Що вас чекає:**\n• Щоденні завдання\n• Бонуси за виконання\n• Спеціальні нагороди\n• Турніри між користувачами\n\n⏰ Слідкуйте за оновленнями!",
+    # Додаткові переклади для інлайн кнопок
+    "activate_promo_button": "Активувати промокод",
+    "my_transactions_button": "Мої транзакції",
+    "challenges_button": "Челленджі",
+    "social_content_button": "Контент для репостів",
+    "tiktok_button": "TikTok",
+    "instagram_button": "Instagram",
+    "telegram_button": "Telegram",
+    "duels_button": "Дуелі",
+    "timer_button": "Таймер",
+    "coinflip_button": "Орел/Решка",
+    "slots_button": "Слоти",
+    "football_button": "Футбол",
+    "bowling_button": "Боулінг",
+    "basketball_button": "Баскетбол",
+    "darts_button": "Дартс",
+    "dice_button": "Кістки",
+    "webapp_game_button": "Maniac Clic Game",
+    "passive_income_button": "Пасивний дохід",
+    "daily_bonus_button": "Отримати щоденний бонус",
+    "our_channel_button": "Наш канал",
+    "our_chat_button": "Наш чат",
+    "our_withdrawals_button": "Наші виводи",
+    "our_manual_button": "Наш мануал",
+    "tech_support_button": "Техпідтримка 12:00-21:00 🆘",
+    "heads_button": "Орел",
+    "tails_button": "Решка",
+    "risk_button": "Ризикнути!",
+    "cashout_button": "Забрати виграш",
+    "play_again_button": "Грати знову",
+    "to_other_games_button": "До інших ігор",
+    "training_button": "Навчання",
+    "stats_button": "Статистика",
+    "cancel_search_button": "Скасувати пошук",
+    "how_to_play_button": "Як грати?",
+    "stop_button": "СТОП!",
+    "surrender_button": "Здатися",
+    "boost_card_button": "Підсилити карту",
+    "new_cards_button": "Нові карти",
+    "bet_low_button": "Поставити на 1-3",
+    "bet_high_button": "Поставити на 4-6",
+    # --- FAQ і Користувацька угода ---
+    "faq_menu": "❓ **Часті запитання** ❓\n\n"
+    "**🤔 Як заробляти в боті?**\n"
+    "• Запрошуйте друзів за реферальним посиланням (+5 ⭐ за кожного)\n"
+    "• Грайте в міні-ігри на ставки\n"
+    "• Отримуйте щоденний бонус (1 ⭐ кожні 24 години)\n"
+    "• Активуйте пасивний дохід (розмістіть посилання в профілі)\n\n"
+    "**🎮 Які ігри доступні?**\n"
+    "• 🃏 Картярські дуелі - стратегічна гра\n"
+    "• ⏱️ Зірковий таймер - гра на реакцію\n"
+    "• 🪙 Орел і Решка - гра на удачу\n"
+    "• 🎰 Слоти - класична азартна гра\n"
+    "• ⚽️ Футбол, 🎳 Боулінг, 🏀 Баскетбол, 🎯 Дартс, 🎲 Кості\n\n"
+    "**💰 Як вивести зароблені зірки?**\n"
+    "• Потрібно запросити мінімум 5 друзів\n"
+    "• Підписатися на всі наші ресурси\n"
+    "• Обміняти зірки на подарунки в розділі 'Призи'\n\n"
+    "**🎁 Що таке пасивний дохід?**\n"
+    "• Розмістіть посилання на бота в своєму профілі\n"
+    "• Отримуйте 1 ⭐ кожен день автоматично\n"
+    "• 30 ⭐ на місяць пасивно!\n\n"
+    "**❓ Чи є обмеження?**\n"
+    "• Нові користувачі не можуть виводити кошти 24 години\n"
+    "• Максимум 3 заявки на вивід на день\n"
+    "• Максимум 500 ⭐ на вивід на день",
+    "terms_of_service": "📋 **Користувацька угода** 📋\n\n"
+    "**1. Загальні положення**\n"
+    "Використовуючи бота Maniac Stars, ви погоджуєтесь з цими умовами. "
+    "Якщо ви не згодні з будь-якими пунктами, припиніть використання бота.\n\n"
+    "**2. Опис сервісу**\n"
+    "Maniac Stars - це розважальний бот з елементами геймі фікації, "
+    "що дозволяє користувачам заробляти віртуальну валюту (зірки) "
+    "через участь в іграх та запрошення друзів.\n\n"
+    "**3. Реєстрація та акаунт**\n"
+    "• Для використання бота необхідно мати акаунт Telegram\n"
+    "• Один користувач може мати тільки один акаунт\n"
+    "• Заборонено створення множинних акаунтів\n"
+    "• Адміністрація залишає за собою право заблокувати акаунт при порушенні правил\n\n"
+    "**4. Віртуальна валюта**\n"
+    "• Зірки (⭐) - віртуальна валюта бота\n"
+    "• Зірки не мають реальної грошової вартості\n"
+    "• Зірки можна обмінювати на подарунки згідно каталогу\n"
+    "• Адміністрація не гарантує виплату реальних грошей\n\n"
+    "**5. Ігровий процес**\n"
+    "• Всі ігри засновані на випадковості\n"
+    "• Результати ігор не підлягають оскарженню\n"
+    "• Заборонено використання ботів, скриптів або інших засобів автоматизації\n"
+    "• Заборонено шахрайство та обман інших користувачів\n\n"
+    "**6. Реферальна програма**\n"
+    "• За кожного запрошеного друга нараховується 5 ⭐\n"
+    "• Реферал повинен бути активним користувачем\n"
+    "• Заборонено створення фейкових акаунтів для отримання бонусів\n\n"
+    "**7. Вивід коштів**\n"
+    "• Для виводу необхідно виконати умови (мінімум рефералів, підписка)\n"
+    "• Адміністрація залишає за собою право відмовити у виводі\n"
+    "• Термін розгляду заявок - до 7 робочих днів\n"
+    "• Вивід здійснюється у вигляді подарунків згідно каталогу\n\n"
+    "**8. Відповідальність**\n"
+    "• Адміністрація не несе відповідальності за втрату даних\n"
+    "• Користувач використовує бота на свій ризик\n"
+    "• Адміністрація може змінити умови без попереднього повідомлення\n\n"
+    "**9. Заборонені дії**\n"
+    "• Спам і флуд в боті\n"
+    "• Образи інших користувачів\n"
+    "• Спроби злому або порушення роботи бота\n"
+    "• Поширення шкідливого контенту\n\n"
+    "**10. Контактна інформація**\n"
+    "З усіх питань звертайтесь в техпідтримку: @limejko\n\n"
+    "**Дата останнього оновлення:** {current_date}",
+    "faq_button": "FAQ",
+    "terms_button": "Користувацька угода",
+    "back_to_settings": "Назад в налаштування",
+}
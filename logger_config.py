@@ -1,36 +1,48 @@
 # plyusovp/maniacstarsbot/ManiacStarsBot-4df23ef8bd5b8766acddffe6bca30a128458c7a5/logger_config.py
 
+import atexit
 import logging
+import queue
+import random
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Mapping, Optional
 
 from pythonjsonlogger import jsonlogger
 
 from config import settings
 
+MASK = "***BOT_TOKEN***"
 
-class SecretMasker(logging.Filter):
-    """Фильтр для маскирования секретов в логах."""
 
-    def filter(self, record):
-        if hasattr(record, "msg") and isinstance(record.msg, str):
-            record.msg = record.msg.replace(settings.BOT_TOKEN, "***BOT_TOKEN***")
-        # Also check args
-        if record.args:
-            cleaned_args = []
-            for arg in record.args:
-                if isinstance(arg, str):
-                    cleaned_args.append(
-                        arg.replace(settings.BOT_TOKEN, "***BOT_TOKEN***")
-                    )
-                else:
-                    cleaned_args.append(arg)
-            record.args = tuple(cleaned_args)
-        return True
+class SecretMasker:
+    """
+    Маскирует токен бота в готовой строке лога.
+
+    Строка проверяется один раз целиком (вместе с extra и трейсбеком) уже
+    в потоке записи; замена и новая строка — только если токен в ней есть.
+    """
+
+    def __init__(self, secret: str) -> None:
+        self.secret = secret
+
+    def __call__(self, line: str) -> str:
+        if self.secret and self.secret in line:
+            return line.replace(self.secret, MASK)
+        return line
 
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Кастомный форматер для добавления кастомных полей."""
 
+    def __init__(self, *args, masker: Optional[SecretMasker] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.masker = masker
+
+    def format(self, record):
+        line = super().format(record)
+        return self.masker(line) if self.masker else line
+
     def add_fields(self, log_record, record, message_dict):
         super(CustomJsonFormatter, self).add_fields(log_record, record, message_dict)
         log_record["timestamp"] = log_record.get(
@@ -56,15 +68,102 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
                 del log_record[field]
 
 
+class SamplingQueueHandler(QueueHandler):
+    """
+    QueueHandler с ограниченной очередью и выборкой по логгерам.
+
+    В вызывающем потоке остаются только выборка и подстановка аргументов в
+    сообщение; JSON, маскирование и запись в stdout выполняет QueueListener.
+    """
+
+    def __init__(
+        self, log_queue: queue.Queue, sample_rates: Mapping[str, float]
+    ) -> None:
+        super().__init__(log_queue)
+        self.sample_rates = dict(sample_rates)
+        self._rates: Dict[str, float] = {}  # Имя логгера -> доля, с учётом родителей
+        self.dropped = 0
+        self.sampled_out = 0
+        self._unreported = 0
+
+    def _rate(self, name: str) -> float:
+        rate = self._rates.get(name)
+        if rate is None:
+            rate, probe = 1.0, name
+            while probe:
+                if probe in self.sample_rates:
+                    rate = self.sample_rates[probe]
+                    break
+                probe = probe.rpartition(".")[0]
+            self._rates[name] = rate
+        return rate
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno < logging.WARNING and self.sample_rates:
+            rate = self._rate(record.name)
+            if rate < 1.0 and random.random() >= rate:  # nosec B311
+                self.sampled_out += 1
+                return
+        super().emit(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Текст фиксируем сразу: аргументы могут измениться, пока запись
+        # ждёт в очереди. Трейсбек форматирует уже поток записи.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported += 1
+            return
+        if self._unreported:
+            # Очередь освободилась — сообщаем, сколько записей потеряно
+            report = logging.LogRecord(
+                __name__,
+                logging.WARNING,
+                __file__,
+                0,
+                f"Очередь логов была переполнена, отброшено записей: {self._unreported}",
+                None,
+                None,
+            )
+            try:
+                self.queue.put_nowait(report)
+            except queue.Full:
+                return
+            self._unreported = 0
+
+
+class _DrainingQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # В заполненную очередь put_nowait не пролезет — ждём, пока поток её разберёт
+        self.queue.put(self._sentinel)
+
+
+_listener: Optional[QueueListener] = None
+
+
 def setup_logging():
-    """Настраивает структурированное логирование в JSON."""
+    """Настраивает структурированное логирование в JSON через фоновый поток."""
+    global _listener
+    stop_logging()
+
     log_formatter = CustomJsonFormatter(
-        "%(timestamp)s %(level)s %(module)s %(message)s %(user_id)s %(trace_id)s"
+        "%(timestamp)s %(level)s %(module)s %(message)s %(user_id)s %(trace_id)s",
+        masker=SecretMasker(settings.BOT_TOKEN),
     )
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(log_formatter)
-    handler.addFilter(SecretMasker())
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(log_formatter)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    handler = SamplingQueueHandler(log_queue, settings.LOG_SAMPLE_RATES)
+    _listener = _DrainingQueueListener(log_queue, stream_handler)
+    _listener.start()
 
     logging.basicConfig(
         level=logging.INFO,
@@ -72,4 +171,14 @@ def setup_logging():
         force=True,  # Переопределяем любую существующую конфигурацию
     )
     logging.info("Logging configured successfully.")
-    
\ No newline at end of file
+
+
+def stop_logging():
+    """Дописывает записи, оставшиеся в очереди, и останавливает поток записи."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
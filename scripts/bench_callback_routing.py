@@ -0,0 +1,148 @@
+# scripts/bench_callback_routing.py
+"""
+Сравнивает маршрутизацию callback_query обычного Router и CallbackRouter.
+
+1. Задержка одного нажатия через Dispatcher в зависимости от числа
+   хендлеров в роутере (нажатие адресовано последнему хендлеру — худший
+   случай для последовательной проверки фильтров).
+2. Настоящие роутеры бота: сколько хендлеров проверяется, пока не найдётся
+   нужный, для самых частых игровых нажатий.
+
+Запуск: python -m scripts.bench_callback_routing
+"""
+
+import asyncio
+import time
+from importlib import import_module
+
+from aiogram import Bot, Dispatcher, F, Router
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import CallbackQuery, Update, User
+
+from botstar import ROUTERS
+from keyboards.factories import (
+    DuelCallback,
+    GameCallback,
+    MenuCallback,
+    SlotsCallback,
+    TimerCallback,
+)
+from utils.callback_router import CallbackQueryObserver, CallbackRouter, route_key
+
+# --- Настройки бенчмарка ---
+HANDLER_COUNTS = (10, 50, 100, 200)
+PRESSES = 2_000
+
+HOT_CALLBACKS = {
+    "дуэль: ход картой": DuelCallback(action="play", match_id=1, value=5).pack(),
+    "таймер: стоп": TimerCallback(action="stop", match_id=1).pack(),
+    "слоты: спин": SlotsCallback(action="spin", value=10).pack(),
+    "меню: главное": MenuCallback(name="main_menu").pack(),
+    "игры: монетка": GameCallback(name="coinflip", action="start").pack(),
+}
+
+
+class BenchCallback(CallbackData, prefix="bench"):  # type: ignore
+    action: str
+    value: int = 0
+
+
+def _press(data: str) -> Update:
+    return Update(
+        update_id=1,
+        callback_query=CallbackQuery(
+            id="1",
+            from_user=User(id=1, is_bot=False, first_name="Bench"),
+            chat_instance="1",
+            data=data,
+        ),
+    )
+
+
+def _make_router(router_class, handlers: int) -> Router:
+    router = router_class()
+
+    async def handle(callback: CallbackQuery) -> None:
+        pass
+
+    for i in range(handlers):
+        router.callback_query.register(
+            handle, BenchCallback.filter(F.action == f"action_{i}")
+        )
+    return router
+
+
+async def press_latency(router_class, handlers: int) -> float:
+    """мкс на одно нажатие через Dispatcher."""
+    dp = Dispatcher()
+    dp.include_router(_make_router(router_class, handlers))
+    bot = Bot(token="42:BENCH")
+    update = _press(BenchCallback(action=f"action_{handlers - 1}").pack())
+    await dp.feed_update(bot, update)
+    start = time.perf_counter()
+    for _ in range(PRESSES):
+        await dp.feed_update(bot, update)
+    elapsed = time.perf_counter() - start
+    await bot.session.close()
+    return elapsed / PRESSES * 1e6
+
+
+def _answers(handler, data: str) -> bool:
+    """Ключ хендлера совпал с нажатием (у горячих нажатий других фильтров нет)."""
+    key = route_key(handler)
+    if key is None:
+        return False
+    parts = data.split(":")
+    prefix, positions, values = key
+    return parts[0] == prefix and all(
+        parts[p] == v for p, v in zip(positions, values, strict=True)
+    )
+
+
+def checks_per_press(routers: list, data: str) -> tuple[int, int]:
+    """(проверок подряд, проверок по таблице) до хендлера, который ответит."""
+    sequential = indexed = 0
+    for router in routers:
+        observer = router.callback_query
+        if isinstance(observer, CallbackQueryObserver):
+            candidates = observer.candidates(data)
+        else:
+            candidates = observer.handlers
+        for handler in observer.handlers:
+            sequential += 1
+            if _answers(handler, data):
+                return sequential, indexed + candidates.index(handler) + 1
+        indexed += len(candidates)
+    return sequential, indexed
+
+
+async def main():
+    latencies = [
+        (
+            handlers,
+            await press_latency(Router, handlers),
+            await press_latency(CallbackRouter, handlers),
+        )
+        for handlers in HANDLER_COUNTS
+    ]
+    routers = [import_module(name).router for name in ROUTERS]
+
+    print("\n" + "=" * 60)
+    print(f"НАЖАТИЕ ЧЕРЕЗ DISPATCHER: {PRESSES} нажатий, мкс на нажатие")
+    print("=" * 60)
+    print(f"{'хендлеров':<12}{'Router':>12}{'CallbackRouter':>18}{'ускорение':>12}")
+    for handlers, plain, indexed in latencies:
+        print(f"{handlers:<12}{plain:>12.1f}{indexed:>18.1f}{plain / indexed:>11.1f}x")
+
+    print("\n" + "=" * 60)
+    print("РОУТЕРЫ БОТА: проверок хендлеров до нужного")
+    print("=" * 60)
+    print(f"{'нажатие':<24}{'подряд':>12}{'по таблице':>14}")
+    for title, data in HOT_CALLBACKS.items():
+        sequential, indexed = checks_per_press(routers, data)
+        print(f"{title:<24}{sequential:>12}{indexed:>14}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+# scripts/bench_cluster.py
+"""
+Нагрузочный тест webhook-режима: сколько обновлений в секунду проходит
+через aiohttp -> брокер -> рабочие процессы при разном числе процессов.
+
+Рабочие процессы запускают настоящий Dispatcher aiogram с одним
+обработчиком, который тратит HANDLER_CPU_MS процессорного времени (как
+типичный хендлер с клавиатурой и запросом к БД) и ничего не отправляет
+в Telegram. Нагрузку подаёт этот же процесс через HTTP, повторяя
+обновления, на которые брокер ответил 503, — как делает Telegram.
+
+Прирост близок к линейному, пока процессов не больше, чем свободных
+ядер. На одном ядре выигрыш даёт только перекрытие работы приёма
+обновлений и обработчиков, поэтому он заметно меньше.
+
+Запуск: python -m scripts.bench_cluster
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+import aiohttp
+from aiogram import Bot, Dispatcher, Router
+from aiogram.types import Message
+from aiohttp import web
+
+from config import settings
+from utils.broker import Broker, broker_client
+from utils.cluster import WorkerPool, create_webhook_app
+
+# --- Настройки бенчмарка ---
+UPDATES = 4000
+USERS = 1000
+CLIENT_CONCURRENCY = 64  # Одновременных HTTP-запросов от "Telegram"
+HANDLER_CPU_MS = 2.0
+PORT = 18080
+
+
+def _burn(ms: float) -> None:
+    deadline = time.process_time() + ms / 1000
+    while time.process_time() < deadline:
+        pass
+
+
+async def _run_bench_worker(index: int) -> None:
+    router = Router()
+
+    @router.message()
+    async def handle(message: Message) -> None:
+        _burn(HANDLER_CPU_MS)
+
+    dp = Dispatcher()
+    dp.include_router(router)
+    bot = Bot(token="42:BENCH")
+    await broker_client.serve(
+        index, settings.BROKER_SOCKET, lambda update: dp.feed_raw_update(bot, update)
+    )
+
+
+def bench_worker(index: int) -> None:
+    asyncio.run(_run_bench_worker(index))
+
+
+def _update(update_id: int) -> dict:
+    user_id = update_id % USERS + 1
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": user_id, "type": "private"},
+            "from": {"id": user_id, "is_bot": False, "first_name": "Bench"},
+            "text": "/start",
+        },
+    }
+
+
+async def run(workers: int) -> float:
+    broker = Broker(workers, settings.BROKER_SOCKET, max_inflight=200)
+    await broker.start()
+    pool = WorkerPool(bench_worker, workers)
+    pool.start()
+    runner = web.AppRunner(create_webhook_app(broker))
+    try:
+        await broker.wait_workers(timeout=60)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", PORT).start()
+
+        pending = iter(range(UPDATES))
+        url = f"http://127.0.0.1:{PORT}{settings.WEBHOOK_PATH}"
+
+        async def client(session: aiohttp.ClientSession) -> None:
+            for update_id in pending:
+                while True:
+                    async with session.post(url, json=_update(update_id)) as resp:
+                        if resp.status == 200:
+                            break
+                    await asyncio.sleep(0.01)
+
+        start = time.perf_counter()
+        async with aiohttp.ClientSession() as session:
+            await asyncio.gather(*(client(session) for _ in range(CLIENT_CONCURRENCY)))
+        while sum(broker.processed) < UPDATES:
+            await asyncio.sleep(0.005)
+        return UPDATES / (time.perf_counter() - start)
+    finally:
+        await runner.cleanup()
+        await broker.close()
+        await pool.stop()
+
+
+async def main():
+    cores = os.cpu_count() or 1
+    variants = sorted({1, 2, 4, cores})
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.BROKER_SOCKET = os.path.join(tmp, "broker.sock")
+        # Дочерние процессы (spawn) читают настройки из окружения заново
+        os.environ["BROKER_SOCKET"] = settings.BROKER_SOCKET
+        for workers in variants:
+            results[workers] = await run(workers)
+
+    print("\n" + "=" * 60)
+    print(
+        f"WEBHOOK-КЛАСТЕР: {UPDATES} обновлений, {HANDLER_CPU_MS} мс CPU на обработку"
+    )
+    print(f"Ядер: {cores}")
+    print("=" * 60)
+    print(f"{'процессов':<12}{'обновл./с':>12}{'ускорение':>12}")
+    for workers, rate in results.items():
+        print(f"{workers:<12}{rate:>12.0f}{rate / results[1]:>11.2f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
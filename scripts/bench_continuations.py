@@ -0,0 +1,69 @@
+# scripts/bench_continuations.py
+"""
+Сравнивает стоимость N одновременных "анимаций": спящие корутины
+(asyncio.sleep внутри обработчика) против записей в куче продолжений.
+
+Запуск: python -m scripts.bench_continuations
+"""
+
+import asyncio
+import time
+import tracemalloc
+
+from utils.continuations import ContinuationScheduler
+
+# --- Настройки бенчмарка ---
+SPINS = 10_000  # Одновременных бросков
+DELAY = 0.5  # Длительность "анимации", сек
+
+
+async def _finish(results: list, value: int):
+    results.append(value)
+
+
+async def _sleeping_handler(results: list, value: int):
+    # Так выглядел обработчик до перехода на продолжения
+    await asyncio.sleep(DELAY)
+    await _finish(results, value)
+
+
+async def measure_sleeping() -> tuple[float, float]:
+    results: list[int] = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(_sleeping_handler(results, i)) for i in range(SPINS)]
+    await asyncio.sleep(0)  # Даём задачам дойти до sleep
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await asyncio.gather(*tasks)
+    return memory / SPINS, time.perf_counter() - start
+
+
+async def measure_continuations() -> tuple[float, float]:
+    results: list[int] = []
+    scheduler = ContinuationScheduler()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(SPINS):
+        scheduler.call_later(DELAY, _finish, results, i)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await scheduler.join()
+    return memory / SPINS, time.perf_counter() - start
+
+
+async def main():
+    sleep_bytes, sleep_total = await measure_sleeping()
+    cont_bytes, cont_total = await measure_continuations()
+
+    print("\n" + "=" * 60)
+    print(f"ПРОДОЛЖЕНИЯ: {SPINS} одновременных бросков по {DELAY} с")
+    print("=" * 60)
+    print(f"{'подход':<16}{'байт/бросок':>14}{'всего, с':>12}")
+    print(f"{'asyncio.sleep':<16}{sleep_bytes:>14.0f}{sleep_total:>12.2f}")
+    print(f"{'continuations':<16}{cont_bytes:>14.0f}{cont_total:>12.2f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,395 @@
+# scripts/bench_db.py
+"""
+Бенчмарки горячих функций database/db.py с базовой линией и порогом регрессии.
+
+Каждая функция вызывается OPERATIONS раз подряд, ROUNDS раундов. Пропускная
+способность берётся по лучшему раунду (меньше всего зависит от соседей по
+машине), p50 и p99 — медианы раундов. БД синтетическая, по профилю:
+  10k — 10 000 пользователей, 100 000 записей ledger;
+  1m  — 1 000 000 пользователей, 10 000 000 записей ledger (генерация — минуты).
+
+Перед каждым раундом замеряется эталон — транзакция на голом aiosqlite без
+кода бота. Скорость машины гуляет от запуска к запуску на десятки процентов,
+поэтому базовая линия (scripts/baselines/bench_db.json) пересчитывается на
+отношение эталонов, и только потом сравнивается: падение операций в секунду
+больше THROUGHPUT_THRESHOLD или рост p99 больше P99_THRESHOLD — регрессия,
+скрипт завершается с кодом 1. После намеренного изменения скорости базовую
+линию перезаписывают с --update.
+
+Запуск: python -m scripts.bench_db [10k|1m] [--update]
+"""
+
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from unittest import mock
+
+import aiosqlite
+
+from database import db
+from database.achievements import achievement_engine
+
+# --- Настройки бенчмарка ---
+PROFILES = {
+    "10k": {"users": 10_000, "ledger": 100_000},
+    "1m": {"users": 1_000_000, "ledger": 10_000_000},
+}
+DEFAULT_PROFILE = "10k"
+OPERATIONS = 200  # Вызовов функции за раунд
+ROUNDS = 5
+WARMUP = 10
+REFERENCE_OPERATIONS = 100  # Эталонных транзакций перед раундом
+INITIAL_BALANCE = 1_000_000
+PROMO_CODE = "BENCH"
+THROUGHPUT_THRESHOLD = 0.25  # Допустимое падение операций в секунду
+P99_THRESHOLD = 0.50  # Допустимый рост p99 (хвост шумнее среднего)
+BASELINE_PATH = Path(__file__).parent / "baselines" / "bench_db.json"
+
+
+class Dataset:
+    """Пользователи синтетической БД."""
+
+    def __init__(self, users: int) -> None:
+        self.users = users
+        self.rng = random.Random(7)
+        ids = list(range(1, users + 1))
+        self.rng.shuffle(ids)
+        self._fresh = iter(ids)
+
+    def fresh(self) -> int:
+        """Пользователь, которого ещё не трогали (для разовых операций)."""
+        user_id = next(self._fresh, None)
+        if user_id is None:
+            raise RuntimeError("Нетронутые пользователи профиля закончились")
+        return user_id
+
+    def any(self) -> int:
+        return self.rng.randint(1, self.users)
+
+    def pair(self) -> tuple[int, int]:
+        p1, p2 = self.rng.sample(range(1, self.users + 1), 2)
+        return p1, p2
+
+
+@dataclass
+class Case:
+    name: str
+    call: Callable[..., Awaitable[Any]]
+    # Готовит аргументы одного вызова; время подготовки в замер не входит
+    prepare: Callable[[Dataset], Awaitable[tuple]]
+
+
+async def _spend_args(data: Dataset) -> tuple:
+    return data.any(), 1, "bench"
+
+
+async def _add_args(data: Dataset) -> tuple:
+    return data.fresh(), 1, "daily_bonus"
+
+
+async def _create_duel_args(data: Dataset) -> tuple:
+    return *data.pair(), 1
+
+
+async def _finish_duel_args(data: Dataset) -> tuple:
+    p1, p2 = data.pair()
+    return await db.create_duel(p1, p2, 1), p1, p2, 1
+
+
+async def _finish_timer_args(data: Dataset) -> tuple:
+    p1, p2 = data.pair()
+    match_id, _ = await db.create_timer_match(p1, p2, 1)
+    return match_id, p1
+
+
+async def _promo_args(data: Dataset) -> tuple:
+    user_id = data.fresh()
+    return user_id, PROMO_CODE, f"bench-promo-{user_id}"
+
+
+async def _fresh_user_args(data: Dataset) -> tuple:
+    return (data.fresh(),)
+
+
+async def _achievement_args(data: Dataset) -> tuple:
+    return data.fresh(), "first_referral", None
+
+
+async def _streak_args(data: Dataset) -> tuple:
+    return data.fresh(), None
+
+
+CASES = (
+    Case("spend_balance", db.spend_balance, _spend_args),
+    Case("add_balance_with_checks", db.add_balance_with_checks, _add_args),
+    Case("create_duel", db.create_duel, _create_duel_args),
+    Case("finish_duel_atomic", db.finish_duel_atomic, _finish_duel_args),
+    Case("finish_timer_match", db.finish_timer_match, _finish_timer_args),
+    Case("activate_promo", db.activate_promo, _promo_args),
+    Case("get_daily_bonus", db.get_daily_bonus, _fresh_user_args),
+    Case("grant_achievement", db.grant_achievement, _achievement_args),
+    Case("update_user_streak", db.update_user_streak, _streak_args),
+)
+
+
+def populate(path: str, users: int, entries: int) -> None:
+    """
+    Заполняет БД напрямую через sqlite3 — так в разы быстрее, чем через API.
+    Балансы сходятся с ledger: у каждого начальная запись плюс случайные.
+    """
+    rng = random.Random(42)
+    balances = [INITIAL_BALANCE] * (users + 1)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    insert = "INSERT INTO ledger_entries (user_id, amount, reason) VALUES (?, ?, ?)"
+    conn.executemany(
+        insert,
+        (
+            (user_id, INITIAL_BALANCE, "initial_balance")
+            for user_id in range(1, users + 1)
+        ),
+    )
+    batch = []
+    for _ in range(max(entries - users, 0)):
+        user_id = rng.randint(1, users)
+        amount = rng.choice((-5, -1, 1, 2, 10))
+        balances[user_id] += amount
+        batch.append((user_id, amount, "bench"))
+        if len(batch) == 100_000:
+            conn.executemany(insert, batch)
+            batch.clear()
+    if batch:
+        conn.executemany(insert, batch)
+    now = int(time.time())
+    conn.executemany(
+        """INSERT INTO users (user_id, username, full_name, registration_date, balance)
+           VALUES (?, ?, ?, ?, ?)""",
+        (
+            (user_id, f"u{user_id}", "Bench", now, balances[user_id])
+            for user_id in range(1, users + 1)
+        ),
+    )
+    conn.execute(
+        "INSERT INTO promocodes (code, reward, total_uses, uses_left) VALUES (?, ?, ?, ?)",
+        (PROMO_CODE, 1, 10**9, 10**9),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def reference_transaction(user_id: int) -> None:
+    """Эталон: соединение и транзакция с одним UPDATE на голом aiosqlite."""
+    conn = await aiosqlite.connect(db.DB_NAME)
+    try:
+        await conn.execute("BEGIN IMMEDIATE")
+        await conn.execute(
+            "UPDATE users SET balance = balance WHERE user_id = ?", (user_id,)
+        )
+        await conn.commit()
+    finally:
+        await conn.close()
+
+
+async def _timed(call, calls: List[tuple]) -> List[float]:
+    timings = []
+    for args in calls:
+        start = time.perf_counter()
+        await call(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)
+
+
+async def measure(case: Case, data: Dataset, warmup: int = WARMUP) -> Dict[str, float]:
+    """
+    Операций в секунду (лучший раунд), медианы p50 и p99 одного вызова в мс
+    и операций в секунду эталона, замеренного рядом.
+    """
+    for _ in range(warmup):
+        await case.call(*await case.prepare(data))
+    rounds = []
+    for _ in range(ROUNDS):
+        reference = await _timed(
+            reference_transaction,
+            [(data.any(),) for _ in range(REFERENCE_OPERATIONS)],
+        )
+        calls = [await case.prepare(data) for _ in range(OPERATIONS)]
+        timings = await _timed(case.call, calls)
+        rounds.append(
+            (
+                OPERATIONS / (sum(timings) / 1000),
+                _percentile(timings, 0.5),
+                _percentile(timings, 0.99),
+                REFERENCE_OPERATIONS / (sum(reference) / 1000),
+            )
+        )
+    ops, p50, p99, reference_ops = zip(*rounds, strict=True)
+    return {
+        "ops_per_s": round(max(ops), 1),
+        "p50_ms": round(statistics.median(p50), 3),
+        "p99_ms": round(statistics.median(p99), 3),
+        "reference_ops_per_s": round(max(reference_ops), 1),
+    }
+
+
+async def run_suite(
+    profile: str = DEFAULT_PROFILE,
+    baseline: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Генерирует БД профиля во временном каталоге и замеряет все функции.
+    Если передана базовая линия, функции с регрессией замеряются ещё раз
+    и в зачёт идёт лучший замер: одиночный выброс на общей машине — не регрессия.
+    """
+    sizes = PROFILES[profile]
+    with tempfile.TemporaryDirectory() as tmp:
+        with mock.patch.object(db, "DB_NAME", os.path.join(tmp, "bench.db")):
+            await db.init_db()
+            populate(db.DB_NAME, sizes["users"], sizes["ledger"])
+            # Каталог и маски достижений могли остаться от другой БД
+            achievement_engine.reset()
+            data = Dataset(sizes["users"])
+            results = {case.name: await measure(case, data) for case in CASES}
+            regressed = find_regressions(results, baseline or {})
+            for case in CASES:
+                if case.name in regressed:
+                    retry = await measure(case, data, warmup=0)
+                    results[case.name] = _best(results[case.name], retry)
+            return results
+
+
+def _best(first: Dict[str, float], second: Dict[str, float]) -> Dict[str, float]:
+    return {
+        "ops_per_s": max(first["ops_per_s"], second["ops_per_s"]),
+        "p50_ms": min(first["p50_ms"], second["p50_ms"]),
+        "p99_ms": min(first["p99_ms"], second["p99_ms"]),
+        # Эталон первого замера: по нему считается скорость машины для всех функций
+        "reference_ops_per_s": first["reference_ops_per_s"],
+    }
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]
+) -> Dict[str, List[str]]:
+    """Регрессии относительно базовой линии: функция -> описания."""
+    regressions: Dict[str, List[str]] = {}
+    speed = machine_speed(results, baseline)
+    for name, base in baseline.items():
+        current = results.get(name)
+        if current is None:
+            continue
+        floor = base["ops_per_s"] * speed * (1 - THROUGHPUT_THRESHOLD)
+        if current["ops_per_s"] < floor:
+            regressions.setdefault(name, []).append(
+                f"{current['ops_per_s']:.0f} оп/с, ожидалось не меньше {floor:.0f} "
+                f"(база {base['ops_per_s']:.0f}, скорость машины {speed:.2f})"
+            )
+        ceiling = base["p99_ms"] / speed * (1 + P99_THRESHOLD)
+        if current["p99_ms"] > ceiling:
+            regressions.setdefault(name, []).append(
+                f"p99 {current['p99_ms']:.2f} мс, ожидалось не больше {ceiling:.2f} "
+                f"(база {base['p99_ms']:.2f}, скорость машины {speed:.2f})"
+            )
+    return regressions
+
+
+def machine_speed(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]
+) -> float:
+    """
+    Во сколько раз машина сейчас быстрее, чем при записи базы: медиана
+    отношений эталонов по всем функциям (один эталон слишком шумный).
+    """
+    ratios = [
+        results[name]["reference_ops_per_s"] / base["reference_ops_per_s"]
+        for name, base in baseline.items()
+        if name in results and base.get("reference_ops_per_s")
+    ]
+    return statistics.median(ratios) if ratios else 1.0
+
+
+def load_baseline(profile: str) -> Dict[str, Dict[str, float]]:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text(encoding="utf-8")).get(profile, {})
+
+
+def save_baseline(profile: str, results: Dict[str, Dict[str, float]]) -> None:
+    baselines = {}
+    if BASELINE_PATH.exists():
+        baselines = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    baselines[profile] = results
+    BASELINE_PATH.parent.mkdir(exist_ok=True)
+    BASELINE_PATH.write_text(
+        json.dumps(baselines, indent=2, ensure_ascii=False, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+
+
+def _change(current: float, expected: float) -> str:
+    return f"{(current / expected - 1) * 100:+.0f}%" if expected else ""
+
+
+async def main() -> int:
+    args = sys.argv[1:]
+    update = "--update" in args
+    profile = next((arg for arg in args if arg in PROFILES), DEFAULT_PROFILE)
+
+    baseline = {} if update else load_baseline(profile)
+    start = time.perf_counter()
+    results = await run_suite(profile, baseline)
+    elapsed = time.perf_counter() - start
+
+    sizes = PROFILES[profile]
+    print("\n" + "=" * 60)
+    print(
+        f"DB: {sizes['users']} пользователей, {sizes['ledger']} записей ledger, "
+        f"{elapsed:.0f} с"
+    )
+    print("=" * 60)
+    # Δ — отклонение от базы, пересчитанной на текущую скорость машины
+    print(f"{'функция':<26}{'оп/с':>9}{'Δ':>6}{'p50 мс':>8}{'p99 мс':>8}{'Δ':>6}")
+    speed = machine_speed(results, baseline)
+    for name, current in results.items():
+        base = baseline.get(name, {})
+        print(
+            f"{name:<26}{current['ops_per_s']:>9.0f}"
+            f"{_change(current['ops_per_s'], base.get('ops_per_s', 0) * speed):>6}"
+            f"{current['p50_ms']:>8.2f}{current['p99_ms']:>8.2f}"
+            f"{_change(current['p99_ms'], base.get('p99_ms', 0) / speed):>6}"
+        )
+    print("=" * 60)
+    if baseline:
+        print(f"Скорость машины относительно базы: {speed:.2f}")
+
+    if update:
+        save_baseline(profile, results)
+        print(f"Базовая линия {profile} записана в {BASELINE_PATH}")
+        return 0
+    if not baseline:
+        print(f"Базовой линии для {profile} нет — запишите её с --update")
+        return 0
+    regressions = find_regressions(results, baseline)
+    for name, problems in regressions.items():
+        for problem in problems:
+            print(f"РЕГРЕССИЯ {name}: {problem}")
+    if not regressions:
+        print("Регрессий нет")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,115 @@
+# scripts/bench_duel_state.py
+"""
+Замеряет память на одну активную дуэль и время рендера одного раунда.
+
+Для сравнения рядом лежит копия прежнего представления матча
+(обычные dataclass'ы, рука — list[int]).
+
+Запуск: python -m scripts.bench_duel_state
+"""
+
+import asyncio
+import secrets
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Optional
+
+from handlers import duel_handlers
+
+# --- Настройки бенчмарка ---
+MATCHES = 10_000  # Сколько матчей держим в памяти одновременно
+RENDER_ROUNDS = 2_000  # Сколько раз перерисовываем интерфейс
+
+
+@dataclass
+class LegacyPlayer:
+    id: int
+    message_id: int
+    hand: list[int] = field(default_factory=list)
+    played_card: Optional[int] = None
+    has_boosted: bool = False
+    has_rerolled: bool = False
+
+
+@dataclass
+class LegacyDuelMatch:
+    match_id: int
+    p1: LegacyPlayer
+    p2: LegacyPlayer
+    stake: int
+    round: int = 1
+    p1_wins: int = 0
+    p2_wins: int = 0
+    turn_started_at: float = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    current_event: Optional[str] = None
+    trace_id: Optional[str] = None
+
+
+_legacy_rand = secrets.SystemRandom()
+
+
+def legacy_match(i: int) -> LegacyDuelMatch:
+    return LegacyDuelMatch(
+        match_id=i,
+        p1=LegacyPlayer(i, i, _legacy_rand.sample(range(1, 11), 5)),
+        p2=LegacyPlayer(i + 1, i + 1, _legacy_rand.sample(range(1, 11), 5)),
+        stake=5,
+    )
+
+
+def compact_match(i: int) -> duel_handlers.DuelMatch:
+    return duel_handlers.DuelMatch(
+        match_id=i,
+        p1=duel_handlers.Player(i, i, duel_handlers.deal_hand()),
+        p2=duel_handlers.Player(i + 1, i + 1, duel_handlers.deal_hand()),
+        stake=5,
+    )
+
+
+def bytes_per_match(factory) -> tuple[float, float]:
+    """Возвращает (байт на матч, мкс на создание матча)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    matches = {i: factory(i) for i in range(MATCHES)}
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del matches
+    return current / MATCHES, elapsed / MATCHES * 1e6
+
+
+class _NullBot:
+    """Бот-заглушка: принимает вызовы API и ничего не отправляет."""
+
+    async def edit_message_caption(self, **kwargs):
+        return True
+
+
+async def render_time_per_round() -> float:
+    bot = _NullBot()
+    match = compact_match(1)
+    start = time.perf_counter()
+    for _ in range(RENDER_ROUNDS):
+        await duel_handlers.update_game_interface(bot, match)
+    return (time.perf_counter() - start) / RENDER_ROUNDS * 1e6
+
+
+async def main():
+    legacy_bytes, legacy_us = bytes_per_match(legacy_match)
+    compact_bytes, compact_us = bytes_per_match(compact_match)
+    render_us = await render_time_per_round()
+
+    print("\n" + "=" * 60)
+    print(f"ДУЭЛИ: {MATCHES} активных матчей")
+    print("=" * 60)
+    print(f"{'layout':<10}{'байт/матч':>12}{'создание, мкс':>16}")
+    print(f"{'legacy':<10}{legacy_bytes:>12.0f}{legacy_us:>16.2f}")
+    print(f"{'compact':<10}{compact_bytes:>12.0f}{compact_us:>16.2f}")
+    print(f"\nРендер раунда (текст + клавиатуры обоим игрокам): {render_us:.1f} мкс")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
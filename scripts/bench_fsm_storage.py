@@ -0,0 +1,86 @@
+# scripts/bench_fsm_storage.py
+"""
+Сравнивает задержку get/set FSM-состояния у MemoryStorage и SQLiteStorage.
+
+Запуск: python -m scripts.bench_fsm_storage
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from aiogram.fsm.storage.base import BaseStorage, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from database.fsm_storage import SQLiteStorage
+
+# --- Настройки бенчмарка ---
+HOT_KEYS = 100  # Количество "активных" пользователей
+ITERATIONS = 20_000  # Операций get+set на хранилище
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run(storage: BaseStorage) -> dict[str, float]:
+    keys = [StorageKey(bot_id=1, chat_id=i, user_id=i) for i in range(HOT_KEYS)]
+    # Прогрев: ключи попадают в кеш, как у пользователей посреди сценария
+    for key in keys:
+        await storage.set_state(key, "GameState:stake")
+
+    get_samples = []
+    set_samples = []
+    for i in range(ITERATIONS):
+        key = keys[i % HOT_KEYS]
+        start = time.perf_counter_ns()
+        await storage.set_data(key, {"stake": i})
+        set_samples.append(time.perf_counter_ns() - start)
+        start = time.perf_counter_ns()
+        await storage.get_data(key)
+        get_samples.append(time.perf_counter_ns() - start)
+
+    flush_ms = 0.0
+    if isinstance(storage, SQLiteStorage):
+        start = time.perf_counter()
+        await storage.flush()
+        flush_ms = (time.perf_counter() - start) * 1000
+    await storage.close()
+    return {
+        "get_p50": statistics.median(get_samples) / 1000,
+        "get_p99": _percentile(get_samples, 0.99) / 1000,
+        "set_p50": statistics.median(set_samples) / 1000,
+        "set_p99": _percentile(set_samples, 0.99) / 1000,
+        "flush_ms": flush_ms,
+    }
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {
+            "MemoryStorage": await run(MemoryStorage()),
+            "SQLiteStorage": await run(
+                SQLiteStorage(db_path=os.path.join(tmp, "fsm_bench.db"))
+            ),
+        }
+
+    print("\n" + "=" * 60)
+    print(f"FSM STORAGE: {HOT_KEYS} горячих ключей, {ITERATIONS} операций")
+    print("=" * 60)
+    print(f"{'storage':<15}{'get p50':>9}{'get p99':>9}{'set p50':>9}{'set p99':>9}")
+    for name, r in results.items():
+        print(
+            f"{name:<15}{r['get_p50']:>7.2f}us{r['get_p99']:>7.2f}us"
+            f"{r['set_p50']:>7.2f}us{r['set_p99']:>7.2f}us"
+        )
+    print(
+        f"\nФинальный flush SQLiteStorage: {results['SQLiteStorage']['flush_ms']:.2f} мс"
+    )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+# scripts/bench_keyboards.py
+"""
+Замеряет стоимость сборки inline-клавиатур (мкс на вызов).
+
+Кэшированные клавиатуры сравниваются с исходной функцией без кэша
+(`__wrapped__`), клавиатура партии дуэли — с копией прежней реализации,
+которая каждый раунд собирала все кнопки через InlineKeyboardBuilder.
+
+Запуск: python -m scripts.bench_keyboards
+"""
+
+import timeit
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from config import settings
+from keyboards import inline
+from keyboards.factories import DuelCallback
+from lexicon.languages import get_text
+
+# --- Настройки бенчмарка ---
+CALLS = 2_000
+REPEATS = 5
+HAND = [7, 2, 9, 4, 1]
+
+
+def legacy_duel_game_keyboard(
+    match_id: int,
+    hand: list[int],
+    opponent_id: int,
+    can_boost: bool,
+    can_reroll: bool,
+    language: str = "ru",
+) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    # Создаем красивые кнопки для карт с эмодзи
+    card_emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+    card_buttons = []
+
+    for card in sorted(hand):
+        emoji = card_emojis[card - 1] if card <= 10 else f"{card}"
+        card_buttons.append(
+            InlineKeyboardButton(
+                text=f"🃏 {emoji}",
+                callback_data=DuelCallback(
+                    action="play", match_id=match_id, value=card
+                ).pack(),
+            )
+        )
+    builder.row(*card_buttons, width=len(hand) or 1)
+    # Кнопки улучшений
+    improvement_buttons = []
+    if can_boost:
+        improvement_buttons.append(
+            InlineKeyboardButton(
+                text=f"⚡ {get_text('boost_card_button', language, default='Усилить карту')} ({settings.DUEL_BOOST_COST} ⭐)",
+                callback_data=DuelCallback(action="boost", match_id=match_id).pack(),
+            )
+        )
+    if can_reroll:
+        improvement_buttons.append(
+            InlineKeyboardButton(
+                text=f"🔄 {get_text('new_cards_button', language, default='Новые карты')} ({settings.DUEL_REROLL_COST} ⭐)",
+                callback_data=DuelCallback(action="reroll", match_id=match_id).pack(),
+            )
+        )
+
+    if improvement_buttons:
+        if len(improvement_buttons) == 2:
+            builder.row(*improvement_buttons)
+        else:
+            builder.row(improvement_buttons[0])
+
+    builder.row(
+        InlineKeyboardButton(
+            text="🏳️ " + get_text("surrender_button", language, default="Сдаться"),
+            callback_data=DuelCallback(
+                action="surrender", match_id=match_id, opponent_id=opponent_id
+            ).pack(),
+        )
+    )
+    return builder.as_markup()
+
+
+CASES = [
+    (
+        "main_menu_keyboard",
+        inline.main_menu_keyboard.__wrapped__,
+        inline.main_menu_keyboard,
+        ("en",),
+    ),
+    (
+        "games_menu_keyboard",
+        inline.games_menu_keyboard.__wrapped__,
+        inline.games_menu_keyboard,
+        ("en",),
+    ),
+    (
+        "slots_stake_keyboard",
+        inline.slots_stake_keyboard.__wrapped__,
+        inline.slots_stake_keyboard,
+        ("en",),
+    ),
+    (
+        "back_to_duels_keyboard",
+        inline.back_to_duels_keyboard.__wrapped__,
+        inline.back_to_duels_keyboard,
+        ("en",),
+    ),
+    (
+        "timer_game_keyboard",
+        inline.timer_game_keyboard.__wrapped__,
+        inline.timer_game_keyboard,
+        (42, "en"),
+    ),
+    (
+        "duel_game_keyboard",
+        legacy_duel_game_keyboard,
+        inline.duel_game_keyboard,
+        (42, HAND, 7, True, True, "en"),
+    ),
+]
+
+
+def _us_per_call(func, args) -> float:
+    timer = timeit.Timer(lambda: func(*args))
+    return min(timer.repeat(REPEATS, CALLS)) / CALLS * 1e6
+
+
+def main():
+    print("\n" + "=" * 60)
+    print(f"КЛАВИАТУРЫ: {CALLS} вызовов, лучший из {REPEATS} замеров")
+    print("=" * 60)
+    print(f"{'клавиатура':<26}{'было, мкс':>11}{'стало, мкс':>11}{'ускорение':>11}")
+    for title, before_func, after_func, args in CASES:
+        assert before_func(*args) == after_func(*args)
+        before = _us_per_call(before_func, args)
+        after = _us_per_call(after_func, args)
+        print(f"{title:<26}{before:>11.2f}{after:>11.2f}{before / after:>10.0f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# scripts/bench_ledger_audit.py
+"""
+Замеряет время полной и инкрементальной сверки балансов на синтетической
+БД: USERS пользователей и ENTRIES записей ledger во временном файле.
+
+Запуск: python -m scripts.bench_ledger_audit [ENTRIES]
+"""
+
+import asyncio
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from database import db, ledger_audit
+
+# --- Настройки бенчмарка ---
+USERS = 100_000
+ENTRIES = 10_000_000
+NEW_ENTRIES = 100_000  # Сколько записей добавляется перед инкрементальной сверкой
+DRIFTED_USERS = 10  # Скольким пользователям портим баланс в обход ledger
+
+
+def populate(path: str, entries: int) -> None:
+    """Заполняет БД напрямую через sqlite3 — так в разы быстрее, чем через API."""
+    rng = random.Random(42)
+    balances = [0] * (USERS + 1)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    batch = []
+    for _ in range(entries):
+        user_id = rng.randint(1, USERS)
+        amount = rng.choice((-5, -1, 1, 2, 10))
+        if balances[user_id] + amount < 0:  # CHECK (balance >= 0)
+            amount = -amount
+        balances[user_id] += amount
+        batch.append((user_id, amount, "bench"))
+        if len(batch) == 100_000:
+            conn.executemany(
+                "INSERT INTO ledger_entries (user_id, amount, reason) VALUES (?, ?, ?)",
+                batch,
+            )
+            batch.clear()
+    if batch:
+        conn.executemany(
+            "INSERT INTO ledger_entries (user_id, amount, reason) VALUES (?, ?, ?)",
+            batch,
+        )
+    conn.executemany(
+        "UPDATE users SET balance = ? WHERE user_id = ?",
+        [(balances[user_id], user_id) for user_id in range(1, USERS + 1)],
+    )
+    conn.commit()
+    conn.close()
+
+
+async def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else ENTRIES
+    with tempfile.TemporaryDirectory() as tmp:
+        db.DB_NAME = os.path.join(tmp, "bench.db")
+        await db.init_db()
+        async with db.connect() as conn:
+            await conn.executemany(
+                """INSERT INTO users (user_id, username, full_name, registration_date)
+                   VALUES (?, ?, ?, ?)""",
+                [(i, f"u{i}", "Bench", int(time.time())) for i in range(1, USERS + 1)],
+            )
+            await conn.commit()
+
+        start = time.perf_counter()
+        populate(db.DB_NAME, entries)
+        populate_s = time.perf_counter() - start
+
+        full = await ledger_audit.run_audit(full=True)
+
+        populate_extra = sqlite3.connect(db.DB_NAME)
+        populate_extra.executemany(
+            "INSERT INTO ledger_entries (user_id, amount, reason) VALUES (?, 1, 'bench')",
+            [(i % USERS + 1,) for i in range(NEW_ENTRIES)],
+        )
+        populate_extra.execute(
+            "UPDATE users SET balance = balance + ? WHERE user_id <= ?",
+            (NEW_ENTRIES // USERS, USERS),
+        )
+        populate_extra.execute(
+            "UPDATE users SET balance = balance + 7 WHERE user_id <= ?",
+            (DRIFTED_USERS,),
+        )
+        populate_extra.commit()
+        populate_extra.close()
+
+        incremental = await ledger_audit.run_audit()
+
+    print("\n" + "=" * 60)
+    print(f"СВЕРКА БАЛАНСОВ: {USERS} пользователей, {entries} записей ledger")
+    print("=" * 60)
+    print(f"Заполнение БД: {populate_s:.1f} с")
+    print(
+        f"Полная сверка: {full['duration']:.2f} с "
+        f"({entries / max(full['duration'], 1e-9):,.0f} записей/с), "
+        f"расхождений: {full['drifted_users']}"
+    )
+    print(
+        f"Инкрементальная (+{NEW_ENTRIES} записей): {incremental['duration']:.2f} с, "
+        f"расхождений: {incremental['drifted_users']} (ожидается {DRIFTED_USERS})"
+    )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
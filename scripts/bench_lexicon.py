@@ -0,0 +1,66 @@
+# scripts/bench_lexicon.py
+"""
+Замеряет стоимость одного вызова get_text (нс/вызов).
+
+Для сравнения рядом лежит копия прежней реализации, которая на каждый
+вызов проверяла язык, искала ключ с откатом на русский и форматировала
+строку даже без подстановок.
+
+Запуск: python -m scripts.bench_lexicon
+"""
+
+import timeit
+from typing import Optional
+
+from lexicon.languages import SUPPORTED_LANGUAGES, get_text, load_texts
+
+# --- Настройки бенчмарка ---
+CALLS = 200_000
+REPEATS = 5
+
+MULTILINGUAL_TEXTS = {code: load_texts(code) for code in SUPPORTED_LANGUAGES}
+
+
+def legacy_get_text(
+    key: str, language_code: str = "ru", default: Optional[str] = None, **kwargs
+) -> str:
+    if language_code not in SUPPORTED_LANGUAGES:
+        language_code = "ru"
+    text = MULTILINGUAL_TEXTS.get(language_code, {}).get(key)
+    if text is None:
+        text = MULTILINGUAL_TEXTS.get("ru", {}).get(key)
+    if text is None:
+        text = default if default is not None else f"[{key}]"
+    try:
+        return text.format(**kwargs)
+    except KeyError:
+        return text
+
+
+CASES = [
+    ("без подстановок", ("faq_button", "en"), {}),
+    ("с подстановками", ("main_menu", "en"), {"balance": 150}),
+    ("откат на русский", ("faq_button", "xx"), {}),
+]
+
+
+def _ns_per_call(func, args, kwargs) -> float:
+    timer = timeit.Timer(lambda: func(*args, **kwargs))
+    return min(timer.repeat(REPEATS, CALLS)) / CALLS * 1e9
+
+
+def main():
+    print("\n" + "=" * 60)
+    print(f"GET_TEXT: {CALLS} вызовов, лучший из {REPEATS} замеров")
+    print("=" * 60)
+    print(f"{'случай':<20}{'было, нс':>12}{'стало, нс':>12}{'ускорение':>12}")
+    for title, args, kwargs in CASES:
+        assert legacy_get_text(*args, **kwargs) == get_text(*args, **kwargs)
+        before = _ns_per_call(legacy_get_text, args, kwargs)
+        after = _ns_per_call(get_text, args, kwargs)
+        print(f"{title:<20}{before:>12.0f}{after:>12.0f}{before / after:>11.2f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
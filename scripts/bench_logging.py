@@ -0,0 +1,95 @@
+# scripts/bench_logging.py
+"""
+Сколько времени logger.info отнимает у вызывающего потока (event loop).
+
+Прежняя схема: StreamHandler прямо в вызывающем потоке — JSON,
+маскирование токена (копия прежнего SecretMasker) и запись. Новая:
+SamplingQueueHandler кладёт запись в очередь, остальное делает
+QueueListener. Вывод идёт в os.devnull, чтобы мерить не терминал.
+
+Запуск: python -m scripts.bench_logging
+"""
+
+import logging
+import os
+import queue
+import time
+
+from logger_config import (
+    CustomJsonFormatter,
+    SamplingQueueHandler,
+    SecretMasker,
+    _DrainingQueueListener,
+)
+
+# --- Настройки бенчмарка ---
+RECORDS = 20_000
+TOKEN = "123456789:AAHdqTcvCH1vGWJxfSeofSAs0K5PALDsaw"
+FORMAT = "%(timestamp)s %(level)s %(module)s %(message)s %(user_id)s %(trace_id)s"
+
+
+class LegacySecretMasker(logging.Filter):
+    def filter(self, record):
+        if hasattr(record, "msg") and isinstance(record.msg, str):
+            record.msg = record.msg.replace(TOKEN, "***BOT_TOKEN***")
+        if record.args:
+            record.args = tuple(
+                arg.replace(TOKEN, "***BOT_TOKEN***") if isinstance(arg, str) else arg
+                for arg in record.args
+            )
+        return True
+
+
+def _log_records(logger: logging.Logger) -> float:
+    """мкс вызывающего потока на одну запись."""
+    start = time.perf_counter()
+    for i in range(RECORDS):
+        logger.info(
+            "Update processed in %s ms", i % 50, extra={"user_id": i, "trace_id": "t"}
+        )
+    return (time.perf_counter() - start) / RECORDS * 1e6
+
+
+def legacy(stream) -> float:
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(CustomJsonFormatter(FORMAT))
+    handler.addFilter(LegacySecretMasker())
+    logger = logging.getLogger("bench.legacy")
+    logger.addHandler(handler)
+    return _log_records(logger)
+
+
+def queued(stream) -> tuple[float, float]:
+    """(мкс вызывающего потока, мкс до записи всех строк) на запись."""
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(CustomJsonFormatter(FORMAT, masker=SecretMasker(TOKEN)))
+    log_queue: queue.Queue = queue.Queue(maxsize=RECORDS)
+    listener = _DrainingQueueListener(log_queue, stream_handler)
+    listener.start()
+    logger = logging.getLogger("bench.queued")
+    logger.addHandler(SamplingQueueHandler(log_queue, {}))
+    start = time.perf_counter()
+    caller_us = _log_records(logger)
+    listener.stop()
+    return caller_us, (time.perf_counter() - start) / RECORDS * 1e6
+
+
+def main():
+    with open(os.devnull, "w") as stream:
+        for logger_name in ("bench.legacy", "bench.queued"):
+            logging.getLogger(logger_name).propagate = False
+            logging.getLogger(logger_name).setLevel(logging.INFO)
+        legacy_us = legacy(stream)
+        caller_us, total_us = queued(stream)
+
+    print("\n" + "=" * 60)
+    print(f"ЛОГИРОВАНИЕ: {RECORDS} записей logger.info с extra")
+    print("=" * 60)
+    print(f"{'StreamHandler в потоке':<40}{legacy_us:>12.1f} мкс")
+    print(f"{'очередь: вызывающий поток':<40}{caller_us:>12.1f} мкс")
+    print(f"{'очередь: до записи последней строки':<40}{total_us:>12.1f} мкс")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# scripts/bench_sqlite_profiles.py
+"""
+Сравнивает профили настроек SQLite (SQLITE_* в config.Settings) на
+денежных операциях: транзакций в секунду и p99 задержки для
+spend_balance и add_balance_unrestricted при WORKERS параллельных
+"пользователях". Каждый профиль гоняется на своей временной БД.
+
+Запуск: python -m scripts.bench_sqlite_profiles
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from config import settings
+from database import db
+
+# --- Настройки бенчмарка ---
+USERS = 200  # Пользователей с балансом
+WORKERS = 20  # Одновременных операций
+OPS_PER_WORKER = 250  # Операций на одного воркера (пополам add/spend)
+
+PROFILES = {
+    # Что было до профиля: только WAL, остальное — значения SQLite по умолчанию
+    "legacy": {
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_CACHE_SIZE_KB": 2000,
+        "SQLITE_MMAP_SIZE": 0,
+        "SQLITE_TEMP_STORE": "DEFAULT",
+        "SQLITE_WAL_AUTOCHECKPOINT": 1000,
+    },
+    "default": {},  # Значения из config.Settings
+    # Без fsync вообще — только для сравнения, в продакшене небезопасно
+    "unsafe": {"SQLITE_SYNCHRONOUS": "OFF"},
+}
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run_profile(path: str) -> dict[str, dict[str, float]]:
+    db.DB_NAME = path
+    await db.init_db()
+    for user_id in range(1, USERS + 1):
+        await db.add_user(user_id, f"bench{user_id}", "Bench")
+        await db.add_balance_unrestricted(user_id, 1_000_000, "bench_seed")
+
+    samples: dict[str, list[float]] = {
+        "add_balance_unrestricted": [],
+        "spend_balance": [],
+    }
+
+    async def worker(worker_id: int) -> None:
+        for i in range(OPS_PER_WORKER):
+            user_id = (worker_id * OPS_PER_WORKER + i) % USERS + 1
+            start = time.perf_counter()
+            if i % 2:
+                await db.spend_balance(user_id, 1, "bench_spend")
+                samples["spend_balance"].append(time.perf_counter() - start)
+            else:
+                await db.add_balance_unrestricted(user_id, 1, "bench_add")
+                samples["add_balance_unrestricted"].append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(w) for w in range(WORKERS)))
+    elapsed = time.perf_counter() - start
+    return {
+        name: {
+            "tps": len(values) / elapsed,
+            "p50_ms": statistics.median(values) * 1000,
+            "p99_ms": _percentile(values, 0.99) * 1000,
+        }
+        for name, values in samples.items()
+    }
+
+
+async def main():
+    defaults = {key: getattr(settings, key) for p in PROFILES.values() for key in p}
+    results = {}
+    for name, overrides in PROFILES.items():
+        for key, value in {**defaults, **overrides}.items():
+            setattr(settings, key, value)
+        with tempfile.TemporaryDirectory() as tmp:
+            results[name] = await run_profile(os.path.join(tmp, "bench.db"))
+
+    print("\n" + "=" * 60)
+    print(f"ПРОФИЛИ SQLITE: {WORKERS} воркеров × {OPS_PER_WORKER} операций")
+    print("=" * 60)
+    print(f"{'профиль':<10}{'операция':<26}{'tx/s':>8}{'p50, мс':>9}{'p99, мс':>9}")
+    for name, ops in results.items():
+        for op, r in ops.items():
+            print(
+                f"{name:<10}{op:<26}{r['tps']:>8.0f}{r['p50_ms']:>9.2f}{r['p99_ms']:>9.2f}"
+            )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,35 @@
+# scripts/enable_incremental_vacuum.py
+"""
+Разовая миграция: включает auto_vacuum = INCREMENTAL на существующей БД.
+
+Файлы, созданные до этого режима, переключаются только полным VACUUM —
+он перестраивает весь файл и держит блокировку записи до конца. Поэтому
+ночное обслуживание само его не делает, а запускает оператор при
+остановленном боте. После миграции освободившиеся страницы возвращает
+incremental_vacuum небольшими шагами (utils.maintenance).
+
+Запуск: python -m scripts.enable_incremental_vacuum
+"""
+
+import asyncio
+
+from database import db
+
+
+async def main():
+    report = await db.enable_incremental_vacuum()
+
+    print("\n" + "=" * 60)
+    print(f"AUTO_VACUUM = INCREMENTAL: {db.DB_NAME}")
+    print("=" * 60)
+    if not report["changed"]:
+        print("Режим уже включён, ничего не сделано")
+        return
+    print(f"{'Страниц до':<40}{report['pages_before']:>12}")
+    print(f"{'Страниц после':<40}{report['pages_after']:>12}")
+    print(f"{'Полный VACUUM':<40}{report['vacuum_ms']:>12.1f} мс")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
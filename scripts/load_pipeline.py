@@ -0,0 +1,535 @@
+# scripts/load_pipeline.py
+"""
+Синтетическая нагрузка на весь конвейер обновлений.
+
+Тысячи виртуальных пользователей шлют сырые обновления (команды, меню,
+игры на кубиках, дуэли, таймер) в настоящий Dispatcher со всеми
+middleware и роутерами — так же, как их подаёт webhook-воркер. Бот
+работает с RecordingSession: в сеть ничего не уходит, вызовы API
+считаются и получают правдоподобные ответы. SubGram подменяется так же.
+База — временные файлы SQLite.
+
+Отчёт: обновлений в секунду, p50/p95/p99 по хендлерам, транзакции и
+запросы к БД на обновление, вызовы API на обновление. БД и API считаются
+целиком, включая фоновые продолжения игр, которые эти обновления запустили.
+
+Запуск: python -m scripts.load_pipeline
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+import typing
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncGenerator, Optional
+from unittest import mock
+
+import aiosqlite
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import GetChat, GetChatMember, GetMe, SendDice, TelegramMethod
+from aiogram.types import Chat, ChatFullInfo, ChatMemberMember, Dice, Message, User
+
+from botstar import create_dispatcher
+from config import DUEL_STAKES, SLOTS_STAKES, TIMER_STAKES
+from database import db
+from database.fsm_storage import SQLiteStorage
+from handlers import duel_handlers, timer_handlers
+from keyboards.factories import (
+    BasketballCallback,
+    BowlingCallback,
+    DartsCallback,
+    DuelCallback,
+    FootballCallback,
+    MenuCallback,
+    SlotsCallback,
+    TimerCallback,
+)
+from utils import subgram_api
+from utils.continuations import continuations
+from utils.game_events import game_events
+
+# --- Настройки нагрузки ---
+VIRTUAL_USERS = 2_000
+DURATION_SECONDS = 60
+THINK_TIME = (10.0, 30.0)  # Пауза пользователя между действиями, с
+REGISTRATION_CONCURRENCY = 50
+INITIAL_BALANCE = 100_000
+FIRST_USER_ID = 10_000_000
+SEARCH_TIMEOUT = 20  # Столько ждём соперника, потом отменяем поиск
+DRAIN_SECONDS = 15
+
+# Вес действия свободного пользователя. Ход в дуэли и стоп таймера
+# пользователь делает сам, когда сидит в матче
+ACTIONS = {
+    "menu": 30,
+    "message": 10,
+    "slots": 10,
+    "football": 4,
+    "bowling": 4,
+    "basketball": 4,
+    "darts": 4,
+    "duel": 20,
+    "timer": 14,
+}
+MENU_SCREENS = ("main_menu", "profile", "games", "top_users", "achievements")
+MESSAGES = ("📖 Меню", "/menu", "/bonus")
+DICE_GAMES = {
+    "slots": lambda stake: SlotsCallback(action="spin", value=stake),
+    "football": lambda stake: FootballCallback(action="kick", value=stake),
+    "bowling": lambda stake: BowlingCallback(action="throw", value=stake),
+    "basketball": lambda stake: BasketballCallback(action="throw", value=stake),
+    "darts": lambda stake: DartsCallback(action="throw", value=stake),
+}
+DICE_VALUES = {"🎰": 64, "⚽": 5, "🏀": 5}  # Остальные кубики — 1..6
+
+
+class RecordingSession(BaseSession):
+    """Сессия без сети: считает вызовы API и отвечает правдоподобными объектами."""
+
+    def __init__(self, calls: Counter) -> None:
+        super().__init__()
+        self.calls = calls
+        self._message_ids = itertools.count(1_000)
+
+    async def make_request(
+        self, bot: Bot, method: TelegramMethod, timeout: Optional[int] = None
+    ) -> Any:
+        self.calls[type(method).__name__] += 1
+        return self._response(bot, method)
+
+    def _response(self, bot: Bot, method: TelegramMethod) -> Any:
+        returning = method.__returning__
+        if returning is bool:
+            return True
+        if isinstance(method, GetChat):
+            return ChatFullInfo(
+                id=method.chat_id,
+                type="private",
+                first_name="Load",
+                accent_color_id=0,
+                max_reaction_count=0,
+            )
+        if isinstance(method, GetChatMember):
+            return ChatMemberMember(user=_user(method.user_id))
+        if isinstance(method, GetMe):
+            return User(id=42, is_bot=True, first_name="Load", username="load_bot")
+        if returning is Message or Message in typing.get_args(returning):
+            chat_id = getattr(method, "chat_id", None)
+            dice = None
+            if isinstance(method, SendDice):
+                emoji = method.emoji or "🎲"
+                dice = Dice(
+                    emoji=emoji, value=random.randint(1, DICE_VALUES.get(emoji, 6))
+                )
+            return Message(
+                message_id=next(self._message_ids),
+                date=datetime.now(),
+                chat=Chat(
+                    id=chat_id if isinstance(chat_id, int) else 0, type="private"
+                ),
+                dice=dice,
+            ).as_(bot)
+        raise NotImplementedError(f"Нет ответа для {type(method).__name__}")
+
+    async def close(self) -> None:
+        pass
+
+    async def stream_content(
+        self, *args: Any, **kwargs: Any
+    ) -> AsyncGenerator[bytes, None]:
+        # Скачивание файлов под нагрузкой не нужно
+        raise NotImplementedError
+        yield b""
+
+
+def _user(user_id: int) -> User:
+    return User(
+        id=user_id, is_bot=False, first_name=f"Load {user_id}", language_code="ru"
+    )
+
+
+@dataclass
+class LoadReport:
+    users: int = 0
+    seconds: float = 0.0
+    updates: int = 0
+    update_ms: list = field(default_factory=list)
+    handler_ms: dict = field(default_factory=lambda: defaultdict(list))
+    api_calls: Counter = field(default_factory=Counter)
+    sql: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    registration_rate: float = 0.0
+
+    @property
+    def handled(self) -> int:
+        return sum(len(timings) for timings in self.handler_ms.values())
+
+    def per_update(self, count: int) -> float:
+        return count / self.updates if self.updates else 0.0
+
+    def reset(self) -> None:
+        self.updates = 0
+        self.update_ms.clear()
+        self.handler_ms.clear()
+        self.api_calls.clear()
+        self.sql.clear()
+        self.errors.clear()
+
+
+class HandlerTimer(BaseMiddleware):
+    """Время хендлера по его имени (inner middleware, видит выбранный хендлер)."""
+
+    def __init__(self, report: LoadReport) -> None:
+        self.report = report
+
+    async def __call__(self, handler, event, data):
+        callback = data["handler"].callback
+        name = f"{callback.__module__.rsplit('.', 1)[-1]}.{callback.__name__}"
+        start = time.perf_counter()
+        try:
+            return await handler(event, data)
+        finally:
+            self.report.handler_ms[name].append((time.perf_counter() - start) * 1000)
+
+
+class ErrorCounter(logging.Handler):
+    def __init__(self, report: LoadReport) -> None:
+        super().__init__(logging.ERROR)
+        self.report = report
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Номера пользователей и обновлений не разбивают одну ошибку на сотни
+        message = re.sub(r"\d+", "N", " ".join(record.getMessage().split()))
+        self.report.errors[f"{record.name}: {message[:60]}"] += 1
+
+
+class SqlCounter:
+    """Считает выражения SQL всех соединений (trace callback из их потоков)."""
+
+    def __init__(self, report: LoadReport) -> None:
+        self.report = report
+        self._lock = threading.Lock()
+        self._connect = aiosqlite.connect
+
+    def trace(self, statement: str) -> None:
+        kind = statement.lstrip()[:6].upper()
+        with self._lock:
+            self.report.sql["statements"] += 1
+            if kind.startswith("BEGIN"):
+                self.report.sql["transactions"] += 1
+
+    async def connect(self, *args: Any, **kwargs: Any) -> aiosqlite.Connection:
+        conn = await self._connect(*args, **kwargs)
+        await conn.set_trace_callback(self.trace)
+        with self._lock:
+            self.report.sql["connections"] += 1
+        return conn
+
+
+class LoadGenerator:
+    def __init__(self, bot: Bot, dp, report: LoadReport, think_time: tuple) -> None:
+        self.bot = bot
+        self.dp = dp
+        self.report = report
+        self.think_time = think_time
+        self._update_ids = itertools.count(1)
+        self._searching: dict[int, tuple[str, int, float]] = {}
+        self._matches: dict[int, Any] = {}
+        self._actions = list(ACTIONS)
+        self._weights = list(ACTIONS.values())
+
+    async def feed(self, update: dict) -> None:
+        start = time.perf_counter()
+        await self.dp.feed_raw_update(self.bot, update)
+        self.report.update_ms.append((time.perf_counter() - start) * 1000)
+        self.report.updates += 1
+
+    def message(self, user_id: int, text: str) -> dict:
+        return {
+            "update_id": next(self._update_ids),
+            "message": {
+                "message_id": next(self._update_ids),
+                "date": int(time.time()),
+                "chat": {"id": user_id, "type": "private"},
+                "from": _user(user_id).model_dump(exclude_none=True),
+                "text": text,
+            },
+        }
+
+    def press(self, user_id: int, callback_data) -> dict:
+        return {
+            "update_id": next(self._update_ids),
+            "callback_query": {
+                "id": str(next(self._update_ids)),
+                "chat_instance": str(user_id),
+                "from": _user(user_id).model_dump(exclude_none=True),
+                "data": callback_data.pack(),
+                "message": {
+                    "message_id": user_id,
+                    "date": int(time.time()),
+                    "chat": {"id": user_id, "type": "private"},
+                },
+            },
+        }
+
+    async def virtual_user(self, user_id: int, deadline: float) -> None:
+        loop = asyncio.get_running_loop()
+        pause = random.uniform(0, self.think_time[1])
+        while loop.time() + pause < deadline:
+            await asyncio.sleep(pause)
+            update = self.next_update(user_id)
+            if update is not None:
+                await self.feed(update)
+            pause = random.uniform(*self.think_time)
+
+    def next_update(self, user_id: int) -> Optional[dict]:
+        match = self._match(user_id)
+        if match is not None:
+            return self._move(user_id, match)
+        if user_id in self._searching:
+            game, stake, since = self._searching[user_id]
+            if time.monotonic() - since < SEARCH_TIMEOUT:
+                return None
+            del self._searching[user_id]
+            callback = DuelCallback if game == "duel" else TimerCallback
+            return self.press(user_id, callback(action="cancel_search", value=stake))
+
+        action = random.choices(self._actions, self._weights)[0]
+        if action == "menu":
+            return self.press(user_id, MenuCallback(name=random.choice(MENU_SCREENS)))
+        if action == "message":
+            return self.message(user_id, random.choice(MESSAGES))
+        if action in DICE_GAMES:
+            return self.press(user_id, DICE_GAMES[action](random.choice(SLOTS_STAKES)))
+        stake = random.choice(DUEL_STAKES if action == "duel" else TIMER_STAKES)
+        self._searching[user_id] = (action, stake, time.monotonic())
+        callback = DuelCallback if action == "duel" else TimerCallback
+        return self.press(user_id, callback(action="stake", value=stake))
+
+    def _match(self, user_id: int) -> Any:
+        """Матч, в котором сидит пользователь (ищем, пока он ждёт соперника)."""
+        match = self._matches.get(user_id)
+        if match is not None:
+            games = duel_handlers.active_duels
+            if isinstance(match, timer_handlers.TimerMatch):
+                games = timer_handlers.active_timers
+            if games.get(match.match_id) is match:
+                return match
+            del self._matches[user_id]
+            return None
+        if user_id not in self._searching:
+            return None
+        if self._searching[user_id][0] == "duel":
+            for match in duel_handlers.active_duels.values():
+                if user_id in (match.p1.id, match.p2.id):
+                    break
+            else:
+                return None
+        else:
+            for match in timer_handlers.active_timers.values():
+                if user_id in (match.p1_id, match.p2_id):
+                    break
+            else:
+                return None
+        del self._searching[user_id]
+        self._matches[user_id] = match
+        return match
+
+    def _move(self, user_id: int, match: Any) -> Optional[dict]:
+        if isinstance(match, timer_handlers.TimerMatch):
+            stopped = (
+                match.p1_stopped_time
+                if user_id == match.p1_id
+                else match.p2_stopped_time
+            )
+            if not match.start_time or stopped:
+                return None
+            return self.press(
+                user_id, TimerCallback(action="stop", match_id=match.match_id)
+            )
+        player = match.p1 if user_id == match.p1.id else match.p2
+        if (
+            match.phase != duel_handlers.PHASE_PLAYING
+            or player.played_card
+            or not player.hand
+        ):
+            return None
+        card = random.choice(player.hand)
+        return self.press(
+            user_id, DuelCallback(action="play", match_id=match.match_id, value=card)
+        )
+
+
+async def _register(generator: LoadGenerator, user_ids: range) -> None:
+    """/start для всех пользователей и начальный баланс (через ledger)."""
+    semaphore = asyncio.Semaphore(REGISTRATION_CONCURRENCY)
+
+    async def start(user_id: int) -> None:
+        async with semaphore:
+            await generator.feed(generator.message(user_id, "/start"))
+
+    await asyncio.gather(*(start(user_id) for user_id in user_ids))
+    async with db.connect() as conn:
+        await conn.execute(
+            "UPDATE users SET balance = balance + ? WHERE user_id BETWEEN ? AND ?",
+            (INITIAL_BALANCE, user_ids.start, user_ids.stop - 1),
+        )
+        await conn.execute(
+            "INSERT INTO ledger_entries (user_id, amount, reason) "
+            "SELECT user_id, ?, 'initial_balance' FROM users "
+            "WHERE user_id BETWEEN ? AND ?",
+            (INITIAL_BALANCE, user_ids.start, user_ids.stop - 1),
+        )
+        await conn.commit()
+
+
+async def _stop_games() -> None:
+    """Останавливает то, что осталось от матчей после нагрузки."""
+    for match in list(timer_handlers.active_timers.values()):
+        if match.updater_task is not None:
+            match.updater_task.cancel()
+    await continuations.close(timeout=DRAIN_SECONDS)
+    await game_events.close(timeout=DRAIN_SECONDS)
+    duel_handlers.active_duels.clear()
+    duel_handlers.duel_queue.clear()
+    timer_handlers.active_timers.clear()
+    timer_handlers.timer_queue.clear()
+
+
+async def run_load(
+    users: int = VIRTUAL_USERS,
+    duration: float = DURATION_SECONDS,
+    think_time: tuple = THINK_TIME,
+) -> LoadReport:
+    """Регистрирует `users` пользователей и гоняет смешанную нагрузку `duration` секунд."""
+    report = LoadReport(users=users)
+    sql = SqlCounter(report)
+
+    async def subgram_sponsors(user_id: int, chat_id: int, **kwargs: Any) -> dict:
+        report.api_calls["SubGram"] += 1
+        return {"status": "ok", "code": 200, "result": []}
+
+    root = logging.getLogger()
+    saved_logging = (root.level, root.handlers[:])
+    root.handlers = [ErrorCounter(report)]
+    root.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp, ExitStack() as stack:
+        stack.enter_context(
+            mock.patch.object(db, "DB_NAME", os.path.join(tmp, "bot.db"))
+        )
+        stack.enter_context(mock.patch.object(aiosqlite, "connect", sql.connect))
+        stack.enter_context(
+            mock.patch.object(subgram_api, "get_subgram_sponsors", subgram_sponsors)
+        )
+        await db.init_db()
+        storage = SQLiteStorage(db_path=os.path.join(tmp, "fsm.db"))
+        bot = Bot(
+            token="42:LOAD",
+            session=RecordingSession(report.api_calls),
+            default=DefaultBotProperties(parse_mode="Markdown"),
+        )
+        dp = create_dispatcher(storage)
+        timer = HandlerTimer(report)
+        dp.message.middleware(timer)
+        dp.callback_query.middleware(timer)
+        generator = LoadGenerator(bot, dp, report, think_time)
+        game_events.start(bot)
+        try:
+            start = time.perf_counter()
+            await _register(generator, range(FIRST_USER_ID, FIRST_USER_ID + users))
+            report.registration_rate = users / (time.perf_counter() - start)
+            report.reset()
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + duration
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    generator.virtual_user(user_id, deadline)
+                    for user_id in range(FIRST_USER_ID, FIRST_USER_ID + users)
+                )
+            )
+            report.seconds = time.perf_counter() - start
+        finally:
+            await _stop_games()
+            await storage.close()
+            root.handlers = saved_logging[1]
+            root.setLevel(saved_logging[0])
+    return report
+
+
+def _percentile(ordered: list, q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def print_report(report: LoadReport) -> None:
+    print("\n" + "=" * 60)
+    print(f"НАГРУЗКА: {report.users} пользователей, {report.seconds:.1f} с")
+    print("=" * 60)
+    print(f"{'регистрация (/start)':<36}{report.registration_rate:>14.1f} польз./с")
+    print(f"{'обновлений':<36}{report.updates:>14}")
+    print(f"{'обновлений в секунду':<36}{report.updates / report.seconds:>14.1f}")
+    print(
+        f"{'без хендлера (троттлинг, ошибки)':<36}{report.updates - report.handled:>14}"
+    )
+    ordered = sorted(report.update_ms)
+    print(
+        f"{'обновление целиком, мс p50/p95/p99':<36}"
+        f"{_percentile(ordered, 0.5):>8.1f}{_percentile(ordered, 0.95):>8.1f}"
+        f"{_percentile(ordered, 0.99):>8.1f}"
+    )
+
+    print("\n" + "=" * 60)
+    print("ХЕНДЛЕРЫ, мс")
+    print("=" * 60)
+    print(f"{'хендлер':<36}{'вызовов':>8}{'p50':>8}{'p95':>8}{'p99':>8}")
+    for name, timings in sorted(
+        report.handler_ms.items(), key=lambda item: len(item[1]), reverse=True
+    ):
+        ordered = sorted(timings)
+        print(
+            f"{name[:35]:<36}{len(ordered):>8}{_percentile(ordered, 0.5):>8.1f}"
+            f"{_percentile(ordered, 0.95):>8.1f}{_percentile(ordered, 0.99):>8.1f}"
+        )
+
+    print("\n" + "=" * 60)
+    print("НА ОДНО ОБНОВЛЕНИЕ")
+    print("=" * 60)
+    for title, key in (
+        ("транзакций БД", "transactions"),
+        ("запросов SQL", "statements"),
+        ("соединений с БД", "connections"),
+    ):
+        print(f"{title:<36}{report.per_update(report.sql[key]):>14.2f}")
+    total_calls = sum(report.api_calls.values())
+    print(f"{'вызовов API (всего)':<36}{report.per_update(total_calls):>14.2f}")
+    for method, calls in report.api_calls.most_common():
+        print(f"{'  ' + method:<36}{report.per_update(calls):>14.2f}")
+
+    if report.errors:
+        print("\n" + "=" * 60)
+        print(f"ОШИБКИ В ЛОГЕ: {sum(report.errors.values())}")
+        print("=" * 60)
+        for message, count in report.errors.most_common(5):
+            print(f"{count:>6}  {message}")
+    print("=" * 60)
+
+
+async def main():
+    print_report(await run_load())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
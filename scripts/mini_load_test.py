@@ -46,6 +46,13 @@ async def setup_test_user():
                 0,
             ),
         )
+        # REPLACE удаляет прежнюю строку вместе с её записями ledger (каскадом),
+        # поэтому начальный баланс тоже проводим через ledger — иначе сверка
+        # балансов покажет расхождение
+        await conn.execute(
+            "INSERT INTO ledger_entries (user_id, amount, reason) VALUES (?, ?, ?)",
+            (TEST_USER_ID, INITIAL_BALANCE, "initial_balance"),
+        )
         # Очистим его лимиты на всякий случай
         await conn.execute(
             "DELETE FROM earn_counters_daily WHERE user_id = ?", (TEST_USER_ID,)
@@ -0,0 +1,121 @@
+# scripts/profile_startup.py
+"""
+Профиль холодного старта бота.
+
+1. Отчёт `python -X importtime`: какие пакеты и модули проекта дороже
+   всего импортировать.
+2. Время по этапам в свежем интерпретаторе: импорт botstar, сборка
+   Dispatcher со всеми роутерами, первый вызов get_text. Сумма — время,
+   через которое бот готов обработать первое обновление (без сетевых
+   вызовов к Telegram и без init_db).
+
+Запуск: python -m scripts.profile_startup
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+# --- Настройки профиля ---
+RUNS = 5  # Сколько раз запускаем свежий интерпретатор
+TOP_MODULES = 15  # Сколько самых дорогих модулей проекта показать
+PROJECT_PACKAGES = {
+    "botstar",
+    "config",
+    "database",
+    "handlers",
+    "keyboards",
+    "lexicon",
+    "logger_config",
+    "middlewares",
+    "utils",
+}
+
+COLD_START = """
+import json, time
+start = time.perf_counter()
+import botstar
+imported = time.perf_counter()
+from database.fsm_storage import SQLiteStorage
+botstar.create_dispatcher(SQLiteStorage(db_path=":memory:"))
+assembled = time.perf_counter()
+from lexicon.languages import get_text
+get_text("main_menu", "ru", balance=0)
+ready = time.perf_counter()
+print(json.dumps({
+    "импорт botstar": imported - start,
+    "сборка Dispatcher": assembled - imported,
+    "первый get_text": ready - assembled,
+}))
+"""
+
+
+def import_times() -> list[tuple[str, int, int]]:
+    """[(модуль, собственное время мкс, с зависимостями мкс)] для import botstar."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import botstar"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def cold_start() -> tuple[float, dict]:
+    """Время до готовности (с запуском интерпретатора) и этапы внутри него."""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START], capture_output=True, text=True, check=True
+    )
+    total = time.perf_counter() - started
+    return total, json.loads(result.stdout.splitlines()[-1])
+
+
+def main():
+    rows = import_times()
+    by_package = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+    project = [row for row in rows if row[0].split(".")[0] in PROJECT_PACKAGES]
+
+    runs = [cold_start() for _ in range(RUNS)]
+    phases = {
+        phase: statistics.median(run[1][phase] for run in runs) for phase in runs[0][1]
+    }
+    total = statistics.median(run[0] for run in runs)
+
+    print("\n" + "=" * 60)
+    print("ИМПОРТ BOTSTAR: самые дорогие пакеты (собственное время)")
+    print("=" * 60)
+    for package, self_us in sorted(by_package.items(), key=lambda i: -i[1])[:10]:
+        print(f"{package:<40}{self_us / 1000:>12.1f} мс")
+    print("-" * 60)
+    print(f"{'модули проекта, всего':<40}{sum(r[1] for r in project) / 1000:>12.1f} мс")
+
+    print("\n" + "=" * 60)
+    print(f"МОДУЛИ ПРОЕКТА: топ-{TOP_MODULES} с зависимостями")
+    print("=" * 60)
+    for name, _, cumulative_us in sorted(project, key=lambda r: -r[2])[:TOP_MODULES]:
+        print(f"{name:<40}{cumulative_us / 1000:>12.1f} мс")
+
+    print("\n" + "=" * 60)
+    print(f"ХОЛОДНЫЙ СТАРТ: медиана {RUNS} запусков")
+    print("=" * 60)
+    for phase, seconds in phases.items():
+        print(f"{phase:<40}{seconds * 1000:>12.1f} мс")
+    print("-" * 60)
+    print(f"{'до первого обновления (с интерпретатором)':<40}{total * 1000:>12.1f} мс")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+# scripts/stress_balances.py
+"""
+Стресс-тест конкурентных операций с балансом на настоящем файле SQLite.
+
+OPERATIONS операций (не больше CONCURRENCY одновременно) идут по небольшому
+пулу USERS пользователей, чтобы транзакции постоянно дрались за блокировку:
+  spend  — spend_balance на случайную сумму;
+  idem   — spend_balance с ключом идемпотентности из общего пула, один и тот
+           же ключ отправляется много раз, часто одновременно;
+  bonus  — add_balance_with_checks("daily_bonus") с дневным лимитом;
+  refill — add_balance_unrestricted, чтобы деньги в системе не кончались;
+  duel   — create_duel и сразу finish_duel_atomic;
+  promo  — activate_promo по коду с ограниченным числом активаций.
+
+После прогона проверяются инварианты: баланс не уходит в минус, сумма
+ledger равна балансу (ledger_audit), ключ идемпотентности списывает ровно
+один раз, промокод не активирован больше total_uses и дважды одним
+пользователем, дневной лимит бонуса не превышен, банк дуэли выплачен не
+больше одного раза. Контеншн берётся из db.lock_stats (ожидание и повторы
+_begin_transaction) и из логов: функции на BEGIN IMMEDIATE не идут через
+_begin_transaction, их "database is locked" видны только по ошибкам.
+
+Запуск: python -m scripts.stress_balances [операций] [одновременно]
+Код выхода 1, если нарушен хотя бы один инвариант.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List
+from unittest import mock
+
+from config import settings
+from database import db, ledger_audit
+from economy import EARN_RULES
+
+# --- Настройки стресс-теста ---
+OPERATIONS = 5000
+CONCURRENCY = 500  # Операций в полёте одновременно
+USERS = 50  # Маленький пул — больше пересечений по пользователям
+INITIAL_BALANCE = 100
+IDEM_KEYS_SHARE = 0.1  # Ключей идемпотентности на одну операцию
+PROMO_CODE = "STRESS"
+PROMO_REWARD = 25
+USER_ID_OFFSET = 1_000_000
+OPERATION_WEIGHTS = {
+    "spend": 30,
+    "idem": 20,
+    "bonus": 15,
+    "refill": 10,
+    "duel": 15,
+    "promo": 10,
+}
+
+
+class LockedErrorCounter(logging.Handler):
+    """Считает ошибки "database is locked", которые функции db проглотили в лог."""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.count = 0
+
+    def emit(self, record):
+        exc = record.exc_info[1] if record.exc_info else None
+        if exc is not None and "locked" in str(exc).lower():
+            self.count += 1
+
+
+@dataclass
+class StressReport:
+    operations: int = 0
+    concurrency: int = 0
+    users: int = 0
+    seconds: float = 0.0
+    outcomes: Counter = field(default_factory=Counter)
+    lock_stats: Dict[str, float] = field(default_factory=dict)
+    logged_locked: int = 0
+    raised_locked: int = 0
+    violations: List[str] = field(default_factory=list)
+
+    @property
+    def ops_per_s(self) -> float:
+        return self.operations / self.seconds if self.seconds else 0.0
+
+
+class StressRun:
+    def __init__(self, report: StressReport, users: List[int], idem_keys: int):
+        self.report = report
+        self.users = users
+        self.idem_owners = {
+            f"stress-{n}": users[n % len(users)] for n in range(idem_keys)
+        }
+        self.promo_attempts = 0
+        self.names = list(OPERATION_WEIGHTS)
+        self.weights = list(OPERATION_WEIGHTS.values())
+
+    async def spend(self) -> str:
+        user_id = random.choice(self.users)
+        ok = await db.spend_balance(user_id, random.randint(1, 20), "stress_spend")
+        return "ok" if ok else "rejected"
+
+    async def idem(self) -> str:
+        key = random.choice(list(self.idem_owners))
+        ok = await db.spend_balance(
+            self.idem_owners[key], 5, "stress_idem", ref_id=key, idem_key=key
+        )
+        return "ok" if ok else "rejected"
+
+    async def bonus(self) -> str:
+        user_id = random.choice(self.users)
+        result = await db.add_balance_with_checks(
+            user_id, random.randint(1, 3), "daily_bonus"
+        )
+        return "ok" if result["success"] else result.get("reason", "rejected")
+
+    async def refill(self) -> str:
+        user_id = random.choice(self.users)
+        ok = await db.add_balance_unrestricted(user_id, 50, "stress_refill")
+        return "ok" if ok else "rejected"
+
+    async def duel(self) -> str:
+        p1, p2 = random.sample(self.users, 2)
+        stake = random.randint(1, 10)
+        match_id = await db.create_duel(p1, p2, stake)
+        if not match_id:
+            return "rejected"
+        winner, loser = random.sample((p1, p2), 2)
+        prize = stake * 2 * (100 - settings.DUEL_RAKE_PERCENT) // 100
+        await db.finish_duel_atomic(match_id, winner, loser, prize)
+        return "ok"
+
+    async def promo(self) -> str:
+        self.promo_attempts += 1
+        user_id = random.choice(self.users)
+        result = await db.activate_promo(
+            user_id, PROMO_CODE, f"promo-{user_id}-{self.promo_attempts}"
+        )
+        return "ok" if isinstance(result, int) else result
+
+    async def one(self, semaphore: asyncio.Semaphore) -> None:
+        name = random.choices(self.names, self.weights)[0]
+        async with semaphore:
+            try:
+                outcome = await getattr(self, name)()
+            except Exception as e:
+                outcome = "error"
+                if "locked" in str(e).lower():
+                    self.report.raised_locked += 1
+        self.report.outcomes[(name, outcome)] += 1
+
+
+async def check_invariants(promo_uses: int) -> List[str]:
+    """Список нарушений инвариантов баланса; пустой — всё сошлось."""
+    violations = []
+    async with db.connect() as conn:
+
+        async def rows(sql: str, params=()) -> list:
+            cursor = await conn.execute(sql, params)
+            return [tuple(row) for row in await cursor.fetchall()]
+
+        negative = await rows("SELECT user_id, balance FROM users WHERE balance < 0")
+        if negative:
+            violations.append(f"Отрицательный баланс: {negative[:5]}")
+
+        # Каждый записанный ключ — ровно одно списание, каждое списание — с ключом
+        idem = await rows(
+            """SELECT i.key, COUNT(l.id) FROM idempotency i
+               LEFT JOIN ledger_entries l
+                 ON l.ref_id = i.key AND l.reason = 'stress_idem'
+               WHERE i.key LIKE 'stress-%' GROUP BY i.key HAVING COUNT(l.id) != 1"""
+        )
+        if idem:
+            violations.append(f"Ключ идемпотентности списал не один раз: {idem[:5]}")
+        orphans = await rows(
+            """SELECT l.ref_id FROM ledger_entries l
+               LEFT JOIN idempotency i ON i.key = l.ref_id
+               WHERE l.reason = 'stress_idem' AND i.key IS NULL"""
+        )
+        if orphans:
+            violations.append(f"Списание без ключа идемпотентности: {orphans[:5]}")
+
+        total_uses, uses_left = (
+            await rows(
+                "SELECT total_uses, uses_left FROM promocodes WHERE code = ?",
+                (PROMO_CODE,),
+            )
+        )[0]
+        activations = (
+            await rows(
+                "SELECT COUNT(*) FROM promo_activations WHERE code = ?", (PROMO_CODE,)
+            )
+        )[0][0]
+        promo_credits = await rows(
+            """SELECT user_id, COUNT(*) FROM ledger_entries
+               WHERE reason = 'promo_activation' AND ref_id = ? GROUP BY user_id""",
+            (PROMO_CODE,),
+        )
+        if uses_left < 0 or activations != total_uses - uses_left:
+            violations.append(
+                f"Промокод: активаций {activations}, total_uses {total_uses}, "
+                f"uses_left {uses_left}"
+            )
+        if activations > promo_uses or any(count > 1 for _, count in promo_credits):
+            violations.append(f"Промокод начислен лишний раз: {promo_credits[:5]}")
+        if sum(count for _, count in promo_credits) != activations:
+            violations.append("Начислений промокода не столько, сколько активаций")
+
+        cap = EARN_RULES["daily_bonus"]["daily_cap"]
+        bonus = await rows(
+            """SELECT l.user_id, SUM(l.amount), COALESCE(MAX(c.amount), 0)
+               FROM ledger_entries l
+               LEFT JOIN earn_counters_daily c
+                 ON c.user_id = l.user_id AND c.source = 'daily_bonus'
+               WHERE l.reason = 'daily_bonus' GROUP BY l.user_id"""
+        )
+        over_cap = [row for row in bonus if row[1] > cap or row[1] != row[2]]
+        if over_cap:
+            violations.append(
+                f"Дневной бонус сверх лимита или мимо счётчика: {over_cap[:5]}"
+            )
+
+        duels = await rows(
+            """SELECT m.id, m.bank, COUNT(l.id), SUM(l.amount) FROM duel_matches m
+               JOIN ledger_entries l
+                 ON l.ref_id = CAST(m.id AS TEXT) AND l.reason = 'duel_win'
+               GROUP BY m.id HAVING COUNT(l.id) > 1 OR SUM(l.amount) > m.bank"""
+        )
+        if duels:
+            violations.append(f"Банк дуэли выплачен неверно: {duels[:5]}")
+        stuck = await rows("SELECT id FROM duel_matches WHERE state = 'active'")
+        if stuck:
+            violations.append(f"Дуэли не завершены, ставки зависли: {stuck[:5]}")
+
+    audit = await ledger_audit.run_audit(full=True)
+    if audit["drifted_users"]:
+        violations.append(f"Баланс расходится с ledger: {audit['drifts'][:5]}")
+    return violations
+
+
+async def run_stress(
+    operations: int = OPERATIONS,
+    concurrency: int = CONCURRENCY,
+    users: int = USERS,
+) -> StressReport:
+    report = StressReport(operations=operations, concurrency=concurrency, users=users)
+    user_ids = [USER_ID_OFFSET + n for n in range(users)]
+    promo_uses = max(users // 2, 1)
+    locked_logs = LockedErrorCounter()
+    root = logging.getLogger()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with mock.patch.object(db, "DB_NAME", os.path.join(tmp, "stress.db")):
+            await db.init_db()
+            for user_id in user_ids:
+                await db.add_user(
+                    user_id, f"u{user_id}", "Stress", initial_balance=INITIAL_BALANCE
+                )
+            await db.add_promo_code(PROMO_CODE, PROMO_REWARD, promo_uses)
+
+            run = StressRun(report, user_ids, max(int(operations * IDEM_KEYS_SHARE), 1))
+            semaphore = asyncio.Semaphore(concurrency)
+            db.reset_lock_stats()
+            # Проглоченные ошибки только считаем: тысячи трейсбеков в консоли не нужны
+            saved_logging = (root.level, root.handlers[:])
+            root.handlers = [locked_logs]
+            root.setLevel(logging.WARNING)
+            started = time.perf_counter()
+            try:
+                await asyncio.gather(*(run.one(semaphore) for _ in range(operations)))
+            finally:
+                report.seconds = time.perf_counter() - started
+                root.handlers = saved_logging[1]
+                root.setLevel(saved_logging[0])
+            report.lock_stats = dict(db.lock_stats)
+            report.logged_locked = locked_logs.count
+            report.violations = await check_invariants(promo_uses)
+    return report
+
+
+def print_report(report: StressReport) -> None:
+    stats = report.lock_stats
+    transactions = stats.get("transactions", 0)
+    avg_wait_ms = stats["wait_seconds"] / transactions * 1000 if transactions else 0.0
+
+    print("\n" + "=" * 60)
+    print(
+        f"СТРЕСС БАЛАНСОВ: {report.operations} операций, "
+        f"{report.concurrency} одновременно, {report.users} пользователей"
+    )
+    print("=" * 60)
+    print(f"{'Время':<40}{report.seconds:>12.1f} с")
+    print(f"{'Операций в секунду':<40}{report.ops_per_s:>12.1f}")
+    print("-" * 60)
+    for (name, outcome), count in sorted(report.outcomes.items()):
+        print(f"{name + ': ' + str(outcome):<40}{count:>12}")
+    print("-" * 60)
+    print(f"{'Транзакций _begin_transaction':<40}{transactions:>12}")
+    print(f"{'Среднее ожидание блокировки':<40}{avg_wait_ms:>12.2f} мс")
+    print(
+        f"{'Максимальное ожидание блокировки':<40}"
+        f"{stats.get('max_wait_seconds', 0) * 1000:>12.2f} мс"
+    )
+    print(f"{'Повторов BEGIN EXCLUSIVE':<40}{stats.get('retries', 0):>12}")
+    print(f"{'locked после всех повторов':<40}{stats.get('locked_failures', 0):>12}")
+    print(f"{'locked, проглоченных в лог':<40}{report.logged_locked:>12}")
+    print(f"{'locked, дошедших до вызова':<40}{report.raised_locked:>12}")
+    print("=" * 60)
+    if report.violations:
+        print("НАРУШЕНЫ ИНВАРИАНТЫ:")
+        for violation in report.violations:
+            print(f"  - {violation}")
+    else:
+        print("Инварианты соблюдены")
+
+
+async def main():
+    args = [int(arg) for arg in sys.argv[1:3]]
+    report = await run_stress(*args)
+    print_report(report)
+    if report.violations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
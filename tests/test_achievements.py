@@ -0,0 +1,91 @@
+# tests/test_achievements.py
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from database import db
+from database.achievements import achievement_engine
+from keyboards.inline import ACHIEVEMENTS_PAGE_SIZE, achievements_keyboard
+
+USER_ID = 401
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database(monkeypatch):
+    conn = await aiosqlite.connect(":memory:")
+    conn.row_factory = aiosqlite.Row
+
+    @asynccontextmanager
+    async def mock_connect():
+        yield conn
+
+    monkeypatch.setattr(db, "connect", mock_connect)
+    await db.init_db()
+    await db.add_user(USER_ID, "user", "User")
+    yield
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_earned_achievements_are_granted_together():
+    """Все пороги стрика выдаются за одно событие, награда запускает проверку баланса."""
+    await db.add_balance_unrestricted(USER_ID, 98, "grant")
+    bot = AsyncMock()
+
+    granted = await achievement_engine.check(USER_ID, bot, ["streak"], {"streak": 30})
+
+    assert granted == ["streak_3", "streak_7", "streak_30"]
+    owned = set(await db.get_user_achievements(USER_ID))
+    # 98 + 1 + 2 + 3 звезды наград — этого хватает на «Магната»
+    assert owned == {"streak_3", "streak_7", "streak_30", "magnate"}
+    assert await db.get_user_balance(USER_ID) == 98 + 6 + 1
+    assert bot.send_message.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_held_achievements_are_checked_without_db(monkeypatch):
+    await achievement_engine.check(USER_ID, None, ["streak"], {"streak": 30})
+    for ach_id in ("magnate", "balance_master"):
+        await db.grant_achievement(USER_ID, ach_id, None)
+
+    @asynccontextmanager
+    async def no_db():
+        raise AssertionError("обращение к БД")
+        yield
+
+    monkeypatch.setattr(db, "connect", no_db)
+    assert await achievement_engine.check(USER_ID, None, ["streak"]) == []
+    assert await achievement_engine.check(USER_ID, None, ["balance"]) == []
+    assert not await db.grant_achievement(USER_ID, "streak_7", None)
+
+
+@pytest.mark.asyncio
+async def test_achievements_pages_overlay_user_mask(monkeypatch):
+    await db.grant_achievement(USER_ID, "streak_3", None)
+    entries = await achievement_engine.display_order()
+    unlocked = await achievement_engine.unlocked(USER_ID)
+
+    @asynccontextmanager
+    async def no_db():
+        raise AssertionError("обращение к БД")
+        yield
+
+    monkeypatch.setattr(db, "connect", no_db)
+    texts = []
+    for page in range(1, -(-len(entries) // ACHIEVEMENTS_PAGE_SIZE) + 1):
+        markup = achievements_keyboard(
+            await achievement_engine.display_order(),
+            achievement_engine.version,
+            await achievement_engine.unlocked(USER_ID),
+            page,
+        )
+        texts += [row[0].text for row in markup.inline_keyboard[:-1] if len(row) == 1]
+
+    assert len(texts) == len(entries)
+    assert [t for t in texts if t.startswith("✅")] == [
+        f"✅ {dict(entries)['streak_3'].name}"
+    ]
+    assert unlocked.bit_count() == 1
@@ -0,0 +1,54 @@
+# tests/test_balance_stress.py
+"""
+Конкурентные операции с балансом на файле SQLite (scripts/stress_balances.py).
+
+По умолчанию прогон короткий; полный — через STRESS_OPERATIONS, например
+STRESS_OPERATIONS=5000 python -m pytest tests/test_balance_stress.py.
+"""
+
+import os
+
+import aiosqlite
+import pytest
+
+from config import settings
+from database import db
+from scripts.stress_balances import run_stress
+
+USER_ID = 701
+
+
+@pytest.mark.asyncio
+async def test_concurrent_balance_operations_keep_invariants():
+    operations = int(os.environ.get("STRESS_OPERATIONS", 300))
+
+    report = await run_stress(
+        operations=operations, concurrency=min(operations, 500), users=10
+    )
+
+    assert report.violations == []
+    assert sum(report.outcomes.values()) == operations
+    assert report.lock_stats["transactions"] > 0
+
+
+@pytest.mark.asyncio
+async def test_begin_transaction_counts_lock_waits(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_NAME", str(tmp_path / "locks.db"))
+    monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", 1)
+    await db.init_db()
+    await db.add_user(USER_ID, "user", "User", initial_balance=10)
+    db.reset_lock_stats()
+
+    async with aiosqlite.connect(db.DB_NAME) as holder:
+        await holder.execute("BEGIN EXCLUSIVE;")
+        with pytest.raises(aiosqlite.OperationalError):
+            await db.add_balance_unrestricted(USER_ID, 5, "test")
+        await holder.rollback()
+
+    assert db.lock_stats["retries"] == 4
+    assert db.lock_stats["locked_failures"] == 1
+    assert db.lock_stats["transactions"] == 0
+
+    assert await db.add_balance_unrestricted(USER_ID, 5, "test")
+    assert db.lock_stats["transactions"] == 1
+    assert db.lock_stats["max_wait_seconds"] >= db.lock_stats["wait_seconds"] > 0
@@ -0,0 +1,122 @@
+# tests/test_broadcast.py
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+from aiogram.exceptions import TelegramForbiddenError
+
+from config import settings
+from database import db
+from utils.broadcast import Broadcaster
+
+USER_IDS = [301, 302, 303, 304, 305]
+BLOCKED_ID = 303
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database(monkeypatch):
+    conn = await aiosqlite.connect(":memory:")
+    conn.row_factory = aiosqlite.Row
+
+    @asynccontextmanager
+    async def mock_connect():
+        yield conn
+
+    monkeypatch.setattr(db, "connect", mock_connect)
+    monkeypatch.setattr(settings, "BROADCAST_RATE", 1000)
+    monkeypatch.setattr(settings, "BROADCAST_CHUNK_SIZE", 2)
+    await db.init_db()
+    for user_id in USER_IDS:
+        await db.add_user(user_id, f"user{user_id}", "User")
+    yield
+    await conn.close()
+
+
+def _mock_bot() -> AsyncMock:
+    async def send_message(chat_id, text, **kwargs):
+        if chat_id == BLOCKED_ID:
+            raise TelegramForbiddenError(
+                method=MagicMock(), message="Forbidden: bot was blocked by the user"
+            )
+
+    bot = AsyncMock()
+    bot.send_message.side_effect = send_message
+    return bot
+
+
+def _recipients(bot: AsyncMock) -> list[int]:
+    return [call.args[0] for call in bot.send_message.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_records_deliveries_and_blocked_users():
+    """Рассылка доходит до всех, а заблокировавший бота помечается."""
+    broadcast_id = await db.create_broadcast("<b>Привет</b>", 1, 1, 10)
+    bot = _mock_bot()
+
+    await Broadcaster().run(bot, broadcast_id)
+
+    assert sorted(_recipients(bot)) == USER_IDS
+    broadcast = await db.get_broadcast(broadcast_id)
+    assert broadcast["status"] == "done"
+    assert (broadcast["sent"], broadcast["blocked"], broadcast["failed"]) == (4, 1, 0)
+    assert broadcast["last_user_id"] == USER_IDS[-1]
+    bot.edit_message_text.assert_awaited()
+
+    # Заблокировавший бота не попадает в следующие рассылки
+    next_id = await db.create_broadcast("Ещё раз", 1, 1, 11)
+    assert (await db.get_broadcast(next_id))["total"] == len(USER_IDS) - 1
+    assert BLOCKED_ID not in await db.get_broadcast_recipients(next_id, 0, 100)
+
+
+@pytest.mark.asyncio
+async def test_returning_user_gets_broadcasts_again():
+    """Заблокировавший бота, вернувшись, снова получает рассылки."""
+    broadcast_id = await db.create_broadcast("Привет", 1, 1, 10)
+    await Broadcaster().run(_mock_bot(), broadcast_id)
+
+    await db.update_user_last_seen(BLOCKED_ID)
+
+    next_id = await db.create_broadcast("Ещё раз", 1, 1, 11)
+    assert (await db.get_broadcast(next_id))["total"] == len(USER_IDS)
+    assert BLOCKED_ID in await db.get_broadcast_recipients(next_id, 0, 100)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_resumes_from_saved_cursor():
+    """После перезапуска отправка продолжается с первой необработанной пачки."""
+    broadcast_id = await db.create_broadcast("Новости", 1, 1, 10)
+    # Первая пачка успела уйти до перезапуска
+    await db.record_broadcast_chunk(
+        broadcast_id, [(301, "sent"), (302, "sent")], last_user_id=302
+    )
+    bot = _mock_bot()
+
+    await Broadcaster().run(bot, broadcast_id)
+
+    assert _recipients(bot) == [303, 304, 305]
+    broadcast = await db.get_broadcast(broadcast_id)
+    assert broadcast["status"] == "done"
+    assert (broadcast["sent"], broadcast["blocked"]) == (4, 1)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_stops_when_cancelled_elsewhere():
+    """Остановка из другого воркера прерывает рассылку после текущей пачки."""
+    broadcast_id = await db.create_broadcast("Новости", 1, 1, 10)
+
+    async def send_message(chat_id, text, **kwargs):
+        # Другой процесс помечает рассылку остановленной, задачи тут нет
+        await db.finish_broadcast(broadcast_id, "cancelled")
+
+    bot = AsyncMock()
+    bot.send_message.side_effect = send_message
+
+    await Broadcaster().run(bot, broadcast_id)
+
+    assert _recipients(bot) == USER_IDS[:2]
+    broadcast = await db.get_broadcast(broadcast_id)
+    assert broadcast["status"] == "cancelled"
+    assert broadcast["sent"] == 2
@@ -0,0 +1,63 @@
+# tests/test_callback_router.py
+import pytest
+from aiogram import Bot, Dispatcher, F
+from aiogram.types import CallbackQuery, Update, User
+
+from keyboards.factories import DuelCallback, GameCallback
+from utils.callback_router import CallbackRouter
+
+
+def _press(data: str) -> Update:
+    return Update(
+        update_id=1,
+        callback_query=CallbackQuery(
+            id="1",
+            from_user=User(id=1, is_bot=False, first_name="U"),
+            chat_instance="1",
+            data=data,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_callback_router_keeps_handler_order_and_filters():
+    router = CallbackRouter()
+    calls = []
+
+    @router.callback_query(
+        GameCallback.filter((F.name == "duel") & (F.action == "start"))
+    )
+    async def duel_start(callback: CallbackQuery):
+        calls.append("duel_start")
+
+    @router.callback_query(DuelCallback.filter(F.action == "play"), F.from_user.id == 2)
+    async def play_other_user(callback: CallbackQuery):
+        calls.append("play_other_user")
+
+    @router.callback_query(F.data.startswith("duel:"))
+    async def duel_any(callback: CallbackQuery):
+        calls.append("duel_any")
+
+    @router.callback_query(DuelCallback.filter(F.action == "play"))
+    async def play(callback: CallbackQuery, callback_data: DuelCallback):
+        calls.append(f"play:{callback_data.value}")
+
+    dp = Dispatcher()
+    dp.include_router(router)
+    bot = Bot(token="42:TEST")
+
+    await dp.feed_update(bot, _press(GameCallback(name="duel", action="start").pack()))
+    await dp.feed_update(bot, _press(DuelCallback(action="play", value=3).pack()))
+    await dp.feed_update(bot, _press("game:duel:rules"))
+    await dp.feed_update(bot, _press("other"))
+
+    # Хендлер без ключа (F.data) стоит раньше play и перехватывает нажатие
+    assert calls == ["duel_start", "duel_any"]
+    observer = router.callback_query
+    # Чужой ключ — остаются только хендлеры без ключа
+    assert [h.callback for h in observer.candidates("game:timer:start")] == [duel_any]
+    assert [h.callback for h in observer.candidates("duel:play:1:5:::")] == [
+        play_other_user,
+        duel_any,
+        play,
+    ]
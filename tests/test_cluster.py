@@ -0,0 +1,103 @@
+# tests/test_cluster.py
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from keyboards.factories import DuelCallback
+from utils.broker import ALREADY_WAITING, MATCHED, WAITING, Broker, BrokerClient
+from utils.cluster import SECRET_HEADER, create_webhook_app
+from utils.sharding import shard_for_update
+
+WORKERS = 2
+
+
+def _message(update_id: int, user_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {"message_id": 1, "from": {"id": user_id}, "chat": {"id": user_id}},
+    }
+
+
+def _press(update_id: int, user_id: int, data: str) -> dict:
+    return {
+        "update_id": update_id,
+        "callback_query": {"id": "1", "from": {"id": user_id}, "data": data},
+    }
+
+
+def test_updates_are_sharded_by_user_and_match_owner():
+    play = DuelCallback(action="play", match_id=7, value=3).pack()
+
+    assert shard_for_update(_message(1, 10), 4, {}) == 2
+    assert shard_for_update(_press(2, 10, "menu:main"), 4, {}) == 2
+    # Нажатие в матче уходит процессу, который ведёт матч
+    assert shard_for_update(_press(3, 10, play), 4, {("duel", 7): 1}) == 1
+    assert shard_for_update(_press(4, 10, play), 4, {}) == 2
+
+
+@pytest.mark.asyncio
+async def test_broker_routes_updates_and_shares_queue(tmp_path):
+    broker = Broker(WORKERS, str(tmp_path / "broker.sock"), max_inflight=10)
+    await broker.start()
+    received = {0: [], 1: []}
+    clients = [BrokerClient(), BrokerClient()]
+
+    def handler(worker):
+        async def handle(update):
+            received[worker].append(update["update_id"])
+
+        return handle
+
+    serving = [
+        asyncio.create_task(client.serve(i, broker.socket_path, handler(i)))
+        for i, client in enumerate(clients)
+    ]
+    await broker.wait_workers(timeout=5)
+
+    for update_id, user_id in enumerate([100, 101, 102, 103]):
+        assert broker.dispatch(_message(update_id, user_id))
+
+    # Игроки из разных процессов находят друг друга через брокер
+    assert await clients[0].call("join", "duel", 5, [100, 1, None]) == [WAITING, None]
+    assert await clients[0].call("join", "duel", 5, [100, 1, None]) == [
+        ALREADY_WAITING,
+        None,
+    ]
+    assert await clients[1].call("join", "duel", 5, [101, 2, None]) == [
+        MATCHED,
+        [100, 1, None],
+    ]
+    clients[1].notify("claim", "duel", 42)
+    await clients[1].call("leave", "duel", 101, None)
+    play = DuelCallback(action="play", match_id=42, value=1).pack()
+    assert broker.dispatch(_press(10, 100, play))
+
+    while sum(broker.processed) < 5:
+        await asyncio.sleep(0.01)
+    assert received == {0: [0, 2], 1: [1, 3, 10]}
+    assert broker.inflight == [0, 0]
+
+    await broker.close()
+    await asyncio.gather(*serving)
+    assert not broker.dispatch(_message(11, 100))
+
+
+@pytest.mark.asyncio
+async def test_webhook_checks_secret_and_backpressure(tmp_path):
+    broker = Broker(1, str(tmp_path / "broker.sock"), max_inflight=1)
+    await broker.start()
+    client = TestClient(TestServer(create_webhook_app(broker, secret="s3cret")))
+    await client.start_server()
+    try:
+        update = _message(1, 100)
+        response = await client.post("/webhook", json=update)
+        assert response.status == 401
+        # Рабочий процесс не подключён — просим Telegram повторить позже
+        response = await client.post(
+            "/webhook", json=update, headers={SECRET_HEADER: "s3cret"}
+        )
+        assert response.status == 503
+    finally:
+        await client.close()
+        await broker.close()
@@ -0,0 +1,58 @@
+# tests/test_continuations.py
+import asyncio
+
+import pytest
+
+from utils.continuations import ContinuationScheduler
+
+
+@pytest.mark.asyncio
+async def test_continuations_run_in_deadline_order():
+    scheduler = ContinuationScheduler()
+    fired = []
+
+    async def mark(name):
+        fired.append(name)
+
+    scheduler.call_later(0.03, mark, "late")
+    scheduler.call_later(0.01, mark, "early")
+    cancelled = scheduler.call_later(0.02, mark, "cancelled")
+    cancelled.cancel()
+    assert scheduler.pending == 2
+
+    await scheduler.join()
+    assert fired == ["early", "late"]
+    assert scheduler.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_continuation_can_schedule_next_step():
+    """Продолжение может запланировать следующее (как переброс в слотах)."""
+    scheduler = ContinuationScheduler()
+    steps = []
+
+    async def step(n):
+        steps.append(n)
+        if n < 3:
+            scheduler.call_later(0, step, n + 1)
+
+    scheduler.call_later(0, step, 1)
+    await asyncio.wait_for(scheduler.join(), 1)
+    assert steps == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_failed_continuation_does_not_stop_others():
+    scheduler = ContinuationScheduler()
+    fired = []
+
+    async def boom():
+        raise RuntimeError("boom")
+
+    async def mark():
+        fired.append(True)
+
+    scheduler.call_later(0, boom)
+    scheduler.call_later(0, mark)
+    await scheduler.join()
+    assert fired == [True]
@@ -0,0 +1,61 @@
+# tests/test_db_benchmarks.py
+"""
+Бенчмарки горячих функций db против базовой линии (scripts/bench_db.py).
+
+Замер идёт, если задан DB_BENCHMARK_PROFILE (10k или 1m): например,
+DB_BENCHMARK_PROFILE=10k python -m pytest tests/test_db_benchmarks.py.
+Без него проверяется только логика сравнения с базовой линией.
+"""
+
+import os
+
+import pytest
+
+from scripts.bench_db import PROFILES, find_regressions, load_baseline, run_suite
+
+
+def _result(ops: float, p99: float, reference: float) -> dict:
+    return {
+        "ops_per_s": ops,
+        "p50_ms": p99 / 2,
+        "p99_ms": p99,
+        "reference_ops_per_s": reference,
+    }
+
+
+def test_regressions_are_measured_against_machine_speed():
+    baseline = {
+        "spend_balance": _result(500, 4.0, 1000),
+        "create_duel": _result(400, 5.0, 1000),
+    }
+
+    # Машина вдвое медленнее: вдвое меньше операций — не регрессия
+    slower_machine = {
+        "spend_balance": _result(250, 8.0, 500),
+        "create_duel": _result(200, 10.0, 500),
+    }
+    assert find_regressions(slower_machine, baseline) == {}
+
+    # Та же машина, но create_duel просел и по пропускной способности, и по хвосту
+    regressed = {
+        "spend_balance": _result(500, 4.0, 1000),
+        "create_duel": _result(250, 9.0, 1000),
+    }
+    regressions = find_regressions(regressed, baseline)
+    assert list(regressions) == ["create_duel"]
+    assert len(regressions["create_duel"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_hot_db_functions_match_baseline():
+    profile = os.environ.get("DB_BENCHMARK_PROFILE")
+    if not profile:
+        pytest.skip("DB_BENCHMARK_PROFILE не задан")
+    assert profile in PROFILES
+    baseline = load_baseline(profile)
+    if not baseline:
+        pytest.skip(f"Нет базовой линии {profile}: python -m scripts.bench_db --update")
+
+    results = await run_suite(profile, baseline)
+
+    assert find_regressions(results, baseline) == {}
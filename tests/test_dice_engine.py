@@ -0,0 +1,191 @@
+# tests/test_dice_engine.py
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from database import db
+from handlers import dice_engine
+from handlers.bowling_handlers import BOWLING
+from handlers.slots_handlers import SLOTS
+from utils.continuations import continuations
+
+USER_ID = 301
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database(monkeypatch):
+    conn = await aiosqlite.connect(":memory:")
+    conn.row_factory = aiosqlite.Row
+
+    @asynccontextmanager
+    async def mock_connect():
+        yield conn
+
+    monkeypatch.setattr(db, "connect", mock_connect)
+    await db.init_db()
+    await db.add_user(USER_ID, "player", "Player", initial_balance=10)
+    yield
+    await conn.close()
+
+
+def _bot(dice_values):
+    bot = AsyncMock()
+    messages = []
+    for value in dice_values:
+        msg = MagicMock()
+        msg.dice.value = value
+        messages.append(msg)
+    bot.send_dice.side_effect = messages
+    return bot
+
+
+def _callback():
+    callback = MagicMock()
+    callback.answer = AsyncMock()
+    callback.from_user.id = USER_ID
+    callback.message.chat.id = USER_ID
+    callback.message.message_id = 1
+    return callback
+
+
+def test_payout_tables():
+    assert SLOTS.payout(5, 64) == 35  # Три семерки
+    assert SLOTS.payout(5, 1) == 10  # Три BAR
+    assert SLOTS.payout(5, 6) == dice_engine.RESPIN  # Grapes Grapes BAR
+    assert SLOTS.payout(5, 5) == 0  # BAR Grapes BAR
+    assert BOWLING.payout(3, 6) == 9
+    assert BOWLING.payout(3, 5) == 4
+    assert BOWLING.payout(3, 1) == 0
+
+
+@pytest.mark.asyncio
+async def test_stake_is_debited_before_throw_and_payout_settles_hold(monkeypatch):
+    monkeypatch.setattr(BOWLING, "animation_delay", 0)
+    await dice_engine.play_dice_game(_callback(), _bot([6]), BOWLING, 3)
+    # Дайс уже брошен, продолжение ещё не выполнено: ставка списана
+    assert await db.get_user_balance(USER_ID) == 10 - 3
+    await continuations.join()
+
+    assert await db.get_user_balance(USER_ID) == 10 - 3 + 9
+    async with db.connect() as conn:
+        cursor = await conn.execute(
+            "SELECT amount, reason, ref_id FROM ledger_entries "
+            "WHERE user_id = ? AND reason LIKE 'bowling%' ORDER BY id",
+            (USER_ID,),
+        )
+        rows = await cursor.fetchall()
+        cursor = await conn.execute("SELECT COUNT(*) FROM game_holds")
+        holds = (await cursor.fetchone())[0]
+    assert [(r["amount"], r["reason"]) for r in rows] == [
+        (-3, "bowling_throw_cost"),
+        (9, "bowling_win"),
+    ]
+    assert rows[0]["ref_id"] == rows[1]["ref_id"]
+    assert holds == 0
+    # Повторный расчёт того же броска ничего не начисляет
+    assert await db.settle_game(USER_ID, rows[0]["ref_id"], 9, "bowling_win") is None
+
+
+@pytest.mark.asyncio
+async def test_parallel_throws_cannot_overspend(monkeypatch):
+    monkeypatch.setattr(BOWLING, "animation_delay", 0.01)
+    first, second = _callback(), _callback()
+    await dice_engine.play_dice_game(first, _bot([1]), BOWLING, 6)
+    # Первый бросок ещё "катится", а ставка уже списана в БД
+    assert await db.get_user_balance(USER_ID) == 4
+    await dice_engine.play_dice_game(second, _bot([1]), BOWLING, 6)
+    await continuations.join()
+
+    second.answer.assert_called_once_with(
+        "Недостаточно средств для игры.", show_alert=True
+    )
+    assert await db.get_user_balance(USER_ID) == 4
+
+
+@pytest.mark.asyncio
+async def test_losing_roll_is_charged_even_if_balance_is_spent_meanwhile(
+    monkeypatch,
+):
+    monkeypatch.setattr(BOWLING, "animation_delay", 0.01)
+    await dice_engine.play_dice_game(_callback(), _bot([1]), BOWLING, 6)
+    # Пока дайс катится, остаток уходит на другую трату
+    assert await db.spend_balance(USER_ID, 4, "withdraw")
+    assert not await db.spend_balance(USER_ID, 1, "withdraw")
+    await continuations.join()
+
+    assert await db.get_user_balance(USER_ID) == 0
+
+
+@pytest.mark.asyncio
+async def test_stake_is_refunded_when_dice_is_not_sent():
+    bot = AsyncMock()
+    bot.send_dice.side_effect = RuntimeError("network")
+    with pytest.raises(RuntimeError):
+        await dice_engine.play_dice_game(_callback(), bot, BOWLING, 3)
+
+    assert await db.get_user_balance(USER_ID) == 10
+    async with db.connect() as conn:
+        cursor = await conn.execute("SELECT COUNT(*) FROM game_holds")
+        assert (await cursor.fetchone())[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_slots_respin_continues_until_final(monkeypatch):
+    monkeypatch.setattr(SLOTS, "animation_delay", 0)
+    monkeypatch.setattr(dice_engine, "RESPIN_DELAY", 0)
+    bot = _bot([6, 64])  # Grapes Grapes BAR -> ещё раз, затем три семерки
+    await dice_engine.play_dice_game(_callback(), bot, SLOTS, 1)
+    await continuations.join()
+
+    assert bot.send_dice.call_count == 2
+    assert await db.get_user_balance(USER_ID) == 10 - 1 + 7
+
+
+async def _holds() -> int:
+    async with db.connect() as conn:
+        cursor = await conn.execute("SELECT COUNT(*) FROM game_holds")
+        return (await cursor.fetchone())[0]
+
+
+@pytest.mark.asyncio
+async def test_stake_is_refunded_when_callback_answer_fails():
+    callback = _callback()
+    callback.answer.side_effect = RuntimeError("query is too old")
+    bot = _bot([6])
+    with pytest.raises(RuntimeError):
+        await dice_engine.play_dice_game(callback, bot, BOWLING, 3)
+
+    bot.send_dice.assert_not_called()
+    assert await db.get_user_balance(USER_ID) == 10
+    assert await _holds() == 0
+
+
+@pytest.mark.asyncio
+async def test_stake_is_refunded_when_respin_message_fails(monkeypatch):
+    monkeypatch.setattr(SLOTS, "animation_delay", 0)
+    bot = _bot([6, 64])
+    bot.send_message.side_effect = RuntimeError("bot was blocked")
+    await dice_engine.play_dice_game(_callback(), bot, SLOTS, 1)
+    await continuations.join()
+
+    assert bot.send_dice.call_count == 1
+    assert await db.get_user_balance(USER_ID) == 10
+    assert await _holds() == 0
+
+
+@pytest.mark.asyncio
+async def test_stake_is_refunded_when_settlement_fails(monkeypatch):
+    monkeypatch.setattr(BOWLING, "animation_delay", 0)
+
+    async def failed_settle(*args):
+        return None
+
+    monkeypatch.setattr(db, "settle_game", failed_settle)
+    await dice_engine.play_dice_game(_callback(), _bot([6]), BOWLING, 3)
+    await continuations.join()
+
+    assert await db.get_user_balance(USER_ID) == 10
+    assert await _holds() == 0
@@ -201,3 +201,44 @@ async def test_full_duel_lifecycle(mock_bot, memory_storage):
             assert p1_stats["losses"] == 1
             assert p2_stats["wins"] == 1
             assert p2_stats["losses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_round_transitions_are_scheduled(mock_bot, monkeypatch):
+    """
+    Раскрытие карт не держит корутину: следующий раунд запланирован таймером,
+    а ходы во время паузы отклоняются.
+    """
+    monkeypatch.setattr(duel_handlers.settings, "DUEL_START_DELAY", 0.01)
+    monkeypatch.setattr(duel_handlers.settings, "DUEL_REVEAL_DELAY", 0.05)
+    with patch("handlers.duel_handlers.deal_hand") as mock_deal:
+        mock_deal.side_effect = [[9, 7, 5, 3, 1], [10, 8, 6, 4, 2]]
+        match = duel_handlers.start_duel_game(
+            mock_bot, 1, P1_ID, P2_ID, STAKE, 11, 22, "trace"
+        )
+    assert match.phase == duel_handlers.PHASE_STARTING
+    await asyncio.sleep(0.03)
+    assert match.phase == duel_handlers.PHASE_PLAYING
+
+    def play(user_id, card):
+        callback = MagicMock()
+        callback.answer = AsyncMock()
+        callback.from_user.id = user_id
+        data = DuelCallback(action="play", match_id=1, value=card)
+        return callback, duel_handlers.play_card_handler(callback, data, mock_bot)
+
+    await play(P1_ID, 9)[1]
+    await play(P2_ID, 10)[1]
+    assert match.phase == duel_handlers.PHASE_REVEAL
+    assert match.p2_wins == 1
+    assert match.timer is not None
+
+    late_callback, late_play = play(P1_ID, 7)
+    await late_play
+    assert 7 in match.p1.hand
+    late_callback.answer.assert_called_once_with("Дождитесь начала раунда.")
+
+    await asyncio.sleep(0.1)
+    assert match.phase == duel_handlers.PHASE_PLAYING
+    assert match.round == 2
+    assert match.timer is None
@@ -0,0 +1,65 @@
+# tests/test_fsm_storage.py
+import time
+
+import aiosqlite
+import pytest
+from aiogram.fsm.storage.base import StorageKey
+
+from database.fsm_storage import SQLiteStorage
+
+KEY = StorageKey(bot_id=1, chat_id=42, user_id=42)
+
+
+@pytest.mark.asyncio
+async def test_state_survives_restart(tmp_path):
+    """Состояние и данные, записанные до close(), читаются новым экземпляром."""
+    db_path = str(tmp_path / "fsm.db")
+    storage = SQLiteStorage(db_path=db_path, flush_interval=60)
+    await storage.set_state(KEY, "AdminState:confirm_broadcast")
+    await storage.set_data(KEY, {"broadcast_text": "Привет", "stake": 5})
+    await storage.close()
+
+    restarted = SQLiteStorage(db_path=db_path, flush_interval=60)
+    assert await restarted.get_state(KEY) == "AdminState:confirm_broadcast"
+    assert await restarted.get_data(KEY) == {"broadcast_text": "Привет", "stake": 5}
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_are_batched_and_cleared_keys_deleted(tmp_path):
+    """Несколько изменений одного ключа дают одну запись; пустой ключ удаляется."""
+    db_path = str(tmp_path / "fsm.db")
+    storage = SQLiteStorage(db_path=db_path, flush_interval=60)
+    for stake in range(10):
+        await storage.update_data(KEY, {"stake": stake})
+    assert await storage.flush() == 1
+
+    async with aiosqlite.connect(db_path) as conn:
+        cursor = await conn.execute("SELECT data FROM fsm_states")
+        rows = await cursor.fetchall()
+    assert rows == [('{"stake": 9}',)]
+
+    await storage.set_state(KEY, None)
+    await storage.set_data(KEY, {})
+    await storage.flush()
+    async with aiosqlite.connect(db_path) as conn:
+        cursor = await conn.execute("SELECT COUNT(*) FROM fsm_states")
+        assert (await cursor.fetchone())[0] == 0
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_removes_stale_states(tmp_path):
+    db_path = str(tmp_path / "fsm.db")
+    storage = SQLiteStorage(db_path=db_path, flush_interval=60, state_ttl_days=1)
+    stale_key = StorageKey(bot_id=1, chat_id=7, user_id=7)
+    await storage.set_state(stale_key, "DiceState:waiting_for_choice")
+    await storage.set_state(KEY, "DiceState:waiting_for_choice")
+    storage._cache[storage.key_builder.build(stale_key)].updated_at = (
+        int(time.time()) - 2 * 86400
+    )
+
+    assert await storage.cleanup_expired() == 1
+    assert await storage.get_state(stale_key) is None
+    assert await storage.get_state(KEY) == "DiceState:waiting_for_choice"
+    await storage.close()
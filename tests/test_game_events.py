@@ -0,0 +1,77 @@
+# tests/test_game_events.py
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from database import db
+from utils.game_events import GameEventBus, GameFinished
+
+WINNER_ID = 201
+LOSER_ID = 202
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database(monkeypatch):
+    conn = await aiosqlite.connect(":memory:")
+    conn.row_factory = aiosqlite.Row
+
+    @asynccontextmanager
+    async def mock_connect():
+        yield conn
+
+    monkeypatch.setattr(db, "connect", mock_connect)
+    await db.init_db()
+    await db.add_user(WINNER_ID, "winner", "Winner")
+    await db.add_user(LOSER_ID, "loser", "Loser")
+    yield
+    await conn.close()
+
+
+async def _owned(user_id: int) -> set[str]:
+    achievements = await db.get_owned_achievements(
+        [user_id], ["first_duel_win", "duel_warrior", "duel_master", "game_master"]
+    )
+    return {ach_id for _, ach_id in achievements}
+
+
+@pytest.mark.asyncio
+async def test_events_are_processed_in_background():
+    """Воркер записывает game_plays и выдаёт достижение за первую победу."""
+    async with db.connect() as conn:
+        await conn.execute(
+            "UPDATE users SET duel_wins = 1 WHERE user_id = ?", (WINNER_ID,)
+        )
+        await conn.commit()
+
+    bus = GameEventBus(workers=1, batch_size=10)
+    bus.start(AsyncMock())
+    bus.publish(GameFinished("duel", (WINNER_ID, LOSER_ID), WINNER_ID))
+    bus.publish(GameFinished("slots", (LOSER_ID,)))
+    await bus.close()
+
+    assert await db.get_played_game_counts([WINNER_ID, LOSER_ID]) == {
+        WINNER_ID: 1,
+        LOSER_ID: 2,
+    }
+    assert await _owned(WINNER_ID) == {"first_duel_win"}
+    assert await _owned(LOSER_ID) == set()
+
+
+@pytest.mark.asyncio
+async def test_milestone_not_missed_when_batched():
+    """Несколько побед в одной пачке не должны перескакивать через порог."""
+    async with db.connect() as conn:
+        await conn.execute(
+            "UPDATE users SET duel_wins = 6 WHERE user_id = ?", (WINNER_ID,)
+        )
+        await conn.commit()
+
+    bus = GameEventBus(workers=1, batch_size=10)
+    bus.publish(GameFinished("duel", (WINNER_ID, LOSER_ID), WINNER_ID))
+    bus.publish(GameFinished("duel", (WINNER_ID, LOSER_ID), WINNER_ID))
+    bus.start(AsyncMock())
+    await bus.close()
+    assert await _owned(WINNER_ID) == {"first_duel_win", "duel_warrior"}
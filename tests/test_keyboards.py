@@ -0,0 +1,29 @@
+# tests/test_keyboards.py
+from keyboards.factories import DuelCallback
+from keyboards.inline import (
+    duel_game_keyboard,
+    main_menu_keyboard,
+    timer_game_keyboard,
+)
+
+
+def test_static_keyboards_are_built_once_per_language():
+    assert main_menu_keyboard("en") is main_menu_keyboard("en")
+    assert main_menu_keyboard("en") != main_menu_keyboard("ru")
+    assert timer_game_keyboard(1) is not timer_game_keyboard(2)
+    assert timer_game_keyboard(1) == timer_game_keyboard.__wrapped__(1)
+
+
+def test_duel_keyboard_reuses_match_buttons_between_rounds():
+    first = duel_game_keyboard(9, [5, 2, 11], 77, True, False)
+    second = duel_game_keyboard(9, [2, 3], 77, False, False)
+
+    cards = [
+        DuelCallback.unpack(b.callback_data).value for b in first.inline_keyboard[0]
+    ]
+    assert cards == [2, 5, 11]
+    assert first.inline_keyboard[0][0] is second.inline_keyboard[0][0]
+    assert [len(row) for row in first.inline_keyboard] == [3, 1, 1]
+    assert [len(row) for row in second.inline_keyboard] == [2, 1]
+    surrender = DuelCallback.unpack(second.inline_keyboard[-1][0].callback_data)
+    assert (surrender.action, surrender.opponent_id) == ("surrender", 77)
@@ -0,0 +1,87 @@
+# tests/test_ledger_audit.py
+from contextlib import asynccontextmanager
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from database import db, ledger_audit
+
+ALICE = 701
+BOB = 702
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database(monkeypatch):
+    conn = await aiosqlite.connect(":memory:")
+    conn.row_factory = aiosqlite.Row
+
+    @asynccontextmanager
+    async def mock_connect():
+        yield conn
+
+    monkeypatch.setattr(db, "connect", mock_connect)
+    await db.init_db()
+    await db.add_user(ALICE, "alice", "Alice")
+    await db.add_user(BOB, "bob", "Bob")
+    yield conn
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_audit_flags_balance_changed_outside_ledger(setup_database):
+    conn = setup_database
+    await db.add_balance_unrestricted(ALICE, 50, "grant")
+    await db.spend_balance(ALICE, 20, "slots_stake")
+    await db.add_balance_unrestricted(BOB, 10, "grant")
+
+    clean = await ledger_audit.run_audit(batch_size=2)
+    assert clean["drifted_users"] == 0
+    assert clean["entries"] == 3
+
+    # Прямой UPDATE в обход ledger
+    await conn.execute(
+        "UPDATE users SET balance = balance + 5 WHERE user_id = ?", (BOB,)
+    )
+    await conn.commit()
+    await db.add_balance_unrestricted(ALICE, 1, "daily_bonus")
+
+    report = await ledger_audit.run_audit(batch_size=2)
+
+    # Повторная сверка читает только новую запись
+    assert report["entries"] == 1
+    assert report["drifts"] == [(BOB, 15, 10, 5)]
+    assert report["total_drift"] == 5
+
+
+@pytest.mark.asyncio
+async def test_audit_counts_entries_archived_before_audit(setup_database):
+    conn = setup_database
+    await db.add_balance_unrestricted(ALICE, 30, "grant")
+    await ledger_audit.run_audit()
+
+    await db.spend_balance(ALICE, 10, "slots_stake")
+    await db.add_balance_unrestricted(BOB, 7, "grant")
+    await conn.execute("UPDATE ledger_entries SET created_at = '2025-01-01 00:00:00'")
+    await conn.commit()
+    # Все записи ушли в архив раньше, чем их учла инкрементальная сверка
+    await db.archive_ledger_entries("2025-02-01 00:00:00")
+
+    report = await ledger_audit.run_audit()
+    assert report["archived_entries"] == 2
+    assert report["drifted_users"] == 0
+
+    full = await ledger_audit.run_audit(full=True)
+    assert full["archived_entries"] == 3
+    assert full["drifted_users"] == 0
+
+
+@pytest.mark.asyncio
+async def test_audit_reads_new_archive_segments_by_index(setup_database):
+    cursor = await setup_database.execute(
+        """EXPLAIN QUERY PLAN SELECT user_id, entries FROM ledger_archive
+           WHERE last_id > ? ORDER BY first_id""",
+        (0,),
+    )
+    plan = " ".join(row[3] for row in await cursor.fetchall())
+    assert "idx_ledger_archive_last_id" in plan
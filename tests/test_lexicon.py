@@ -0,0 +1,48 @@
+# tests/test_lexicon.py
+import pytest
+
+from lexicon import languages
+from lexicon.languages import _compile, check_lexicon, get_text, load_texts
+
+
+def test_get_text_resolves_language_fallbacks_and_formatting():
+    assert get_text("faq_button", "en") == load_texts("en")["faq_button"]
+    # Неизвестный язык — русский текст
+    assert get_text("faq_button", "xx") == load_texts("ru")["faq_button"]
+    assert "150" in get_text("main_menu", "uk", balance=150)
+    # Не хватает параметра — шаблон возвращается как есть
+    assert get_text("main_menu", "es") == load_texts("es")["main_menu"]
+    assert get_text("missing_key") == "[missing_key]"
+    assert get_text("missing_key", default="{n} ⭐", n=3) == "3 ⭐"
+
+
+def test_all_languages_are_complete():
+    check_lexicon()
+
+
+def test_incomplete_lexicon_is_rejected():
+    base = {"hello": "Привет, {name}!", "bye": "Пока"}
+
+    with pytest.raises(RuntimeError) as error:
+        _compile("en", {"hello": "Hello, {username}!"}, base)
+
+    assert "en: нет ключей ['bye']" in str(error.value)
+    assert "en.hello" in str(error.value)
+
+
+def test_incomplete_language_falls_back_to_russian(monkeypatch):
+    monkeypatch.setattr(languages, "_COMPILED", {})
+    real_load_texts = languages.load_texts
+
+    def broken_load_texts(language_code):
+        if language_code == "es":
+            return {"faq_button": "FAQ"}
+        return real_load_texts(language_code)
+
+    monkeypatch.setattr(languages, "load_texts", broken_load_texts)
+
+    with pytest.raises(RuntimeError):
+        check_lexicon()
+    # В обработчике — не исключение, а русский текст
+    assert get_text("faq_button", "es") == load_texts("ru")["faq_button"]
+    assert languages._COMPILED["es"] is languages._COMPILED["ru"]
@@ -0,0 +1,60 @@
+# tests/test_logging.py
+import logging
+import queue
+
+from logger_config import CustomJsonFormatter, SamplingQueueHandler, SecretMasker
+
+
+def _record(
+    name: str, level: int, msg: str = "event %s", args=(1,)
+) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_full_queue_drops_records_and_reports_them():
+    log_queue: queue.Queue = queue.Queue(maxsize=2)
+    handler = SamplingQueueHandler(log_queue, {})
+
+    for _ in range(4):
+        handler.handle(_record("app", logging.INFO))
+    assert handler.dropped == 2
+
+    first = log_queue.get_nowait()
+    assert (first.msg, first.args) == ("event 1", None)
+    log_queue.get_nowait()
+    handler.handle(_record("app", logging.INFO))
+
+    log_queue.get_nowait()
+    report = log_queue.get_nowait()
+    assert report.levelno == logging.WARNING
+    assert report.getMessage().endswith(": 2")
+
+
+def test_sampling_applies_to_logger_children_below_warning():
+    log_queue: queue.Queue = queue.Queue()
+    handler = SamplingQueueHandler(log_queue, {"noisy": 0.0})
+
+    handler.handle(_record("noisy.child", logging.INFO))
+    handler.handle(_record("noisy.child", logging.WARNING))
+    handler.handle(_record("noisy_other", logging.INFO))
+
+    assert handler.sampled_out == 1
+    assert [log_queue.get_nowait().name for _ in range(2)] == [
+        "noisy.child",
+        "noisy_other",
+    ]
+
+
+def test_token_is_masked_in_formatted_line():
+    formatter = CustomJsonFormatter(
+        "%(message)s %(user_id)s", masker=SecretMasker("42:SECRET")
+    )
+    record = _record("app", logging.INFO, "url %s", ("https://x/bot42:SECRET/",))
+    record.user_id = "42:SECRET"
+
+    line = formatter.format(record)
+
+    assert "42:SECRET" not in line
+    assert line.count("***BOT_TOKEN***") == 2
+    # Пустой токен ничего не заменяет
+    assert SecretMasker("")("plain") == "plain"
@@ -0,0 +1,174 @@
+# tests/test_maintenance.py
+import datetime
+from contextlib import asynccontextmanager
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from config import settings
+from database import db
+from utils import maintenance
+
+USER_ID = 601
+REAL_CONNECT = db.connect
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database(monkeypatch):
+    conn = await aiosqlite.connect(":memory:")
+    conn.row_factory = aiosqlite.Row
+
+    @asynccontextmanager
+    async def mock_connect():
+        yield conn
+
+    monkeypatch.setattr(db, "connect", mock_connect)
+    monkeypatch.setattr(settings, "MAINTENANCE_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "MAINTENANCE_BATCH_PAUSE", 0)
+    await db.init_db()
+    await db.add_user(USER_ID, "user", "User")
+    yield conn
+    await conn.close()
+
+
+async def _count(conn, table: str) -> int:
+    cursor = await conn.execute(f"SELECT COUNT(*) FROM {table}")
+    return (await cursor.fetchone())[0]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_deletes_only_expired_rows_in_batches(setup_database):
+    conn = setup_database
+    old_day = datetime.date.today() - datetime.timedelta(days=60)
+    await conn.executemany(
+        """INSERT INTO idempotency (key, user_id, created_at)
+           VALUES (?, ?, datetime('now', '-30 days'))""",
+        [(f"old-{i}", USER_ID) for i in range(5)],
+    )
+    await conn.execute(
+        "INSERT INTO idempotency (key, user_id) VALUES ('fresh', ?)", (USER_ID,)
+    )
+    await conn.executemany(
+        """INSERT INTO earn_counters_daily (user_id, source, day, amount, ops)
+           VALUES (?, ?, ?, 1, 1)""",
+        [
+            (USER_ID, "old", old_day.isoformat()),
+            (USER_ID, "today", datetime.date.today().isoformat()),
+        ],
+    )
+    await conn.commit()
+
+    summary = await maintenance.run_cleanup()
+
+    assert summary["deleted"]["idempotency"] == 5
+    assert summary["deleted"]["earn_counters_daily"] == 1
+    cursor = await conn.execute("SELECT key FROM idempotency")
+    assert [row[0] for row in await cursor.fetchall()] == ["fresh"]
+    assert await _count(conn, "earn_counters_daily") == 1
+    assert summary["max_lock_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_storage_maintenance_reclaims_free_pages(setup_database):
+    conn = setup_database
+    await conn.executemany(
+        "INSERT INTO idempotency (key, user_id) VALUES (?, ?)",
+        [(f"key-{i}-" + "x" * 200, USER_ID) for i in range(2000)],
+    )
+    await conn.commit()
+    await conn.execute("DELETE FROM idempotency")
+    await conn.commit()
+
+    report = await maintenance.run_storage_maintenance()
+
+    assert report["pages_reclaimed"] > 0
+    cursor = await conn.execute("PRAGMA freelist_count")
+    assert (await cursor.fetchone())[0] == 0
+    assert {"checkpoint_ms", "optimize_ms", "vacuum_max_step_ms"} <= report.keys()
+
+
+@pytest.mark.asyncio
+async def test_ledger_archive_keeps_per_user_sum(setup_database):
+    """Архивация переносит старые записи, не меняя сумму ledger пользователя."""
+    conn = setup_database
+    await conn.executemany(
+        """INSERT INTO ledger_entries (user_id, amount, reason, ref_id, created_at)
+           VALUES (?, ?, ?, ?, ?)""",
+        [
+            (USER_ID, 10, "grant", "a", "2025-01-05 10:00:00"),
+            (USER_ID, -3, "slots_stake", "b", "2025-01-20 10:00:00"),
+            (USER_ID, 7, "slots_win", "b", "2025-02-01 09:00:00"),
+            (USER_ID, -2, "slots_stake", "c", "2025-02-03 09:00:00"),
+            (USER_ID, 5, "daily_bonus", None, "2025-03-01 00:00:00"),
+        ],
+    )
+    await conn.commit()
+
+    report = await db.archive_ledger_entries("2025-03-01 00:00:00", batch_size=3)
+
+    assert report["archived"] == 4
+    assert report["segments"] == 3  # январь + февраль, разрезанный пачками
+    assert await _count(conn, "ledger_entries") == 1
+    checkpoint = await db.get_ledger_checkpoint(USER_ID)
+    assert checkpoint["balance"] == 12
+    archived = await db.get_archived_ledger(USER_ID)
+    assert [e["amount"] for e in archived] == [10, -3, 7, -2]
+    assert archived[1]["reason"] == "slots_stake"
+    assert [e["ref_id"] for e in await db.get_archived_ledger(USER_ID, "2025-02")] == [
+        "b",
+        "c",
+    ]
+
+
+def test_ledger_archive_cutoff_is_month_start():
+    cutoff = db.ledger_archive_cutoff(1)
+    assert cutoff.endswith("-01 00:00:00")
+    assert cutoff[:7] == datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m")
+
+
+@pytest.mark.asyncio
+async def test_stale_game_holds_are_refunded(setup_database):
+    conn = setup_database
+    await db.add_balance_unrestricted(USER_ID, 10, "grant")
+    assert await db.hold_game_stake(USER_ID, 3, "slots_spin_cost", "stale")
+    assert await db.hold_game_stake(USER_ID, 2, "slots_spin_cost", "fresh")
+    await conn.execute(
+        """UPDATE game_holds SET created_at = datetime('now', '-1 hour')
+           WHERE ref_id = 'stale'"""
+    )
+    await conn.commit()
+
+    report = await maintenance.run_game_hold_refunds()
+
+    assert (report["stale"], report["refunded"]) == (1, 1)
+    assert await db.get_user_balance(USER_ID) == 10 - 2
+    cursor = await conn.execute("SELECT ref_id FROM game_holds")
+    assert [row[0] for row in await cursor.fetchall()] == ["fresh"]
+
+
+@pytest.mark.asyncio
+async def test_storage_maintenance_never_runs_full_vacuum(tmp_path, monkeypatch):
+    # Файл без auto_vacuum, как у БД, созданных до этого режима
+    path = tmp_path / "legacy.db"
+    async with aiosqlite.connect(path) as conn:
+        await conn.execute("CREATE TABLE t (x)")
+        await conn.commit()
+    monkeypatch.setattr(db, "connect", REAL_CONNECT)
+    monkeypatch.setattr(db, "DB_NAME", str(path))
+
+    report = await maintenance.run_storage_maintenance()
+
+    assert report["incremental_vacuum"] is False
+    assert await _auto_vacuum(path) == 0
+
+    # Переключение — только явной миграцией
+    assert (await db.enable_incremental_vacuum())["changed"] is True
+    assert await _auto_vacuum(path) == 2
+    assert (await db.enable_incremental_vacuum())["changed"] is False
+
+
+async def _auto_vacuum(path) -> int:
+    async with aiosqlite.connect(path) as conn:
+        async with conn.execute("PRAGMA auto_vacuum") as cursor:
+            return (await cursor.fetchone())[0]
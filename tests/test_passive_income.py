@@ -0,0 +1,123 @@
+# tests/test_passive_income.py
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+from aiogram.exceptions import TelegramBadRequest
+
+from config import settings
+from database import db
+from utils.passive_income import PassiveIncomeSweeper
+
+WITH_LINK_ID = 501
+WITHOUT_LINK_ID = 502
+RECENTLY_CHECKED_ID = 503
+API_ERROR_ID = 504
+PRIVATE_CHAT_ID = 505
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database(monkeypatch):
+    conn = await aiosqlite.connect(":memory:")
+    conn.row_factory = aiosqlite.Row
+
+    @asynccontextmanager
+    async def mock_connect():
+        yield conn
+
+    monkeypatch.setattr(db, "connect", mock_connect)
+    monkeypatch.setattr(settings, "BOT_USERNAME", "ManiacStarsBot")
+    monkeypatch.setattr(settings, "PASSIVE_INCOME_CHECK_RATE", 1000)
+    await db.init_db()
+    for user_id in (
+        WITH_LINK_ID,
+        WITHOUT_LINK_ID,
+        RECENTLY_CHECKED_ID,
+        API_ERROR_ID,
+        PRIVATE_CHAT_ID,
+    ):
+        await db.add_user(user_id, f"user{user_id}", "User")
+    await conn.execute("UPDATE users SET passive_income_enabled = 1")
+    await conn.execute(
+        "UPDATE users SET last_bio_check_time = ? WHERE user_id = ?",
+        (int(time.time()), RECENTLY_CHECKED_ID),
+    )
+    await conn.commit()
+    yield conn
+    await conn.close()
+
+
+def _mock_bot() -> AsyncMock:
+    async def get_chat(user_id):
+        if user_id == API_ERROR_ID:
+            raise ConnectionError("network is down")
+        if user_id == PRIVATE_CHAT_ID:
+            raise TelegramBadRequest(
+                method=MagicMock(), message="Bad Request: chat not found"
+            )
+        bio = "Играю тут: t.me/maniacstarsbot" if user_id == WITH_LINK_ID else "Привет"
+        return SimpleNamespace(bio=bio)
+
+    bot = AsyncMock()
+    bot.get_chat.side_effect = get_chat
+    return bot
+
+
+async def _user(conn, user_id: int) -> aiosqlite.Row:
+    cursor = await conn.execute(
+        """SELECT balance, passive_income_enabled, last_bio_check_time
+           FROM users WHERE user_id = ?""",
+        (user_id,),
+    )
+    return await cursor.fetchone()
+
+
+@pytest.mark.asyncio
+async def test_sweep_credits_disables_and_caches_verdicts(setup_database):
+    conn = setup_database
+    bot = _mock_bot()
+
+    stats = await PassiveIncomeSweeper().run(bot)
+
+    # Недавно проверенного не запрашиваем повторно
+    checked = {call.args[0] for call in bot.get_chat.call_args_list}
+    assert checked == {WITH_LINK_ID, WITHOUT_LINK_ID, API_ERROR_ID, PRIVATE_CHAT_ID}
+    assert (stats["checked"], stats["credited"], stats["disabled"]) == (3, 1, 1)
+    assert (stats["errors"], stats["unavailable"]) == (1, 1)
+
+    credited = await _user(conn, WITH_LINK_ID)
+    assert credited["balance"] == settings.PASSIVE_INCOME_REWARD
+    assert credited["last_bio_check_time"] > 0
+    cursor = await conn.execute(
+        "SELECT amount, reason FROM ledger_entries WHERE user_id = ?",
+        (WITH_LINK_ID,),
+    )
+    assert [tuple(row) for row in await cursor.fetchall()] == [
+        (settings.PASSIVE_INCOME_REWARD, "passive_income")
+    ]
+    # Начисление молчаливое, без личных сообщений
+    bot.send_message.assert_not_awaited()
+
+    assert (await _user(conn, WITHOUT_LINK_ID))["passive_income_enabled"] == 0
+    # Ошибка API — ни вердикта, ни отметки о проверке
+    assert (await _user(conn, API_ERROR_ID))["last_bio_check_time"] == 0
+    # Недоступный чат: доход не отключается и не начисляется, но проверка
+    # засчитана — до следующего интервала get_chat не повторяется
+    private = await _user(conn, PRIVATE_CHAT_ID)
+    assert private["passive_income_enabled"] == 1
+    assert private["balance"] == 0
+    assert private["last_bio_check_time"] > 0
+
+    # Повторный проход в тот же день ничего не начисляет
+    second_bot = _mock_bot()
+    second = await PassiveIncomeSweeper().run(second_bot)
+    assert second["credited"] == 0
+    rechecked = {call.args[0] for call in second_bot.get_chat.call_args_list}
+    assert rechecked == {API_ERROR_ID}
+    assert (await _user(conn, WITH_LINK_ID))["balance"] == (
+        settings.PASSIVE_INCOME_REWARD
+    )
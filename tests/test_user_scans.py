@@ -0,0 +1,72 @@
+# tests/test_user_scans.py
+import time
+from contextlib import asynccontextmanager
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from database import db
+
+USER_IDS = [401, 402, 403, 404, 405]
+PASSIVE_IDS = [402, 404, 405]
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database(monkeypatch):
+    conn = await aiosqlite.connect(":memory:")
+    conn.row_factory = aiosqlite.Row
+
+    @asynccontextmanager
+    async def mock_connect():
+        yield conn
+
+    monkeypatch.setattr(db, "connect", mock_connect)
+    await db.init_db()
+    for user_id in USER_IDS:
+        await db.add_user(user_id, f"user{user_id}", "User")
+    await conn.executemany(
+        "UPDATE users SET passive_income_enabled = 1 WHERE user_id = ?",
+        [(user_id,) for user_id in PASSIVE_IDS],
+    )
+    # 405 недавно проверяли, а 401 сегодня уже забирал бонус
+    await conn.execute(
+        "UPDATE users SET last_bio_check_time = ? WHERE user_id = 405",
+        (int(time.time()),),
+    )
+    await conn.execute(
+        "UPDATE users SET last_bonus_time = ? WHERE user_id = 401",
+        (int(time.time()),),
+    )
+    await conn.commit()
+    yield
+    await conn.close()
+
+
+async def _collect(batches) -> list[list[int]]:
+    return [batch async for batch in batches]
+
+
+@pytest.mark.asyncio
+async def test_iter_all_users_yields_keyset_batches():
+    assert await _collect(db.iter_all_users(batch_size=2)) == [
+        [401, 402],
+        [403, 404],
+        [405],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_filtered_scans_match_list_variants():
+    """Потоковые обходы отдают те же ID, что и списочные функции."""
+    assert await _collect(db.iter_users_for_passive_income_check(batch_size=1)) == [
+        [402],
+        [404],
+    ]
+    assert await db.get_users_for_passive_income_check() == [402, 404]
+
+    assert await _collect(db.iter_users_for_notification(batch_size=3)) == [
+        [402, 403, 404],
+        [405],
+    ]
+    assert await db.get_users_for_notification() == [402, 403, 404, 405]
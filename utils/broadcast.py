@@ -0,0 +1,190 @@
+# utils/broadcast.py
+"""
+Рассылка сообщений всем пользователям.
+
+Получатели читаются из БД пачками по возрастанию user_id, внутри пачки
+сообщения уходят параллельно, но не быстрее BROADCAST_RATE в секунду.
+Статус каждой доставки и курсор рассылки сохраняются после каждой пачки,
+поэтому после перезапуска бота рассылка продолжается с места остановки.
+Там же перечитывается статус рассылки: в режиме webhook её может
+остановить админ, попавший на другой воркер.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict
+
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
+
+from config import settings
+from database import db
+from keyboards.inline import admin_back_keyboard, admin_broadcast_progress_keyboard
+from utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+SENT = "sent"
+FAILED = "failed"
+BLOCKED = "blocked"
+MAX_SEND_ATTEMPTS = 3
+
+
+def format_progress(broadcast: Dict[str, Any], rate: float) -> str:
+    """Текст сообщения о ходе рассылки для админа."""
+    done = broadcast["sent"] + broadcast["failed"] + broadcast["blocked"]
+    total = max(broadcast["total"], done)
+    if broadcast["status"] == "running":
+        percent = done / total * 100 if total else 100
+        eta = (total - done) / rate if rate > 0 else 0
+        header = f"📢 Рассылка #{broadcast['id']}: {done} из {total} ({percent:.1f}%)"
+        footer = (
+            f"Скорость: {rate:.1f} сообщ/с\n"
+            f"Осталось: ~{int(eta // 60)} мин {int(eta % 60)} с"
+        )
+    else:
+        header = (
+            "✅ Рассылка завершена!"
+            if broadcast["status"] == "done"
+            else "⏹ Рассылка остановлена."
+        )
+        footer = f"Скорость: {rate:.1f} сообщ/с"
+    return (
+        f"{header}\n\n"
+        f"Отправлено: {broadcast['sent']}\n"
+        f"Заблокировали бота: {broadcast['blocked']}\n"
+        f"Не удалось отправить: {broadcast['failed']}\n\n"
+        f"{footer}"
+    )
+
+
+class Broadcaster:
+    def __init__(self) -> None:
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+    def start(self, bot: Bot, broadcast_id: int) -> None:
+        if broadcast_id in self._tasks:
+            return
+        task = asyncio.create_task(self.run(bot, broadcast_id))
+        self._tasks[broadcast_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(broadcast_id, None))
+
+    async def resume_unfinished(self, bot: Bot) -> None:
+        """Продолжает рассылки, прерванные перезапуском."""
+        for broadcast in await db.get_running_broadcasts():
+            logger.info(f"Resuming broadcast {broadcast['id']}")
+            self.start(bot, broadcast["id"])
+
+    async def stop(self, bot: Bot, broadcast_id: int) -> bool:
+        """Останавливает рассылку. False — если она уже не шла."""
+        if not await db.finish_broadcast(broadcast_id, "cancelled"):
+            return False
+        task = self._tasks.get(broadcast_id)
+        if task is not None:
+            task.cancel()
+        await self._report(bot, broadcast_id, rate=0)
+        return True
+
+    async def close(self) -> None:
+        """Прерывает идущие рассылки, оставляя их в статусе running."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, bot: Bot, broadcast_id: int) -> None:
+        broadcast = await db.get_broadcast(broadcast_id)
+        if not broadcast or broadcast["status"] != "running":
+            return
+
+        limiter = RateLimiter(settings.BROADCAST_RATE)
+        semaphore = asyncio.Semaphore(settings.BROADCAST_CONCURRENCY)
+        text = broadcast["text"]
+
+        async def send_one(user_id: int) -> tuple[int, str]:
+            async with semaphore:
+                return user_id, await self._deliver(bot, limiter, user_id, text)
+
+        started_at = time.monotonic()
+        processed = 0
+        last_report = started_at
+        cursor = broadcast["last_user_id"]
+        logger.info(
+            f"Starting broadcast {broadcast_id} for {broadcast['total']} users "
+            f"from user_id > {cursor}"
+        )
+        while True:
+            user_ids = await db.get_broadcast_recipients(
+                broadcast_id, cursor, settings.BROADCAST_CHUNK_SIZE
+            )
+            if not user_ids:
+                break
+            results = await asyncio.gather(*(send_one(u) for u in user_ids))
+            status = await db.record_broadcast_chunk(
+                broadcast_id, results, user_ids[-1]
+            )
+            if status != "running":
+                # Остановлена в другом процессе, итог показал тот, кто остановил
+                logger.info(f"Broadcast {broadcast_id} is {status}, stopping")
+                return
+            cursor = user_ids[-1]
+            processed += len(user_ids)
+
+            now = time.monotonic()
+            if now - last_report >= settings.BROADCAST_PROGRESS_INTERVAL:
+                last_report = now
+                await self._report(bot, broadcast_id, processed / (now - started_at))
+
+        await db.finish_broadcast(broadcast_id, "done")
+        elapsed = time.monotonic() - started_at
+        await self._report(bot, broadcast_id, processed / elapsed if elapsed else 0)
+        logger.info(f"Broadcast {broadcast_id} finished in {elapsed:.1f}s")
+
+    async def _deliver(
+        self, bot: Bot, limiter: RateLimiter, user_id: int, text: str
+    ) -> str:
+        for _ in range(MAX_SEND_ATTEMPTS):
+            await limiter.acquire()
+            try:
+                # Текст рассылки сохраняется как HTML (message.html_text)
+                await bot.send_message(user_id, text, parse_mode="HTML")
+                return SENT
+            except TelegramRetryAfter as e:
+                logger.warning(f"Broadcast flood control, pausing {e.retry_after}s")
+                limiter.pause(e.retry_after)
+            except TelegramForbiddenError:
+                return BLOCKED
+            except TelegramBadRequest as e:
+                logger.warning(f"Failed to send broadcast to {user_id}: {e}")
+                return FAILED
+            except Exception as e:
+                logger.error(f"An unexpected error occurred sending to {user_id}: {e}")
+                return FAILED
+        return FAILED
+
+    async def _report(self, bot: Bot, broadcast_id: int, rate: float) -> None:
+        broadcast = await db.get_broadcast(broadcast_id)
+        if not broadcast or not broadcast["progress_message_id"]:
+            return
+        running = broadcast["status"] == "running"
+        try:
+            await bot.edit_message_text(
+                format_progress(broadcast, rate),
+                chat_id=broadcast["admin_chat_id"],
+                message_id=broadcast["progress_message_id"],
+                reply_markup=admin_broadcast_progress_keyboard(broadcast_id)
+                if running
+                else admin_back_keyboard(),
+            )
+        except TelegramBadRequest as e:
+            # "message is not modified" и удалённое сообщение — не повод
+            # прерывать рассылку
+            logger.warning(f"Failed to update broadcast progress: {e}")
+
+
+broadcaster = Broadcaster()
@@ -0,0 +1,281 @@
+# utils/broker.py
+"""
+Локальный брокер между главным процессом и рабочими процессами бота.
+
+Брокер живёт в главном процессе webhook-режима. Рабочие подключаются к
+нему по unix-сокету и по этому же соединению получают обновления и
+обращаются к общему состоянию: очередям поиска соперника и таблице
+«матч -> процесс». Все операции над состоянием выполняются в одном
+потоке главного процесса, поэтому атомарны без блокировок.
+
+Протокол — JSON, одно сообщение на строку:
+  воркер -> брокер: {"t": "hello", "w": номер}, {"t": "ack"},
+                    {"t": "call", "id": n, "op": ..., "a": [...]}
+  брокер -> воркер: {"t": "update", "u": {...}}, {"t": "reply", "id": n, "r": ...}
+Вызовы без "id" — уведомления, ответ на них не отправляется.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from utils.sharding import MatchKey, shard_for_update
+
+logger = logging.getLogger(__name__)
+
+# Результаты MatchQueue.join
+WAITING = "waiting"  # Соперника нет, игрок встал в очередь
+ALREADY_WAITING = "already"  # Игрок уже ждёт с этой ставкой
+MATCHED = "matched"  # Соперник найден и снят с очереди
+
+STREAM_LIMIT = 1024 * 1024  # Максимальный размер одного сообщения
+_ACK = b'{"t":"ack"}\n'
+
+UpdateHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+class MatchQueue:
+    """
+    Игроки, ждущие соперника, по ставкам. На каждую ставку ждёт не больше
+    одного: следующий пришедший сразу забирает его в матч.
+
+    Запись — кортеж, первым элементом которого идёт user_id.
+    """
+
+    def __init__(self, slots: Optional[Dict[int, tuple]] = None) -> None:
+        self.slots = slots if slots is not None else {}
+
+    def join(self, stake: int, entry: tuple) -> Tuple[str, Optional[tuple]]:
+        waiting = self.slots.get(stake)
+        if waiting is None:
+            self.slots[stake] = entry
+            return WAITING, None
+        if waiting[0] == entry[0]:
+            return ALREADY_WAITING, None
+        del self.slots[stake]
+        return MATCHED, waiting
+
+    def requeue(self, stake: int, entry: tuple) -> bool:
+        """Возвращает соперника в очередь, если матч не удалось создать."""
+        if stake in self.slots:
+            return False
+        self.slots[stake] = entry
+        return True
+
+    def leave(self, user_id: int, stake: Optional[int] = None) -> bool:
+        stakes = [stake] if stake is not None else list(self.slots)
+        for candidate in stakes:
+            waiting = self.slots.get(candidate)
+            if waiting is not None and waiting[0] == user_id:
+                del self.slots[candidate]
+                return True
+        return False
+
+
+class Broker:
+    """Сторона брокера в главном процессе: раздаёт обновления и хранит общее состояние."""
+
+    def __init__(self, workers: int, socket_path: str, max_inflight: int) -> None:
+        self.workers = workers
+        self.socket_path = socket_path
+        self.max_inflight = max_inflight
+        self.match_owners: Dict[MatchKey, int] = {}
+        self.queues: Dict[str, MatchQueue] = {}
+        self.inflight: List[int] = [0] * workers
+        self.processed: List[int] = [0] * workers
+        self._writers: Dict[int, asyncio.StreamWriter] = {}
+        self._connected = asyncio.Condition()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = await asyncio.start_unix_server(
+            self._serve_worker, path=self.socket_path, limit=STREAM_LIMIT
+        )
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        # Закрытое соединение — сигнал рабочему процессу завершаться
+        for writer in list(self._writers.values()):
+            writer.close()
+        await self._server.wait_closed()
+        self._server = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def wait_workers(self, timeout: float) -> None:
+        """Ждёт, пока подключатся все рабочие процессы."""
+        async with self._connected:
+            await asyncio.wait_for(
+                self._connected.wait_for(lambda: len(self._writers) == self.workers),
+                timeout,
+            )
+
+    def dispatch(self, update: Dict[str, Any], raw: Optional[bytes] = None) -> bool:
+        """
+        Отправляет обновление своему рабочему процессу. False — процесс
+        недоступен или перегружен; Telegram повторит доставку позже.
+
+        `raw` — исходный JSON обновления: его не нужно сериализовать заново.
+        """
+        shard = shard_for_update(update, self.workers, self.match_owners)
+        writer = self._writers.get(shard)
+        if writer is None or self.inflight[shard] >= self.max_inflight:
+            return False
+        self.inflight[shard] += 1
+        if raw is None:
+            writer.write(_encode({"t": "update", "u": update}))
+        else:
+            # Перевод строки в корректном JSON может быть только пробельным
+            writer.write(b'{"t":"update","u":' + raw.replace(b"\n", b" ") + b"}\n")
+        return True
+
+    async def _serve_worker(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        hello = json.loads(await reader.readline() or b"{}")
+        worker = hello.get("w")
+        if not isinstance(worker, int) or not 0 <= worker < self.workers:
+            writer.close()
+            return
+        async with self._connected:
+            self._writers[worker] = writer
+            self.inflight[worker] = 0
+            self._connected.notify_all()
+        logger.info("Worker connected to broker", extra={"worker": worker})
+        try:
+            while line := await reader.readline():
+                message = json.loads(line)
+                if message["t"] == "ack":
+                    self.inflight[worker] -= 1
+                    self.processed[worker] += 1
+                elif message["t"] == "call":
+                    result = getattr(self, f"_op_{message['op']}")(
+                        worker, *message["a"]
+                    )
+                    if "id" in message:
+                        writer.write(
+                            _encode({"t": "reply", "id": message["id"], "r": result})
+                        )
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if self._writers.get(worker) is writer:
+                del self._writers[worker]
+            # Матчи упавшего процесса больше никто не ведёт
+            for key in [k for k, v in self.match_owners.items() if v == worker]:
+                del self.match_owners[key]
+            writer.close()
+            logger.warning("Worker disconnected from broker", extra={"worker": worker})
+
+    def _queue(self, game: str) -> MatchQueue:
+        queue = self.queues.get(game)
+        if queue is None:
+            queue = self.queues[game] = MatchQueue()
+        return queue
+
+    def _op_join(self, worker: int, game: str, stake: int, entry: list) -> list:
+        status, opponent = self._queue(game).join(stake, tuple(entry))
+        return [status, opponent]
+
+    def _op_requeue(self, worker: int, game: str, stake: int, entry: list) -> bool:
+        return self._queue(game).requeue(stake, tuple(entry))
+
+    def _op_leave(
+        self, worker: int, game: str, user_id: int, stake: Optional[int]
+    ) -> bool:
+        return self._queue(game).leave(user_id, stake)
+
+    def _op_claim(self, worker: int, game: str, match_id: int) -> None:
+        self.match_owners[(game, match_id)] = worker
+
+    def _op_release(self, worker: int, game: str, match_id: int) -> None:
+        self.match_owners.pop((game, match_id), None)
+
+
+class BrokerClient:
+    """Соединение рабочего процесса с брокером."""
+
+    def __init__(self) -> None:
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._calls: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None
+
+    async def call(self, op: str, *args: Any) -> Any:
+        if self._writer is None:
+            raise ConnectionError("Нет соединения с брокером")
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._calls[self._next_id] = future
+        self._writer.write(
+            _encode({"t": "call", "id": self._next_id, "op": op, "a": args})
+        )
+        return await future
+
+    def notify(self, op: str, *args: Any) -> None:
+        """Вызов без ответа; вне кластера ничего не делает."""
+        if self._writer is not None:
+            self._writer.write(_encode({"t": "call", "op": op, "a": args}))
+
+    async def serve(
+        self, worker: int, socket_path: str, handler: UpdateHandler
+    ) -> None:
+        """Получает обновления от брокера, пока он не закроет соединение."""
+        reader, writer = await asyncio.open_unix_connection(
+            socket_path, limit=STREAM_LIMIT
+        )
+        self._writer = writer
+        writer.write(_encode({"t": "hello", "w": worker}))
+        try:
+            while line := await reader.readline():
+                message = json.loads(line)
+                if message["t"] == "update":
+                    task = asyncio.create_task(self._handle(handler, message["u"]))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                else:
+                    future = self._calls.pop(message["id"], None)
+                    if future is not None and not future.done():
+                        future.set_result(message["r"])
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writer = None
+            writer.close()
+            for future in self._calls.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Брокер закрыл соединение"))
+            self._calls.clear()
+            # Дообрабатываем уже полученные обновления
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _handle(self, handler: UpdateHandler, update: Dict[str, Any]) -> None:
+        try:
+            await handler(update)
+        except Exception:
+            logger.error(
+                "Update handling failed in worker",
+                exc_info=True,
+                extra={"update_id": update.get("update_id")},
+            )
+        finally:
+            if self._writer is not None:
+                self._writer.write(_ACK)
+
+
+broker_client = BrokerClient()
@@ -0,0 +1,179 @@
+# utils/callback_router.py
+"""
+Роутер с таблицей маршрутов для callback_query.
+
+Обычный роутер aiogram проверяет фильтры хендлеров по очереди, и каждый
+фильтр `XCallback.filter(...)` с подходящим префиксом заново разбирает
+callback_data в pydantic-модель. CallbackRouter один раз раскладывает
+хендлеры по таблице (префикс, значения полей) -> хендлеры: ключ берётся
+из условий вида `F.поле == "значение"` (в том числе соединённых через &).
+Для нажатия строка разбивается по разделителю один раз, и проверяются
+только хендлеры из таблицы плюс те, для которых ключ вывести нельзя
+(F.data, F.data.startswith(...), хендлеры без фильтра и т.п.).
+
+Фильтры кандидатов по-прежнему выполняются (они отдают callback_data и
+могут проверять состояние FSM), порядок хендлеров сохраняется, поэтому
+поведение не меняется — меняется только число проверок.
+"""
+
+from operator import eq, itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiogram import Router
+from aiogram.dispatcher.event.bases import UNHANDLED, SkipHandler
+from aiogram.dispatcher.event.handler import HandlerObject
+from aiogram.dispatcher.event.telegram import TelegramEventObserver
+from aiogram.filters.callback_data import CallbackQueryFilter
+from aiogram.types import TelegramObject
+from magic_filter import MagicFilter
+from magic_filter.operations import (
+    CombinationOperation,
+    ComparatorOperation,
+    GetAttributeOperation,
+)
+from magic_filter.util import and_op
+
+SEPARATOR = ":"
+
+# Значения полей в порядке позиций -> [(номер хендлера, хендлер)]
+RouteTable = Dict[Any, List[Tuple[int, HandlerObject]]]
+
+
+def _equalities(rule: MagicFilter) -> Optional[Dict[str, Any]]:
+    """{поле: значение} для правил вида (F.a == x) & (F.b == y), иначе None."""
+    operations = rule._operations
+    if len(operations) < 2:
+        return None
+    getter, comparator = operations[:2]
+    if not (
+        isinstance(getter, GetAttributeOperation)
+        and isinstance(comparator, ComparatorOperation)
+        and comparator.comparator is eq
+    ):
+        return None
+    result = {getter.name: comparator.right}
+    for operation in operations[2:]:
+        if not (
+            isinstance(operation, CombinationOperation)
+            and operation.combinator is and_op
+            and isinstance(operation.right, MagicFilter)
+        ):
+            return None
+        nested = _equalities(operation.right)
+        if nested is None:
+            return None
+        result.update(nested)
+    return result
+
+
+def route_key(handler: HandlerObject) -> Optional[Tuple[str, Tuple[int, ...], Tuple]]:
+    """
+    (префикс, позиции полей, значения) для хендлера или None.
+
+    Берутся только строковые поля, сравниваемые со строкой: их значение в
+    модели совпадает с частью упакованной строки, поэтому таблица никогда
+    не отсеет хендлер, фильтр которого прошёл бы.
+    """
+    for filter_object in handler.filters or ():
+        callback_filter = filter_object.callback
+        if not isinstance(callback_filter, CallbackQueryFilter):
+            continue
+        factory = callback_filter.callback_data
+        if callback_filter.rule is None or factory.__separator__ != SEPARATOR:
+            continue
+        equalities = _equalities(callback_filter.rule)
+        if not equalities:
+            continue
+        fields = factory.model_fields
+        conditions = sorted(
+            (list(fields).index(name) + 1, value)
+            for name, value in equalities.items()
+            if name in fields
+            and fields[name].annotation in (str, Optional[str])
+            and isinstance(value, str)
+        )
+        if conditions:
+            positions, values = zip(*conditions, strict=True)
+            return factory.__prefix__, positions, values
+    return None
+
+
+class CallbackQueryObserver(TelegramEventObserver):
+    """Наблюдатель callback_query, выбирающий хендлеры по таблице маршрутов."""
+
+    def __init__(self, router: Router, event_name: str) -> None:
+        super().__init__(router=router, event_name=event_name)
+        self._indexed = -1  # Сколько хендлеров было при построении таблицы
+        self._routes: Dict[str, List[Tuple[itemgetter, RouteTable]]] = {}
+        self._unrouted: List[Tuple[int, HandlerObject]] = []
+        self._unrouted_handlers: List[HandlerObject] = []
+
+    def build_routes(self) -> None:
+        groups: Dict[Tuple[str, Tuple[int, ...]], RouteTable] = {}
+        self._unrouted = []
+        for order, handler in enumerate(self.handlers):
+            key = route_key(handler)
+            if key is None:
+                self._unrouted.append((order, handler))
+                continue
+            prefix, positions, values = key
+            table = groups.setdefault((prefix, positions), {})
+            # itemgetter с одной позицией возвращает само значение, а не кортеж
+            table_key = values if len(values) > 1 else values[0]
+            table.setdefault(table_key, []).append((order, handler))
+        self._routes = {}
+        for (prefix, positions), table in groups.items():
+            self._routes.setdefault(prefix, []).append((itemgetter(*positions), table))
+        self._unrouted_handlers = [handler for _, handler in self._unrouted]
+        self._indexed = len(self.handlers)
+
+    def candidates(self, data: Optional[str]) -> List[HandlerObject]:
+        """Хендлеры, которые стоит проверять для этой callback_data, по порядку."""
+        if len(self.handlers) != self._indexed:
+            self.build_routes()
+        if not data:
+            return self._unrouted_handlers
+        parts = data.split(SEPARATOR)
+        groups = self._routes.get(parts[0])
+        if groups is None:
+            return self._unrouted_handlers
+        matched: List[Tuple[int, HandlerObject]] = []
+        for getter, table in groups:
+            try:
+                found = table.get(getter(parts))
+            except IndexError:
+                continue
+            if found:
+                matched += found
+        if not matched:
+            return self._unrouted_handlers
+        return [handler for _, handler in sorted(matched + self._unrouted)]
+
+    async def trigger(self, event: TelegramObject, **kwargs: Any) -> Any:
+        # Тот же цикл, что в TelegramEventObserver.trigger, но по кандидатам
+        for handler in self.candidates(getattr(event, "data", None)):
+            kwargs["handler"] = handler
+            result, data = await handler.check(event, **kwargs)
+            if result:
+                kwargs.update(data)
+                try:
+                    wrapped_inner = self.outer_middleware.wrap_middlewares(
+                        self._resolve_middlewares(),
+                        handler.call,
+                    )
+                    return await wrapped_inner(event, kwargs)
+                except SkipHandler:
+                    continue
+
+        return UNHANDLED
+
+
+class CallbackRouter(Router):
+    """Router, у которого callback_query идёт через таблицу маршрутов."""
+
+    def __init__(self, *, name: Optional[str] = None) -> None:
+        super().__init__(name=name)
+        self.callback_query = CallbackQueryObserver(
+            router=self, event_name="callback_query"
+        )
+        self.observers["callback_query"] = self.callback_query
@@ -0,0 +1,128 @@
+# utils/cluster.py
+"""
+Webhook-режим: главный процесс принимает обновления и раздаёт их рабочим.
+
+Главный процесс поднимает aiohttp на WEB_SERVER_PORT, проверяет секрет
+webhook и передаёт каждое обновление брокеру (utils/broker.py), который
+отправляет его рабочему процессу по user_id. Рабочие процессы — обычный
+Dispatcher бота без polling; планировщик и фоновые задачи запускает
+только процесс 0. Упавший рабочий процесс перезапускается.
+"""
+
+import asyncio
+import hmac
+import json
+import logging
+import multiprocessing
+import os
+from typing import Callable, List
+
+from aiogram import Bot
+from aiohttp import web
+
+from config import settings
+from utils.broker import Broker
+
+logger = logging.getLogger(__name__)
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+WORKERS_CONNECT_TIMEOUT = 60.0
+
+
+def worker_count() -> int:
+    return settings.WEBHOOK_WORKERS or os.cpu_count() or 1
+
+
+def create_webhook_app(broker: Broker, secret: str = "") -> web.Application:
+    async def handle_update(request: web.Request) -> web.Response:
+        if secret and not hmac.compare_digest(
+            request.headers.get(SECRET_HEADER, ""), secret
+        ):
+            return web.Response(status=401)
+        raw = await request.read()
+        try:
+            update = json.loads(raw)
+        except ValueError:
+            return web.Response(status=400)
+        if not broker.dispatch(update, raw):
+            # Ответ не 2xx: Telegram повторит доставку этого обновления
+            return web.Response(status=503)
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_post(settings.WEBHOOK_PATH, handle_update)
+    return app
+
+
+class WorkerPool:
+    """Рабочие процессы бота; упавшие перезапускаются."""
+
+    def __init__(self, target: Callable[[int], None], count: int) -> None:
+        self.target = target
+        self.count = count
+        # spawn: дочерний процесс не наследует event loop и соединения родителя
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: List[multiprocessing.Process] = []
+
+    def start(self) -> None:
+        self._processes = [self._spawn(index) for index in range(self.count)]
+
+    def _spawn(self, index: int) -> multiprocessing.Process:
+        process = self._context.Process(
+            target=self.target, args=(index,), name=f"bot-worker-{index}"
+        )
+        process.start()
+        return process
+
+    async def supervise(self, interval: float = 1.0) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            for index, process in enumerate(self._processes):
+                if not process.is_alive():
+                    logger.error(
+                        "Worker process died, restarting",
+                        extra={"worker": index, "exitcode": process.exitcode},
+                    )
+                    self._processes[index] = self._spawn(index)
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        # Рабочие завершаются сами, когда брокер закрывает соединения
+        for process in self._processes:
+            await asyncio.to_thread(process.join, timeout)
+            if process.is_alive():
+                process.terminate()
+
+
+async def run_cluster(worker_target: Callable[[int], None]) -> None:
+    """Главный процесс webhook-режима."""
+    workers = worker_count()
+    broker = Broker(
+        workers, settings.BROKER_SOCKET, settings.WEBHOOK_WORKER_MAX_INFLIGHT
+    )
+    pool = WorkerPool(worker_target, workers)
+    runner = web.AppRunner(create_webhook_app(broker, settings.WEBHOOK_SECRET))
+    bot = Bot(token=settings.BOT_TOKEN)
+
+    await broker.start()
+    pool.start()
+    try:
+        await broker.wait_workers(WORKERS_CONNECT_TIMEOUT)
+        await runner.setup()
+        await web.TCPSite(
+            runner, settings.WEB_SERVER_HOST, settings.WEB_SERVER_PORT
+        ).start()
+        await bot.set_webhook(
+            settings.WEBHOOK_URL + settings.WEBHOOK_PATH,
+            secret_token=settings.WEBHOOK_SECRET or None,
+            drop_pending_updates=True,
+        )
+        logger.info(
+            "Webhook cluster started",
+            extra={"workers": workers, "port": settings.WEB_SERVER_PORT},
+        )
+        await pool.supervise()
+    finally:
+        await runner.cleanup()
+        await broker.close()
+        await pool.stop()
+        await bot.session.close()
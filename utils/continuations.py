@@ -0,0 +1,138 @@
+# utils/continuations.py
+"""
+Планировщик отложенных продолжений.
+
+Вместо `await asyncio.sleep(delay)` посреди обработчика игра регистрирует
+"продолжить в момент T": обработчик сразу завершается, а до срока в памяти
+остаётся только запись в общей куче. В цикле событий при этом взведён
+один таймер — на ближайший срок, сколько бы продолжений ни ждало.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Цикл событий может запустить таймер чуть раньше срока (в пределах
+# разрешения часов), поэтому "наступившими" считаем и такие записи
+_TOLERANCE = 0.001
+
+
+class Continuation:
+    """Запланированный вызов. cancel() снимает его до срабатывания."""
+
+    __slots__ = ("callback", "args", "cancelled")
+
+    def __init__(self, callback: Callable[..., Awaitable[Any]], args: tuple) -> None:
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class ContinuationScheduler:
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, Continuation]] = []
+        self._counter = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_when = math.inf
+        self._running: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return sum(1 for _, _, c in self._heap if not c.cancelled)
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Awaitable[Any]], *args: Any
+    ) -> Continuation:
+        """Запускает `await callback(*args)` через `delay` секунд."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Новый цикл событий (перезапуск, отдельный тест): старые
+            # записи и таймер принадлежат закрытому циклу
+            self._loop = loop
+            self._heap.clear()
+            self._timer = None
+            self._timer_when = math.inf
+            self._running.clear()
+
+        continuation = Continuation(callback, args)
+        when = loop.time() + max(delay, 0)
+        heapq.heappush(self._heap, (when, next(self._counter), continuation))
+        if when < self._timer_when:
+            self._arm(when)
+        return continuation
+
+    def _arm(self, when: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_when = when
+        self._timer = self._loop.call_at(when, self._run_due)
+
+    def _run_due(self) -> None:
+        self._timer = None
+        self._timer_when = math.inf
+        deadline = self._loop.time() + _TOLERANCE
+        while self._heap and self._heap[0][0] <= deadline:
+            _, _, continuation = heapq.heappop(self._heap)
+            if continuation.cancelled:
+                continue
+            task = self._loop.create_task(self._run(continuation))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        if self._heap:
+            self._arm(self._heap[0][0])
+
+    async def _run(self, continuation: Continuation) -> None:
+        try:
+            await continuation.callback(*continuation.args)
+        except Exception:
+            logger.error(
+                f"Continuation {continuation.callback.__qualname__} failed",
+                exc_info=True,
+            )
+
+    async def join(self) -> None:
+        """Ждёт, пока не останется ни запланированных, ни выполняющихся продолжений."""
+        while True:
+            if self._running:
+                await asyncio.wait(set(self._running))
+                continue
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return
+            await asyncio.sleep(max(self._heap[0][0] - self._loop.time(), 0))
+
+    async def close(self, timeout: float = 10) -> None:
+        """Даёт начатым играм доиграть, затем снимает всё, что осталось."""
+        if self._loop is None:
+            return
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Continuations not finished on shutdown: "
+                f"{self.pending} pending, {self.running} running"
+            )
+        for _, _, continuation in self._heap:
+            continuation.cancel()
+        self._heap.clear()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_when = math.inf
+
+
+continuations = ContinuationScheduler()
@@ -0,0 +1,124 @@
+# utils/game_events.py
+"""
+Шина событий завершённых игр.
+
+Игра публикует одно событие GameFinished и сразу показывает игроку результат.
+Учёт (game_plays, статистика, достижения) выполняют фоновые воркеры пачками:
+одна транзакция на запись game_plays и по одному запросу на чтение прогресса
+для всей пачки. Игроки, у которых все игровые достижения уже есть,
+отсеиваются по кэшу движка достижений без обращения к БД.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from aiogram import Bot
+
+from config import settings
+from database import db
+from database.achievements import achievement_engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class GameFinished:
+    game_type: str
+    player_ids: tuple[int, ...]
+    winner_id: Optional[int] = None
+
+
+class GameEventBus:
+    """Очередь событий GameFinished и пул воркеров, разбирающих её пачками."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ) -> None:
+        self.workers = workers or settings.GAME_EVENT_WORKERS
+        self.batch_size = batch_size or settings.GAME_EVENT_BATCH_SIZE
+        self._queue: asyncio.Queue[GameFinished] = asyncio.Queue(
+            queue_size or settings.GAME_EVENT_QUEUE_SIZE
+        )
+        self._bot: Optional[Bot] = None
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self, bot: Bot) -> None:
+        self._bot = bot
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    def publish(self, event: GameFinished) -> None:
+        """Ставит событие в очередь, не дожидаясь обработки."""
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.error(
+                "Game event queue is full, event dropped",
+                extra={"game_type": event.game_type, "player_ids": event.player_ids},
+            )
+
+    async def _worker(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self.process_batch(batch)
+            except Exception:
+                logger.error(
+                    "Failed to process game events",
+                    exc_info=True,
+                    extra={"batch_size": len(batch)},
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def process_batch(self, batch: list[GameFinished]) -> None:
+        plays = {
+            (user_id, event.game_type)
+            for event in batch
+            for user_id in event.player_ids
+        }
+        await db.record_game_plays(list(plays))
+
+        players = sorted({user_id for user_id, _ in plays})
+        duel_winners = sorted(
+            {e.winner_id for e in batch if e.game_type == "duel" and e.winner_id}
+        )
+        await achievement_engine.preload(players)
+        wins = await db.get_duel_wins(duel_winners)
+        game_counts = await db.get_played_game_counts(players)
+
+        # Правила сравнивают с порогом через >=: в пачке у игрока может быть
+        # несколько побед, и промежуточное значение мы не видим.
+        for user_id in players:
+            facts = {"games_played": game_counts.get(user_id, 0)}
+            if user_id in wins:
+                facts["duel_wins"] = wins[user_id]
+            await achievement_engine.check(user_id, self._bot, facts.keys(), facts)
+
+    async def close(self, timeout: float = 10) -> None:
+        """Дожидается обработки очереди и останавливает воркеров."""
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Game event queue not drained on shutdown, {self._queue.qsize()} events left"
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+game_events = GameEventBus()
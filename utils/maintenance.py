@@ -0,0 +1,105 @@
+# utils/maintenance.py
+"""
+Плановое обслуживание БД.
+
+cleanup — раз в час удаляет устаревшие служебные строки маленькими
+транзакциями, чтобы не держать блокировку записи дольше нескольких
+миллисекунд. ledger audit — раз в час сверяет балансы с ledger.
+game holds — каждые GAME_HOLD_REFUND_MINUTES минут возвращает
+ставки игр на дайсах, которые так и не были рассчитаны.
+ledger archive — раз в месяц переносит старые записи ledger_entries
+в сжатый архив. storage — раз в сутки в MAINTENANCE_HOUR
+возвращает освободившиеся страницы (incremental_vacuum), обрезает WAL
+и обновляет статистику планировщика запросов. БД, созданную до включения
+auto_vacuum, переводят в этот режим вручную при остановленном боте:
+python -m scripts.enable_incremental_vacuum.
+"""
+
+import logging
+import time
+from typing import Any, Dict
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from config import settings
+from database import db, ledger_audit
+
+logger = logging.getLogger(__name__)
+
+
+async def run_cleanup() -> Dict[str, Any]:
+    """Удаляет ключи идемпотентности, старые счётчики лимитов и доставки рассылок."""
+    started = time.monotonic()
+    reports = [
+        await db.cleanup_old_idempotency_keys(settings.IDEMPOTENCY_TTL_DAYS),
+        *await db.prune_earn_counters(settings.EARN_COUNTERS_TTL_DAYS),
+        await db.prune_broadcast_deliveries(settings.BROADCAST_DELIVERIES_TTL_DAYS),
+    ]
+    summary = {
+        "deleted": {r["table"]: r["deleted"] for r in reports},
+        "max_lock_ms": max(r["max_lock_ms"] for r in reports),
+        "lock_ms": round(sum(r["lock_ms"] for r in reports), 1),
+        "duration": round(time.monotonic() - started, 2),
+    }
+    logger.info("DB cleanup finished", extra=summary)
+    return summary
+
+
+async def run_game_hold_refunds() -> Dict[str, Any]:
+    """Возвращает ставки, зависшие в game_holds дольше GAME_HOLD_REFUND_MINUTES."""
+    report = await db.refund_stale_game_holds(settings.GAME_HOLD_REFUND_MINUTES)
+    if report["stale"]:
+        logger.warning("Refunded stale game holds", extra=report)
+    return report
+
+
+async def run_ledger_archive() -> Dict[str, Any]:
+    """Переносит ledger_entries старше LEDGER_HOT_MONTHS месяцев в архив."""
+    started = time.monotonic()
+    cutoff = db.ledger_archive_cutoff(settings.LEDGER_HOT_MONTHS)
+    report = await db.archive_ledger_entries(cutoff)
+    report["cutoff"] = cutoff
+    report["duration"] = round(time.monotonic() - started, 2)
+    logger.info("Ledger archive finished", extra=report)
+    return report
+
+
+async def run_storage_maintenance() -> Dict[str, Any]:
+    started = time.monotonic()
+    report = await db.run_storage_maintenance()
+    report["duration"] = round(time.monotonic() - started, 2)
+    logger.info("DB storage maintenance finished", extra=report)
+    return report
+
+
+def schedule_maintenance(scheduler: AsyncIOScheduler) -> None:
+    scheduler.add_job(run_cleanup, "interval", hours=1, max_instances=1, coalesce=True)
+    scheduler.add_job(
+        run_game_hold_refunds,
+        "interval",
+        minutes=settings.GAME_HOLD_REFUND_MINUTES,
+        max_instances=1,
+        coalesce=True,
+    )
+    # Архивация раз в месяц перед ночным обслуживанием: VACUUM сразу вернёт
+    # освободившиеся страницы
+    scheduler.add_job(
+        run_ledger_archive,
+        "cron",
+        day=1,
+        hour=max(settings.MAINTENANCE_HOUR - 1, 0),
+        minute=0,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        ledger_audit.run_audit, "interval", hours=1, max_instances=1, coalesce=True
+    )
+    scheduler.add_job(
+        run_storage_maintenance,
+        "cron",
+        hour=settings.MAINTENANCE_HOUR,
+        minute=0,
+        max_instances=1,
+        coalesce=True,
+    )
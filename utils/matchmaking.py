@@ -0,0 +1,49 @@
+# utils/matchmaking.py
+"""
+Поиск соперника для игр на двоих.
+
+В одном процессе (polling) очередь лежит в памяти. В webhook-режиме с
+несколькими рабочими процессами игроки с одной ставкой могут попасть в
+разные процессы, поэтому очередь хранит брокер, а процесс, создавший
+матч, регистрирует себя его владельцем — туда брокер направит нажатия
+обоих игроков.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from utils.broker import ALREADY_WAITING, MATCHED, WAITING, MatchQueue, broker_client
+
+
+class Matchmaker:
+    def __init__(self, game: str, slots: Dict[int, tuple]) -> None:
+        self.game = game
+        self.local = MatchQueue(slots)
+
+    async def join(self, stake: int, entry: tuple) -> Tuple[str, Optional[tuple]]:
+        """Ставит игрока в очередь или забирает ждущего соперника (см. MatchQueue)."""
+        if broker_client.connected:
+            status, opponent = await broker_client.call(
+                "join", self.game, stake, list(entry)
+            )
+            return status, tuple(opponent) if opponent is not None else None
+        return self.local.join(stake, entry)
+
+    async def requeue(self, stake: int, entry: tuple) -> bool:
+        if broker_client.connected:
+            return await broker_client.call("requeue", self.game, stake, list(entry))
+        return self.local.requeue(stake, entry)
+
+    async def leave(self, user_id: int, stake: Optional[int] = None) -> bool:
+        if broker_client.connected:
+            return await broker_client.call("leave", self.game, user_id, stake)
+        return self.local.leave(user_id, stake)
+
+    def claim(self, match_id: int) -> None:
+        """Матч ведёт этот процесс: нажатия в нём нужно направлять сюда."""
+        broker_client.notify("claim", self.game, match_id)
+
+    def release(self, match_id: int) -> None:
+        broker_client.notify("release", self.game, match_id)
+
+
+__all__ = ["ALREADY_WAITING", "MATCHED", "WAITING", "Matchmaker"]
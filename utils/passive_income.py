@@ -0,0 +1,123 @@
+# utils/passive_income.py
+"""
+Фоновое начисление пассивного дохода.
+
+Планировщик периодически запускает PassiveIncomeSweeper.run: пользователи,
+которым пора получить доход, читаются из БД пачками, их био проверяется
+параллельно в пределах лимита запросов к Bot API, а результаты пачки
+(время проверки, отключение дохода, начисление и записи в ledger)
+сохраняются одной транзакцией.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Dict, Union
+
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
+
+from config import settings
+from database import db
+from utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+MAX_CHECK_ATTEMPTS = 3
+# Био недоступно (приватность, удалённый чат): не вердикт, но проверка засчитана
+UNAVAILABLE = "unavailable"
+
+
+class PassiveIncomeSweeper:
+    def __init__(self) -> None:
+        self.last_run: Dict[str, Any] = {}
+
+    async def run(self, bot: Bot) -> Dict[str, Any]:
+        """Один проход по всем пользователям, которым положен доход."""
+        limiter = RateLimiter(settings.PASSIVE_INCOME_CHECK_RATE)
+        semaphore = asyncio.Semaphore(settings.PASSIVE_INCOME_CHECK_CONCURRENCY)
+        sweep_id = uuid.uuid4().hex
+        stats = {
+            "checked": 0,
+            "credited": 0,
+            "disabled": 0,
+            "unavailable": 0,
+            "errors": 0,
+        }
+        max_lag = 0
+        started_at = time.monotonic()
+
+        async def check(user_id: int) -> Union[bool, str, None]:
+            async with semaphore:
+                return await self._has_bot_link(bot, limiter, user_id)
+
+        async for user_ids in db.iter_users_for_passive_income_check():
+            results = await asyncio.gather(*(check(u) for u in user_ids))
+            # Непроверенных (ошибка API) не трогаем: они попадут в следующий проход.
+            # Недоступное био откладывается на обычный интервал проверки (None)
+            verdicts = [
+                (user_id, None if has_link == UNAVAILABLE else has_link)
+                for user_id, has_link in zip(user_ids, results, strict=True)
+                if has_link is not None
+            ]
+            stats["errors"] += len(user_ids) - len(verdicts)
+            stats["unavailable"] += sum(1 for r in results if r == UNAVAILABLE)
+            stats["checked"] += len(verdicts)
+            stats["disabled"] += sum(1 for _, has_link in verdicts if has_link is False)
+
+            credited = await db.apply_passive_income_checks(verdicts, ref_id=sweep_id)
+            stats["credited"] += len(credited)
+            # Задержка начисления: сколько прошло сверх положенных 24 часов
+            now = int(time.time())
+            for last_income_time in credited.values():
+                if last_income_time:
+                    max_lag = max(max_lag, now - last_income_time - 24 * 3600)
+
+        elapsed = time.monotonic() - started_at
+        self.last_run = {
+            **stats,
+            "duration": round(elapsed, 2),
+            "users_per_second": round(stats["checked"] / elapsed, 1) if elapsed else 0,
+            "max_lag_seconds": max_lag,
+        }
+        logger.info("Passive income sweep finished", extra=self.last_run)
+        return self.last_run
+
+    async def _has_bot_link(
+        self, bot: Bot, limiter: RateLimiter, user_id: int
+    ) -> Union[bool, str, None]:
+        """
+        True/False — есть ли ссылка в био, UNAVAILABLE — био недоступно,
+        None — проверить не удалось.
+        """
+        for _ in range(MAX_CHECK_ATTEMPTS):
+            await limiter.acquire()
+            try:
+                chat = await bot.get_chat(user_id)
+                return db.bio_has_bot_link(chat.bio, settings.BOT_USERNAME)
+            except TelegramRetryAfter as e:
+                logger.warning(f"Bio check flood control, pausing {e.retry_after}s")
+                limiter.pause(e.retry_after)
+            except (TelegramBadRequest, TelegramForbiddenError) as e:
+                # Чат может быть недоступен временно или из-за настроек
+                # приватности — это не повод отключать доход навсегда
+                logger.warning(
+                    f"Bio of user {user_id} is unavailable: {e}",
+                    extra={"user_id": user_id},
+                )
+                return UNAVAILABLE
+            except Exception as e:
+                logger.warning(
+                    f"Failed to check bio for user {user_id}: {e}",
+                    extra={"user_id": user_id},
+                )
+                return None
+        return None
+
+
+passive_income_sweeper = PassiveIncomeSweeper()
@@ -0,0 +1,24 @@
+# utils/rate_limiter.py
+"""Ограничение частоты исходящих запросов к Bot API в фоновых задачах."""
+
+import asyncio
+
+
+class RateLimiter:
+    """Равномерно распределяет запросы: не чаще `rate` в секунду."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def pause(self, seconds: float) -> None:
+        """Сдвигает все следующие запросы (ответ Telegram "retry after")."""
+        resume_at = asyncio.get_running_loop().time() + seconds
+        self._next_slot = max(self._next_slot, resume_at)
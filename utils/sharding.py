@@ -0,0 +1,66 @@
+# utils/sharding.py
+"""
+Распределение входящих обновлений между рабочими процессами.
+
+Обновления одного пользователя всегда попадают в один и тот же процесс:
+там живут его FSM-кэш, троттлинг и незавершённые диалоги. Исключение —
+нажатия внутри матча (дуэль, таймер): состояние матча есть только в
+процессе, который его ведёт, поэтому такие callback'и идут туда.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from keyboards.factories import DuelCallback, TimerCallback
+
+MatchKey = Tuple[str, int]
+
+# Префикс callback_data -> позиция match_id в упакованной строке
+# ("duel:play:<match_id>:..."), берётся из порядка полей фабрики
+MATCH_CALLBACKS: Dict[str, int] = {
+    factory.__prefix__: list(factory.model_fields).index("match_id") + 1
+    for factory in (DuelCallback, TimerCallback)
+}
+SEPARATOR = DuelCallback.__separator__
+
+
+def update_user_id(update: Mapping[str, Any]) -> Optional[int]:
+    """ID пользователя, от которого пришло обновление (или чата, если его нет)."""
+    for key, payload in update.items():
+        if key == "update_id" or not isinstance(payload, dict):
+            continue
+        user = payload.get("from") or payload.get("user")
+        if user:
+            return user["id"]
+        chat = payload.get("chat")
+        if chat:
+            return chat["id"]
+    return None
+
+
+def match_key(update: Mapping[str, Any]) -> Optional[MatchKey]:
+    """(игра, match_id) для нажатия кнопки внутри матча, иначе None."""
+    query = update.get("callback_query")
+    if not query:
+        return None
+    parts = (query.get("data") or "").split(SEPARATOR)
+    position = MATCH_CALLBACKS.get(parts[0])
+    if position is None or len(parts) <= position or not parts[position].isdigit():
+        return None
+    return parts[0], int(parts[position])
+
+
+def shard_for_update(
+    update: Mapping[str, Any],
+    workers: int,
+    match_owners: Mapping[MatchKey, int],
+) -> int:
+    """Номер рабочего процесса, который должен обработать обновление."""
+    key = match_key(update)
+    if key is not None:
+        owner = match_owners.get(key)
+        if owner is not None:
+            return owner
+    user_id = update_user_id(update)
+    if user_id is None:
+        user_id = update.get("update_id", 0)
+    return user_id % workers